@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Measure open-to-interactive time for the connection dialog and Preferences.
+
+Opens the real dialogs against a parent window whose key manager and agent
+client answer after ``--latency`` ms (standing in for daemon round trips) and
+report ``--keys`` synthetic keys, each with a ``.pub`` file to fingerprint.
+Steps:
+
+  connection   ``ConnectionDialog`` construction -> first painted frame
+  chooser      "Add key" -> key chooser painted / keys listed
+  preferences  Settings pushed -> first painted frame
+  plugins      Plugins page selected -> painted / manifests listed
+
+``painted`` is the time until the dialog's next frame-clock ``after-paint``;
+``ready`` is the time until its data is on screen. With ``--eager`` the
+chooser discovers and fingerprints keys before it is shown, every Preferences
+page is built up front and plugin manifests are scanned on the main thread
+(the pre-change behaviour).
+
+Usage (needs a display + GTK 4 / libadwaita):
+
+    python3 scripts/bench_dialog_open.py --keys 200 --latency 150
+    python3 scripts/bench_dialog_open.py --keys 200 --latency 150 --eager
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Callable, List, Optional, Tuple
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+from gi.repository import Adw, GLib, Gtk  # noqa: E402
+
+# Repo root on sys.path
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from sshpilot.config import Config  # noqa: E402
+from sshpilot.connection_dialog import ConnectionDialog, KeyChooserDialog  # noqa: E402
+from sshpilot.key_manager import SSHKey  # noqa: E402
+from sshpilot.preferences import PreferencesWindow  # noqa: E402
+
+_PUBLIC_KEY = (
+    "ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIOMqqnkVzrm0SdG6UOoqKLsabgH5C9okWi0dh2l9GKJl"
+    " bench@{index}\n"
+)
+
+
+def _synthetic_keys(directory: str, count: int) -> List[SSHKey]:
+    keys = []
+    for index in range(count):
+        path = os.path.join(directory, f"id_bench_{index:04d}")
+        with open(f"{path}.pub", "w", encoding="utf-8") as handle:
+            handle.write(_PUBLIC_KEY.format(index=index))
+        keys.append(SSHKey(path))
+    return keys
+
+
+class _SlowKeyManager:
+    def __init__(self, keys: List[SSHKey], latency: float):
+        self._keys = keys
+        self._latency = latency
+
+    def discover_keys(self):
+        time.sleep(self._latency)
+        return list(self._keys)
+
+
+class _SlowClient:
+    def __init__(self, count: int, latency: float):
+        self._keys = [
+            SimpleNamespace(fingerprint=f"SHA256:bench{index:04d}", key_type="ssh-ed25519",
+                            comment=f"agent-{index}")
+            for index in range(count)
+        ]
+        self._latency = latency
+
+    def list_agent_keys(self):
+        time.sleep(self._latency)
+        return SimpleNamespace(keys=list(self._keys))
+
+
+def _eager_open_key_chooser(dialog: ConnectionDialog, editor) -> None:
+    """The pre-change chooser: discover and fingerprint, then show."""
+    disk_keys, agent_keys = dialog._collect_chooser_keys(dialog.get_transient_for())
+    chooser = KeyChooserDialog(
+        dialog,
+        disk_keys=disk_keys,
+        agent_keys=agent_keys,
+        existing_paths=editor.get_paths(),
+        on_add=editor.add_path,
+    )
+    chooser.present()
+
+
+def _eager_populate_plugins_page(prefs: PreferencesWindow) -> None:
+    """The pre-change Plugins page: scan manifests on the main thread."""
+    from sshpilot.plugins.loader import discover_plugins
+
+    group = Adw.PreferencesGroup()
+    prefs._plugins_page.add(group)
+    prefs._plugin_groups.append(group)
+    prefs._plugins_loading_group = group
+    prefs._on_plugins_discovered(group, discover_plugins())
+
+
+class Runner:
+    def __init__(self, keys: int, latency_ms: float, eager: bool):
+        self._tmp = tempfile.TemporaryDirectory(prefix="sshpilot-bench-")
+        latency = latency_ms / 1000.0
+        self.key_manager = _SlowKeyManager(_synthetic_keys(self._tmp.name, keys), latency)
+        self.client = _SlowClient(keys, latency)
+        self.eager = eager
+        self.samples: List[Tuple[str, float, Optional[float]]] = []
+        self._app: Optional[Adw.Application] = None
+        self._window: Optional[Adw.ApplicationWindow] = None
+        self._dialog: Optional[ConnectionDialog] = None
+        self._chooser: Optional[KeyChooserDialog] = None
+        self._prefs: Optional[PreferencesWindow] = None
+        self._steps: List[Callable[[], None]] = []
+
+    def run(self) -> None:
+        app_id = f"io.github.mfat.sshpilot.benchdialogs{os.getpid()}"
+        self._app = Adw.Application(application_id=app_id)
+        self._app.connect("activate", self._on_activate)
+        self._app.run(None)
+        self._tmp.cleanup()
+
+    def _on_activate(self, _app):
+        self._window = Adw.ApplicationWindow(application=self._app, title="bench-dialogs")
+        self._window.set_default_size(1000, 800)
+        self._nav = Adw.NavigationView()
+        self._nav.add(Adw.NavigationPage(child=Gtk.Label(label="work"), title="Work"))
+        self._window.set_content(self._nav)
+        self._window.key_manager = self.key_manager
+        self._window.client = self.client
+        self._window.config = Config()
+        self._window.loaded_plugins = []
+        self._window.present()
+        self._steps = [self._open_connection, self._open_chooser, self._open_preferences,
+                       self._open_plugins]
+        GLib.timeout_add(500, self._next)
+
+    # ---- measurement ----------------------------------------------------
+    def _measure(self, label: str, widget: Gtk.Widget, t0: float,
+                 ready: Optional[List[float]] = None) -> None:
+        """Record painted/ready times once *widget* paints, then move on."""
+        def _on_painted():
+            painted = (time.perf_counter() - t0) * 1000.0
+            if ready is None:
+                self._record(label, painted, None)
+                return
+
+            def _wait_ready():
+                if not ready:
+                    return True
+                self._record(label, painted, (ready[0] - t0) * 1000.0)
+                return False
+            GLib.timeout_add(5, _wait_ready)
+
+        map_ids: List[int] = []
+
+        def _on_map(*_args):
+            while map_ids:
+                widget.disconnect(map_ids.pop())
+            clock = widget.get_frame_clock()
+            handler_ids = []
+
+            def _after_paint(frame_clock):
+                frame_clock.disconnect(handler_ids.pop())
+                _on_painted()
+            handler_ids.append(clock.connect("after-paint", _after_paint))
+            widget.queue_draw()
+
+        if widget.get_mapped():
+            _on_map()
+        else:
+            map_ids.append(widget.connect("map", _on_map))
+
+    def _record(self, label: str, painted: float, ready: Optional[float]) -> None:
+        self.samples.append((label, painted, ready))
+        GLib.idle_add(self._next)
+
+    def _next(self):
+        if not self._steps:
+            self._app.quit()
+        else:
+            self._steps.pop(0)()
+        return False
+
+    # ---- steps ----------------------------------------------------------
+    def _open_connection(self) -> None:
+        t0 = time.perf_counter()
+        self._dialog = ConnectionDialog(self._window, None, None)
+        self._dialog.present()
+        self._measure("connection", self._dialog, t0)
+
+    def _open_chooser(self) -> None:
+        ready: List[float] = []
+        opened: List[Gtk.Window] = []
+        original_set_keys = KeyChooserDialog.set_keys
+        original_present = KeyChooserDialog.present
+
+        def set_keys(chooser, disk_keys, agent_keys):
+            result = original_set_keys(chooser, disk_keys, agent_keys)
+            if disk_keys is not None:
+                ready.append(time.perf_counter())
+            return result
+
+        def present(chooser):
+            opened.append(chooser)
+            original_present(chooser)
+
+        KeyChooserDialog.set_keys = set_keys
+        KeyChooserDialog.present = present
+        t0 = time.perf_counter()
+        if self.eager:
+            _eager_open_key_chooser(self._dialog, self._dialog.key_editor)
+        else:
+            self._dialog._open_key_chooser(self._dialog.key_editor)
+        KeyChooserDialog.present = original_present
+        self._chooser = opened[0]
+        self._measure("chooser", self._chooser, t0, ready)
+
+    def _open_preferences(self) -> None:
+        self._chooser.close()
+        self._dialog.close()
+        if self.eager:
+            PreferencesWindow._populate_plugins_page = _eager_populate_plugins_page
+        t0 = time.perf_counter()
+        self._prefs = PreferencesWindow(self._window, self._window.config)
+        if self.eager:
+            for page_id in list(self._prefs._page_builders):
+                self._prefs._ensure_page_built(page_id)
+        self._nav.push(self._prefs)
+        self._measure("preferences", self._prefs, t0)
+
+    def _open_plugins(self) -> None:
+        ready: List[float] = []
+        prefs = self._prefs
+        original = prefs._on_plugins_discovered
+
+        def discovered(group, infos):
+            result = original(group, infos)
+            ready.append(time.perf_counter())
+            return result
+
+        prefs._on_plugins_discovered = discovered
+        if self.eager and getattr(prefs, '_plugins_loading_group', None) is None:
+            ready.append(time.perf_counter())  # already scanned up front
+        t0 = time.perf_counter()
+        prefs.select_page("plugins")
+        self._measure("plugins", prefs, t0, ready)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--keys", type=int, default=200)
+    ap.add_argument("--latency", type=float, default=150.0,
+                    help="simulated daemon round trip in ms")
+    ap.add_argument(
+        "--eager",
+        action="store_true",
+        help="load keys, pages and plugin manifests up front (pre-change behaviour)",
+    )
+    args = ap.parse_args()
+
+    print(f"keys={args.keys} latency={args.latency}ms eager={args.eager}", flush=True)
+    runner = Runner(args.keys, args.latency, eager=args.eager)
+    runner.run()
+    for label, painted, ready in runner.samples:
+        ready_text = f"  ready={ready:8.1f}ms" if ready is not None else ""
+        print(f"{label:12s} painted={painted:8.1f}ms{ready_text}")
+
+
+if __name__ == "__main__":
+    main()
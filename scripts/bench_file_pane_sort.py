@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Measure FilePane listing, sort and hidden-filter cost on a huge directory.
+
+Builds ``--entries`` synthetic ``FileEntry`` objects (10% folders, 5% dotfiles)
+and drives a real ``FilePane`` through the operations that re-order its list
+model:
+
+  show        initial ``show_entries`` of the whole listing
+  sort:<key>  switching the sort column (name/size/modified)
+  direction   toggling ascending/descending
+  hidden      toggling "show hidden files" on and off
+
+For each step it records the time spent in the pane call and the time until
+the next frame-clock ``after-paint``. With ``--legacy`` the pane uses the old
+model update (``remove_all`` plus one ``append`` per row, a fresh
+``Gtk.StringObject`` per row, keys computed on every sort) for comparison.
+
+Usage (needs a display + GTK 4 / libadwaita):
+
+    python3 scripts/bench_file_pane_sort.py --entries 100000
+    python3 scripts/bench_file_pane_sort.py --entries 100000 --legacy
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+from gi.repository import Adw, GLib, Gtk  # noqa: E402
+
+# Repo root on sys.path
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from sshpilot.file_manager import FileEntry, FilePane  # noqa: E402
+
+
+def _synthetic_entries(count: int, seed: int = 1) -> List[FileEntry]:
+    rng = random.Random(seed)
+    entries = []
+    for index in range(count):
+        is_dir = index % 10 == 0
+        prefix = "." if index % 20 == 1 else ""
+        entries.append(FileEntry(
+            name=f"{prefix}{'Dir' if is_dir else 'file'}-{rng.randrange(1 << 30):09d}-{index}",
+            is_dir=is_dir,
+            size=0 if is_dir else rng.randrange(1 << 24),
+            modified=1_600_000_000 + rng.random() * 1e8,
+        ))
+    return entries
+
+
+def _legacy_apply_entry_filter(pane: FilePane, *, preserve_selection: bool) -> None:
+    """The pre-model-layer update, kept only for comparison."""
+    selected = {entry.name for entry in pane.get_selected_entries()} if preserve_selection else set()
+    pane._raw_entries = [
+        entry for entry in pane._cached_entries
+        if pane._show_hidden or not entry.name.startswith(".")
+    ]
+
+    def key_func(item):
+        if pane._sort_key == "size":
+            return item.size
+        if pane._sort_key == "modified":
+            return item.modified
+        return item.name.casefold()
+
+    dirs = sorted((e for e in pane._raw_entries if e.is_dir), key=key_func, reverse=pane._sort_descending)
+    files = sorted((e for e in pane._raw_entries if not e.is_dir), key=key_func, reverse=pane._sort_descending)
+    pane._entries = dirs + files
+    pane._list_store.remove_all()
+    restored = []
+    for idx, entry in enumerate(pane._entries):
+        pane._list_store.append(Gtk.StringObject.new(entry.name + ("/" if entry.is_dir else "")))
+        if entry.name in selected:
+            restored.append(idx)
+    pane._selection_model.unselect_all()
+    for index in restored:
+        pane._selection_model.select_item(index, False)
+    pane._update_menu_state()
+
+
+class Runner:
+    def __init__(self, count: int, legacy: bool):
+        self.entries = _synthetic_entries(count)
+        self.legacy = legacy
+        self.samples: List[Tuple[str, float, float]] = []
+        self._app: Optional[Adw.Application] = None
+        self._pane: Optional[FilePane] = None
+        self._steps: List[Tuple[str, Callable[[], None]]] = []
+        self._label = ""
+        self._t0 = 0.0
+        self._call_ms = 0.0
+        self._pending = False
+        self._paint_handler = 0
+
+    def run(self) -> None:
+        app_id = f"io.github.mfat.sshpilot.benchfilepane{os.getpid()}"
+        self._app = Adw.Application(application_id=app_id)
+        self._app.connect("activate", self._on_activate)
+        self._app.run(None)
+
+    def _on_activate(self, _app):
+        self._pane = FilePane("Bench")
+        if self.legacy:
+            pane = self._pane
+            pane._apply_entry_filter = (
+                lambda *, preserve_selection: _legacy_apply_entry_filter(
+                    pane, preserve_selection=preserve_selection
+                )
+            )
+        win = Gtk.ApplicationWindow(application=self._app, title="bench-file-pane")
+        win.set_default_size(900, 900)
+        win.set_child(self._pane)
+        win.present()
+        pane = self._pane
+        self._steps = [
+            ("show", lambda: pane.show_entries("/bench", self.entries)),
+            ("sort:size", lambda: pane._on_sort_by("size")),
+            ("sort:modified", lambda: pane._on_sort_by("modified")),
+            ("sort:name", lambda: pane._on_sort_by("name")),
+            ("direction", lambda: pane._on_sort_direction(True)),
+            ("direction", lambda: pane._on_sort_direction(False)),
+            ("hidden", lambda: pane.set_show_hidden(True)),
+            ("hidden", lambda: pane.set_show_hidden(False)),
+        ]
+        GLib.timeout_add(500, self._start)
+
+    def _start(self):
+        clock = self._pane.get_frame_clock()
+        self._paint_handler = clock.connect("after-paint", self._on_after_paint)
+        self._next()
+        return False
+
+    def _next(self) -> None:
+        if not self._steps:
+            self._pane.get_frame_clock().disconnect(self._paint_handler)
+            self._app.quit()
+            return
+        self._label, step = self._steps.pop(0)
+        self._t0 = time.perf_counter()
+        step()
+        self._call_ms = (time.perf_counter() - self._t0) * 1000.0
+        self._pending = True
+        self._pane.queue_draw()
+
+    def _on_after_paint(self, _clock):
+        if not self._pending:
+            return
+        self._pending = False
+        frame_ms = (time.perf_counter() - self._t0) * 1000.0
+        self.samples.append((self._label, self._call_ms, frame_ms))
+        GLib.idle_add(self._next_deferred)
+
+    def _next_deferred(self):
+        self._next()
+        return False
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--entries", type=int, default=100000)
+    ap.add_argument(
+        "--legacy",
+        action="store_true",
+        help="rebuild the list store row by row (pre-change behaviour)",
+    )
+    args = ap.parse_args()
+
+    print(f"entries={args.entries} legacy={args.legacy}", flush=True)
+    runner = Runner(args.entries, legacy=args.legacy)
+    runner.run()
+    for label, call_ms, frame_ms in runner.samples:
+        print(f"{label:14s} call={call_ms:8.1f}ms  frame={frame_ms:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
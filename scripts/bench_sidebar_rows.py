@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Measure sidebar frame time while typing a search over many connections.
+
+Builds ``--connections`` synthetic hosts as real ``ConnectionRow`` widgets in a
+``Gtk.ListBox`` and replays a search query one keystroke at a time, the way
+``MainWindow.rebuild_connection_list()`` does: detach every row, then append
+the rows that match. For each keystroke it records
+
+  rebuild_ms   time spent detaching/obtaining/appending rows
+  frame_ms     rebuild start -> next frame-clock ``after-paint``
+
+With ``--no-recycle`` every keystroke constructs fresh rows (the old
+behaviour); by default rows come from ``SidebarRowCache``.
+
+Usage (needs a display + GTK 4 / libadwaita):
+
+    python3 scripts/bench_sidebar_rows.py --connections 10000
+    python3 scripts/bench_sidebar_rows.py --connections 10000 --no-recycle
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import List, Optional
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+from gi.repository import Adw, GLib, Gtk  # noqa: E402
+
+# Repo root on sys.path
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from sshpilot.connection_model import Connection  # noqa: E402
+from sshpilot.sidebar import ConnectionRow, SidebarRowCache  # noqa: E402
+
+
+class _Config:
+    def get_setting(self, _key, default=None):
+        return default
+
+
+def _group_manager(config) -> SimpleNamespace:
+    return SimpleNamespace(
+        config=config,
+        groups={},
+        connections={},
+        get_connection_group=lambda _id: None,
+        get_connection_groups=lambda _id: [],
+    )
+
+
+class Runner:
+    def __init__(self, connections: int, query: str, recycle: bool):
+        self.config = _Config()
+        self.group_manager = _group_manager(self.config)
+        self.connections = [
+            Connection({
+                "nickname": f"host-{index:05d}",
+                "hostname": f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}",
+                "username": "bench",
+            })
+            for index in range(connections)
+        ]
+        # Replay every prefix, then delete back to empty.
+        self.queries = [query[:n] for n in range(1, len(query) + 1)]
+        self.queries += [query[:n] for n in range(len(query) - 1, -1, -1)]
+        self.recycle = recycle
+        self.cache = SidebarRowCache()
+        self.rebuild_ms: List[float] = []
+        self.frame_ms: List[float] = []
+        self._app: Optional[Adw.Application] = None
+        self._listbox: Optional[Gtk.ListBox] = None
+        self._t0 = 0.0
+        self._pending = False
+        self._paint_handler = 0
+
+    def run(self) -> None:
+        app_id = f"io.github.mfat.sshpilot.benchsidebar{os.getpid()}"
+        self._app = Adw.Application(application_id=app_id)
+        self._app.connect("activate", self._on_activate)
+        self._app.run(None)
+
+    def _on_activate(self, _app):
+        self._listbox = Gtk.ListBox()
+        self._listbox.set_selection_mode(Gtk.SelectionMode.MULTIPLE)
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_child(self._listbox)
+        win = Gtk.ApplicationWindow(application=self._app, title="bench-sidebar")
+        win.set_default_size(320, 900)
+        win.set_child(scrolled)
+        win.present()
+        self._rebuild("")
+        GLib.timeout_add(500, self._start)
+
+    def _start(self):
+        clock = self._listbox.get_frame_clock()
+        self._paint_handler = clock.connect("after-paint", self._on_after_paint)
+        self._next()
+        return False
+
+    def _make_row(self, connection):
+        return ConnectionRow(connection, self.group_manager, self.config)
+
+    def _rebuild(self, query: str) -> None:
+        child = self._listbox.get_first_child()
+        while child:
+            next_child = child.get_next_sibling()
+            self._listbox.remove(child)
+            child = next_child
+        self.cache.begin()
+        for connection in self.connections:
+            if query and query not in connection.nickname:
+                continue
+            if self.recycle:
+                row = self.cache.take(
+                    ("connection", connection.nickname, None, False),
+                    lambda: self._make_row(connection),
+                    lambda cached: cached.rebind(connection),
+                )
+            else:
+                row = self._make_row(connection)
+            self._listbox.append(row)
+        self.cache.trim()
+
+    def _next(self) -> None:
+        if not self.queries:
+            self._listbox.get_frame_clock().disconnect(self._paint_handler)
+            self._app.quit()
+            return
+        query = self.queries.pop(0)
+        self._t0 = time.perf_counter()
+        self._rebuild(query)
+        self.rebuild_ms.append((time.perf_counter() - self._t0) * 1000.0)
+        self._pending = True
+        self._listbox.queue_draw()
+
+    def _on_after_paint(self, _clock):
+        if not self._pending:
+            return
+        self._pending = False
+        self.frame_ms.append((time.perf_counter() - self._t0) * 1000.0)
+        GLib.idle_add(self._next_deferred)
+
+    def _next_deferred(self):
+        self._next()
+        return False
+
+
+def _summary(label: str, values: List[float]) -> str:
+    if not values:
+        return f"{label}: (no samples)"
+    vals = sorted(values)
+    med = statistics.median(vals)
+    p90 = vals[max(0, int(round(0.9 * (len(vals) - 1))))]
+    return f"{label}: n={len(vals)}  median={med:7.1f}ms  p90={p90:7.1f}ms  max={vals[-1]:7.1f}ms"
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--connections", type=int, default=10000)
+    ap.add_argument("--query", default="host-001", help="search text to type")
+    ap.add_argument(
+        "--no-recycle",
+        action="store_true",
+        help="construct fresh rows on every keystroke (pre-cache behaviour)",
+    )
+    args = ap.parse_args()
+
+    print(
+        f"connections={args.connections} query={args.query!r} "
+        f"recycle={not args.no_recycle}",
+        flush=True,
+    )
+    runner = Runner(args.connections, args.query, recycle=not args.no_recycle)
+    runner.run()
+    print(_summary("rebuild", runner.rebuild_ms))
+    print(_summary("frame  ", runner.frame_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -94,6 +94,8 @@ IMPLEMENTED_MODELS = {
     "ClientInfo",
     "CompatibilityResult",
     "ConnectionDetails",
+    "ConnectionReachability",
+    "ConnectionReachabilityRequest",
     "ConnectionSummary",
     "EffectiveConfigComparison",
     "UnsavedHostCheckRequest",
@@ -122,9 +124,12 @@ IMPLEMENTED_MODELS = {
     "CloseSessionRequest",
     "DetachSessionRequest",
     "OpenSessionRequest",
+    "PrewarmConnectionRequest",
+    "PrewarmReason",
     "SessionCapabilities",
     "SessionExitInfo",
     "SessionFailure",
+    "SessionStartupTiming",
     "SessionSummary",
     "ExternalTerminalLaunchSpec",
     "ServiceFailure",
@@ -145,10 +150,16 @@ IMPLEMENTED_MODELS = {
     "TransferBackend",
     "CancelTransferRequest",
     "ForwardSummary",
+    "ForwardHealth",
+    "ForwardHealthStatus",
     "OpenForwardRequest",
     "CloseForwardRequest",
     "DaemonStatus",
     "DaemonDiagnostics",
+    "ControlMasterPrewarmStats",
+    "SecretCacheStats",
+    "ConnectionStartupPercentiles",
+    "StartupStagePercentiles",
     "DaemonResourceCounts",
     "DaemonIdleInfo",
     "DaemonStopResult",
@@ -162,6 +173,7 @@ IMPLEMENTED_MODELS = {
     "VerifyKeyPassphraseResult",
     "KnownHostEntrySummary",
     "KnownHostsSnapshot",
+    "FindKnownHostEntriesRequest",
     "RemoveKnownHostEntriesRequest",
     "KnownHostsMutationResult",
 }
@@ -199,6 +211,8 @@ RELATED_METHODS = {
         "update_connection",
     ),
     "ConnectionSummary": ("list_connections",),
+    "ConnectionReachability": ("get_connection_reachability",),
+    "ConnectionReachabilityRequest": ("get_connection_reachability",),
     "EffectiveConfigComparison": ("get_effective_config",),
     "UnsavedHostCheckRequest": ("check_unsaved_host",),
     "UnsavedHostCheckResult": ("check_unsaved_host",),
@@ -207,6 +221,8 @@ RELATED_METHODS = {
     "CreateConnectionRequest": ("create_connection",),
     "DeleteConnectionRequest": ("delete_connection",),
     "DeleteConnectionResult": ("delete_connection",),
+    "ConnectionUpdateItem": ("update_connections",),
+    "ConnectionBatchItemResult": ("delete_connections", "update_connections"),
     "UpdateConnectionRequest": ("update_connection",),
     "OpenSessionRequest": ("open_session",),
     "ExternalTerminalLaunchSpec": ("prepare_external_terminal_launch",),
@@ -220,6 +236,8 @@ RELATED_METHODS = {
     "AttachSessionResult": ("attach_session",),
     "DetachSessionRequest": ("detach_session",),
     "CloseSessionRequest": ("close_session",),
+    "PrewarmConnectionRequest": ("prewarm_connection",),
+    "SessionStartupTiming": ("list_sessions", "get_session"),
     "TerminalInput": ("send_terminal_input",),
     "BroadcastTerminalInputRequest": ("broadcast_terminal_input",),
     "ResizeTerminalRequest": ("resize_terminal",),
@@ -257,15 +275,22 @@ RELATED_METHODS = {
     "TransferBackend": ("start_scp_transfer",),
     "CancelTransferRequest": ("cancel_transfer",),
     "ForwardSummary": ("list_forwards", "get_forward", "open_forward"),
+    "ForwardHealth": ("list_forwards", "get_forward"),
+    "ForwardHealthStatus": ("list_forwards", "get_forward"),
     "OpenForwardRequest": ("open_forward",),
     "CloseForwardRequest": ("close_forward",),
     "DaemonStatus": ("get_daemon_status",),
     "DaemonDiagnostics": ("get_daemon_diagnostics",),
+    "ControlMasterPrewarmStats": ("get_daemon_diagnostics",),
+    "SecretCacheStats": ("get_daemon_diagnostics",),
+    "ConnectionStartupPercentiles": ("get_daemon_diagnostics",),
+    "StartupStagePercentiles": ("get_daemon_diagnostics",),
     "DaemonStopResult": ("stop_daemon", "restart_daemon"),
     "StopDaemonRequest": ("stop_daemon",),
     "RestartDaemonRequest": ("restart_daemon",),
     "KnownHostEntrySummary": ("list_known_hosts", "remove_known_host_entries"),
-    "KnownHostsSnapshot": ("list_known_hosts",),
+    "KnownHostsSnapshot": ("list_known_hosts", "find_known_host_entries"),
+    "FindKnownHostEntriesRequest": ("find_known_host_entries",),
     "RemoveKnownHostEntriesRequest": ("remove_known_host_entries",),
     "KnownHostsMutationResult": ("remove_known_host_entries",),
     "StoreKeyPassphraseRequest": ("store_key_passphrase",),
@@ -279,6 +304,7 @@ RELATED_EVENTS = {
         "connection.updated",
         "connection.deleted",
     ),
+    "ConnectionReachability": ("connection.reachability_changed",),
     "CoreEvent": tuple(item.value for item in EventType),
     "InteractionRequest": ("session.interaction_requested",),
     "SessionExitInfo": ("session.exited",),
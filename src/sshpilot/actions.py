@@ -479,24 +479,33 @@ class WindowActions:
                             lambda _prev: controller.client.delete_group(group_id),
                         ])
                     elif response == 'delete_all':
-                        # Delete each connection, then delete the group.
+                        # Delete every member in one daemon transaction,
+                        # then delete the now-empty group.
                         from sshpilot.api.models.connections import (
-                            ConnectionId, DeleteConnectionRequest,
+                            ConnectionId, DeleteConnectionsRequest,
                         )
-                        steps = []
-                        for nickname in actual_connections:
-                            steps.append(
-                                lambda _prev, nick=nickname: (
-                                    controller.client.delete_connection(
-                                        DeleteConnectionRequest(
-                                            connection_id=ConnectionId(nick),
-                                        )
-                                    )
-                                )
+                        request = DeleteConnectionsRequest(
+                            connection_ids=tuple(
+                                ConnectionId(nickname)
+                                for nickname in actual_connections
+                            ),
+                        )
+
+                        def _delete_members(_prev):
+                            result = controller.client.delete_connections(
+                                request
                             )
-                        steps.append(
+                            if result.failed:
+                                raise RuntimeError(
+                                    result.failed[0].error_message
+                                    or result.failed[0].error_code
+                                )
+                            return result
+
+                        steps = [
+                            _delete_members,
                             lambda _prev: controller.client.delete_group(group_id),
-                        )
+                        ]
                         _run_delete(steps)
                     _dialog.destroy()
 
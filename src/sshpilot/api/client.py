@@ -12,17 +12,21 @@ from .terminal_events import (
     TerminalSubscription,
 )
 from .models.connections import (
+    ConnectionBatchResult,
     ConnectionDetails,
     ConnectionEditorDetails,
     EffectiveConfigComparison,
     UnsavedHostCheckRequest,
     UnsavedHostCheckResult,
     ConnectionMutationResult,
+    ConnectionReachability,
+    ConnectionReachabilityRequest,
     ConnectionSummary,
     CreateConnectionRequest,
     DeleteConnectionPasswordRequest,
     DeleteConnectionRequest,
     DeleteConnectionResult,
+    DeleteConnectionsRequest,
     StoreConnectionPasswordRequest,
     SetSessionConnectionPasswordRequest,
     DeleteKeyPassphraseRequest,
@@ -31,6 +35,7 @@ from .models.connections import (
     SshConfigText,
     StoreKeyPassphraseRequest,
     UpdateConnectionRequest,
+    UpdateConnectionsRequest,
 )
 from .models.connection_store import (
     AddTagToConnectionsRequest,
@@ -86,6 +91,7 @@ from .models.secrets import (
     UpdateSecretConfigurationRequest,
 )
 from .models.known_hosts import (
+    FindKnownHostEntriesRequest,
     KnownHostsMutationResult,
     KnownHostsSnapshot,
     RemoveKnownHostEntriesRequest,
@@ -96,6 +102,7 @@ from .models.sessions import (
     CloseSessionRequest,
     DetachSessionRequest,
     OpenSessionRequest,
+    PrewarmConnectionRequest,
     SessionSummary,
 )
 from .models.terminal import (
@@ -200,6 +207,12 @@ class SshPilotClient(Protocol):
     def get_connection_store_snapshot(self) -> ConnectionStoreSnapshot:
         ...
 
+    def get_connection_reachability(
+        self, request: ConnectionReachabilityRequest
+    ) -> List[ConnectionReachability]:
+        """Report visible rows and return the daemon's latest probe results."""
+        ...
+
     def get_connection(self, connection_id: ConnectionId) -> ConnectionDetails:
         ...
 
@@ -249,6 +262,18 @@ class SshPilotClient(Protocol):
     def delete_connection(self, request: DeleteConnectionRequest) -> DeleteConnectionResult:
         ...
 
+    def update_connections(
+        self, request: UpdateConnectionsRequest
+    ) -> ConnectionBatchResult:
+        """Patch many connections in one transaction with per-item results."""
+        ...
+
+    def delete_connections(
+        self, request: DeleteConnectionsRequest
+    ) -> ConnectionBatchResult:
+        """Delete many connections in one transaction with per-item results."""
+        ...
+
     def store_connection_password(self, request: StoreConnectionPasswordRequest) -> bool:
         ...
 
@@ -375,6 +400,10 @@ class SshPilotClient(Protocol):
     def close_session(self, request: CloseSessionRequest) -> None:
         ...
 
+    def prewarm_connection(self, request: PrewarmConnectionRequest) -> bool:
+        """Hint that a connection is about to be opened; ``True`` if a master is being built."""
+        ...
+
     def send_terminal_input(self, request: TerminalInput) -> None:
         ...
 
@@ -533,6 +562,13 @@ class SshPilotClient(Protocol):
     def list_known_hosts(self) -> KnownHostsSnapshot:
         ...
 
+    def find_known_host_entries(
+        self,
+        request: FindKnownHostEntriesRequest,
+    ) -> KnownHostsSnapshot:
+        """Entries ``ssh`` would consult for one host, hashed names included."""
+        ...
+
     def remove_known_host_entries(
         self,
         request: RemoveKnownHostEntriesRequest,
@@ -36,17 +36,21 @@ from .models.common import (
     TransferId,
 )
 from .models.connections import (
+    ConnectionBatchResult,
     ConnectionDetails,
     ConnectionEditorDetails,
     EffectiveConfigComparison,
     UnsavedHostCheckRequest,
     UnsavedHostCheckResult,
     ConnectionMutationResult,
+    ConnectionReachability,
+    ConnectionReachabilityRequest,
     ConnectionSummary,
     CreateConnectionRequest,
     DeleteConnectionPasswordRequest,
     DeleteConnectionRequest,
     DeleteConnectionResult,
+    DeleteConnectionsRequest,
     DeleteKeyPassphraseRequest,
     SaveSshConfigTextRequest,
     StoreConnectionPasswordRequest,
@@ -54,6 +58,7 @@ from .models.connections import (
     StoreKeyPassphraseRequest,
     SshConfigText,
     UpdateConnectionRequest,
+    UpdateConnectionsRequest,
 )
 from .models.connection_store import (
     AddTagToConnectionsRequest,
@@ -95,6 +100,7 @@ from .models.keys import (
     VerifyKeyPassphraseResult,
 )
 from .models.known_hosts import (
+    FindKnownHostEntriesRequest,
     KnownHostsMutationResult,
     KnownHostsSnapshot,
     RemoveKnownHostEntriesRequest,
@@ -131,6 +137,7 @@ from .models.sessions import (
     CloseSessionRequest,
     DetachSessionRequest,
     OpenSessionRequest,
+    PrewarmConnectionRequest,
     SessionSummary,
 )
 from .models.terminal import (
@@ -177,6 +184,8 @@ from .transport.codec import (
     unsaved_host_check_result_from_wire,
     external_terminal_launch_spec_from_wire,
     connection_summary_from_wire,
+    connection_reachability_from_wire,
+    connection_reachability_request_to_wire,
     ssh_config_text_from_wire,
     connection_store_snapshot_from_wire,
     create_connection_request_to_wire,
@@ -206,6 +215,7 @@ from .transport.codec import (
     interaction_decision_to_wire,
     interaction_summary_from_wire,
     key_list_from_wire,
+    find_known_host_entries_request_to_wire,
     known_hosts_mutation_result_from_wire,
     known_hosts_snapshot_from_wire,
     list_keys_request_to_wire,
@@ -215,6 +225,7 @@ from .transport.codec import (
     list_directory_result_from_wire,
     open_forward_request_to_wire,
     open_session_request_to_wire,
+    prewarm_connection_request_to_wire,
     open_sftp_request_to_wire,
     public_event_from_envelope,
     release_terminal_input_request_to_wire,
@@ -252,6 +263,9 @@ from .transport.codec import (
     add_tag_to_connections_request_to_wire,
     update_connection_metadata_request_to_wire,
     update_connection_request_to_wire,
+    update_connections_request_to_wire,
+    delete_connections_request_to_wire,
+    connection_batch_result_from_wire,
     set_group_color_request_to_wire,
     place_group_request_to_wire,
     copy_connection_to_group_request_to_wire,
@@ -317,6 +331,7 @@ DAEMON_IMPLEMENTED_CLIENT_METHOD_CAPABILITIES = {
     "get_daemon_diagnostics": Capability.DAEMON_STATUS,
     "get_daemon_status": Capability.DAEMON_STATUS,
     "get_connection_store_snapshot": Capability.CONNECTIONS_READ,
+    "get_connection_reachability": Capability.CONNECTIONS_READ,
     "get_effective_config": Capability.CONNECTIONS_CONFIG_READ,
     "check_unsaved_host": Capability.CONNECTIONS_READ,
     "set_operation_mode": Capability.OPERATION_MODE,
@@ -340,6 +355,7 @@ DAEMON_IMPLEMENTED_CLIENT_METHOD_CAPABILITIES = {
     "list_interactions": Capability.INTERACTIONS_READ,
     "list_sessions": Capability.SESSIONS_READ,
     "open_session": Capability.SESSIONS_WRITE,
+    "prewarm_connection": Capability.SESSIONS_WRITE,
     "release_terminal_input": Capability.TERMINAL_INPUT,
     "restart_daemon": Capability.DAEMON_CONTROL,
     "set_daemon_log_level": Capability.DAEMON_CONTROL,
@@ -393,6 +409,7 @@ DAEMON_IMPLEMENTED_CLIENT_METHOD_CAPABILITIES = {
     "open_forward": Capability.FORWARDS_WRITE,
     "close_forward": Capability.FORWARDS_WRITE,
     "list_known_hosts": Capability.KNOWN_HOSTS_READ,
+    "find_known_host_entries": Capability.KNOWN_HOSTS_READ,
     "remove_known_host_entries": Capability.KNOWN_HOSTS_WRITE,
     "list_keys": Capability.KEYS_READ,
     "delete_key": Capability.KEYS_WRITE,
@@ -717,6 +734,21 @@ class DaemonClient:
         except (TypeError, ValueError):
             self._fail_protocol("The daemon returned an invalid connection-store snapshot")
 
+    def get_connection_reachability(
+        self, request: ConnectionReachabilityRequest
+    ) -> List[ConnectionReachability]:
+        self._require_capability(Capability.CONNECTIONS_READ)
+        result = self._request(
+            "connections.reachability",
+            connection_reachability_request_to_wire(request),
+        )
+        if type(result) is not list:
+            self._fail_protocol("The daemon returned invalid reachability results")
+        try:
+            return [connection_reachability_from_wire(item) for item in result]
+        except (TypeError, ValueError):
+            self._fail_protocol("The daemon returned invalid reachability results")
+
     def get_connection(self, connection_id: ConnectionId) -> ConnectionDetails:
         result = self._request(
             "connections.get",
@@ -875,6 +907,38 @@ class DaemonClient:
         except (TypeError, ValueError):
             self._fail_protocol("The daemon returned an invalid delete result")
 
+    def update_connections(
+        self, request: UpdateConnectionsRequest
+    ) -> ConnectionBatchResult:
+        self._require_write_compatibility("update connections")
+        self._require_capability(Capability.CONNECTIONS_WRITE)
+        if any(item.update.config_patch for item in request.items):
+            self._require_capability(Capability.CONNECTIONS_CONFIG_WRITE)
+        result = self._request(
+            "connections.update_many",
+            update_connections_request_to_wire(request),
+            mutation_description="update connections",
+        )
+        try:
+            return connection_batch_result_from_wire(result)
+        except (TypeError, ValueError):
+            self._fail_protocol("The daemon returned an invalid batch result")
+
+    def delete_connections(
+        self, request: DeleteConnectionsRequest
+    ) -> ConnectionBatchResult:
+        self._require_write_compatibility("delete connections")
+        self._require_capability(Capability.CONNECTIONS_WRITE)
+        result = self._request(
+            "connections.delete_many",
+            delete_connections_request_to_wire(request),
+            mutation_description="delete connections",
+        )
+        try:
+            return connection_batch_result_from_wire(result)
+        except (TypeError, ValueError):
+            self._fail_protocol("The daemon returned an invalid batch result")
+
     def store_connection_password(self, request: StoreConnectionPasswordRequest) -> bool:
         self._require_write_compatibility("store password")
         self._require_capability(Capability.CONNECTIONS_SECRETS_WRITE)
@@ -1201,6 +1265,16 @@ class DaemonClient:
         except (TypeError, ValueError):
             self._fail_protocol("The daemon returned an invalid session summary")
 
+    def prewarm_connection(self, request: PrewarmConnectionRequest) -> bool:
+        self._require_capability(Capability.SESSIONS_WRITE)
+        result = self._request(
+            "sessions.prewarm",
+            prewarm_connection_request_to_wire(request),
+        )
+        if type(result) is not bool:
+            self._fail_protocol("The daemon returned an invalid prewarm result")
+        return result
+
     def list_sessions(self) -> List[SessionSummary]:
         self._require_capability(Capability.SESSIONS_READ)
         result = self._request("sessions.list", {})
@@ -1637,6 +1711,20 @@ class DaemonClient:
         except (TypeError, ValueError):
             self._fail_protocol("The daemon returned an invalid known-hosts snapshot")
 
+    def find_known_host_entries(
+        self,
+        request: FindKnownHostEntriesRequest,
+    ) -> KnownHostsSnapshot:
+        self._require_capability(Capability.KNOWN_HOSTS_READ)
+        result = self._request(
+            "known_hosts.find",
+            find_known_host_entries_request_to_wire(request),
+        )
+        try:
+            return known_hosts_snapshot_from_wire(result)
+        except (TypeError, ValueError):
+            self._fail_protocol("The daemon returned an invalid known-hosts snapshot")
+
     def remove_known_host_entries(
         self,
         request: RemoveKnownHostEntriesRequest,
@@ -13,7 +13,7 @@ from typing import Any, Callable, Deque, Dict, Generic, Mapping, Optional, Tuple
 from ._safe_values import copy_safe_details
 from .models.common import ConnectionId, RequestId, SessionId, utc_now
 from .models.connection_store import ConnectionStoreSnapshot
-from .models.connections import ConnectionSummary
+from .models.connections import ConnectionReachability, ConnectionSummary
 from .models.interactions import InteractionRequest, InteractionSummary
 from .models.operations import ForwardSummary, OperationSummary, SftpServiceSummary
 from .models.broadcast import BroadcastCommandOutput
@@ -33,6 +33,7 @@ class EventType(str, Enum):
     CONNECTION_UPDATED = "connection.updated"
     CONNECTION_DELETED = "connection.deleted"
     CONNECTION_STORE_CHANGED = "connection_store.changed"
+    CONNECTION_REACHABILITY_CHANGED = "connection.reachability_changed"
     SESSION_CREATED = "session.created"
     SESSION_STATE_CHANGED = "session.state_changed"
     SESSION_OUTPUT = "session.output"
@@ -106,6 +107,7 @@ _EVENT_PAYLOAD_TYPES = {
     EventType.CONNECTION_UPDATED: ConnectionSummary,
     EventType.CONNECTION_DELETED: ConnectionSummary,
     EventType.CONNECTION_STORE_CHANGED: ConnectionStoreSnapshot,
+    EventType.CONNECTION_REACHABILITY_CHANGED: ConnectionReachability,
     EventType.SESSION_CREATED: SessionSummary,
     EventType.SESSION_STATE_CHANGED: SessionSummary,
     EventType.SESSION_OUTPUT: TerminalOutput,
@@ -14,6 +14,7 @@ UNSUPPORTED_CLIENT_METHOD_CAPABILITIES = {
     "detach_session": Capability.SESSIONS_WRITE,
     "get_daemon_diagnostics": Capability.DAEMON_STATUS,
     "get_daemon_status": Capability.DAEMON_STATUS,
+    "get_connection_reachability": Capability.CONNECTIONS_READ,
     "get_session": Capability.SESSIONS_READ,
     "get_interaction": Capability.INTERACTIONS_READ,
     "claim_interaction": Capability.INTERACTIONS_RESPOND,
@@ -21,6 +22,7 @@ UNSUPPORTED_CLIENT_METHOD_CAPABILITIES = {
     "list_interactions": Capability.INTERACTIONS_READ,
     "list_sessions": Capability.SESSIONS_READ,
     "open_session": Capability.SESSIONS_WRITE,
+    "prewarm_connection": Capability.SESSIONS_WRITE,
     "release_terminal_input": Capability.TERMINAL_INPUT,
     "replay_terminal": Capability.TERMINAL_REPLAY,
     "resize_terminal": Capability.TERMINAL_RESIZE,
@@ -32,6 +32,8 @@ from .connection_store import (
 from .connections import (
     AssignConnectionToGroupRequest,
     AuthenticationMethod,
+    ConnectionBatchItemResult,
+    ConnectionBatchResult,
     ConnectionDetails,
     ConnectionEditorCapabilities,
     ConnectionEditorDetails,
@@ -40,7 +42,10 @@ from .connections import (
     UnsavedHostCheckResult,
     ConnectionHealth,
     ConnectionMutationResult,
+    ConnectionReachability,
+    ConnectionReachabilityRequest,
     ConnectionSummary,
+    ConnectionUpdateItem,
     ConnectionValidationError,
     ConnectionValidationResult,
     CreateConnectionRequest,
@@ -48,6 +53,7 @@ from .connections import (
     DeleteConnectionRequest,
     DeleteConnectionResult,
     DeleteConnectionPasswordRequest,
+    DeleteConnectionsRequest,
     DeleteGroupRequest,
     DeleteKeyPassphraseRequest,
     DeletePluginSecretRequest,
@@ -68,11 +74,14 @@ from .connections import (
     UNSET,
     UpdateConnectionMetadataRequest,
     UpdateConnectionRequest,
+    UpdateConnectionsRequest,
     forwarding_rule_from_dict,
     forwarding_rule_to_dict,
     validate_config_patch,
 )
 from .daemon import (
+    ConnectionStartupPercentiles,
+    ControlMasterPrewarmStats,
     DaemonDiagnostics,
     DaemonDisconnectReason,
     DaemonIdleInfo,
@@ -82,7 +91,9 @@ from .daemon import (
     DaemonStatus,
     DaemonStopResult,
     RestartDaemonRequest,
+    SecretCacheStats,
     SetDaemonLogLevelRequest,
+    StartupStagePercentiles,
     OperationMode,
     OperationModeFiles,
     OperationModeResult,
@@ -148,6 +159,7 @@ from .identity import (
     UpdateIdentitySelectionRequest,
 )
 from .known_hosts import (
+    FindKnownHostEntriesRequest,
     KnownHostEntryId,
     KnownHostEntrySummary,
     KnownHostsMutationResult,
@@ -160,6 +172,8 @@ from .operations import (
     CloseForwardRequest,
     CloseSftpRequest,
     FileEntryKind,
+    ForwardHealth,
+    ForwardHealthStatus,
     ForwardKind,
     ForwardState,
     ForwardSummary,
@@ -218,9 +232,12 @@ from .sessions import (
     DetachSessionRequest,
     InputOwner,
     OpenSessionRequest,
+    PrewarmConnectionRequest,
+    PrewarmReason,
     SessionCapabilities,
     SessionExitInfo,
     SessionFailure,
+    SessionStartupTiming,
     SessionState,
     SessionSummary,
 )
@@ -305,6 +322,8 @@ __all__ = [
     "CloseSftpRequest",
     "CompatibilityResult",
     "ConfirmationPrompt",
+    "ConnectionBatchItemResult",
+    "ConnectionBatchResult",
     "ConnectionDetails",
     "ConnectionEditorCapabilities",
     "ConnectionEditorDetails",
@@ -313,10 +332,15 @@ __all__ = [
     "ConnectionMetadataSummary",
     "ConnectionMutationResult",
     "ConnectionPlacementMode",
+    "ConnectionReachability",
+    "ConnectionReachabilityRequest",
+    "ConnectionStartupPercentiles",
     "ConnectionStoreSnapshot",
     "ConnectionSummary",
+    "ConnectionUpdateItem",
     "ConnectionValidationError",
     "ConnectionValidationResult",
+    "ControlMasterPrewarmStats",
     "CopyConnectionToGroupRequest",
     "CoreInfo",
     "CreateConnectionRequest",
@@ -332,6 +356,7 @@ __all__ = [
     "DeleteConnectionPasswordRequest",
     "DeleteConnectionRequest",
     "DeleteConnectionResult",
+    "DeleteConnectionsRequest",
     "DeleteGroupRequest",
     "DeleteKeyPassphraseRequest",
     "DeleteKeyRequest",
@@ -343,6 +368,9 @@ __all__ = [
     "ExecutionInteractionMode",
     "ExternalTerminalLaunchSpec",
     "FileEntryKind",
+    "FindKnownHostEntriesRequest",
+    "ForwardHealth",
+    "ForwardHealthStatus",
     "ForwardId",
     "ForwardKind",
     "ForwardState",
@@ -411,6 +439,8 @@ __all__ = [
     "PluginOperationResult",
     "PortForwardSummary",
     "PresencePrompt",
+    "PrewarmConnectionRequest",
+    "PrewarmReason",
     "PublicKeyResult",
     "RbwStatus",
     "ReadPublicKeyRequest",
@@ -434,6 +464,7 @@ __all__ = [
     "SecretBackendDescriptor",
     "SecretBackendRegistry",
     "SecretBackendState",
+    "SecretCacheStats",
     "SecretConfiguration",
     "SecretDecision",
     "SecretOperationResult",
@@ -445,6 +476,7 @@ __all__ = [
     "SessionExitInfo",
     "SessionFailure",
     "SessionId",
+    "SessionStartupTiming",
     "SessionState",
     "SessionSummary",
     "SetDaemonLogLevelRequest",
@@ -474,6 +506,7 @@ __all__ = [
     "SshConfigText",
     "StartScpTransferRequest",
     "StartTransferRequest",
+    "StartupStagePercentiles",
     "StopDaemonRequest",
     "StoreConnectionPasswordRequest",
     "StoreKeyPassphraseRequest",
@@ -493,6 +526,7 @@ __all__ = [
     "UnsavedHostCheckResult",
     "UpdateConnectionMetadataRequest",
     "UpdateConnectionRequest",
+    "UpdateConnectionsRequest",
     "UpdateGlobalSshOverridesRequest",
     "UpdateIdentityConfigurationRequest",
     "UpdateIdentitySelectionRequest",
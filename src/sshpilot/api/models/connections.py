@@ -2,13 +2,17 @@
 
 import re
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
+from math import isfinite
 from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple, Union
 
 from .common import ConnectionId, SessionId, require_identifier, validate_ssh_host_alias
 from .connection_store import validate_safe_metadata
 
 MAX_DISPLAY_NAME_LENGTH = 512
+MAX_SSH_BANNER_LENGTH = 255
+MAX_REACHABILITY_HINT_CONNECTIONS = 4096
 
 
 # -- Patch sentinels --------------------------------------------------------
@@ -264,6 +268,84 @@ class ConnectionDetails(ConnectionSummary):
             raise ValueError("forwarding rule count must not be negative")
 
 
+# -- Reachability -----------------------------------------------------------
+
+@dataclass(frozen=True)
+class ConnectionReachability:
+    """Daemon TCP probes of one connection's SSH endpoint.
+
+    ``health`` is ``reachable`` after a successful connect and
+    ``unreachable`` after consecutive failures; a single failure leaves it
+    unchanged. RTT percentiles are nearest-rank over recent successful
+    probes. ``ssh_banner`` is the server identification line when banner
+    reads were requested.
+    """
+
+    connection_id: ConnectionId
+    health: ConnectionHealth = ConnectionHealth.UNKNOWN
+    probes: int = 0
+    consecutive_failures: int = 0
+    last_checked_at: Optional[datetime] = None
+    last_seen_at: Optional[datetime] = None
+    rtt_p50_ms: Optional[float] = None
+    rtt_p90_ms: Optional[float] = None
+    rtt_max_ms: Optional[float] = None
+    ssh_banner: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        require_identifier(self.connection_id, "connection id")
+        if not isinstance(self.health, ConnectionHealth):
+            raise TypeError("connection health must be a ConnectionHealth")
+        for name in ("probes", "consecutive_failures"):
+            value = getattr(self, name)
+            if type(value) is not int or value < 0:
+                raise ValueError(f"reachability {name} must be a non-negative int")
+        if self.consecutive_failures > self.probes:
+            raise ValueError("reachability failures exceed the probe count")
+        for name in ("last_checked_at", "last_seen_at"):
+            value = getattr(self, name)
+            if value is not None and (type(value) is not datetime or value.tzinfo is None):
+                raise ValueError(f"reachability {name} must be timezone-aware or None")
+        rtts = (self.rtt_p50_ms, self.rtt_p90_ms, self.rtt_max_ms)
+        if (None in rtts) != all(value is None for value in rtts):
+            raise ValueError("reachability RTT percentiles are set together")
+        for value in rtts:
+            if value is not None and (
+                type(value) not in (int, float) or not isfinite(value) or value < 0
+            ):
+                raise ValueError("reachability RTT must be a non-negative number")
+        if None not in rtts and not self.rtt_p50_ms <= self.rtt_p90_ms <= self.rtt_max_ms:
+            raise ValueError("reachability RTT percentiles must be ordered")
+        if self.ssh_banner is not None and (
+            type(self.ssh_banner) is not str
+            or not self.ssh_banner.isprintable()
+            or len(self.ssh_banner) > MAX_SSH_BANNER_LENGTH
+        ):
+            raise ValueError("SSH banner must be a short printable string or None")
+
+
+@dataclass(frozen=True)
+class ConnectionReachabilityRequest:
+    """Connections the list is showing now; they are probed most often.
+
+    Each request also keeps background probing alive: the daemon stops
+    probing once clients stop asking.
+    """
+
+    visible_connection_ids: Tuple[ConnectionId, ...] = ()
+    read_ssh_banner: bool = False
+
+    def __post_init__(self) -> None:
+        if type(self.visible_connection_ids) is not tuple:
+            raise TypeError("visible connection ids must be a tuple")
+        if len(self.visible_connection_ids) > MAX_REACHABILITY_HINT_CONNECTIONS:
+            raise ValueError("too many visible connection ids")
+        for connection_id in self.visible_connection_ids:
+            require_identifier(connection_id, "connection id")
+        if type(self.read_ssh_banner) is not bool:
+            raise TypeError("read_ssh_banner must be a boolean")
+
+
 # -- Editor capabilities and details ----------------------------------------
 
 @dataclass(frozen=True)
@@ -687,6 +769,105 @@ class DeleteConnectionResult:
             raise TypeError("connection deleted result must be a boolean")
 
 
+def _require_unique_connection_ids(connection_ids: Tuple[ConnectionId, ...]) -> None:
+    if type(connection_ids) is not tuple or not connection_ids:
+        raise ValueError("connection ids must be a non-empty tuple")
+    for connection_id in connection_ids:
+        require_identifier(connection_id, "connection id")
+    if len(set(connection_ids)) != len(connection_ids):
+        raise ValueError("connection ids must be unique")
+
+
+@dataclass(frozen=True)
+class ConnectionUpdateItem:
+    """One connection patch inside an :class:`UpdateConnectionsRequest`."""
+
+    connection_id: ConnectionId
+    update: UpdateConnectionRequest
+
+    def __post_init__(self) -> None:
+        require_identifier(self.connection_id, "connection id")
+        if type(self.update) is not UpdateConnectionRequest:
+            raise TypeError("connection update item requires an UpdateConnectionRequest")
+
+
+@dataclass(frozen=True)
+class UpdateConnectionsRequest:
+    """Patch several connections in one daemon transaction.
+
+    Items are applied in order.  An item that fails validation or hits a
+    stale generation is reported in the result and does not prevent the
+    remaining items from being committed.
+    """
+
+    items: Tuple[ConnectionUpdateItem, ...]
+
+    def __post_init__(self) -> None:
+        if type(self.items) is not tuple:
+            raise TypeError("connection update items must be a tuple")
+        if any(type(item) is not ConnectionUpdateItem for item in self.items):
+            raise TypeError("connection update items must be ConnectionUpdateItem")
+        _require_unique_connection_ids(
+            tuple(item.connection_id for item in self.items)
+        )
+
+
+@dataclass(frozen=True)
+class DeleteConnectionsRequest:
+    """Delete several connections in one daemon transaction."""
+
+    connection_ids: Tuple[ConnectionId, ...]
+
+    def __post_init__(self) -> None:
+        _require_unique_connection_ids(self.connection_ids)
+
+
+@dataclass(frozen=True)
+class ConnectionBatchItemResult:
+    """Per-item outcome of a batch connection mutation.
+
+    A failed item carries the stable :class:`~sshpilot.api.errors.ErrorCode`
+    value and frontend-safe message it would have raised on its own.
+    """
+
+    connection_id: ConnectionId
+    succeeded: bool
+    error_code: str = ""
+    error_message: str = ""
+
+    def __post_init__(self) -> None:
+        require_identifier(self.connection_id, "connection id")
+        if type(self.succeeded) is not bool:
+            raise TypeError("batch item succeeded flag must be a boolean")
+        if type(self.error_code) is not str or type(self.error_message) is not str:
+            raise TypeError("batch item error fields must be strings")
+        if self.succeeded and (self.error_code or self.error_message):
+            raise ValueError("a succeeded batch item must not carry an error")
+        if not self.succeeded and not self.error_code.strip():
+            raise ValueError("a failed batch item requires an error code")
+
+
+@dataclass(frozen=True)
+class ConnectionBatchResult:
+    """Committed outcome of a batch connection mutation, in request order."""
+
+    items: Tuple[ConnectionBatchItemResult, ...]
+
+    def __post_init__(self) -> None:
+        if type(self.items) is not tuple:
+            raise TypeError("batch result items must be a tuple")
+        if any(type(item) is not ConnectionBatchItemResult for item in self.items):
+            raise TypeError("batch result items must be ConnectionBatchItemResult")
+
+    @property
+    def succeeded_ids(self) -> Tuple[ConnectionId, ...]:
+        return tuple(item.connection_id for item in self.items if item.succeeded)
+
+    @property
+    def failed(self) -> Tuple[ConnectionBatchItemResult, ...]:
+        return tuple(item for item in self.items if not item.succeeded)
+
+
 @dataclass(frozen=True)
 class SplitConnectionRequest:
     """Split a connection out of a multi-host SSH config block.
@@ -7,7 +7,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Mapping, Optional, Tuple
 
-from .common import require_identifier, utc_now
+from .common import ConnectionId, require_identifier, utc_now
+from .sessions import SESSION_STARTUP_STAGES
 
 
 class DaemonLogLevel(str, Enum):
@@ -278,6 +279,133 @@ class DaemonStatus:
             raise TypeError("restart_requested must be a boolean")
 
 
+@dataclass(frozen=True)
+class ControlMasterPrewarmStats:
+    """How often launches found a warm ControlMaster.
+
+    A *hit* is an SSH launch that found a live master for its host and so
+    skipped the TCP, key exchange and authentication round trips; a *miss*
+    had to build one. ``prewarmed_hits`` counts the hits whose master the
+    prewarm scheduler established.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    prewarmed_hits: int = 0
+    prewarms_started: int = 0
+    prewarms_succeeded: int = 0
+    prewarms_failed: int = 0
+    prewarms_skipped: int = 0
+
+    def __post_init__(self) -> None:
+        for name in (
+            "hits",
+            "misses",
+            "prewarmed_hits",
+            "prewarms_started",
+            "prewarms_succeeded",
+            "prewarms_failed",
+            "prewarms_skipped",
+        ):
+            value = getattr(self, name)
+            if type(value) is not int or value < 0:
+                raise ValueError(f"{name} must be a non-negative int")
+        if self.prewarmed_hits > self.hits:
+            raise ValueError("prewarmed_hits cannot exceed hits")
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Fraction of measured launches that found a live master."""
+        measured = self.hits + self.misses
+        return self.hits / measured if measured else None
+
+
+@dataclass(frozen=True)
+class SecretCacheStats:
+    """How often stored-secret lookups were answered without a backend call.
+
+    A *hit* was served from the daemon's secret cache; a *miss* called the
+    selected backend; a *coalesced* lookup waited for a concurrent miss of
+    the same secret instead of starting its own. ``locked_entries`` counts
+    the cached values held in ``mlock``'d memory.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+    entries: int = 0
+    locked_entries: int = 0
+
+    def __post_init__(self) -> None:
+        for name in (
+            "hits",
+            "misses",
+            "coalesced",
+            "invalidations",
+            "evictions",
+            "entries",
+            "locked_entries",
+        ):
+            value = getattr(self, name)
+            if type(value) is not int or value < 0:
+                raise ValueError(f"{name} must be a non-negative int")
+        if self.locked_entries > self.entries:
+            raise ValueError("locked_entries cannot exceed entries")
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Fraction of lookups that did not start a backend call."""
+        measured = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / measured if measured else None
+
+
+@dataclass(frozen=True)
+class StartupStagePercentiles:
+    """Rolling percentiles of one startup stage, in milliseconds."""
+
+    stage: str
+    samples: int
+    p50_ms: float
+    p90_ms: float
+    max_ms: float
+
+    def __post_init__(self) -> None:
+        if self.stage not in SESSION_STARTUP_STAGES:
+            raise ValueError("unknown session startup stage")
+        if type(self.samples) is not int or self.samples < 1:
+            raise ValueError("stage percentiles need at least one sample")
+        for name in ("p50_ms", "p90_ms", "max_ms"):
+            value = getattr(self, name)
+            if type(value) not in (int, float) or value < 0:
+                raise ValueError(f"{name} must be a non-negative number")
+        if not self.p50_ms <= self.p90_ms <= self.max_ms:
+            raise ValueError("stage percentiles must be ordered")
+
+
+@dataclass(frozen=True)
+class ConnectionStartupPercentiles:
+    """Session startup timing of the recent launches of one connection.
+
+    Stages follow :class:`~sshpilot.api.models.sessions.SessionStartupTiming`;
+    a stage no recent launch reached is omitted.
+    """
+
+    connection_id: ConnectionId
+    launches: int
+    stages: Tuple[StartupStagePercentiles, ...] = ()
+
+    def __post_init__(self) -> None:
+        require_identifier(self.connection_id, "connection id")
+        if type(self.launches) is not int or self.launches < 1:
+            raise ValueError("launches must be a positive int")
+        if type(self.stages) is not tuple or any(
+            type(item) is not StartupStagePercentiles for item in self.stages
+        ):
+            raise TypeError("stages must be a tuple of StartupStagePercentiles")
+
+
 @dataclass(frozen=True)
 class DaemonDiagnostics:
     status: DaemonStatus
@@ -288,6 +416,9 @@ class DaemonDiagnostics:
     rss_bytes: Optional[int] = None
     socket_bound: bool = True
     keep_alive_lease: bool = False
+    control_master_prewarm: Optional[ControlMasterPrewarmStats] = None
+    session_startup: Tuple[ConnectionStartupPercentiles, ...] = ()
+    secret_cache: Optional[SecretCacheStats] = None
 
     def __post_init__(self) -> None:
         if type(self.status) is not DaemonStatus:
@@ -315,6 +446,16 @@ class DaemonDiagnostics:
             raise TypeError("socket_bound must be a boolean")
         if type(self.keep_alive_lease) is not bool:
             raise TypeError("keep_alive_lease must be a boolean")
+        if self.control_master_prewarm is not None and (
+            type(self.control_master_prewarm) is not ControlMasterPrewarmStats
+        ):
+            raise TypeError("control_master_prewarm must be ControlMasterPrewarmStats or None")
+        if type(self.session_startup) is not tuple or any(
+            type(item) is not ConnectionStartupPercentiles for item in self.session_startup
+        ):
+            raise TypeError("session_startup must be a tuple of ConnectionStartupPercentiles")
+        if self.secret_cache is not None and type(self.secret_cache) is not SecretCacheStats:
+            raise TypeError("secret_cache must be SecretCacheStats or None")
 
 
 @dataclass(frozen=True)
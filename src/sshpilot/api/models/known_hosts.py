@@ -53,6 +53,26 @@ class KnownHostsSnapshot:
                 raise TypeError("known-hosts entries must be KnownHostEntrySummary")
 
 
+@dataclass(frozen=True)
+class FindKnownHostEntriesRequest:
+    """Look up the entries ``ssh`` would consult for one host and port.
+
+    The daemon also matches hashed ``|1|salt|hash`` names, so a result may
+    include lines whose display text never mentions the host.
+    """
+
+    host: str
+    port: int = 22
+
+    def __post_init__(self) -> None:
+        if type(self.host) is not str or not self.host.strip():
+            raise ValueError("known-hosts lookup host must be a non-empty string")
+        if "\x00" in self.host or any(char.isspace() for char in self.host):
+            raise ValueError("known-hosts lookup host must not contain whitespace or NUL")
+        if type(self.port) is not int or not 1 <= self.port <= 65535:
+            raise ValueError("known-hosts lookup port must be an integer 1-65535")
+
+
 @dataclass(frozen=True)
 class RemoveKnownHostEntriesRequest:
     """Batch removal against one loaded revision of the document."""
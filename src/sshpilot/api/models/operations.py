@@ -501,6 +501,65 @@ class ForwardState(str, Enum):
     STOPPED = "stopped"
 
 
+class ForwardHealthStatus(str, Enum):
+    """Probe verdict for an ``ACTIVE`` forward, independent of its state."""
+
+    UNKNOWN = "unknown"
+    HEALTHY = "healthy"
+    DEGRADED = "degraded"
+
+
+# Upper bounds (inclusive) of the probe latency histogram buckets; one more
+# bucket counts everything slower than the last bound.
+FORWARD_PROBE_LATENCY_BUCKETS_MS = (1.0, 5.0, 25.0, 100.0, 500.0, 2000.0)
+
+
+@dataclass(frozen=True)
+class ForwardHealth:
+    """Daemon health probes of one local or dynamic forward.
+
+    ``latency_histogram`` counts successful probes per
+    :data:`FORWARD_PROBE_LATENCY_BUCKETS_MS` bucket plus a final overflow
+    bucket. Failed probes count in ``failures`` only. ``restarts`` is how
+    often the daemon replaced the ssh process of a degraded forward.
+    """
+
+    status: ForwardHealthStatus = ForwardHealthStatus.UNKNOWN
+    probes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_probe_at: Optional[datetime] = None
+    last_latency_ms: Optional[float] = None
+    latency_histogram: Tuple[int, ...] = (0,) * (len(FORWARD_PROBE_LATENCY_BUCKETS_MS) + 1)
+    restarts: int = 0
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.status, ForwardHealthStatus):
+            raise TypeError("forward health status must be a ForwardHealthStatus")
+        for name in ("probes", "failures", "consecutive_failures", "restarts"):
+            value = getattr(self, name)
+            if type(value) is not int or value < 0:
+                raise ValueError(f"forward health {name} must be a non-negative int")
+        if self.failures > self.probes or self.consecutive_failures > self.failures:
+            raise ValueError("forward health failure counts exceed the probe count")
+        if self.last_probe_at is not None and (
+            type(self.last_probe_at) is not datetime or self.last_probe_at.tzinfo is None
+        ):
+            raise ValueError("forward health last_probe_at must be timezone-aware or None")
+        if self.last_latency_ms is not None and (
+            type(self.last_latency_ms) not in (int, float)
+            or not isfinite(self.last_latency_ms)
+            or self.last_latency_ms < 0
+        ):
+            raise ValueError("forward health latency must be a non-negative number")
+        if type(self.latency_histogram) is not tuple or len(self.latency_histogram) != (
+            len(FORWARD_PROBE_LATENCY_BUCKETS_MS) + 1
+        ):
+            raise ValueError("forward health histogram has the wrong number of buckets")
+        if any(type(count) is not int or count < 0 for count in self.latency_histogram):
+            raise ValueError("forward health histogram counts must be non-negative ints")
+
+
 @dataclass(frozen=True)
 class ForwardSummary:
     id: ForwardId
@@ -518,6 +577,8 @@ class ForwardSummary:
     failure: Optional[ServiceFailure] = None
     # Optional link to a terminal session when the forward is terminal-bound.
     session_id: Optional[SessionId] = None
+    # Probe results while ACTIVE; None for remote forwards and other states.
+    health: Optional[ForwardHealth] = None
 
     def __post_init__(self) -> None:
         require_identifier(self.id, "forward id")
@@ -554,6 +615,8 @@ class ForwardSummary:
             raise TypeError("forward failure must be ServiceFailure or None")
         if self.session_id is not None:
             require_identifier(self.session_id, "session id")
+        if self.health is not None and type(self.health) is not ForwardHealth:
+            raise TypeError("forward health must be ForwardHealth or None")
 
 
 @dataclass(frozen=True)
@@ -1,5 +1,6 @@
 """Frontend-neutral session lifecycle models for Protocol v1."""
 
+import math
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -93,6 +94,56 @@ class SessionFailure:
         require_identifier(self.message, "session failure message")
 
 
+# Startup milestones in launch order, then the time spent inside askpass
+# round trips and stored-secret lookups (which overlap the milestones).
+SESSION_STARTUP_MILESTONES = (
+    "command_ready",
+    "spawned",
+    "first_output",
+    "authenticated",
+    "first_prompt",
+)
+SESSION_STARTUP_STAGES = SESSION_STARTUP_MILESTONES + ("secret_lookup", "askpass")
+
+
+@dataclass(frozen=True)
+class SessionStartupTiming:
+    """Where the time to a usable prompt went for one session launch.
+
+    Milestones are milliseconds since the daemon started the launch:
+    ``command_ready`` (argv, effective config and askpass wiring prepared),
+    ``spawned`` (the SSH client exec'd), ``first_output`` (first PTY byte),
+    ``authenticated`` (OpenSSH diagnostics or terminal evidence proved
+    authentication) and ``first_prompt`` (first shell-prompt-like output).
+    ``None`` is a milestone not reached (yet). ``secret_lookup_ms`` and
+    ``askpass_ms`` are totals across the launch, including any time a user
+    spent answering a prompt.
+    """
+
+    command_ready_ms: Optional[float] = None
+    spawned_ms: Optional[float] = None
+    first_output_ms: Optional[float] = None
+    authenticated_ms: Optional[float] = None
+    first_prompt_ms: Optional[float] = None
+    secret_lookup_ms: float = 0.0
+    askpass_ms: float = 0.0
+    askpass_requests: int = 0
+
+    def __post_init__(self) -> None:
+        for stage in SESSION_STARTUP_STAGES:
+            value = getattr(self, f"{stage}_ms")
+            if value is None and stage in SESSION_STARTUP_MILESTONES:
+                continue
+            if (
+                type(value) not in (int, float)
+                or not math.isfinite(value)
+                or value < 0
+            ):
+                raise ValueError(f"{stage}_ms must be a non-negative number")
+        if type(self.askpass_requests) is not int or self.askpass_requests < 0:
+            raise ValueError("askpass_requests must be a non-negative int")
+
+
 @dataclass(frozen=True)
 class SessionSummary:
     id: SessionId
@@ -104,6 +155,7 @@ class SessionSummary:
     exit_info: Optional[SessionExitInfo] = None
     failure: Optional[SessionFailure] = None
     attachment_count: int = 0
+    startup_timing: Optional[SessionStartupTiming] = None
 
     def __post_init__(self) -> None:
         require_identifier(self.id, "session id")
@@ -122,6 +174,11 @@ class SessionSummary:
             raise TypeError("session failure must be SessionFailure or None")
         if type(self.attachment_count) is not int or self.attachment_count < 0:
             raise ValueError("session attachment count must not be negative")
+        if (
+            self.startup_timing is not None
+            and type(self.startup_timing) is not SessionStartupTiming
+        ):
+            raise TypeError("session startup timing must be SessionStartupTiming or None")
 
 
 @dataclass(frozen=True)
@@ -193,6 +250,26 @@ class DetachSessionRequest:
         require_identifier(self.attachment_id, "attachment id")
 
 
+class PrewarmReason(str, Enum):
+    """What in the frontend suggested a connection is about to be opened."""
+
+    HOVER = "hover"
+    SELECTION = "selection"
+
+
+@dataclass(frozen=True)
+class PrewarmConnectionRequest:
+    """Ask the daemon to establish a ControlMaster ahead of a launch."""
+
+    connection_id: ConnectionId
+    reason: PrewarmReason = PrewarmReason.SELECTION
+
+    def __post_init__(self) -> None:
+        require_identifier(self.connection_id, "connection id")
+        if type(self.reason) is not PrewarmReason:
+            raise TypeError("prewarm reason must be PrewarmReason")
+
+
 @dataclass(frozen=True)
 class CloseSessionRequest:
     session_id: SessionId
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from datetime import datetime, timezone
 from typing import AbstractSet, Any, Dict, Iterable, Mapping, Optional, Union
 
@@ -40,6 +41,7 @@ from ..models.interactions import (
     SecretDecision,
 )
 from ..models.known_hosts import (
+    FindKnownHostEntriesRequest,
     KnownHostEntryId,
     KnownHostEntrySummary,
     KnownHostsMutationResult,
@@ -82,6 +84,8 @@ from ..models.connections import (
     EDITABLE_CONFIG_FIELDS,
     AuthenticationMethod,
     AssignConnectionToGroupRequest,
+    ConnectionBatchItemResult,
+    ConnectionBatchResult,
     ConnectionDetails,
     ConnectionEditorCapabilities,
     ConnectionEditorDetails,
@@ -89,7 +93,10 @@ from ..models.connections import (
     UnsavedHostCheckRequest,
     UnsavedHostCheckResult,
     ConnectionHealth,
+    ConnectionReachability,
+    ConnectionReachabilityRequest,
     ConnectionSummary,
+    ConnectionUpdateItem,
     ConnectionValidationError,
     ConnectionValidationResult,
     CreateConnectionRequest,
@@ -97,6 +104,7 @@ from ..models.connections import (
     DeleteConnectionPasswordRequest,
     DeleteConnectionRequest,
     DeleteConnectionResult,
+    DeleteConnectionsRequest,
     DeleteGroupRequest,
     ForwardingRule,
     GroupReference,
@@ -112,8 +120,11 @@ from ..models.connections import (
     UNSET,
     UpdateConnectionMetadataRequest,
     UpdateConnectionRequest,
+    UpdateConnectionsRequest,
 )
 from ..models.daemon import (
+    ConnectionStartupPercentiles,
+    ControlMasterPrewarmStats,
     DaemonDiagnostics,
     DaemonIdleInfo,
     DaemonLifecycleState,
@@ -122,11 +133,13 @@ from ..models.daemon import (
     DaemonStatus,
     DaemonStopResult,
     RestartDaemonRequest,
+    SecretCacheStats,
     SetDaemonLogLevelRequest,
     OperationMode,
     OperationModeFiles,
     OperationModeResult,
     SetOperationModeRequest,
+    StartupStagePercentiles,
     StopDaemonRequest,
 )
 from ..models.sessions import (
@@ -137,9 +150,14 @@ from ..models.sessions import (
     DetachSessionRequest,
     InputOwner,
     OpenSessionRequest,
+    PrewarmConnectionRequest,
+    PrewarmReason,
     SessionCapabilities,
     SessionExitInfo,
+    SESSION_STARTUP_MILESTONES,
+    SESSION_STARTUP_STAGES,
     SessionFailure,
+    SessionStartupTiming,
     SessionState,
     SessionSummary,
 )
@@ -158,6 +176,9 @@ from ..models.operations import (
     AttachSftpRequest,
     ClaimForwardRequest,
     CloseSftpRequest,
+    FORWARD_PROBE_LATENCY_BUCKETS_MS,
+    ForwardHealth,
+    ForwardHealthStatus,
     ForwardSummary,
     ForwardType,
     ForwardState,
@@ -462,6 +483,9 @@ _CONNECTION_EVENT_TYPES = frozenset(
         EventType.CONNECTION_STORE_CHANGED,
     }
 )
+_CONNECTION_REACHABILITY_EVENT_TYPES = frozenset(
+    {EventType.CONNECTION_REACHABILITY_CHANGED}
+)
 _SESSION_EVENT_TYPES = frozenset(
     {
         EventType.SESSION_CREATED,
@@ -518,6 +542,7 @@ _OPERATION_EVENT_TYPES = frozenset(
 _BROADCAST_EVENT_TYPES = frozenset({EventType.BROADCAST_OUTPUT})
 _FORWARDED_EVENT_TYPES = (
     _CONNECTION_EVENT_TYPES
+    | _CONNECTION_REACHABILITY_EVENT_TYPES
     | _SESSION_EVENT_TYPES
     | _INTERACTION_EVENT_TYPES
     | _SFTP_EVENT_TYPES
@@ -548,6 +573,10 @@ def public_event_to_envelope(
             if type(event.payload) is not ConnectionSummary:
                 raise TypeError("connection event payload must be ConnectionSummary")
             payload = connection_summary_to_wire(event.payload)
+    elif event.type in _CONNECTION_REACHABILITY_EVENT_TYPES:
+        if type(event.payload) is not ConnectionReachability:
+            raise TypeError("reachability event payload must be ConnectionReachability")
+        payload = connection_reachability_to_wire(event.payload)
     elif event.type in _INTERACTION_EVENT_TYPES:
         if type(event.payload) is not InteractionSummary:
             raise TypeError("interaction event payload must be InteractionSummary")
@@ -632,6 +661,14 @@ def public_event_from_envelope(envelope: EventEnvelope) -> CoreEvent:
             sequence=envelope.sequence,
             connection_id=summary.id,
         )
+    if event_type in _CONNECTION_REACHABILITY_EVENT_TYPES:
+        reachability = connection_reachability_from_wire(dict(envelope.payload))
+        return CoreEvent(
+            type=event_type,
+            payload=reachability,
+            sequence=envelope.sequence,
+            connection_id=reachability.connection_id,
+        )
     if event_type in _INTERACTION_EVENT_TYPES:
         summary = interaction_summary_from_wire(dict(envelope.payload))
         return CoreEvent(
@@ -812,6 +849,28 @@ def known_hosts_snapshot_from_wire(value: Any) -> KnownHostsSnapshot:
     )
 
 
+def find_known_host_entries_request_to_wire(
+    request: FindKnownHostEntriesRequest,
+) -> Dict[str, Any]:
+    if type(request) is not FindKnownHostEntriesRequest:
+        raise TypeError("find known-hosts entries request is required")
+    return {"host": request.host, "port": request.port}
+
+
+def find_known_host_entries_request_from_wire(
+    value: Any,
+) -> FindKnownHostEntriesRequest:
+    data = _strict_fields(
+        value,
+        required={"host", "port"},
+        context="find known-hosts entries request",
+    )
+    return FindKnownHostEntriesRequest(
+        host=_text(data["host"], "known-hosts lookup host"),
+        port=_integer(data["port"], "known-hosts lookup port"),
+    )
+
+
 def remove_known_host_entries_request_to_wire(
     request: RemoveKnownHostEntriesRequest,
 ) -> Dict[str, Any]:
@@ -2457,6 +2516,234 @@ def delete_connection_result_from_wire(value: Any) -> DeleteConnectionResult:
     )
 
 
+def update_connections_request_to_wire(
+    request: UpdateConnectionsRequest,
+) -> Dict[str, Any]:
+    if type(request) is not UpdateConnectionsRequest:
+        raise TypeError("update connections request is required")
+    return {
+        "items": [
+            {
+                "connection_id": item.connection_id,
+                "update": update_connection_request_to_wire(item.update),
+            }
+            for item in request.items
+        ]
+    }
+
+
+def update_connections_request_from_wire(value: Any) -> UpdateConnectionsRequest:
+    data = _strict_fields(
+        value,
+        required={"items"},
+        context="update connections request",
+    )
+    items = data["items"]
+    if type(items) is not list:
+        raise ValueError("connection update items must be an array")
+    decoded = []
+    for item in items:
+        fields = _strict_fields(
+            item,
+            required={"connection_id", "update"},
+            context="connection update item",
+        )
+        decoded.append(
+            ConnectionUpdateItem(
+                connection_id=ConnectionId(
+                    _identifier(fields["connection_id"], "connection id")
+                ),
+                update=update_connection_request_from_wire(fields["update"]),
+            )
+        )
+    return UpdateConnectionsRequest(items=tuple(decoded))
+
+
+def delete_connections_request_to_wire(
+    request: DeleteConnectionsRequest,
+) -> Dict[str, Any]:
+    if type(request) is not DeleteConnectionsRequest:
+        raise TypeError("delete connections request is required")
+    return {"connection_ids": list(request.connection_ids)}
+
+
+def delete_connections_request_from_wire(value: Any) -> DeleteConnectionsRequest:
+    data = _strict_fields(
+        value,
+        required={"connection_ids"},
+        context="delete connections request",
+    )
+    ids = data["connection_ids"]
+    if type(ids) is not list:
+        raise ValueError("connection ids must be an array")
+    return DeleteConnectionsRequest(
+        connection_ids=tuple(
+            ConnectionId(_identifier(item, "connection id")) for item in ids
+        )
+    )
+
+
+def connection_reachability_to_wire(
+    reachability: ConnectionReachability,
+) -> Dict[str, Any]:
+    if type(reachability) is not ConnectionReachability:
+        raise TypeError("connection reachability is required")
+    return {
+        "connection_id": reachability.connection_id,
+        "health": reachability.health.value,
+        "probes": reachability.probes,
+        "consecutive_failures": reachability.consecutive_failures,
+        "last_checked_at": _optional_datetime_to_wire(
+            reachability.last_checked_at, "reachability check time"
+        ),
+        "last_seen_at": _optional_datetime_to_wire(
+            reachability.last_seen_at, "reachability last seen time"
+        ),
+        "rtt_p50_ms": reachability.rtt_p50_ms,
+        "rtt_p90_ms": reachability.rtt_p90_ms,
+        "rtt_max_ms": reachability.rtt_max_ms,
+        "ssh_banner": reachability.ssh_banner,
+    }
+
+
+def connection_reachability_from_wire(value: Any) -> ConnectionReachability:
+    data = _strict_fields(
+        value,
+        required={
+            "connection_id",
+            "health",
+            "probes",
+            "consecutive_failures",
+            "last_checked_at",
+            "last_seen_at",
+            "rtt_p50_ms",
+            "rtt_p90_ms",
+            "rtt_max_ms",
+            "ssh_banner",
+        },
+        context="connection reachability",
+    )
+    try:
+        health = ConnectionHealth(data["health"])
+    except (TypeError, ValueError):
+        raise ValueError("connection reachability contains unknown health state") from None
+    rtts = {
+        name: (
+            _milliseconds(data[name], f"reachability {name}")
+            if data[name] is not None
+            else None
+        )
+        for name in ("rtt_p50_ms", "rtt_p90_ms", "rtt_max_ms")
+    }
+    banner = data["ssh_banner"]
+    return ConnectionReachability(
+        connection_id=ConnectionId(
+            _identifier(data["connection_id"], "connection id")
+        ),
+        health=health,
+        probes=_integer(data["probes"], "reachability probes"),
+        consecutive_failures=_integer(
+            data["consecutive_failures"], "reachability consecutive failures"
+        ),
+        last_checked_at=_optional_datetime_from_wire(
+            data["last_checked_at"], "reachability check time"
+        ),
+        last_seen_at=_optional_datetime_from_wire(
+            data["last_seen_at"], "reachability last seen time"
+        ),
+        ssh_banner=(
+            _text(banner, "SSH banner", allow_empty=True) if banner is not None else None
+        ),
+        **rtts,
+    )
+
+
+def connection_reachability_request_to_wire(
+    request: ConnectionReachabilityRequest,
+) -> Dict[str, Any]:
+    if type(request) is not ConnectionReachabilityRequest:
+        raise TypeError("connection reachability request is required")
+    return {
+        "visible_connection_ids": list(request.visible_connection_ids),
+        "read_ssh_banner": request.read_ssh_banner,
+    }
+
+
+def connection_reachability_request_from_wire(
+    value: Any,
+) -> ConnectionReachabilityRequest:
+    data = _strict_fields(
+        value,
+        required={"visible_connection_ids"},
+        optional={"read_ssh_banner"},
+        context="connection reachability request",
+    )
+    ids = data["visible_connection_ids"]
+    if type(ids) is not list:
+        raise ValueError("visible connection ids must be an array")
+    return ConnectionReachabilityRequest(
+        visible_connection_ids=tuple(
+            ConnectionId(_identifier(item, "connection id")) for item in ids
+        ),
+        read_ssh_banner=_boolean(
+            data.get("read_ssh_banner", False), "read_ssh_banner"
+        ),
+    )
+
+
+def connection_batch_result_to_wire(
+    result: ConnectionBatchResult,
+) -> Dict[str, Any]:
+    if type(result) is not ConnectionBatchResult:
+        raise TypeError("connection batch result is required")
+    return {
+        "items": [
+            {
+                "connection_id": item.connection_id,
+                "succeeded": item.succeeded,
+                "error_code": item.error_code,
+                "error_message": item.error_message,
+            }
+            for item in result.items
+        ]
+    }
+
+
+def connection_batch_result_from_wire(value: Any) -> ConnectionBatchResult:
+    data = _strict_fields(
+        value,
+        required={"items"},
+        context="connection batch result",
+    )
+    items = data["items"]
+    if type(items) is not list:
+        raise ValueError("connection batch result items must be an array")
+    decoded = []
+    for item in items:
+        fields = _strict_fields(
+            item,
+            required={"connection_id", "succeeded", "error_code", "error_message"},
+            context="connection batch item result",
+        )
+        decoded.append(
+            ConnectionBatchItemResult(
+                connection_id=ConnectionId(
+                    _identifier(fields["connection_id"], "connection id")
+                ),
+                succeeded=_boolean(fields["succeeded"], "batch item succeeded"),
+                error_code=_text(
+                    fields["error_code"], "batch item error code", allow_empty=True
+                ),
+                error_message=_text(
+                    fields["error_message"],
+                    "batch item error message",
+                    allow_empty=True,
+                ),
+            )
+        )
+    return ConnectionBatchResult(items=tuple(decoded))
+
+
 def store_connection_password_request_to_wire(
     request: StoreConnectionPasswordRequest,
 ) -> Dict[str, Any]:
@@ -2912,6 +3199,42 @@ def session_exit_info_from_wire(value: Any) -> SessionExitInfo:
     )
 
 
+def _milliseconds(value: Any, context: str) -> float:
+    if type(value) not in (int, float) or not math.isfinite(value) or value < 0:
+        raise ValueError(f"{context} must be a non-negative number")
+    return float(value)
+
+
+def session_startup_timing_to_wire(timing: SessionStartupTiming) -> Dict[str, Any]:
+    if type(timing) is not SessionStartupTiming:
+        raise TypeError("session startup timing is required")
+    payload: Dict[str, Any] = {
+        f"{stage}_ms": getattr(timing, f"{stage}_ms") for stage in SESSION_STARTUP_STAGES
+    }
+    payload["askpass_requests"] = timing.askpass_requests
+    return payload
+
+
+def session_startup_timing_from_wire(value: Any) -> SessionStartupTiming:
+    data = _strict_fields(
+        value,
+        required={f"{stage}_ms" for stage in SESSION_STARTUP_STAGES} | {"askpass_requests"},
+        context="session startup timing",
+    )
+    values: Dict[str, Any] = {}
+    for stage in SESSION_STARTUP_STAGES:
+        name = f"{stage}_ms"
+        raw = data[name]
+        if raw is None and stage in SESSION_STARTUP_MILESTONES:
+            values[name] = None
+        else:
+            values[name] = _milliseconds(raw, name)
+    return SessionStartupTiming(
+        **values,
+        askpass_requests=_integer(data["askpass_requests"], "askpass_requests"),
+    )
+
+
 def session_summary_to_wire(summary: SessionSummary) -> Dict[str, Any]:
     if type(summary) is not SessionSummary:
         raise TypeError("session summary is required")
@@ -2938,6 +3261,11 @@ def session_summary_to_wire(summary: SessionSummary) -> Dict[str, Any]:
             {"code": failure.code, "message": failure.message} if failure is not None else None
         ),
         "attachment_count": summary.attachment_count,
+        "startup_timing": (
+            session_startup_timing_to_wire(summary.startup_timing)
+            if summary.startup_timing is not None
+            else None
+        ),
     }
 
 
@@ -2955,6 +3283,7 @@ def session_summary_from_wire(value: Any) -> SessionSummary:
             "failure",
             "attachment_count",
         },
+        optional={"startup_timing"},
         context="session summary",
     )
     try:
@@ -3018,6 +3347,11 @@ def session_summary_from_wire(value: Any) -> SessionSummary:
             data["attachment_count"],
             "session attachment count",
         ),
+        startup_timing=(
+            session_startup_timing_from_wire(data["startup_timing"])
+            if data.get("startup_timing") is not None
+            else None
+        ),
     )
 
 
@@ -3409,6 +3743,30 @@ def detach_session_request_from_wire(value: Any) -> DetachSessionRequest:
     )
 
 
+def prewarm_connection_request_to_wire(
+    request: PrewarmConnectionRequest,
+) -> Dict[str, Any]:
+    if type(request) is not PrewarmConnectionRequest:
+        raise TypeError("prewarm connection request is required")
+    return {"connection_id": request.connection_id, "reason": request.reason.value}
+
+
+def prewarm_connection_request_from_wire(value: Any) -> PrewarmConnectionRequest:
+    data = _strict_fields(
+        value,
+        required={"connection_id", "reason"},
+        context="prewarm connection request",
+    )
+    try:
+        reason = PrewarmReason(data["reason"])
+    except (TypeError, ValueError):
+        raise ValueError("prewarm connection request contains an unknown reason") from None
+    return PrewarmConnectionRequest(
+        connection_id=ConnectionId(_identifier(data["connection_id"], "connection id")),
+        reason=reason,
+    )
+
+
 def close_session_request_to_wire(request: CloseSessionRequest) -> Dict[str, Any]:
     if type(request) is not CloseSessionRequest:
         raise TypeError("close session request is required")
@@ -4610,6 +4968,66 @@ def cancel_transfer_request_from_wire(value: Any) -> CancelTransferRequest:
     return CancelTransferRequest(transfer_id=_transfer_id(data["transfer_id"], "transfer id"))
 
 
+def forward_health_to_wire(health: ForwardHealth) -> Dict[str, Any]:
+    if type(health) is not ForwardHealth:
+        raise TypeError("forward health is required")
+    return {
+        "status": health.status.value,
+        "probes": health.probes,
+        "failures": health.failures,
+        "consecutive_failures": health.consecutive_failures,
+        "last_probe_at": _optional_datetime_to_wire(
+            health.last_probe_at, "forward health probe time"
+        ),
+        "last_latency_ms": health.last_latency_ms,
+        "latency_histogram": list(health.latency_histogram),
+        "restarts": health.restarts,
+    }
+
+
+def forward_health_from_wire(value: Any) -> ForwardHealth:
+    data = _strict_fields(
+        value,
+        required={
+            "status",
+            "probes",
+            "failures",
+            "consecutive_failures",
+            "last_probe_at",
+            "last_latency_ms",
+            "latency_histogram",
+            "restarts",
+        },
+        context="forward health",
+    )
+    try:
+        status = ForwardHealthStatus(data["status"])
+    except (TypeError, ValueError):
+        raise ValueError("forward health contains an unknown status") from None
+    histogram = data["latency_histogram"]
+    if type(histogram) is not list or len(histogram) != len(FORWARD_PROBE_LATENCY_BUCKETS_MS) + 1:
+        raise ValueError("forward health histogram has the wrong number of buckets")
+    latency = data["last_latency_ms"]
+    return ForwardHealth(
+        status=status,
+        probes=_integer(data["probes"], "forward health probes"),
+        failures=_integer(data["failures"], "forward health failures"),
+        consecutive_failures=_integer(
+            data["consecutive_failures"], "forward health consecutive failures"
+        ),
+        last_probe_at=_optional_datetime_from_wire(
+            data["last_probe_at"], "forward health probe time"
+        ),
+        last_latency_ms=(
+            _milliseconds(latency, "forward health latency") if latency is not None else None
+        ),
+        latency_histogram=tuple(
+            _integer(count, "forward health histogram count") for count in histogram
+        ),
+        restarts=_integer(data["restarts"], "forward health restarts"),
+    )
+
+
 def forward_summary_to_wire(summary: ForwardSummary) -> Dict[str, Any]:
     if type(summary) is not ForwardSummary:
         raise TypeError("forward summary is required")
@@ -4628,6 +5046,9 @@ def forward_summary_to_wire(summary: ForwardSummary) -> Dict[str, Any]:
         "owner_client_id": summary.owner_client_id,
         "failure": _service_failure_to_wire(summary.failure),
         "session_id": summary.session_id,
+        "health": (
+            forward_health_to_wire(summary.health) if summary.health is not None else None
+        ),
     }
 
 
@@ -4650,6 +5071,7 @@ def forward_summary_from_wire(value: Any) -> ForwardSummary:
             "failure",
             "session_id",
         },
+        optional={"health"},
         context="forward summary",
     )
     try:
@@ -4684,6 +5106,11 @@ def forward_summary_from_wire(value: Any) -> ForwardSummary:
         owner_client_id=_optional_client_id(data["owner_client_id"], "forward owner client id"),
         failure=_service_failure_from_wire(data["failure"]),
         session_id=session_id,
+        health=(
+            forward_health_from_wire(data["health"])
+            if data.get("health") is not None
+            else None
+        ),
     )
 
 
@@ -4945,6 +5372,132 @@ def daemon_status_from_wire(value: Any) -> DaemonStatus:
     )
 
 
+_PREWARM_COUNTERS = (
+    "hits",
+    "misses",
+    "prewarmed_hits",
+    "prewarms_started",
+    "prewarms_succeeded",
+    "prewarms_failed",
+    "prewarms_skipped",
+)
+
+
+def control_master_prewarm_stats_to_wire(stats: ControlMasterPrewarmStats) -> Dict[str, Any]:
+    if type(stats) is not ControlMasterPrewarmStats:
+        raise TypeError("control master prewarm stats are required")
+    payload: Dict[str, Any] = {name: getattr(stats, name) for name in _PREWARM_COUNTERS}
+    payload["hit_rate"] = stats.hit_rate
+    return payload
+
+
+def control_master_prewarm_stats_from_wire(value: Any) -> ControlMasterPrewarmStats:
+    data = _strict_fields(
+        value,
+        required=set(_PREWARM_COUNTERS) | {"hit_rate"},
+        context="control master prewarm stats",
+    )
+    # ``hit_rate`` is derived; it is validated but recomputed from the counts.
+    rate = data["hit_rate"]
+    if rate is not None and (type(rate) not in (int, float) or not 0 <= rate <= 1):
+        raise ValueError("hit_rate must be a fraction or null")
+    return ControlMasterPrewarmStats(
+        **{name: _integer(data[name], name.replace("_", " ")) for name in _PREWARM_COUNTERS}
+    )
+
+
+_SECRET_CACHE_COUNTERS = (
+    "hits",
+    "misses",
+    "coalesced",
+    "invalidations",
+    "evictions",
+    "entries",
+    "locked_entries",
+)
+
+
+def secret_cache_stats_to_wire(stats: SecretCacheStats) -> Dict[str, Any]:
+    if type(stats) is not SecretCacheStats:
+        raise TypeError("secret cache stats are required")
+    payload: Dict[str, Any] = {name: getattr(stats, name) for name in _SECRET_CACHE_COUNTERS}
+    payload["hit_rate"] = stats.hit_rate
+    return payload
+
+
+def secret_cache_stats_from_wire(value: Any) -> SecretCacheStats:
+    data = _strict_fields(
+        value,
+        required=set(_SECRET_CACHE_COUNTERS) | {"hit_rate"},
+        context="secret cache stats",
+    )
+    # ``hit_rate`` is derived; it is validated but recomputed from the counts.
+    rate = data["hit_rate"]
+    if rate is not None and (type(rate) not in (int, float) or not 0 <= rate <= 1):
+        raise ValueError("hit_rate must be a fraction or null")
+    return SecretCacheStats(
+        **{
+            name: _integer(data[name], name.replace("_", " "))
+            for name in _SECRET_CACHE_COUNTERS
+        }
+    )
+
+
+def startup_stage_percentiles_to_wire(value: StartupStagePercentiles) -> Dict[str, Any]:
+    if type(value) is not StartupStagePercentiles:
+        raise TypeError("startup stage percentiles are required")
+    return {
+        "stage": value.stage,
+        "samples": value.samples,
+        "p50_ms": float(value.p50_ms),
+        "p90_ms": float(value.p90_ms),
+        "max_ms": float(value.max_ms),
+    }
+
+
+def startup_stage_percentiles_from_wire(value: Any) -> StartupStagePercentiles:
+    data = _strict_fields(
+        value,
+        required={"stage", "samples", "p50_ms", "p90_ms", "max_ms"},
+        context="startup stage percentiles",
+    )
+    return StartupStagePercentiles(
+        stage=_identifier(data["stage"], "startup stage"),
+        samples=_integer(data["samples"], "startup stage samples"),
+        p50_ms=_milliseconds(data["p50_ms"], "p50_ms"),
+        p90_ms=_milliseconds(data["p90_ms"], "p90_ms"),
+        max_ms=_milliseconds(data["max_ms"], "max_ms"),
+    )
+
+
+def connection_startup_percentiles_to_wire(
+    value: ConnectionStartupPercentiles,
+) -> Dict[str, Any]:
+    if type(value) is not ConnectionStartupPercentiles:
+        raise TypeError("connection startup percentiles are required")
+    return {
+        "connection_id": value.connection_id,
+        "launches": value.launches,
+        "stages": [startup_stage_percentiles_to_wire(item) for item in value.stages],
+    }
+
+
+def connection_startup_percentiles_from_wire(value: Any) -> ConnectionStartupPercentiles:
+    data = _strict_fields(
+        value,
+        required={"connection_id", "launches", "stages"},
+        context="connection startup percentiles",
+    )
+    stages = data["stages"]
+    if type(stages) is not list:
+        raise ValueError("startup stages must be an array")
+    return ConnectionStartupPercentiles(
+        connection_id=ConnectionId(_identifier(data["connection_id"], "connection id")),
+        launches=_integer(data["launches"], "startup launches"),
+        stages=tuple(startup_stage_percentiles_from_wire(item) for item in stages),
+    )
+
+
 def daemon_diagnostics_to_wire(diagnostics: DaemonDiagnostics) -> Dict[str, Any]:
     if type(diagnostics) is not DaemonDiagnostics:
         raise TypeError("daemon diagnostics are required")
@@ -4957,6 +5510,20 @@ def daemon_diagnostics_to_wire(diagnostics: DaemonDiagnostics) -> Dict[str, Any]
         "rss_bytes": diagnostics.rss_bytes,
         "socket_bound": diagnostics.socket_bound,
         "keep_alive_lease": diagnostics.keep_alive_lease,
+        "control_master_prewarm": (
+            control_master_prewarm_stats_to_wire(diagnostics.control_master_prewarm)
+            if diagnostics.control_master_prewarm is not None
+            else None
+        ),
+        "session_startup": [
+            connection_startup_percentiles_to_wire(item)
+            for item in diagnostics.session_startup
+        ],
+        "secret_cache": (
+            secret_cache_stats_to_wire(diagnostics.secret_cache)
+            if diagnostics.secret_cache is not None
+            else None
+        ),
     }
 
 
@@ -4973,6 +5540,7 @@ def daemon_diagnostics_from_wire(value: Any) -> DaemonDiagnostics:
             "socket_bound",
             "keep_alive_lease",
         },
+        optional={"control_master_prewarm", "session_startup", "secret_cache"},
         context="daemon diagnostics",
     )
     roles = data["thread_counts_by_role"]
@@ -4992,6 +5560,9 @@ def daemon_diagnostics_from_wire(value: Any) -> DaemonDiagnostics:
     for flag_name in ("socket_bound", "keep_alive_lease"):
         if type(data[flag_name]) is not bool:
             raise ValueError(f"{flag_name} must be a boolean")
+    startup = data.get("session_startup", [])
+    if type(startup) is not list:
+        raise ValueError("session_startup must be an array")
     return DaemonDiagnostics(
         status=daemon_status_from_wire(data["status"]),
         uptime_seconds=float(uptime),
@@ -5001,6 +5572,19 @@ def daemon_diagnostics_from_wire(value: Any) -> DaemonDiagnostics:
         rss_bytes=data["rss_bytes"],
         socket_bound=data["socket_bound"],
         keep_alive_lease=data["keep_alive_lease"],
+        control_master_prewarm=(
+            control_master_prewarm_stats_from_wire(data["control_master_prewarm"])
+            if data.get("control_master_prewarm") is not None
+            else None
+        ),
+        session_startup=tuple(
+            connection_startup_percentiles_from_wire(item) for item in startup
+        ),
+        secret_cache=(
+            secret_cache_stats_from_wire(data["secret_cache"])
+            if data.get("secret_cache") is not None
+            else None
+        ),
     )
 
 
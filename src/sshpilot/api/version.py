@@ -1,4 +1,4 @@
 """Version identifiers for the frontend-neutral sshPilot API."""
 
 PROTOCOL_VERSION = "1.0"
-API_IMPLEMENTATION_VERSION = "0.41"
+API_IMPLEMENTATION_VERSION = "0.48"
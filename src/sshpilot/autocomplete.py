@@ -15,11 +15,15 @@ Kept GTK-free so it is unit-testable headlessly (``tests/test_autocomplete.py``)
 """
 from __future__ import annotations
 
+import bisect
+import heapq
 import os
 import re
 import threading
 from collections import deque
-from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Protocol, Set
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Protocol, Set, Tuple
+
+from .log_index import read_appended, tail_lines
 
 
 class Suggestion(NamedTuple):
@@ -65,21 +69,209 @@ class SessionProvider:
 # zsh EXTENDED_HISTORY entries look like ": 1699999999:0;git status".
 _ZSH_EXT = re.compile(r"^: \d+:\d+;")
 
+# Lines read from the end of a history file the first time it is seen. Older
+# commands rarely matter for completion, and parsing 200k lines costs seconds.
+_HISTORY_TAIL_LINES = 5000
+# Distinct commands kept per index; the lowest-scored go first on overflow.
+_HISTORY_MAX_ENTRIES = 20000
+# Prefix characters the trie indexes, and commands cached per trie node.
+_TRIE_DEPTH = 8
+_TRIE_TOP = 32
+# Best-ranked commands scanned for ones merely containing a prefix, so a
+# prefix miss costs a bounded pass rather than one over the whole history.
+_SUBSTRING_SCAN = 2000
+# Each earlier use of a command ranks it as if it were this many lines newer.
+_FREQUENCY_BONUS = 32
+# Leading bytes compared to tell a rewritten history file from an appended one.
+_HISTORY_SIGNATURE_BYTES = 256
+
+
+class _TrieNode:
+    __slots__ = ("children", "top", "members")
 
-def _recent_first_dedupe(lines: Iterable[str]) -> List[str]:
-    """History lines (oldest first) -> unique commands, most recent first."""
-    seen: Set[str] = set()
-    out: List[str] = []
-    for line in reversed(list(lines)):
-        line = _ZSH_EXT.sub("", line).strip()
-        if line and line not in seen:
-            seen.add(line)
-            out.append(line)
-    return out
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        # (-score, command), best first; at most _TRIE_TOP entries.
+        self.top: List[Tuple[int, str]] = []
+        # Every command through a node at _TRIE_DEPTH, for longer prefixes.
+        self.members: Optional[Set[str]] = None
+
+
+class HistoryIndex:
+    """Distinct shell-history commands ranked by frequency and recency.
+
+    Each ingested line takes the next sequence number; a command scores the
+    number of its latest use plus ``_FREQUENCY_BONUS`` per earlier use. Scores
+    only grow, so every prefix-trie node keeps its best ``_TRIE_TOP`` commands
+    current on insert and a prefix query reads them straight off the node.
+    Prefixes longer than ``_TRIE_DEPTH`` filter the deepest node's members.
+    Commands that merely contain a prefix are looked for only among the best
+    ``_SUBSTRING_SCAN``.
+    """
+
+    def __init__(self, lines: Iterable[str] = (),
+                 max_entries: int = _HISTORY_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._seq = 0
+        self._scores: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+        self._root = _TrieNode()
+        self._ranked: Optional[List[str]] = None
+        self._head: Optional[List[str]] = None
+        self.ingest(lines)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def ingest(self, lines: Iterable[str]) -> None:
+        """Add history lines, oldest first."""
+        changed = False
+        for line in lines:
+            line = _ZSH_EXT.sub("", line).strip()
+            if not line:
+                continue
+            self._seq += 1
+            count = self._counts.get(line, 0) + 1
+            self._counts[line] = count
+            self._insert(line, self._seq + _FREQUENCY_BONUS * (count - 1))
+            changed = True
+        if changed:
+            self._ranked = None
+            self._head = None
+            if len(self._scores) > self.max_entries + self.max_entries // 4:
+                self._compact()
+
+    def _insert(self, command: str, score: int) -> None:
+        old = self._scores.get(command)
+        self._scores[command] = score
+        entry = (-score, command)
+        node = self._root
+        for depth, ch in enumerate(command[:_TRIE_DEPTH], 1):
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = _TrieNode()
+            node = child
+            top = node.top
+            if old is not None:
+                stale = bisect.bisect_left(top, (-old, command))
+                if stale < len(top) and top[stale][1] == command:
+                    del top[stale]
+            if len(top) < _TRIE_TOP or entry < top[-1]:
+                bisect.insort(top, entry)
+                del top[_TRIE_TOP:]
+            if depth == _TRIE_DEPTH:
+                if node.members is None:
+                    node.members = set()
+                node.members.add(command)
+
+    def _compact(self) -> None:
+        keep = heapq.nsmallest(self.max_entries, self._scores.items(),
+                               key=lambda item: (-item[1], item[0]))
+        counts = self._counts
+        self._scores = {}
+        self._counts = {}
+        self._root = _TrieNode()
+        for command, score in reversed(keep):
+            self._counts[command] = counts[command]
+            self._insert(command, score)
+
+    def ranked(self) -> List[str]:
+        """All commands, best first."""
+        if self._ranked is None:
+            self._ranked = sorted(self._scores, key=lambda cmd: (-self._scores[cmd], cmd))
+        return self._ranked
+
+    def _ranked_head(self) -> List[str]:
+        """The best ``_SUBSTRING_SCAN`` commands, best first."""
+        if self._head is None:
+            if self._ranked is not None:
+                self._head = self._ranked[:_SUBSTRING_SCAN]
+            else:
+                scores = self._scores
+                self._head = heapq.nsmallest(
+                    _SUBSTRING_SCAN, scores, key=lambda cmd: (-scores[cmd], cmd)
+                )
+        return self._head
+
+    def prefixed(self, prefix: str, limit: int) -> List[str]:
+        """Best commands starting with *prefix* (never *prefix* itself)."""
+        node = self._root
+        for ch in prefix[:_TRIE_DEPTH]:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        if len(prefix) <= _TRIE_DEPTH:
+            return [cmd for _score, cmd in node.top if cmd != prefix][:limit]
+        scores = self._scores
+        return heapq.nsmallest(
+            limit,
+            (cmd for cmd in node.members or () if cmd != prefix and cmd.startswith(prefix)),
+            key=lambda cmd: (-scores[cmd], cmd),
+        )
+
+    def search(self, prefix: str, limit: int) -> List[str]:
+        """Prefix matches first, then well-ranked commands containing *prefix*."""
+        found = self.prefixed(prefix, limit)
+        if len(found) < limit:
+            seen = set(found)
+            for cmd in self._ranked_head():
+                if prefix in cmd and cmd != prefix and cmd not in seen:
+                    found.append(cmd)
+                    if len(found) >= limit:
+                        break
+        return found
+
+
+class _HistoryFile:
+    """Read position in one history file, so refreshes parse only new bytes."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._stat_key = None
+        self._identity = None
+        self._offset = 0
+        self._signature = b""
+
+    def read_new(self) -> Optional[List[str]]:
+        """Complete lines added since the last call.
+
+        The first call returns the file's last ``_HISTORY_TAIL_LINES`` lines.
+        Returns None once the file was replaced, truncated or rewritten (bash
+        trimming to HISTFILESIZE); the caller then starts over.
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return [] if self._identity is None else None
+        stat_key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        if stat_key == self._stat_key:
+            return []
+        try:
+            with open(self.path, "rb") as f:
+                leading = f.read(_HISTORY_SIGNATURE_BYTES)
+            if self._identity is None:
+                lines, _start, end = tail_lines(self.path, _HISTORY_TAIL_LINES)
+            elif ((st.st_dev, st.st_ino) != self._identity or st.st_size < self._offset
+                  or not leading.startswith(self._signature)):
+                return None
+            else:
+                lines, end = read_appended(self.path, self._offset)
+        except OSError:
+            return []
+        self._stat_key = stat_key
+        self._identity = (st.st_dev, st.st_ino)
+        self._offset = end
+        self._signature = leading[:end]
+        return lines
 
 
 class ShellHistoryProvider:
-    """Local ~/.bash_history + ~/.zsh_history, most recent first, mtime-cached."""
+    """Local ~/.bash_history + ~/.zsh_history, ranked by frequency and recency.
+
+    The first query reads the tail of each file; later ones parse only bytes
+    appended since, so a huge, growing history costs a stat per keystroke.
+    A file that was rotated or rewritten in place rebuilds the index.
+    """
 
     def __init__(self, paths: Optional[List[str]] = None) -> None:
         if paths is None:
@@ -87,33 +279,24 @@ class ShellHistoryProvider:
             paths = [os.path.join(home, ".bash_history"),
                      os.path.join(home, ".zsh_history")]
         self._paths = paths
-        self._mtimes: dict = {}
-        self._entries: List[str] = []
+        self._files = [_HistoryFile(path) for path in paths]
+        self._index = HistoryIndex()
 
     def _refresh(self) -> None:
-        mtimes = {}
-        for path in self._paths:
-            try:
-                mtimes[path] = os.stat(path).st_mtime
-            except OSError:
-                continue
-        if mtimes == self._mtimes:
-            return
-        self._mtimes = mtimes
-        lines: List[str] = []
-        for path in self._paths:
-            if path not in mtimes:
-                continue
-            try:
-                with open(path, encoding="utf-8", errors="replace") as f:
-                    lines.extend(f.read().splitlines()[-5000:])
-            except OSError:
-                continue
-        self._entries = _recent_first_dedupe(lines)
+        fresh: List[str] = []
+        for history in self._files:
+            lines = history.read_new()
+            if lines is None:
+                self._files = [_HistoryFile(path) for path in self._paths]
+                self._index = HistoryIndex()
+                self._refresh()
+                return
+            fresh.extend(lines)
+        self._index.ingest(fresh)
 
     def suggestions(self, prefix: str, limit: int) -> List[Suggestion]:
         self._refresh()
-        return _match(self._entries, prefix, limit, "history")
+        return [Suggestion(text, "history") for text in self._index.search(prefix, limit)]
 
 
 class RemoteHistoryProvider:
@@ -121,12 +304,13 @@ class RemoteHistoryProvider:
 
     ``fetch`` is a blocking zero-arg callable returning the history file text
     (or None); it runs in a daemon thread on the first suggestion query, so
-    keystrokes are never blocked. Results are cached process-wide per
-    ``cache_key`` (host), so multiple tabs to one host share a single fetch.
+    keystrokes are never blocked. The text is ingested into a
+    :class:`HistoryIndex`, cached process-wide per ``cache_key`` (host), so
+    multiple tabs to one host share a single fetch.
     """
-    # ponytail: a failed fetch caches [] for the process lifetime; add a retry
+    # ponytail: a failed fetch caches an empty index for the process lifetime; add a retry
     # timer if stale-empty remote history ever bothers anyone.
-    _cache: Dict[str, List[str]] = {}
+    _cache: Dict[str, HistoryIndex] = {}
     _pending: Set[str] = set()
     _lock = threading.Lock()
 
@@ -147,16 +331,18 @@ class RemoteHistoryProvider:
             text = self._fetch() or ""
         except Exception:  # noqa: BLE001
             text = ""
-        entries = _recent_first_dedupe(text.splitlines())
+        index = HistoryIndex(text.splitlines())
         with self._lock:
-            self._cache[self._key] = entries
+            self._cache[self._key] = index
             self._pending.discard(self._key)
 
     def suggestions(self, prefix: str, limit: int) -> List[Suggestion]:
         self._ensure_fetched()
         with self._lock:
-            entries = list(self._cache.get(self._key, ()))
-        return _match(entries, prefix, limit, "remote")
+            index = self._cache.get(self._key)
+        if index is None:
+            return []
+        return [Suggestion(text, "remote") for text in index.search(prefix, limit)]
 
 
 class CommandBlockProvider:
@@ -168,6 +354,13 @@ class CommandBlockProvider:
     def suggestions(self, prefix: str, limit: int) -> List[Suggestion]:
         if self._store is None:
             return []
+        completions = getattr(self._store, "completions", None)
+        if callable(completions):
+            # CommandBlockStore keeps commands pre-ranked in its search index.
+            try:
+                return [Suggestion(text, "snippet") for text in completions(prefix, limit)]
+            except Exception:
+                return []
         try:
             cmds = sorted(self._store.get_commands(),
                           key=lambda c: c.get("use_count") or 0, reverse=True)
@@ -11,8 +11,9 @@ from typing import Callable, Sequence
 from sshpilot.api.daemon_client import DaemonClient
 from sshpilot.api.errors import ErrorCode, SshPilotError
 from sshpilot.api.models.broadcast import BroadcastCommandRequest
-from sshpilot.api.models.common import ConnectionId
+from sshpilot.api.models.common import ConnectionId, SessionId
 from sshpilot.api.models.operations import OperationState
+from sshpilot.search_utils import ConnectionSearchIndex
 
 from .interactions import handle_interactions
 from .output import write_human, write_json
@@ -54,6 +55,8 @@ def build_parser() -> argparse.ArgumentParser:
     connections.add_argument("--json", action="store_true", default=argparse.SUPPRESS)
     connection_commands = connections.add_subparsers(dest="connections_command", required=True)
     listed = connection_commands.add_parser("list")
+    listed.add_argument("query", nargs="*", help="only list connections matching these keywords")
+    listed.add_argument("--tag", help="only list connections carrying this tag")
     listed.add_argument("--json", action="store_true", default=argparse.SUPPRESS)
     listed.set_defaults(handler="connections_list")
     shown = connection_commands.add_parser("show")
@@ -68,6 +71,15 @@ def build_parser() -> argparse.ArgumentParser:
     session_list = session_commands.add_parser("list")
     session_list.add_argument("--json", action="store_true", default=argparse.SUPPRESS)
     session_list.set_defaults(handler="sessions_list")
+    session_show = session_commands.add_parser("show")
+    session_show.add_argument("session_id")
+    session_show.add_argument("--json", action="store_true", default=argparse.SUPPRESS)
+    session_show.set_defaults(handler="sessions_show")
+    session_timings = session_commands.add_parser(
+        "timings", help="per-connection time-to-prompt percentiles of recent launches"
+    )
+    session_timings.add_argument("--json", action="store_true", default=argparse.SUPPRESS)
+    session_timings.set_defaults(handler="sessions_timings")
 
     execute = commands.add_parser("exec")
     execute.add_argument("connection")
@@ -162,7 +174,11 @@ def _dispatch(client, args, *, stdout, stderr, input_fn, getpass_fn, sleep_fn) -
     if handler == "capabilities":
         return _show(client.get_capabilities(), json_output, stdout, "capabilities")
     if handler == "connections_list":
-        values = client.list_connections()
+        values = _list_connections(
+            client,
+            " ".join(getattr(args, "query", None) or ()),
+            getattr(args, "tag", None),
+        )
         if json_output:
             write_json(stdout, values)
         else:
@@ -185,6 +201,22 @@ def _dispatch(client, args, *, stdout, stderr, input_fn, getpass_fn, sleep_fn) -
                     f"attachments={item.attachment_count}\n"
                 )
         return EXIT_OK
+    if handler == "sessions_show":
+        value = client.get_session(SessionId(args.session_id))
+        return _show(value, json_output, stdout, "session")
+    if handler == "sessions_timings":
+        values = client.get_daemon_diagnostics().session_startup
+        if json_output:
+            write_json(stdout, values)
+        else:
+            for item in values:
+                for stage in item.stages:
+                    stdout.write(
+                        f"{item.connection_id}\t{stage.stage}\tsamples={stage.samples}\t"
+                        f"p50={stage.p50_ms:.0f}ms\tp90={stage.p90_ms:.0f}ms\t"
+                        f"max={stage.max_ms:.0f}ms\n"
+                    )
+        return EXIT_OK
     if handler == "operations_get":
         return _show(client.get_operation(args.operation_id), json_output, stdout, "operation")
     if handler == "operations_cancel":
@@ -211,6 +243,27 @@ def _show(value, json_output, stdout, title):
     return EXIT_OK
 
 
+def _list_connections(client, query: str, tag: str | None):
+    """List connections, filtered and ranked like the GTK sidebar search."""
+    if not query.strip() and not tag:
+        return client.list_connections()
+    tags = None
+    snapshot_getter = getattr(client, "get_connection_store_snapshot", None)
+    if callable(snapshot_getter):
+        snapshot = snapshot_getter()
+        values = tuple(snapshot.connections)
+        tags = {
+            str(item.connection_id): item.values.get("tags", ())
+            for item in snapshot.metadata
+        }
+    else:
+        values = tuple(client.list_connections())
+    index = ConnectionSearchIndex()
+    index.update(values, tags=tags or {})
+    by_id = {ConnectionSearchIndex.key_for(item): item for item in values}
+    return [by_id[key] for key in index.rank(query, tag=tag)]
+
+
 def _resolve_connection(client, name: str) -> ConnectionId:
     matches = []
     for item in client.list_connections():
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import re
 from .runtime_identity import new_command_block_id
 import logging
@@ -387,6 +388,225 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# ---------------------------------------------------------------------------
+# CommandBlockIndex — token index behind search and autocomplete
+# ---------------------------------------------------------------------------
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Per-field weight of a token hit; a hit in the title outranks one in the
+# command, which outranks one in the description.
+_FIELD_WEIGHTS = (("name", 8), ("tags", 6), ("command", 4), ("description", 2))
+
+# Bounds on the linear passes: substring matches a search falls back to, and
+# most-used commands scanned for completions that contain (not start with)
+# the prefix.
+_SUBSTRING_FALLBACK_LIMIT = 200
+_INNER_COMPLETION_SCAN = 500
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def _haystack(cmd: dict) -> str:
+    return " ".join(
+        [
+            cmd.get("name", ""),
+            cmd.get("description", ""),
+            cmd.get("command", ""),
+            " ".join(cmd.get("tags", [])),
+        ]
+    ).lower()
+
+
+class CommandBlockIndex:
+    """Inverted token index over command titles, tags, commands and descriptions.
+
+    Holds, per token, the commands containing it and the best field weight it
+    appears with, plus a lazily re-sorted token list so prefix lookups are a
+    bisect. :meth:`search` ranks commands whose tokens start with every query
+    token first, then the remaining matches of the store's old substring test
+    (mid-word fragments, punctuation) over cached haystacks, capped at
+    ``_SUBSTRING_FALLBACK_LIMIT`` extra results. :meth:`completions`
+    bisects a list sorted by command text for leading matches and scans a
+    bounded head of the by-use list for inner ones.
+    """
+
+    def __init__(self, commands: list[dict] | None = None) -> None:
+        self._commands: dict[str, dict] = {}
+        self._order: dict[str, int] = {}
+        self._fields: dict[str, dict[str, int]] = {}
+        self._haystacks: dict[str, str] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._sorted_tokens: list[str] | None = []
+        self._by_use: list[dict] | None = None
+        self._in_order: list[str] | None = None
+        self._by_command: list[tuple[str, str]] | None = None
+        self._next_order = 0
+        for cmd in commands or []:
+            self.add(cmd)
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def add(self, cmd: dict) -> None:
+        cmd_id = cmd.get("id")
+        if cmd_id is None:
+            return
+        if cmd_id in self._commands:
+            self.remove(cmd_id)
+        fields: dict[str, int] = {}
+        for field, weight in _FIELD_WEIGHTS:
+            value = cmd.get(field, "")
+            text = " ".join(value) if isinstance(value, list) else str(value or "")
+            for token in _tokens(text):
+                if fields.get(token, 0) < weight:
+                    fields[token] = weight
+        self._commands[cmd_id] = cmd
+        self._order.setdefault(cmd_id, self._next_order)
+        self._next_order += 1
+        self._fields[cmd_id] = fields
+        self._haystacks[cmd_id] = _haystack(cmd)
+        for token, weight in fields.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = {}
+                self._sorted_tokens = None
+            posting[cmd_id] = weight
+        self._by_use = self._in_order = self._by_command = None
+
+    def update(self, cmd: dict) -> None:
+        """Re-index *cmd* after its fields changed, keeping its position."""
+        order = self._order.get(cmd.get("id"))
+        self.add(cmd)
+        if order is not None:
+            self._order[cmd["id"]] = order
+            self._in_order = None
+
+    def remove(self, cmd_id: str) -> None:
+        if self._commands.pop(cmd_id, None) is None:
+            return
+        self._order.pop(cmd_id, None)
+        self._haystacks.pop(cmd_id, None)
+        for token in self._fields.pop(cmd_id, {}):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(cmd_id, None)
+            if not posting:
+                del self._postings[token]
+                self._sorted_tokens = None
+        self._by_use = self._in_order = self._by_command = None
+
+    def touch(self, cmd_id: str) -> None:
+        """Note that a command's use count changed."""
+        self._by_use = None
+
+    def _prefix_hits(self, prefix: str) -> dict[str, int]:
+        """Best weight per command over tokens starting with *prefix*.
+
+        Exact token hits count double so "git" ranks a "git" token above a
+        "github" one.
+        """
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        tokens = self._sorted_tokens
+        hits: dict[str, int] = {}
+        for position in range(bisect.bisect_left(tokens, prefix), len(tokens)):
+            token = tokens[position]
+            if not token.startswith(prefix):
+                break
+            factor = 2 if token == prefix else 1
+            for cmd_id, weight in self._postings[token].items():
+                score = weight * factor
+                if hits.get(cmd_id, 0) < score:
+                    hits[cmd_id] = score
+        return hits
+
+    def search(self, query: str) -> list[dict]:
+        """Commands matching *query*, best first."""
+        query_tokens = _tokens(query)
+        scores: dict[str, int] | None = None
+        for token in sorted(set(query_tokens), key=len, reverse=True):
+            hits = self._prefix_hits(token)
+            if scores is None:
+                scores = hits
+            else:
+                scores = {
+                    cmd_id: score + hits[cmd_id]
+                    for cmd_id, score in scores.items()
+                    if cmd_id in hits
+                }
+            if not scores:
+                break
+        ranked = sorted(
+            scores or (),
+            key=lambda cmd_id: (
+                -scores[cmd_id],
+                -(self._commands[cmd_id].get("use_count") or 0),
+                self._order[cmd_id],
+            ),
+        )
+        needle = query.lower().strip()
+        if needle:
+            # Mid-word fragments and punctuation miss every token prefix;
+            # follow the token hits with them from the haystacks in store
+            # order, bounded.
+            if self._in_order is None:
+                self._in_order = sorted(self._haystacks, key=self._order.__getitem__)
+            seen = set(ranked)
+            extra = 0
+            for cmd_id in self._in_order:
+                if cmd_id not in seen and needle in self._haystacks[cmd_id]:
+                    ranked.append(cmd_id)
+                    extra += 1
+                    if extra >= _SUBSTRING_FALLBACK_LIMIT:
+                        break
+        return [self._commands[cmd_id] for cmd_id in ranked]
+
+    def completions(self, prefix: str, limit: int) -> list[str]:
+        """Command texts for terminal autocomplete, most used first.
+
+        Commands that start with *prefix* come before ones that merely
+        contain it; exact matches are skipped. Inner matches are only looked
+        for among the ``_INNER_COMPLETION_SCAN`` most used commands.
+        """
+        if limit <= 0:
+            return []
+        if self._by_command is None:
+            self._by_command = sorted(
+                (cmd.get("command", ""), cmd_id) for cmd_id, cmd in self._commands.items()
+            )
+        by_command = self._by_command
+        leading_ids: list[str] = []
+        for position in range(bisect.bisect_left(by_command, (prefix,)), len(by_command)):
+            text, cmd_id = by_command[position]
+            if not text.startswith(prefix):
+                break
+            if text != prefix:
+                leading_ids.append(cmd_id)
+        leading_ids.sort(key=self._use_key)
+        leading = [self._commands[cmd_id].get("command", "") for cmd_id in leading_ids[:limit]]
+        if len(leading) >= limit:
+            return leading
+        if self._by_use is None:
+            self._by_use = sorted(
+                self._commands.values(), key=lambda cmd: self._use_key(cmd["id"])
+            )
+        inner: list[str] = []
+        for cmd in self._by_use[:_INNER_COMPLETION_SCAN]:
+            text = cmd.get("command", "")
+            if prefix in text and not text.startswith(prefix):
+                inner.append(text)
+                if len(leading) + len(inner) >= limit:
+                    break
+        return leading + inner
+
+    def _use_key(self, cmd_id: str) -> tuple[int, int]:
+        return (-(self._commands[cmd_id].get("use_count") or 0), self._order[cmd_id])
+
+
 # ---------------------------------------------------------------------------
 # CommandBlockStore — pure-Python model
 # ---------------------------------------------------------------------------
@@ -397,6 +617,8 @@ class CommandBlockStore:
 
     def __init__(self, config: "Config") -> None:
         self._config = config
+        self._index: CommandBlockIndex | None = None
+        self._indexed_commands: list | None = None
         self._load()
 
     # ------------------------------------------------------------------
@@ -425,6 +647,21 @@ class CommandBlockStore:
     def _new_id(self) -> str:
         return new_command_block_id()
 
+    def _search_index(self) -> CommandBlockIndex:
+        """The token index, rebuilt only if the commands list was replaced."""
+        commands = self._data().setdefault("commands", [])
+        if self._index is None or self._indexed_commands is not commands:
+            self._index = CommandBlockIndex(commands)
+            self._indexed_commands = commands
+        return self._index
+
+    def _index_changed(self, update=None) -> None:
+        if self._index is not None and self._indexed_commands is self._data().get("commands"):
+            if update is not None:
+                update(self._index)
+        else:
+            self._index = None
+
     def _ensure_defaults(self) -> None:
         data = self._data()
         if data.get("defaults_loaded"):
@@ -520,6 +757,7 @@ class CommandBlockStore:
             "created_at": _now_iso(),
         }
         self._data().setdefault("commands", []).append(entry)
+        self._index_changed(lambda index: index.add(entry))
         self._save()
         return entry
 
@@ -539,12 +777,17 @@ class CommandBlockStore:
                 for k, v in kwargs.items():
                     if k in allowed:
                         cmd[k] = v
+                self._index_changed(lambda index: index.update(cmd))
                 self._save()
                 return
 
     def delete_command(self, cmd_id: str) -> None:
         data = self._data()
+        indexed = self._index is not None and self._indexed_commands is data.get("commands")
         data["commands"] = [c for c in data.get("commands", []) if c["id"] != cmd_id]
+        if indexed:
+            self._index.remove(cmd_id)
+            self._indexed_commands = data["commands"]
         self._save()
 
     def duplicate_command(self, cmd_id: str) -> dict | None:
@@ -557,6 +800,7 @@ class CommandBlockStore:
                 new_cmd["last_used"] = None
                 new_cmd["created_at"] = _now_iso()
                 self._data().setdefault("commands", []).append(new_cmd)
+                self._index_changed(lambda index: index.add(new_cmd))
                 self._save()
                 return new_cmd
         return None
@@ -566,6 +810,7 @@ class CommandBlockStore:
             if cmd["id"] == cmd_id:
                 cmd["use_count"] = cmd.get("use_count", 0) + 1
                 cmd["last_used"] = _now_iso()
+                self._index_changed(lambda index: index.touch(cmd_id))
                 self._save()
                 return
 
@@ -574,22 +819,18 @@ class CommandBlockStore:
     # ------------------------------------------------------------------
 
     def search(self, query: str) -> list[dict]:
-        q = query.lower().strip()
-        if not q:
+        """Commands matching *query*, best first; every command if it is blank.
+
+        Ranked token-prefix matches across title, tags, command and
+        description, falling back to a plain substring match.
+        """
+        if not query.strip():
             return self.get_commands()
-        results = []
-        for cmd in self._data().get("commands", []):
-            haystack = " ".join(
-                [
-                    cmd.get("name", ""),
-                    cmd.get("description", ""),
-                    cmd.get("command", ""),
-                    " ".join(cmd.get("tags", [])),
-                ]
-            ).lower()
-            if q in haystack:
-                results.append(cmd)
-        return results
+        return self._search_index().search(query)
+
+    def completions(self, prefix: str, limit: int) -> list[str]:
+        """Command texts containing *prefix*, for terminal autocomplete."""
+        return self._search_index().completions(prefix, limit)
 
     def get_favorites(self) -> list[dict]:
         return [c for c in self._data().get("commands", []) if c.get("is_favorite")]
@@ -22,7 +22,7 @@ import gi
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk
 
-from .omni_search import collect_commands
+from .omni_search import cached_commands
 
 _ = gettext.gettext
 
@@ -78,7 +78,7 @@ def append_command_rows(window, query: str) -> int:
         return 0
 
     count = 0
-    for command in collect_commands(window):
+    for command in cached_commands(window):
         if not _matches(command.title, query):
             continue
         row = CommandRow(
@@ -7,6 +7,7 @@ import os
 import logging
 import re
 import threading
+import time
 import types
 from typing import Optional, Dict, Any
 
@@ -40,6 +41,7 @@ except (ImportError, AttributeError):  # pragma: no cover - used in tests withou
 
     GLib = _DummyGLib
     GObject.SignalFlags = types.SimpleNamespace(RUN_FIRST=None)
+from . import startup_profile
 from .platform_utils import is_macos, get_ssh_dir
 from .shortcut_utils import install_esc_to_close
 from .ssh_key_fingerprint import (
@@ -750,6 +752,9 @@ class KeyChooserDialog(Adw.Window):
     Each tab is a boxed list of selectable rows showing type · fingerprint ·
     comment/path. Checked rows are committed via ``on_add(path)`` when the user
     presses Add. Agent keys are materialised to a real path at add time.
+
+    Passing ``None`` for the key lists opens the chooser with loading
+    placeholders; :meth:`set_keys` fills the tabs in once discovery is done.
     """
 
     __gtype_name__ = 'SshPilotKeyChooserDialog'
@@ -758,7 +763,7 @@ class KeyChooserDialog(Adw.Window):
     add_btn = Gtk.Template.Child()
     stack = Gtk.Template.Child()
 
-    def __init__(self, parent, *, disk_keys, agent_keys, existing_paths,
+    def __init__(self, parent, *, disk_keys=None, agent_keys=None, existing_paths,
                  on_add, on_browse=None):
         super().__init__()
         if parent is not None:
@@ -778,28 +783,44 @@ class KeyChooserDialog(Adw.Window):
         self.cancel_btn.connect("clicked", lambda *_a: self.close())
         self.add_btn.connect("clicked", self._on_add_clicked)
 
-        self.stack.add_titled_with_icon(
-            self._build_disk_page(disk_keys), "disk", _("On disk"),
-            "computer-symbolic")
-        self.stack.add_titled_with_icon(
-            self._build_agent_page(agent_keys), "agent", _("In agent"),
-            "dialog-password-symbolic")
+        self._disk_box = self._add_tab("disk", _("On disk"), "computer-symbolic")
+        self._agent_box = self._add_tab("agent", _("In agent"), "dialog-password-symbolic")
+        self._disk_group = None
+        self._agent_group = None
+        self.set_keys(disk_keys, agent_keys)
+
+    def set_keys(self, disk_keys, agent_keys):
+        """(Re)build both tabs; ``None`` shows a loading placeholder."""
+        self._checks = []
+        for box, attr, group in (
+            (self._disk_box, '_disk_group', self._build_disk_page(disk_keys)),
+            (self._agent_box, '_agent_group', self._build_agent_page(agent_keys)),
+        ):
+            previous = getattr(self, attr)
+            if previous is not None:
+                box.remove(previous)
+            box.append(group)
+            setattr(self, attr, group)
+        self._update_add_sensitivity()
+        return False
 
     # ---- page builders --------------------------------------------------
-    def _wrap_group(self, group):
+    def _add_tab(self, name, title, icon_name):
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_vexpand(True)
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         box.set_margin_top(12); box.set_margin_bottom(12)
         box.set_margin_start(12); box.set_margin_end(12)
-        box.append(group)
         scrolled.set_child(box)
-        return scrolled
+        self.stack.add_titled_with_icon(scrolled, name, title, icon_name)
+        return box
 
     def _build_disk_page(self, disk_keys):
         group = Adw.PreferencesGroup()
-        for item in disk_keys:
+        if disk_keys is None:
+            group.add(self._loading_row(_("Looking for keys…")))
+        for item in disk_keys or []:
             group.add(self._make_choice_row(
                 title=item.get("name") or item.get("path"),
                 ktype=item.get("ktype"),
@@ -808,7 +829,7 @@ class KeyChooserDialog(Adw.Window):
                 payload=item.get("path"),
                 dedup_path=item.get("path"),
             ))
-        if not disk_keys:
+        if disk_keys is not None and not disk_keys:
             group.add(self._placeholder_row(_("No private keys found in ~/.ssh")))
         if callable(self._on_browse):
             try:
@@ -822,11 +843,13 @@ class KeyChooserDialog(Adw.Window):
                     pass
             browse.connect("activated", self._on_browse_clicked)
             group.add(browse)
-        return self._wrap_group(group)
+        return group
 
     def _build_agent_page(self, agent_keys):
         group = Adw.PreferencesGroup()
-        for item in agent_keys:
+        if agent_keys is None:
+            group.add(self._loading_row(_("Reading ssh-agent…")))
+        for item in agent_keys or []:
             group.add(self._make_choice_row(
                 title=item.get("title"),
                 ktype=item.get("ktype"),
@@ -835,15 +858,22 @@ class KeyChooserDialog(Adw.Window):
                 payload=item.get("materializer"),
                 dedup_path=None,
             ))
-        if not agent_keys:
+        if agent_keys is not None and not agent_keys:
             group.add(self._placeholder_row(_("No keys loaded in ssh-agent")))
-        return self._wrap_group(group)
+        return group
 
     def _placeholder_row(self, text):
         row = Adw.ActionRow(title=text)
         row.set_sensitive(False)
         return row
 
+    def _loading_row(self, text):
+        row = self._placeholder_row(text)
+        spinner = Gtk.Spinner()
+        spinner.start()
+        row.add_prefix(spinner)
+        return row
+
     def _make_choice_row(self, *, title, ktype=None, meta=None, path=None,
                          payload, dedup_path):
         row = Adw.ActionRow(title=title or _("key"))
@@ -1560,6 +1590,7 @@ class ConnectionDialog(
     save_button = Gtk.Template.Child()
     
     def __init__(self, parent, connection=None, connection_manager=None, force_split_from_group=False, split_group_source=None, split_original_nickname=None, as_new=False):
+        started = time.perf_counter()
         super().__init__()
         
         self.parent_window = parent
@@ -1607,6 +1638,7 @@ class ConnectionDialog(
         
         self.setup_ui()
         GLib.idle_add(self.load_connection_data)
+        startup_profile.log_time_to_interactive(self, "Connection dialog", started)
 
     def _cancel_active_save_request(self, *_args):
         request = self._active_save_request
@@ -1963,9 +1995,13 @@ class ConnectionDialog(
             cert_editor.set_sensitive(use_specific)
 
     # ---- discovery / browse for the key & certificate FileListEditors -------
-    def _agent_keys(self):
-        """Return safe metadata for keys loaded in the daemon-selected agent."""
-        parent = self.get_transient_for()
+    def _agent_keys(self, parent=None):
+        """Return safe metadata for keys loaded in the daemon-selected agent.
+
+        Pass the transient parent when calling from a worker thread.
+        """
+        if parent is None:
+            parent = self.get_transient_for()
         client = getattr(parent, "client", None)
         if client is None:
             return []
@@ -2099,35 +2135,57 @@ class ConnectionDialog(
         except Exception:
             logger.debug("Failed to open file chooser", exc_info=True)
 
-    def _open_key_chooser(self, editor):
-        """Open the disk/agent key chooser and add selected keys to *editor*."""
+    def _collect_chooser_keys(self, transient_parent=None):
+        """Disk and agent key items for :class:`KeyChooserDialog`.
+
+        Both lists come from daemon round trips and the disk keys are
+        fingerprinted from their ``.pub`` files, so this runs on a worker.
+        """
         disk_keys = []
         for name, path in self._discover_disk_keys():
             ktype, fp, _comment = _fingerprint_for_path(path)
             disk_keys.append({'name': name, 'path': path, 'ktype': ktype, 'meta': fp})
 
         agent_keys = []
-        for fingerprint, _display, ktype, comment in self._agent_keys():
+        for fingerprint, _display, ktype, comment in self._agent_keys(transient_parent):
             agent_keys.append({
                 'title': comment or _("agent key"),
                 'ktype': ktype,
                 'meta': fingerprint,
                 'materializer': lambda: "",
             })
+        return disk_keys, agent_keys
+
+    def _open_key_chooser(self, editor):
+        """Open the disk/agent key chooser and add selected keys to *editor*.
 
+        The chooser is shown at once with placeholders and filled in when
+        key discovery finishes in the background.
+        """
+        started = time.perf_counter()
+        transient_parent = self.get_transient_for()
         parent = self.get_root() if hasattr(self, 'get_root') else None
         if not isinstance(parent, Gtk.Window):
             parent = None
         dialog = KeyChooserDialog(
             parent,
-            disk_keys=disk_keys,
-            agent_keys=agent_keys,
             existing_paths=editor.get_paths(),
             on_add=editor.add_path,
             on_browse=self._browse_key,
         )
+        startup_profile.log_time_to_interactive(dialog, "Key chooser", started)
         dialog.present()
 
+        def worker():
+            try:
+                disk_keys, agent_keys = self._collect_chooser_keys(transient_parent)
+            except Exception:
+                logger.debug("Key chooser discovery failed", exc_info=True)
+                disk_keys, agent_keys = [], []
+            GLib.idle_add(dialog.set_keys, disk_keys, agent_keys)
+
+        threading.Thread(target=worker, daemon=True).start()
+
     def _browse_key(self, on_chosen, parent=None):
         self._browse_file(_("Select SSH Key File"), on_chosen, parent=parent)
 
@@ -49,17 +49,31 @@ def _cmd_validate_connection(args: argparse.Namespace) -> int:
 
 
 def _cmd_list_keys(args: argparse.Namespace) -> int:
-    from sshpilot.core.keys import KeyService
-    from sshpilot.platform.paths import get_ssh_dir
+    from sshpilot.core.keys import FingerprintCache, KeyService
+    from sshpilot.platform.paths import get_ssh_dir, get_state_dir
 
     ssh_dir = Path(args.ssh_dir) if args.ssh_dir else get_ssh_dir()
-    service = KeyService(ssh_dir)
+    cache = (
+        FingerprintCache(get_state_dir() / "key-fingerprints.json")
+        if args.fingerprints
+        else None
+    )
+    service = KeyService(ssh_dir, fingerprint_cache=cache)
     keys = [str(k.private_path) for k in service.discover_keys()]
+    if not args.fingerprints:
+        if args.json:
+            _print_json({"keys": keys})
+        else:
+            for key in keys:
+                print(key)
+        return 0
+    fingerprints = {key: service.fingerprint(key) for key in keys}
+    cache.save()
     if args.json:
-        _print_json({"keys": keys})
+        _print_json({"keys": keys, "fingerprints": fingerprints})
     else:
         for key in keys:
-            print(key)
+            print(f"{key} {fingerprints[key] or '-'}")
     return 0
 
 
@@ -179,6 +193,9 @@ def main(argv: list[str] | None = None) -> int:
 
     p_keys = sub.add_parser("list-keys", help="Discover SSH private keys")
     p_keys.add_argument("--ssh-dir", help="SSH directory (default: ~/.ssh)")
+    p_keys.add_argument(
+        "--fingerprints", action="store_true", help="Include ssh-keygen -l style fingerprints"
+    )
     p_keys.add_argument("--json", action="store_true")
     p_keys.set_defaults(func=_cmd_list_keys)
 
@@ -32,6 +32,8 @@ from ..api.events import EventPublisher, EventType, Subscription
 from ..api.models.common import ClientInfo, CompatibilityResult, CoreInfo
 from ..api.models.connections import (
     AuthenticationMethod,
+    ConnectionBatchItemResult,
+    ConnectionBatchResult,
     ConnectionDetails,
     ConnectionEditorDetails,
     ConnectionId,
@@ -43,11 +45,13 @@ from ..api.models.connections import (
     CreateConnectionRequest,
     DeleteConnectionRequest,
     DeleteConnectionResult,
+    DeleteConnectionsRequest,
     ForwardingRule,
     SaveSshConfigTextRequest,
     SplitConnectionRequest,
     SshConfigText,
     UpdateConnectionRequest,
+    UpdateConnectionsRequest,
     UNSET,
     forwarding_rule_from_dict,
 )
@@ -82,6 +86,7 @@ IMPLEMENTED_CLIENT_METHOD_CAPABILITIES = {
     "create_connection": Capability.CONNECTIONS_WRITE,
     "duplicate_connection": Capability.CONNECTIONS_WRITE,
     "delete_connection": Capability.CONNECTIONS_WRITE,
+    "delete_connections": Capability.CONNECTIONS_WRITE,
     "store_connection_password": Capability.CONNECTIONS_SECRETS_WRITE,
     "set_session_connection_password": Capability.CONNECTIONS_SECRETS_WRITE,
     "clear_session_connection_password": Capability.CONNECTIONS_SECRETS_WRITE,
@@ -98,6 +103,7 @@ IMPLEMENTED_CLIENT_METHOD_CAPABILITIES = {
     "split_connection": Capability.CONNECTIONS_SPLIT,
     "subscribe_events": Capability.CONNECTIONS_EVENTS,
     "update_connection": Capability.CONNECTIONS_WRITE,
+    "update_connections": Capability.CONNECTIONS_WRITE,
     "get_global_ssh_overrides": Capability.SSH_OVERRIDES_READ,
     "update_global_ssh_overrides": Capability.SSH_OVERRIDES_WRITE,
     "reset_global_ssh_overrides": Capability.SSH_OVERRIDES_WRITE,
@@ -936,15 +942,21 @@ class ConnectionApplicationService:
         port: Optional[int],
         proxy_jump: Tuple[str, ...],
     ) -> tuple:
-        from .ssh_config_effective import get_effective_ssh_config
+        from .ssh_config_effective import (
+            NATIVE_EFFECTIVE_FIELDS,
+            get_effective_ssh_config,
+        )
 
         proxy = ",".join(proxy_jump)
+        # Only destination fields are compared, so the in-process evaluator
+        # can answer without spawning ``ssh -G``.
         effective = get_effective_ssh_config(
             hostname,
             self._active_config_file(),
             user=username or None,
             port=port,
             proxy_jump=proxy or None,
+            fields=NATIVE_EFFECTIVE_FIELDS,
         )
         resolved_host = str(effective.get("hostname") or hostname).strip()
         resolved_user = str(effective.get("user") or username or getpass.getuser()).strip()
@@ -1284,30 +1296,128 @@ class ConnectionApplicationService:
                 ErrorCode.INVALID_REQUEST,
                 "A delete connection request is required",
             )
-        if self._repository.get_record(request.connection_id) is None:
+        self._delete_record(request.connection_id)
+        self._provider_call(
+            self._secret_provider,
+            "clear_session_connection_password",
+            request.connection_id,
+        )
+        return DeleteConnectionResult(
+            connection_id=request.connection_id,
+            deleted=True,
+        )
+
+    def _delete_record(self, connection_id: ConnectionId) -> None:
+        if self._repository.get_record(connection_id) is None:
             raise SshPilotError(
                 ErrorCode.CONNECTION_NOT_FOUND,
                 "The requested connection does not exist",
-                connection_id=request.connection_id,
+                connection_id=connection_id,
             )
         try:
-            self._repository.delete_connection(request.connection_id)
+            self._repository.delete_connection(connection_id)
         except SshPilotError:
             raise
         except CoreError as error:
             raise _map_core_error(error) from error
         except Exception as error:
             logger.exception("Repository delete failed")
-            raise self._persistence_error(request.connection_id) from error
-        self._provider_call(
-            self._secret_provider,
-            "clear_session_connection_password",
-            request.connection_id,
+            raise self._persistence_error(connection_id) from error
+
+    # ------------------------------------------------------------------
+    # Batch mutations
+    # ------------------------------------------------------------------
+
+    def update_connections(
+        self, request: UpdateConnectionsRequest
+    ) -> ConnectionBatchResult:
+        """Apply several connection patches in one repository transaction."""
+        self._assert_command_thread()
+        self._require_capability(Capability.CONNECTIONS_WRITE)
+        if type(request) is not UpdateConnectionsRequest:
+            raise SshPilotError(
+                ErrorCode.INVALID_REQUEST,
+                "An update connections request is required",
+            )
+        if any(item.update.config_patch for item in request.items):
+            self._require_capability(Capability.CONNECTIONS_CONFIG_WRITE)
+        return self._run_batch(
+            (
+                item.connection_id,
+                lambda item=item: self.update_connection(
+                    item.connection_id, item.update
+                ),
+            )
+            for item in request.items
         )
-        return DeleteConnectionResult(
-            connection_id=request.connection_id,
-            deleted=True,
+
+    def delete_connections(
+        self, request: DeleteConnectionsRequest
+    ) -> ConnectionBatchResult:
+        """Delete several connections in one repository transaction."""
+        self._assert_command_thread()
+        self._require_capability(Capability.CONNECTIONS_WRITE)
+        if type(request) is not DeleteConnectionsRequest:
+            raise SshPilotError(
+                ErrorCode.INVALID_REQUEST,
+                "A delete connections request is required",
+            )
+        result = self._run_batch(
+            (
+                connection_id,
+                lambda connection_id=connection_id: self._delete_record(
+                    connection_id
+                ),
+            )
+            for connection_id in request.connection_ids
         )
+        # Temporary credentials are dropped only once the deletions are
+        # durable, so a failed commit never strands a live connection
+        # without its session password.
+        for connection_id in result.succeeded_ids:
+            self._provider_call(
+                self._secret_provider,
+                "clear_session_connection_password",
+                connection_id,
+            )
+        return result
+
+    def _run_batch(self, operations) -> ConnectionBatchResult:
+        """Run per-item operations under one transaction and collect results.
+
+        Item failures are recorded and roll back only that item; a failure
+        of the final commit fails the whole batch with nothing applied.
+        """
+        items: List[ConnectionBatchItemResult] = []
+        try:
+            with self._repository.transaction():
+                for connection_id, operation in operations:
+                    try:
+                        operation()
+                    except SshPilotError as error:
+                        items.append(
+                            ConnectionBatchItemResult(
+                                connection_id=connection_id,
+                                succeeded=False,
+                                error_code=error.code.value,
+                                error_message=error.message,
+                            )
+                        )
+                    else:
+                        items.append(
+                            ConnectionBatchItemResult(
+                                connection_id=connection_id,
+                                succeeded=True,
+                            )
+                        )
+        except SshPilotError:
+            raise
+        except CoreError as error:
+            raise _map_core_error(error) from error
+        except Exception as error:
+            logger.exception("Repository batch commit failed")
+            raise self._persistence_error() from error
+        return ConnectionBatchResult(items=tuple(items))
 
     # ------------------------------------------------------------------
     # Events
@@ -1417,6 +1527,53 @@ class ConnectionApplicationService:
             return ()
         return tuple(self._repository.snapshot().connections)
 
+    def direct_ssh_endpoints(self) -> Tuple[Tuple[ConnectionId, str, int], ...]:
+        """``(connection_id, host, port)`` of SSH connections without a proxy.
+
+        Safe off the command thread; the daemon's reachability prober reads it.
+        Connections behind ProxyJump or ProxyCommand are left out because a
+        direct connect would not follow their network path. That includes a
+        proxy the effective ssh config supplies (a ``Host`` or ``Match``
+        block, an ``Include``), not only one stored on the connection.
+        """
+        from .ssh_config_effective import (
+            NATIVE_EFFECTIVE_FIELDS,
+            get_effective_ssh_config,
+        )
+
+        if self._closed:
+            return ()
+        config_file = self._active_config_file()
+        endpoints = []
+        for summary in self._repository.snapshot().connections:
+            if summary.protocol != "ssh":
+                continue
+            record = self._repository.get_record(summary.id)
+            data = (record.data or {}) if record is not None else {}
+            if data.get("proxy_jump") or str(data.get("proxy_command") or "").strip():
+                continue
+            host = (summary.hostname or summary.host).strip()
+            if not host:
+                continue
+            try:
+                # Memoized per config revision; the in-process evaluator
+                # answers these fields without spawning ssh.
+                effective = get_effective_ssh_config(
+                    summary.host or host,
+                    config_file,
+                    fields=NATIVE_EFFECTIVE_FIELDS,
+                )
+            except Exception:
+                logger.debug("Effective config unavailable for %s", summary.id, exc_info=True)
+                effective = {}
+            if any(
+                str(effective.get(keyword) or "none").strip().lower() != "none"
+                for keyword in ("proxyjump", "proxycommand")
+            ):
+                continue
+            endpoints.append((summary.id, host, summary.port))
+        return tuple(endpoints)
+
     def _require_capability(self, capability: Capability) -> None:
         if not self._capabilities.supports(capability):
             raise unsupported_capability(capability)
@@ -130,3 +130,28 @@ def classify_connection_evidence(text: str) -> ConnectionEvidence:
         evidence = ConnectionEvidence("connected")
 
     return evidence
+
+
+# Characters a shell prompt conventionally ends with: sh/bash "$", root "#",
+# csh/cmd ">", zsh "%", and the arrows of popular prompt themes.
+SHELL_PROMPT_TERMINATORS = ("$", "#", ">", "%", "❯", "➜", "λ", "»")
+
+
+def looks_like_shell_prompt(text: str) -> bool:
+    """Return whether the output ends in something shaped like a shell prompt.
+
+    Only the last visible line is considered: a prompt is the text a shell
+    leaves without a newline while it waits for input. Authentication prompts
+    ("Password:", host key questions) end differently and are excluded
+    explicitly, so this never fires before login completes.
+    """
+
+    visible = visible_terminal_text(text)
+    if not visible or visible.endswith("\n"):
+        return False
+    line = visible.rsplit("\n", 1)[-1].rstrip()
+    if not line or len(line) > 256:
+        return False
+    if not line.endswith(SHELL_PROMPT_TERMINATORS):
+        return False
+    return classify_prompt(line.strip()) is None
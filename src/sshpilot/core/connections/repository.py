@@ -21,6 +21,7 @@ rewriting the sidecar.
 from __future__ import annotations
 
 import copy
+import hashlib
 import logging
 import os
 import stat
@@ -28,7 +29,7 @@ import threading
 from contextlib import contextmanager
 from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping, Optional, Protocol, Tuple, runtime_checkable
+from typing import Any, Callable, ContextManager, Dict, List, Mapping, Optional, Protocol, Tuple, runtime_checkable
 
 from ...api.models.connection_store import (
     ConnectionMetadataSummary,
@@ -113,6 +114,22 @@ class RepositoryChange:
     after: ConnectionStoreSnapshot
 
 
+@dataclass
+class _BulkTransaction:
+    """Open :meth:`ConnectionRepository.transaction` scope.
+
+    ``savepoint`` is the state after the last committed mutation inside the
+    scope; a failing mutation rolls back to it instead of to the files.
+    """
+
+    before: ConnectionStoreSnapshot
+    base_ssh_revision: str
+    base_sidecar_generation: int
+    savepoint: tuple
+    state_dirty: bool = False
+    mutations: int = 0
+
+
 @dataclass(frozen=True)
 class LegacyMigrationResult:
     """Count-only diagnostics from one legacy connection-state migration."""
@@ -223,6 +240,8 @@ class ConnectionRepositoryProtocol(Protocol):
 
     def delete_connection(self, connection_id: str) -> None: ...
 
+    def transaction(self) -> ContextManager[Any]: ...
+
     def split_connection(
         self,
         connection_id: str,
@@ -330,6 +349,10 @@ class ConnectionRepository:
         self._identity_recovery_required = False
         self._pending_identity_target: Optional[IdentityStateV2] = None
         self._loaded_ssh_config: Optional[LoadedSshConfiguration] = None
+        # Source fingerprint of the last full load; a reload whose SSH file
+        # revision vector and sidecar bytes are unchanged skips the rebuild.
+        self._source_fingerprint: Optional[tuple] = None
+        self._bulk: Optional[_BulkTransaction] = None
         self._metadata: Dict[str, Dict[str, Any]] = {}
         self._persisted_root_order: Tuple[str, ...] = ()
         self._non_ssh_generations: Dict[str, int] = {}
@@ -381,13 +404,157 @@ class ConnectionRepository:
         return self._ssh_store.isolated
 
     def reload(self) -> ConnectionStoreSnapshot:
-        """Re-read authoritative sources; publish a change only when semantics differ."""
+        """Re-read authoritative sources; publish a change only when semantics differ.
+
+        The SSH loader reparses only changed files; when no participating SSH
+        file and no sidecar byte changed since the last full load, the
+        in-memory state is already current and the rebuild is skipped.
+        """
         with self._mutation_scope():
             before = self._build_snapshot_locked()
-            self._load_state_locked()
+            ssh_config = self._ssh_store.load()
+            previous = self._loaded_ssh_config
+            if (
+                self._source_fingerprint is not None
+                and self._source_fingerprint
+                == self._source_fingerprint_locked(ssh_config)
+            ):
+                self._overlay_ssh_generations(ssh_config)
+                self._loaded_ssh_config = ssh_config
+                return before
+            changed = ssh_config.changed_source_paths(previous)
+            logger.debug(
+                "Reloading connection state (changed_ssh_files=%d)", len(changed)
+            )
+            self._load_state_locked(ssh_config=ssh_config)
             after = self._build_snapshot_locked()
             return self._notify(before, after)
 
+    @contextmanager
+    def transaction(self):
+        """Group mutations into one durable commit and one change event.
+
+        Inside the scope SSH config mutations are staged in memory and the
+        sidecar write is deferred; on exit the touched config files are
+        rewritten once, the sidecar is written (and fsynced) once under a
+        single identity intent, and a single ``RepositoryChange`` covering
+        the whole scope is published. A mutation that fails inside the
+        scope rolls back only itself, so callers may collect per-item
+        failures; an exception escaping the scope discards everything.
+        Nested scopes join the outer one.
+
+        Batching is explicit only; there is no time-based group-commit
+        window. The daemon runs configuration commands one at a time under
+        a single command key, so a commit held open for later writers would
+        only wait on the queue it is blocking. Bulk operations open this
+        scope, or are a single mutation, instead.
+        """
+        with self._lock:
+            if self._bulk is not None:
+                yield self
+                return
+            state = self._require_identity_state_locked()
+            before = self._build_snapshot_locked()
+            try:
+                with self._ssh_store.staging():
+                    self._bulk = _BulkTransaction(
+                        before=before,
+                        base_ssh_revision=self._ssh_store.load().root_revision,
+                        base_sidecar_generation=state.sidecar_generation,
+                        savepoint=self._bulk_savepoint_locked(),
+                    )
+                    try:
+                        yield self
+                    finally:
+                        bulk, self._bulk = self._bulk, None
+                    self._flush_bulk_locked(bulk)
+            except BaseException:
+                self._resync_from_files()
+                raise
+            self._notify(before, self._build_snapshot_locked())
+        self._dispatch_pending_changes()
+
+    def _bulk_savepoint_locked(self) -> tuple:
+        return (
+            self._identity_state,
+            self._ssh_store.staged_savepoint(),
+            dict(self._non_ssh_generations),
+        )
+
+    def _restore_bulk_savepoint_locked(self) -> None:
+        state, staged, non_ssh_generations = self._bulk.savepoint
+        self._ssh_store.restore_staged(staged)
+        ssh_config = self._ssh_store.load()
+        self._identity_state = state
+        self._non_ssh_generations = dict(non_ssh_generations)
+        self._loaded_ssh_config = ssh_config
+        self._publish_state_locked(
+            ssh_config,
+            state_to_service_file_state(state, ssh_config.connections),
+            migrated=False,
+        )
+
+    def _flush_bulk_locked(self, bulk: _BulkTransaction) -> None:
+        """Durably commit a transaction scope: one intent, one write each."""
+        staged = self._ssh_store.staged_paths()
+        if not staged and not bulk.state_dirty:
+            return
+        state = self._require_identity_state_locked()
+        captured = self._capture_transaction_files_locked(extra_paths=staged)
+        if not staged:
+            try:
+                self._persist_state_file_locked(target_state=state)
+                self._record_post_write_locked(captured, self._state_path)
+            except Exception:
+                self._rollback_after_failure_locked(captured)
+                raise
+            self._source_fingerprint = self._source_fingerprint_locked(
+                self._loaded_ssh_config
+            )
+            return
+        target_state = replace(
+            state, sidecar_generation=bulk.base_sidecar_generation + 1
+        )
+        try:
+            intent = IdentityTransactionIntent(
+                transaction_id=new_uuid4(),
+                base_ssh_revision=bulk.base_ssh_revision,
+                target_ssh_revision=self._ssh_store._current_revision(),
+                base_sidecar_generation=bulk.base_sidecar_generation,
+                operation_label="bulk",
+                operation_kind=(
+                    "pending_ambiguity"
+                    if target_state.pending_ambiguities
+                    else "normal"
+                ),
+                target_state=target_state,
+            )
+        except ValueError as exc:
+            raise CoreError(
+                ErrorCode.MUTATION_AMBIGUOUS,
+                "The bulk connection change could not be prepared",
+            ) from exc
+        write_pending_identity_transaction(
+            identity_transaction_intent_path(self._state_path), intent
+        )
+        try:
+            committed = self._ssh_store.flush_staged(
+                expected_base_revision=bulk.base_ssh_revision
+            )
+            for path in staged:
+                self._record_post_write_locked(captured, Path(path))
+            self._commit_identity_target_locked(intent, committed, captured)
+            self._finish_identity_intent_locked()
+        except Exception:
+            self._rollback_after_failure_locked(captured)
+            raise
+        self._source_fingerprint = self._source_fingerprint_locked(committed)
+        logger.debug(
+            "Committed bulk connection transaction (mutations=%d files=%d)",
+            bulk.mutations,
+            len(staged),
+        )
+
     def transition_ssh_config(
         self, ssh_store: SshConfigStore, isolated: bool
     ) -> ConnectionStoreSnapshot:
@@ -507,14 +674,51 @@ class ConnectionRepository:
             return read_connection_state(self._state_path), False
         return read_legacy_connection_state(self._legacy_config_path), True
 
+    def _source_fingerprint_locked(
+        self, ssh_config: LoadedSshConfiguration
+    ) -> Optional[tuple]:
+        """Identify the exact sources a healthy load was built from.
+
+        ``None`` means "do not trust a cached build": degraded identity state
+        or an unreadable sidecar always takes the full load path.
+        """
+        if self._identity_state_unavailable or self._identity_recovery_required:
+            return None
+        try:
+            state_digest = hashlib.sha256(self._state_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+        if identity_transaction_intent_path(self._state_path).exists():
+            return None
+        return (
+            str(self._ssh_store.root_path),
+            self._ssh_store.isolated,
+            ssh_config.file_revisions,
+            state_digest,
+        )
+
     def _load_state_locked(
         self,
         *,
         allow_tombstone_resurrection: bool = False,
+        ssh_config: Optional[LoadedSshConfiguration] = None,
     ) -> None:
         """Load SSH first, then the UUID sidecar or a one-time v1 migration."""
-        ssh_config = self._ssh_store.load()
+        self._source_fingerprint = None
+        if ssh_config is None:
+            ssh_config = self._ssh_store.load()
         self._loaded_ssh_config = ssh_config
+        self._load_sources_locked(
+            ssh_config, allow_tombstone_resurrection=allow_tombstone_resurrection
+        )
+        self._source_fingerprint = self._source_fingerprint_locked(ssh_config)
+
+    def _load_sources_locked(
+        self,
+        ssh_config: LoadedSshConfiguration,
+        *,
+        allow_tombstone_resurrection: bool,
+    ) -> None:
         projections = projections_from_records(ssh_config.connections)
         try:
             kind = probe_connection_state_file(self._state_path)
@@ -1009,6 +1213,10 @@ class ConnectionRepository:
     # ------------------------------------------------------------------
 
     def _begin(self) -> ConnectionStoreSnapshot:
+        if self._bulk is not None:
+            # The generation cannot move inside a transaction scope, and the
+            # scope publishes against its own starting snapshot.
+            return self._bulk.before
         return self._build_snapshot_locked()
 
     @contextmanager
@@ -1018,10 +1226,22 @@ class ConnectionRepository:
         self._dispatch_pending_changes()
 
     def _commit(self, before: ConnectionStoreSnapshot) -> None:
+        if self._bulk is not None:
+            # Inside a transaction scope: advance the savepoint and publish
+            # one aggregated change when the scope commits.
+            self._bulk.savepoint = self._bulk_savepoint_locked()
+            self._bulk.mutations += 1
+            return
         self._notify(before, self._build_snapshot_locked())
 
     def _resync_from_files(self) -> None:
-        """Restore in-memory state to match the persisted files after a failure."""
+        """Restore in-memory state to match the persisted files after a failure.
+
+        Inside a transaction scope the "files" are the scope's last savepoint.
+        """
+        if self._bulk is not None:
+            self._restore_bulk_savepoint_locked()
+            return
         self._load_state_locked()
 
     def _require_identity_state_locked(self) -> IdentityStateV2:
@@ -1153,9 +1373,10 @@ class ConnectionRepository:
             operation_kind=kind,
             target_state=target,
         )
-        write_pending_identity_transaction(
-            identity_transaction_intent_path(self._state_path), intent
-        )
+        if self._bulk is None:
+            write_pending_identity_transaction(
+                identity_transaction_intent_path(self._state_path), intent
+            )
         return intent
 
     @staticmethod
@@ -1287,6 +1508,8 @@ class ConnectionRepository:
         return transform
 
     def _finish_identity_intent_locked(self) -> None:
+        if self._bulk is not None:
+            return  # the scope writes (and clears) a single intent on flush
         clear_pending_identity_transaction(identity_transaction_intent_path(self._state_path))
 
     def _sync_identity_placements_from_service_locked(
@@ -1417,7 +1640,12 @@ class ConnectionRepository:
         self._identity_state = candidate
         return candidate
 
-    def _capture_transaction_files_locked(self, ssh_target: Optional[Path] = None):
+    def _capture_transaction_files_locked(
+        self,
+        ssh_target: Optional[Path] = None,
+        *,
+        extra_paths=(),
+    ):
         """Capture pre-write state for every file the mutation will touch.
 
         Returns a dict mapping each ``Path`` to a tuple of:
@@ -1437,10 +1665,16 @@ class ConnectionRepository:
 
         Non-SSH mutations must not capture or restore the SSH root, so
         callers must only pass ``ssh_target`` for SSH mutations.
+
+        Inside a transaction scope nothing is written per mutation, so
+        nothing is captured; the scope captures its files once on flush.
         """
+        if self._bulk is not None:
+            return {}
         paths = {self._state_path}
         if ssh_target is not None:
             paths.add(Path(ssh_target))
+        paths.update(Path(path) for path in extra_paths)
         captured = {}
         for path in paths:
             path = Path(path)
@@ -1630,6 +1864,9 @@ class ConnectionRepository:
                 ) from exc
 
     def _rollback_after_failure_locked(self, captured, ssh_target: Optional[Path] = None) -> None:
+        if self._bulk is not None:
+            self._restore_bulk_savepoint_locked()
+            return
         try:
             self._restore_transaction_files_locked(captured)
             self._resync_from_files()
@@ -1988,6 +2225,10 @@ class ConnectionRepository:
             if target_state is not None
             else self._sync_identity_placements_from_service_locked()
         )
+        if self._bulk is not None:
+            self._identity_state = state
+            self._bulk.state_dirty = True
+            return
         write_identity_state_v2(self._state_path, state)
 
     def _remove_persisted_root_id_locked(self, connection_id: str) -> None:
@@ -12,6 +12,13 @@ header aborts the whole load (no partial state is returned) and surfaces a
 generic ``CoreError`` that never embeds filesystem paths. The deterministic
 revision hashes every participating file's path-relative identity plus its
 exact bytes, so any edit anywhere in the include tree changes the revision.
+
+Parsed documents are cached per file, keyed by ``(inode, mtime, size,
+sha256)``. A reload whose stat signature is unchanged (and not racily recent)
+reuses the cached bytes and document without reading the file; a changed
+signature rereads the bytes but reparses only when the digest differs. The
+per-file digests are exposed as ``file_revisions`` so callers can tell which
+participating files actually changed between two loads.
 """
 
 from __future__ import annotations
@@ -22,6 +29,9 @@ import hashlib
 import os
 import re
 import shlex
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, Optional, Tuple
@@ -30,7 +40,7 @@ from ...ssh_config_document import (
     HostBlock,
     MatchBlock,
     SSHConfigDocument,
-    _split_config_option,
+    split_config_option,
     _split_keyword,
 )
 from ...ssh_config_formatter import MANAGED_HOST_OPTIONS
@@ -60,6 +70,26 @@ class LoadedSshConfiguration:
     source_paths: frozenset
     root_revision: str
     watch_paths: frozenset = frozenset()
+    # ``(path, sha256)`` per participating file, in resolution order.
+    file_revisions: Tuple[Tuple[str, str], ...] = ()
+
+    def changed_source_paths(
+        self, previous: Optional["LoadedSshConfiguration"]
+    ) -> frozenset:
+        """Return the participating paths whose bytes differ from *previous*.
+
+        Files that joined or left the include tree count as changed. Without a
+        previous load every participating path is reported.
+        """
+        current = dict(self.file_revisions)
+        if previous is None:
+            return frozenset(current)
+        prior = dict(previous.file_revisions)
+        return frozenset(
+            path
+            for path in set(current) | set(prior)
+            if current.get(path) != prior.get(path)
+        )
 
 
 def _config_error(message: str) -> CoreError:
@@ -97,6 +127,153 @@ def _expand_ssh_tokens(value: str) -> str:
     return _TOKEN_RE.sub(_repl, value)
 
 
+# ---------------------------------------------------------------------------
+# Per-file parse cache
+# ---------------------------------------------------------------------------
+
+# A stat signature is only trusted once the cache entry was recorded clearly
+# after the file's mtime; otherwise a same-size rewrite inside one timestamp
+# tick would go unnoticed (the classic "racy git" problem).
+_RACY_WINDOW_NS = 2_000_000_000
+_MAX_CACHED_FILES = 1024
+
+
+@dataclass(frozen=True)
+class _FileFingerprint:
+    inode: int
+    mtime_ns: int
+    size: int
+    digest: str
+    # ctime catches chmod/chown, so a file made unreadable is re-read (and
+    # fails strictly) instead of being served from the cache.
+    ctime_ns: int = -1
+
+
+class _CachedConfigFile:
+    """Bytes, digest and lazily parsed document of one config file."""
+
+    __slots__ = ("fingerprint", "data", "recorded_ns", "_text", "_document", "_path")
+
+    def __init__(self, path: Path, fingerprint: _FileFingerprint, data: bytes) -> None:
+        self._path = path
+        self.fingerprint = fingerprint
+        self.data = data
+        self.recorded_ns = time.time_ns()
+        self._text: Optional[str] = None
+        self._document: Optional[SSHConfigDocument] = None
+
+    def text(self) -> str:
+        """Decoded text; raises ``UnicodeDecodeError`` for invalid bytes."""
+        if self._text is None:
+            self._text = self.data.decode("utf-8")
+        return self._text
+
+    def document(self) -> SSHConfigDocument:
+        if self._document is None:
+            self._document = SSHConfigDocument.parse_text(
+                self.text(), path=str(self._path)
+            )
+        return self._document
+
+
+class _ConfigFileCache:
+    """Process-wide LRU of parsed config files keyed by resolved path.
+
+    Cached documents are shared between loads and must be treated as
+    read-only; the mutation path in ``SshConfigStore`` parses its own copies.
+    """
+
+    def __init__(self, max_entries: int = _MAX_CACHED_FILES) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Path, _CachedConfigFile]" = OrderedDict()
+        self._max_entries = max_entries
+
+    def get(self, path: Path) -> _CachedConfigFile:
+        """Return the current entry for *path*, reading it only when needed.
+
+        Raises ``FileNotFoundError``/``OSError`` like a plain read.
+        """
+        st = os.stat(path)
+        with self._lock:
+            cached = self._entries.get(path)
+        if cached is not None:
+            fp = cached.fingerprint
+            if (
+                fp.inode == st.st_ino
+                and fp.mtime_ns == st.st_mtime_ns
+                and fp.ctime_ns == st.st_ctime_ns
+                and fp.size == st.st_size
+                and cached.recorded_ns - max(st.st_mtime_ns, st.st_ctime_ns)
+                > _RACY_WINDOW_NS
+            ):
+                with self._lock:
+                    self._entries.move_to_end(path)
+                return cached
+        with open(path, "rb") as handle:
+            data = handle.read()
+        fingerprint = _FileFingerprint(
+            inode=st.st_ino,
+            mtime_ns=st.st_mtime_ns,
+            size=len(data),
+            digest=hashlib.sha256(data).hexdigest(),
+            ctime_ns=st.st_ctime_ns,
+        )
+        entry = _CachedConfigFile(path, fingerprint, data)
+        if cached is not None and cached.fingerprint.digest == fingerprint.digest:
+            # Touched or replaced with identical bytes: keep the parsed AST.
+            entry._text = cached._text
+            entry._document = cached._document
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_FILE_CACHE = _ConfigFileCache()
+
+
+def cached_config_text(path: os.PathLike | str) -> Tuple[str, str]:
+    """Return ``(digest, text)`` of *path* through the shared file cache.
+
+    An unchanged file costs one ``stat``. Raises ``FileNotFoundError`` or
+    ``OSError`` when it cannot be read and ``UnicodeDecodeError`` for
+    invalid bytes.
+    """
+    entry = _FILE_CACHE.get(Path(path).resolve())
+    return entry.fingerprint.digest, entry.text()
+
+
+def _file_entry(
+    path: Path, overrides: Mapping[Path, bytes]
+) -> _CachedConfigFile:
+    """Return the cache entry for *path*, honouring in-memory overrides."""
+    abs_path = path.resolve()
+    override = overrides.get(abs_path)
+    if override is not None:
+        data = bytes(override)
+        return _CachedConfigFile(
+            abs_path,
+            _FileFingerprint(-1, -1, len(data), hashlib.sha256(data).hexdigest()),
+            data,
+        )
+    return _FILE_CACHE.get(abs_path)
+
+
+def _normalized_overrides(
+    content_overrides: Optional[Mapping[Path, bytes]],
+) -> Dict[Path, bytes]:
+    return {
+        Path(key).resolve(): bytes(value)
+        for key, value in (content_overrides or {}).items()
+    }
+
+
 # ---------------------------------------------------------------------------
 # Include resolution (headless; unreadable files are fatal)
 # ---------------------------------------------------------------------------
@@ -120,21 +297,11 @@ def _resolve_config_files(
     unreadable = []
 
     _MISSING = object()
-    overrides = {
-        Path(path).resolve(): bytes(content)
-        for path, content in (content_overrides or {}).items()
-    }
+    overrides = _normalized_overrides(content_overrides)
 
     def _read_lines(path: Path):
-        override = overrides.get(path.resolve())
-        if override is not None:
-            try:
-                return override.decode("utf-8").splitlines(keepends=True)
-            except UnicodeDecodeError:
-                unreadable.append(path)
-                return None
         try:
-            return path.read_text(encoding="utf-8").splitlines(keepends=True)
+            return _file_entry(path, overrides).text().splitlines(keepends=True)
         except FileNotFoundError:
             return _MISSING  # missing include -> tolerated, treated as empty
         except (OSError, UnicodeError):
@@ -568,28 +735,62 @@ def _parse_host_config(
 # Document loading
 # ---------------------------------------------------------------------------
 
+_REVISION_MEMO: "OrderedDict[Tuple[Tuple[str, str], ...], str]" = OrderedDict()
+_REVISION_MEMO_LOCK = threading.Lock()
+_MAX_REVISION_MEMO = 16
+
+
+def _file_revisions(
+    files: List[Path], content_overrides: Optional[Mapping[Path, bytes]] = None
+) -> Tuple[Tuple[str, str], ...]:
+    """Return ``(path, sha256)`` for every participating file."""
+    overrides = _normalized_overrides(content_overrides)
+    revisions = []
+    for path in files:
+        try:
+            entry = _file_entry(path, overrides)
+        except OSError as exc:
+            raise _config_error("SSH configuration could not be read completely") from exc
+        revisions.append((str(path), entry.fingerprint.digest))
+    return tuple(revisions)
+
+
 def _compute_revision(
     files: List[Path], content_overrides: Optional[Mapping[Path, bytes]] = None
 ) -> str:
-    """Deterministic SHA-256 over each file's path-relative identity + bytes."""
-    hasher = hashlib.sha256()
-    overrides = {
-        Path(key).resolve(): bytes(value)
-        for key, value in (content_overrides or {}).items()
-    }
+    """Deterministic SHA-256 over each file's path-relative identity + bytes.
+
+    The formula is unchanged from the uncached loader so persisted observed
+    revisions stay valid; the result is memoized on the per-file digests so
+    an unchanged include tree is not rehashed.
+    """
+    overrides = _normalized_overrides(content_overrides)
+    entries = []
     for path in files:
         try:
-            data = overrides.get(path.resolve())
-            if data is None:
-                data = path.read_bytes()
+            entries.append((path, _file_entry(path, overrides)))
         except OSError as exc:
             raise _config_error("SSH configuration could not be read completely") from exc
-        rel = os.path.relpath(path)
+    key = tuple(
+        (os.path.relpath(path), entry.fingerprint.digest) for path, entry in entries
+    )
+    with _REVISION_MEMO_LOCK:
+        memoized = _REVISION_MEMO.get(key)
+        if memoized is not None:
+            _REVISION_MEMO.move_to_end(key)
+            return memoized
+    hasher = hashlib.sha256()
+    for (rel, _digest), (_path, entry) in zip(key, entries):
         hasher.update(rel.encode("utf-8"))
         hasher.update(b"\x00")
-        hasher.update(data)
+        hasher.update(entry.data)
         hasher.update(b"\x00")
-    return hasher.hexdigest()
+    revision = hasher.hexdigest()
+    with _REVISION_MEMO_LOCK:
+        _REVISION_MEMO[key] = revision
+        while len(_REVISION_MEMO) > _MAX_REVISION_MEMO:
+            _REVISION_MEMO.popitem(last=False)
+    return revision
 
 
 def _static_value(value: str) -> bool:
@@ -608,7 +809,7 @@ def _host_option_values(block: HostBlock, key: str) -> List[str]:
         line = raw_line.strip()
         if not line or line.startswith("#"):
             continue
-        option, value = _split_config_option(line)
+        option, value = split_config_option(line)
         if option and option.lower() == key and value is not None:
             values.append(_unwrap_ssh_value(value))
     return values
@@ -638,18 +839,10 @@ def _static_identity_evidence(
         if global_reason is None or priority[reason] > priority[global_reason]:
             global_reason = reason
 
-    overrides = {
-        Path(key).resolve(): bytes(value)
-        for key, value in (content_overrides or {}).items()
-    }
+    overrides = _normalized_overrides(content_overrides)
     for cfg_file in files:
         try:
-            raw = overrides.get(cfg_file.resolve())
-            doc = (
-                SSHConfigDocument.parse_text(raw.decode("utf-8"), path=str(cfg_file))
-                if raw is not None
-                else SSHConfigDocument.parse_file(cfg_file)
-            )
+            doc = _file_entry(cfg_file, overrides).document()
         except (OSError, UnicodeDecodeError):
             mark_global_reason("include_semantics")
             continue
@@ -860,7 +1053,7 @@ def load_ssh_configuration(
                 continue
             if _split_keyword(line)[0] == "include":
                 continue  # Include lines are handled by resolution
-            key, value = _split_config_option(line)
+            key, value = split_config_option(line)
             if key is None:
                 continue
             key = key.lower()
@@ -872,17 +1065,10 @@ def load_ssh_configuration(
             else:
                 config[key] = value
 
+    overrides = _normalized_overrides(_content_overrides)
     for cfg_file in files:
         try:
-            raw = {
-                Path(key).resolve(): bytes(value)
-                for key, value in (_content_overrides or {}).items()
-            }.get(cfg_file.resolve())
-            doc = (
-                SSHConfigDocument.parse_text(raw.decode("utf-8"), path=str(cfg_file))
-                if raw is not None
-                else SSHConfigDocument.parse_file(cfg_file)
-            )
+            doc = _file_entry(cfg_file, overrides).document()
         except (OSError, UnicodeDecodeError) as exc:
             raise _config_error("SSH configuration could not be read completely") from exc
 
@@ -961,4 +1147,5 @@ def load_ssh_configuration(
         source_paths=frozenset(files),
         root_revision=_compute_revision(files, _content_overrides),
         watch_paths=frozenset(watch_paths or files),
+        file_revisions=_file_revisions(files, _content_overrides),
     )
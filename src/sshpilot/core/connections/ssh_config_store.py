@@ -13,6 +13,11 @@ revision immediately before commit and raises a dedicated stale-state
 are never retried automatically, and failed writes leave the previous file
 bytes untouched.
 
+Bulk edits can run inside :meth:`SshConfigStore.staging`: prepared mutations
+then commit into an in-memory overlay that every subsequent load, preview and
+revision check reads through, and :meth:`SshConfigStore.flush_staged` writes
+each touched file once at the end.
+
 All public errors are generic — they never embed filesystem paths, OS
 exception text, or file contents.
 """
@@ -26,6 +31,7 @@ import shutil
 import stat
 import tempfile
 import hashlib
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, Optional
@@ -322,6 +328,10 @@ class SshConfigStore:
         # Per-connection mutation generations (stale-editor detection). These
         # are in-memory only; the daemon process owns them for its lifetime.
         self._generations: Dict[str, int] = {}
+        # Staged overlay (resolved path -> bytes) while a bulk edit is open,
+        # plus the on-disk bytes each staged file had when first staged.
+        self._staged: Optional[Dict[Path, bytes]] = None
+        self._staged_base: Dict[Path, Optional[bytes]] = {}
 
     @property
     def root_path(self) -> Path:
@@ -335,7 +345,11 @@ class SshConfigStore:
     # -- loading -----------------------------------------------------------
 
     def load(self) -> LoadedSshConfiguration:
-        config = load_ssh_configuration(self._root_path, isolated=self._isolated)
+        config = load_ssh_configuration(
+            self._root_path,
+            isolated=self._isolated,
+            _content_overrides=self._staged or None,
+        )
         return self._overlay_generations(config)
 
     def _overlay_generations(
@@ -346,18 +360,127 @@ class SshConfigStore:
         return config
 
     def _reload_after_write(self) -> LoadedSshConfiguration:
-        return self._overlay_generations(
-            load_ssh_configuration(self._root_path, isolated=self._isolated)
-        )
+        return self.load()
 
     def _revision_matches(self, expected: str) -> bool:
-        """True when the on-disk revision still equals *expected*."""
+        """True when the on-disk (or staged) revision still equals *expected*."""
         try:
-            files = _resolve_config_files(self._root_path)
-            return _compute_revision(files) == expected
+            return self._staged_revision() == expected
         except (CoreError, OSError):
             return False
 
+    def _staged_revision(self) -> str:
+        overrides = self._staged or None
+        files = _resolve_config_files(self._root_path, content_overrides=overrides)
+        return _compute_revision(files, overrides)
+
+    # -- staged bulk edits -------------------------------------------------
+
+    @property
+    def staging_active(self) -> bool:
+        return self._staged is not None
+
+    @contextmanager
+    def staging(self):
+        """Route prepared commits into an in-memory overlay for one bulk edit.
+
+        The caller must end the scope with :meth:`flush_staged` (durable) or
+        let an exception discard the overlay; leaving the scope normally
+        without flushing also discards it. Staging does not nest.
+        """
+        if self._staged is not None:
+            raise RuntimeError("SSH config staging is already active")
+        self._staged = {}
+        self._staged_base = {}
+        try:
+            yield self
+        finally:
+            self._staged = None
+            self._staged_base = {}
+
+    def staged_paths(self) -> frozenset:
+        return frozenset(self._staged or ())
+
+    def staged_savepoint(self) -> Dict[Path, bytes]:
+        """Copy of the overlay, restorable with :meth:`restore_staged`."""
+        return dict(self._staged or {})
+
+    def restore_staged(self, savepoint: Mapping[Path, bytes]) -> None:
+        if self._staged is None:
+            return
+        self._staged = dict(savepoint)
+        for path in list(self._staged_base):
+            if path not in self._staged:
+                del self._staged_base[path]
+
+    def _commit_staged(self, prepared: PreparedSshMutation) -> None:
+        """Staged twin of ``PreparedSshMutation.commit``: no file is touched."""
+        self._refuse_symlinked_root()
+        if not self._revision_matches(prepared.base_revision):
+            raise _stale_error()
+        target = prepared.target_path.resolve()
+        current = self._read_source_bytes(target, missing_ok=True)
+        if prepared.expected_bytes is not None and current != prepared.expected_bytes:
+            raise _stale_error()
+        if target not in self._staged_base:
+            try:
+                self._staged_base[target] = target.read_bytes()
+            except FileNotFoundError:
+                self._staged_base[target] = None
+            except OSError as exc:
+                raise _store_error(
+                    "The connection configuration could not be read"
+                ) from exc
+        self._staged[target] = prepared.target_text.encode("utf-8")
+
+    def flush_staged(self, *, expected_base_revision: str) -> LoadedSshConfiguration:
+        """Write every staged file once and leave staging with an empty overlay.
+
+        The on-disk tree must still be at *expected_base_revision* and each
+        target must still hold the bytes it had when first staged, otherwise a
+        stale-state error is raised before (or instead of) that file's write.
+        """
+        if self._staged is None:
+            raise RuntimeError("SSH config staging is not active")
+        staged, bases = dict(self._staged), dict(self._staged_base)
+        # From here on loads read the real files; a failed flush leaves the
+        # caller to roll back whatever was already replaced.
+        self._staged = {}
+        self._staged_base = {}
+        if staged and not self._revision_matches(expected_base_revision):
+            raise _stale_error()
+        for path, data in staged.items():
+            _atomic_write_text(
+                path, data.decode("utf-8"), expected_bytes=bases.get(path)
+            )
+        return self.load()
+
+    def _read_source_bytes(self, path: Path, *, missing_ok: bool = False) -> Optional[bytes]:
+        """Current bytes of a participating file, staged overlay first."""
+        resolved = Path(path).resolve()
+        if self._staged and resolved in self._staged:
+            return self._staged[resolved]
+        try:
+            return Path(path).read_bytes()
+        except FileNotFoundError:
+            if missing_ok:
+                return None
+            raise
+
+    def _source_exists(self, path: Path) -> bool:
+        if self._staged and Path(path).resolve() in self._staged:
+            return True
+        return Path(path).exists()
+
+    def _parse_source(self, path: Path) -> SSHConfigDocument:
+        """Fresh (mutable) document for *path*, honouring the staged overlay."""
+        resolved = Path(path).resolve()
+        if self._staged and resolved in self._staged:
+            return SSHConfigDocument.parse_text(
+                self._staged[resolved].decode("utf-8"), path=str(path)
+            )
+        return SSHConfigDocument.parse_file(str(path))
+
     # -- raw text editor (daemon-selected document) -----------------------
 
     def _display_name(self) -> str:
@@ -405,7 +528,7 @@ class SshConfigStore:
 
     def _current_revision(self) -> str:
         try:
-            return _compute_revision(_resolve_config_files(self._root_path))
+            return self._staged_revision()
         except (CoreError, OSError) as exc:
             raise _store_error(
                 "The connection configuration could not be read"
@@ -465,9 +588,7 @@ class SshConfigStore:
         if type(expected_revision) is not str or not expected_revision.strip():
             raise TypeError("an expected SSH config revision is required")
         self._refuse_symlinked_root()
-        expected_bytes = (
-            self._root_path.read_bytes() if self._root_path.exists() else None
-        )
+        expected_bytes = self._read_source_bytes(self._root_path, missing_ok=True)
         if not self._revision_matches(expected_revision):
             raise _stale_error()
         prepared = PreparedSshMutation(
@@ -484,7 +605,10 @@ class SshConfigStore:
         """Commit a prepared mutation and reload authoritative projections."""
         if type(prepared) is not PreparedSshMutation:
             raise TypeError("a PreparedSshMutation is required")
-        prepared.commit(self)
+        if self._staged is not None:
+            self._commit_staged(prepared)
+        else:
+            prepared.commit(self)
         if prepared.remove_connection_id is not None:
             self._generations.pop(prepared.remove_connection_id, None)
         if prepared.connection_id:
@@ -508,16 +632,18 @@ class SshConfigStore:
         """
         if type(prepared) is not PreparedSshMutation:
             raise TypeError("a PreparedSshMutation is required")
+        overrides = dict(self._staged or {})
+        overrides[self._root_path.resolve()] = (
+            prepared.target_text.encode("utf-8")
+            if prepared.target_path.resolve() == self._root_path.resolve()
+            else self._read_source_bytes(self._root_path)
+        )
+        overrides[prepared.target_path.resolve()] = prepared.target_text.encode("utf-8")
         return self._overlay_generations(
             load_ssh_configuration(
                 self._root_path,
                 isolated=self._isolated,
-                _content_overrides={
-                    self._root_path.resolve(): prepared.target_text.encode("utf-8")
-                    if prepared.target_path.resolve() == self._root_path.resolve()
-                    else self._root_path.read_bytes(),
-                    prepared.target_path.resolve(): prepared.target_text.encode("utf-8"),
-                },
+                _content_overrides=overrides,
             )
         )
 
@@ -572,9 +698,9 @@ class SshConfigStore:
         if any(record.id == nickname for record in config.connections):
             raise _already_exists_error()
         self._ensure_authored_alias_available(nickname)
-        expected = self._root_path.read_bytes() if self._root_path.exists() else None
-        if self._root_path.exists():
-            doc = SSHConfigDocument.parse_file(str(self._root_path))
+        expected = self._read_source_bytes(self._root_path, missing_ok=True)
+        if self._source_exists(self._root_path):
+            doc = self._parse_source(self._root_path)
             doc.nodes.append(
                 RawSpan(lines=doc.render_lines(["\n"] + merged_block_lines(None, payload)))
             )
@@ -616,8 +742,8 @@ class SshConfigStore:
             raise _already_exists_error()
         if new_name != connection_id:
             self._ensure_authored_alias_available(new_name)
-        expected = target.read_bytes()
-        doc = SSHConfigDocument.parse_file(str(target))
+        expected = self._read_source_bytes(target)
+        doc = self._parse_source(target)
         found = False
         nodes: List[Any] = []
         for node in doc.nodes:
@@ -654,8 +780,8 @@ class SshConfigStore:
         if not source:
             raise _store_error("The connection has no recorded source file")
         target = Path(source)
-        expected = target.read_bytes()
-        doc = SSHConfigDocument.parse_file(str(target))
+        expected = self._read_source_bytes(target)
+        doc = self._parse_source(target)
         modified = False
         nodes: List[Any] = []
         for node in doc.nodes:
@@ -701,8 +827,8 @@ class SshConfigStore:
         base["nickname"] = new_name
         base.setdefault("hostname", record.hostname or new_name)
         target = Path(source)
-        expected = target.read_bytes()
-        doc = SSHConfigDocument.parse_file(str(target))
+        expected = self._read_source_bytes(target)
+        doc = self._parse_source(target)
         doc.nodes.append(RawSpan(lines=doc.render_lines(["\n"] + merged_block_lines(None, base))))
         return self._prepare_document_replacement(
             operation="duplicate", target=target,
@@ -740,8 +866,8 @@ class SshConfigStore:
             raise _already_exists_error()
         self._ensure_split_destination_available(new_name, original_host_token)
         target = Path(source)
-        expected = target.read_bytes()
-        doc = SSHConfigDocument.parse_file(str(target))
+        expected = self._read_source_bytes(target)
+        doc = self._parse_source(target)
         found = False
         nodes: List[Any] = []
         for node in doc.nodes:
@@ -859,8 +985,10 @@ class SshConfigStore:
     def _authored_concrete_host_blocks(self) -> List[HostBlock]:
         """Enumerate literal Host declarations across the Include graph."""
         occurrences: List[HostBlock] = []
-        for cfg_file in _resolve_config_files(self._root_path):
-            doc = SSHConfigDocument.parse_file(str(cfg_file))
+        for cfg_file in _resolve_config_files(
+            self._root_path, content_overrides=self._staged or None
+        ):
+            doc = self._parse_source(cfg_file)
             for node in doc.nodes:
                 if (
                     isinstance(node, HostBlock)
@@ -1,12 +1,16 @@
 """SSH key domain services."""
+from .fingerprint import FingerprintCache, PublicKeyFingerprint, fingerprint_public_key
 from .service import KeyGenerateSpec, KeyService, SSHKeyInfo
 from .utils import SKIPPED_FILENAMES, is_private_key, looks_like_private_key
 
 __all__ = [
     "SKIPPED_FILENAMES",
+    "FingerprintCache",
     "KeyGenerateSpec",
     "KeyService",
+    "PublicKeyFingerprint",
     "SSHKeyInfo",
+    "fingerprint_public_key",
     "is_private_key",
     "looks_like_private_key",
 ]
@@ -0,0 +1,282 @@
+"""In-process OpenSSH public-key fingerprints.
+
+``ssh-keygen -lf`` hashes the decoded public-key blob, so the SHA256 and MD5
+fingerprints of an OpenSSH public-key line can be computed without starting a
+process per key. :class:`FingerprintCache` remembers results per file, keyed
+by ``(path, inode, mtime, size)`` so an edited or replaced ``.pub`` file is
+re-read, and optionally persists them as JSON between runs.
+
+Only public-key lines are read; private key files are never opened here.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..import_export import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+_MAX_LINE_BYTES = 64 * 1024
+_CACHE_FORMAT_VERSION = 1
+
+# Labels ``ssh-keygen -l`` prints in parentheses for each key name.
+KEY_TYPE_LABELS: Dict[str, str] = {
+    "ssh-rsa": "RSA",
+    "ssh-dss": "DSA",
+    "ssh-ed25519": "ED25519",
+    "ecdsa-sha2-nistp256": "ECDSA",
+    "ecdsa-sha2-nistp384": "ECDSA",
+    "ecdsa-sha2-nistp521": "ECDSA",
+    "sk-ssh-ed25519@openssh.com": "ED25519-SK",
+    "sk-ecdsa-sha2-nistp256@openssh.com": "ECDSA-SK",
+}
+
+_ECDSA_CURVE_BITS = {"nistp256": 256, "nistp384": 384, "nistp521": 521}
+
+# File signature used to validate cached entries: (inode, mtime_ns, size).
+_Signature = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class PublicKeyFingerprint:
+    """Fingerprints and display metadata for one public key."""
+
+    key_name: str
+    key_type: str
+    bits: Optional[int]
+    sha256: str
+    md5: str
+    comment: str = ""
+
+    @property
+    def complete(self) -> bool:
+        """True when the blob was fully understood (``bits`` is known)."""
+        return self.bits is not None
+
+    def keygen_line(self) -> str:
+        """Format like ``ssh-keygen -lf``: ``<bits> <sha256> <comment> (<type>)``."""
+        bits = "0" if self.bits is None else str(self.bits)
+        return f"{bits} {self.sha256} {self.comment or 'no comment'} ({self.key_type})"
+
+
+def sha256_fingerprint(blob: bytes) -> str:
+    digest = base64.b64encode(hashlib.sha256(blob).digest()).decode("ascii")
+    return f"SHA256:{digest.rstrip('=')}"
+
+
+def md5_fingerprint(blob: bytes) -> str:
+    digest = hashlib.md5(blob, usedforsecurity=False).hexdigest()
+    return "MD5:" + ":".join(digest[i:i + 2] for i in range(0, len(digest), 2))
+
+
+def _read_string(blob: bytes, offset: int) -> Tuple[bytes, int]:
+    if offset + 4 > len(blob):
+        raise ValueError("truncated key blob")
+    (length,) = struct.unpack_from(">I", blob, offset)
+    start = offset + 4
+    end = start + length
+    if end > len(blob):
+        raise ValueError("truncated key blob")
+    return blob[start:end], end
+
+
+def key_bits(key_name: str, blob: bytes) -> Optional[int]:
+    """Key size as ``ssh-keygen`` reports it, or None if *blob* is not understood.
+
+    The blob must start with *key_name* and carry the fields that key type
+    defines; certificates and unknown types are left to ``ssh-keygen``.
+    """
+    try:
+        embedded, offset = _read_string(blob, 0)
+        if embedded.decode("ascii") != key_name:
+            return None
+        if key_name == "ssh-rsa":
+            _exponent, offset = _read_string(blob, offset)
+            modulus, offset = _read_string(blob, offset)
+            bits = int.from_bytes(modulus, "big").bit_length()
+        elif key_name == "ssh-dss":
+            prime, offset = _read_string(blob, offset)
+            for _ in range(3):
+                _value, offset = _read_string(blob, offset)
+            bits = int.from_bytes(prime, "big").bit_length()
+        elif key_name in ("ssh-ed25519", "sk-ssh-ed25519@openssh.com"):
+            point, offset = _read_string(blob, offset)
+            if len(point) != 32:
+                return None
+            bits = 256
+        elif key_name.startswith("ecdsa-sha2-") or key_name.startswith("sk-ecdsa-sha2-"):
+            curve, offset = _read_string(blob, offset)
+            expected = key_name.split("-")[-1].split("@")[0]
+            if curve.decode("ascii") != expected:
+                return None
+            _point, offset = _read_string(blob, offset)
+            bits = _ECDSA_CURVE_BITS.get(expected)
+        else:
+            return None
+        if key_name.startswith("sk-"):
+            _application, offset = _read_string(blob, offset)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if offset != len(blob):
+        return None
+    return bits or None
+
+
+def fingerprint_public_key(line: Optional[str]) -> Optional[PublicKeyFingerprint]:
+    """Fingerprint one ``<key-name> <base64> [comment]`` line.
+
+    Returns None when the line has no decodable base64 blob. A blob whose
+    structure is not understood still gets its hashes, with ``bits`` None.
+    """
+    parts = (line or "").strip().split(None, 2)
+    if len(parts) < 2:
+        return None
+    key_name, encoded = parts[0], parts[1]
+    try:
+        blob = base64.b64decode(encoded, validate=True)
+    except (ValueError, TypeError):
+        return None
+    return PublicKeyFingerprint(
+        key_name=key_name,
+        key_type=KEY_TYPE_LABELS.get(key_name)
+        or key_name.removeprefix("ecdsa-sha2-").upper(),
+        bits=key_bits(key_name, blob),
+        sha256=sha256_fingerprint(blob),
+        md5=md5_fingerprint(blob),
+        comment=" ".join(parts[2].split()) if len(parts) > 2 else "",
+    )
+
+
+def fingerprint_public_key_file(path: os.PathLike | str) -> Optional[PublicKeyFingerprint]:
+    """Fingerprint the first line of the public-key file at *path*."""
+    with open(path, "rb") as handle:
+        first = handle.readline(_MAX_LINE_BYTES)
+    return fingerprint_public_key(first.decode("utf-8"))
+
+
+class FingerprintCache:
+    """Public-key fingerprints cached by ``(path, inode, mtime, size)``.
+
+    With a *path*, entries are loaded from and :meth:`save`-d to a JSON file
+    so a restart does not re-read every key. Files that could not be
+    fingerprinted are cached as misses under the same signature.
+    """
+
+    def __init__(
+        self,
+        path: Optional[os.PathLike] = None,
+        *,
+        max_entries: int = 4096,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self._path = Path(path) if path is not None else None
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[_Signature, Optional[PublicKeyFingerprint]]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if self._path is None:
+            return
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logger.debug("Ignoring unreadable fingerprint cache", exc_info=True)
+            return
+        if not isinstance(payload, dict) or payload.get("version") != _CACHE_FORMAT_VERSION:
+            return
+        keys = payload.get("keys")
+        if not isinstance(keys, dict):
+            return
+        for key_path, entry in keys.items():
+            try:
+                signature = (int(entry["inode"]), int(entry["mtime_ns"]), int(entry["size"]))
+                stored = entry.get("fingerprint")
+                result = None
+                if stored is not None:
+                    bits = stored["bits"]
+                    result = PublicKeyFingerprint(
+                        key_name=str(stored["key_name"]),
+                        key_type=str(stored["key_type"]),
+                        bits=None if bits is None else int(bits),
+                        sha256=str(stored["sha256"]),
+                        md5=str(stored["md5"]),
+                        comment=str(stored.get("comment", "")),
+                    )
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+            self._entries[str(key_path)] = (signature, result)
+
+    def lookup(self, public_path: os.PathLike | str) -> Optional[PublicKeyFingerprint]:
+        """Fingerprint *public_path*, reading it only if its signature changed."""
+        key = os.path.abspath(os.fspath(public_path))
+        try:
+            info = os.stat(key)
+        except OSError:
+            with self._lock:
+                if self._entries.pop(key, None) is not None:
+                    self._dirty = True
+            return None
+        signature = (info.st_ino, info.st_mtime_ns, info.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        try:
+            result = fingerprint_public_key_file(key)
+        except (OSError, UnicodeError):
+            logger.debug("Public key unreadable for fingerprinting", exc_info=True)
+            result = None
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (signature, result)
+            while len(self._entries) > self._max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._dirty = True
+        return result
+
+    def save(self) -> None:
+        """Write the cache if it changed since the last save."""
+        if self._path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            keys = {}
+            for key_path, ((inode, mtime_ns, size), result) in self._entries.items():
+                keys[key_path] = {
+                    "inode": inode,
+                    "mtime_ns": mtime_ns,
+                    "size": size,
+                    "fingerprint": None
+                    if result is None
+                    else {
+                        "key_name": result.key_name,
+                        "key_type": result.key_type,
+                        "bits": result.bits,
+                        "sha256": result.sha256,
+                        "md5": result.md5,
+                        "comment": result.comment,
+                    },
+                }
+            payload = {"version": _CACHE_FORMAT_VERSION, "keys": keys}
+            self._dirty = False
+        try:
+            atomic_write_json(self._path, payload)
+        except OSError:
+            with self._lock:
+                self._dirty = True
+            logger.debug("Could not save fingerprint cache", exc_info=True)
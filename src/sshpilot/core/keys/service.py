@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Callable, Dict, List, Mapping, Optional, Sequence
 
 from ..errors import CoreError, ErrorCode
+from .fingerprint import FingerprintCache
 from .utils import SKIPPED_FILENAMES, is_private_key
 
 logger = logging.getLogger(__name__)
@@ -51,7 +52,12 @@ class KeyGenerateSpec:
 class KeyService:
     """Discover and generate SSH keys without GObject / GTK."""
 
-    def __init__(self, ssh_dir: Path | str):
+    def __init__(
+        self,
+        ssh_dir: Path | str,
+        *,
+        fingerprint_cache: Optional[FingerprintCache] = None,
+    ):
         self.ssh_dir = Path(ssh_dir)
         if not self.ssh_dir.exists():
             self.ssh_dir.mkdir(parents=True, exist_ok=True)
@@ -60,6 +66,9 @@ class KeyService:
             except OSError:
                 pass
         self._key_validation_cache: Dict[str, bool] = {}
+        self._fingerprint_cache = (
+            fingerprint_cache if fingerprint_cache is not None else FingerprintCache()
+        )
 
     def discover_keys(self) -> List[SSHKeyInfo]:
         keys: List[SSHKeyInfo] = []
@@ -308,7 +317,20 @@ class KeyService:
         return completed.returncode == 0
 
     def fingerprint(self, public_or_private_path: str) -> Optional[str]:
-        """Return ``ssh-keygen -lf`` fingerprint, or None on failure."""
+        """Return the ``ssh-keygen -lf`` fingerprint line, or None on failure.
+
+        OpenSSH public keys (the path itself or its ``.pub`` companion, as
+        ``ssh-keygen`` resolves them) are fingerprinted in-process through
+        the stat-keyed cache; ``ssh-keygen`` only runs for formats the
+        in-process parser does not understand, such as certificates.
+        """
+        public_path = public_or_private_path
+        if not public_path.endswith(".pub") and os.path.isfile(f"{public_path}.pub"):
+            public_path = f"{public_path}.pub"
+        if public_path.endswith(".pub"):
+            result = self._fingerprint_cache.lookup(public_path)
+            if result is not None and result.complete:
+                return result.keygen_line()
         try:
             completed = subprocess.run(
                 ["ssh-keygen", "-lf", public_or_private_path],
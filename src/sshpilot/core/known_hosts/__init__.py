@@ -1,4 +1,5 @@
 """Known-hosts domain services."""
+from .index import KnownHostsIndex, host_lookup_name
 from .service import (
     KnownHostEntry,
     KnownHostsEditPlan,
@@ -12,8 +13,10 @@ from .service import (
 __all__ = [
     "KnownHostEntry",
     "KnownHostsEditPlan",
+    "KnownHostsIndex",
     "filter_entries",
     "find_host_matches",
+    "host_lookup_name",
     "load_known_hosts",
     "plan_remove_entries",
     "save_known_hosts",
@@ -0,0 +1,283 @@
+"""Host lookups over a known-hosts document (GTK-free).
+
+A :class:`KnownHostsIndex` is built for one document revision. Plain host
+patterns (``host`` or ``[host]:port``) map straight to their lines;
+hashed ``|1|salt|hash`` names are checked with HMAC-SHA1, one digest per
+distinct salt; wildcard patterns are kept in a short list and matched the way
+OpenSSH does. Negated patterns (``!host``) veto a line as in ``ssh``.
+
+Edits do not rebuild the index: removals shift the stored line numbers, and a
+document that only grew (``ssh`` appending a newly accepted key) indexes just
+the new lines.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import hmac
+import re
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle guard
+    from .document import KnownHostsDocument, KnownHostsDocumentEntry
+
+HASHED_PREFIX = "|1|"
+_MARKERS = frozenset({"@cert-authority", "@revoked"})
+_DEFAULT_PORT = 22
+_MEMO_LIMIT = 256
+
+
+def host_lookup_name(host: str, port: int = _DEFAULT_PORT) -> str:
+    """The name ``ssh`` looks up: ``host`` on port 22, else ``[host]:port``."""
+    name = (host or "").strip().lower()
+    if port == _DEFAULT_PORT:
+        return name
+    return f"[{name}]:{port}"
+
+
+def host_field(line: str) -> str:
+    """Return the host-pattern field of a known-hosts *line*.
+
+    A leading ``@cert-authority`` / ``@revoked`` marker is skipped.
+    """
+    parts = line.split()
+    if parts and parts[0] in _MARKERS:
+        parts = parts[1:]
+    return parts[0] if len(parts) >= 2 else ""
+
+
+def _hashed_name(token: str) -> Optional[Tuple[bytes, bytes]]:
+    """Decode ``|1|salt|hash`` into ``(salt, digest)``; None if malformed."""
+    parts = token[len(HASHED_PREFIX):].split("|")
+    if len(parts) != 2:
+        return None
+    try:
+        salt = base64.b64decode(parts[0], validate=True)
+        digest = base64.b64decode(parts[1], validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    if len(digest) != hashlib.sha1().digest_size:
+        return None
+    return salt, digest
+
+
+def _hash_matches(salt: bytes, digest: bytes, name: str) -> bool:
+    computed = hmac.new(salt, name.encode("utf-8"), hashlib.sha1).digest()
+    return hmac.compare_digest(computed, digest)
+
+
+@lru_cache(maxsize=1024)
+def _wildcard(pattern: str) -> "re.Pattern[str]":
+    translated = "".join(
+        ".*" if char == "*" else "." if char == "?" else re.escape(char)
+        for char in pattern
+    )
+    return re.compile(translated + r"\Z", re.DOTALL)
+
+
+def _is_wildcard(pattern: str) -> bool:
+    return "*" in pattern or "?" in pattern
+
+
+def _pattern_matches(pattern: str, name: str) -> bool:
+    if _is_wildcard(pattern):
+        return _wildcard(pattern).match(name) is not None
+    return pattern == name
+
+
+def host_field_matches(field: str, name: str) -> bool:
+    """Whether a known-hosts host *field* matches lookup *name*.
+
+    *name* is the lowercased lookup name from :func:`host_lookup_name`.
+    """
+    if field.startswith(HASHED_PREFIX):
+        decoded = _hashed_name(field)
+        return decoded is not None and _hash_matches(decoded[0], decoded[1], name)
+    matched = False
+    for token in field.lower().split(","):
+        if token.startswith("!"):
+            if _pattern_matches(token[1:], name):
+                return False
+        elif token and _pattern_matches(token, name):
+            matched = True
+    return matched
+
+
+class KnownHostsIndex:
+    """Host-name index for one :class:`KnownHostsDocument` revision.
+
+    Lookups are thread-safe; :meth:`refresh` and :meth:`apply_removal` are
+    meant to be called by the single owner that serializes edits.
+    """
+
+    def __init__(self, document: "KnownHostsDocument") -> None:
+        self._lock = threading.Lock()
+        self._document = document
+        self._entries: Dict[int, "KnownHostsDocumentEntry"] = {}
+        self._plain: Dict[str, List[int]] = {}
+        self._hashed: Dict[bytes, Dict[bytes, List[int]]] = {}
+        self._wildcards: List[Tuple[str, int]] = []
+        self._negations: Dict[int, Tuple[str, ...]] = {}
+        self._memo: Dict[str, Tuple[int, ...]] = {}
+        self._physical_lines = _physical_line_count(document.original)
+        self._add_entries(document.entries)
+
+    @property
+    def revision(self) -> str:
+        return self._document.revision
+
+    @property
+    def document(self) -> "KnownHostsDocument":
+        return self._document
+
+    def _add_entries(self, entries: Iterable["KnownHostsDocumentEntry"]) -> None:
+        for entry in entries:
+            line_index = entry.line_index
+            self._entries[line_index] = entry
+            field = host_field(entry.parsed.line)
+            if not field:
+                continue
+            if field.startswith(HASHED_PREFIX):
+                decoded = _hashed_name(field)
+                if decoded is not None:
+                    salt, digest = decoded
+                    self._hashed.setdefault(salt, {}).setdefault(digest, []).append(
+                        line_index
+                    )
+                continue
+            negations = []
+            for token in field.lower().split(","):
+                if not token:
+                    continue
+                if token.startswith("!"):
+                    negations.append(token[1:])
+                elif _is_wildcard(token):
+                    self._wildcards.append((token, line_index))
+                else:
+                    self._plain.setdefault(token, []).append(line_index)
+            if negations:
+                self._negations[line_index] = tuple(negations)
+
+    def lookup(
+        self, host: str, port: int = _DEFAULT_PORT
+    ) -> Tuple["KnownHostsDocumentEntry", ...]:
+        """Entries whose host field matches *host* on *port*, in file order."""
+        name = host_lookup_name(host, port)
+        if not name:
+            return ()
+        with self._lock:
+            lines = self._memo.get(name)
+            if lines is None:
+                lines = self._match_lines(name)
+                if len(self._memo) >= _MEMO_LIMIT:
+                    self._memo.clear()
+                self._memo[name] = lines
+            return tuple(self._entries[line_index] for line_index in lines)
+
+    def _match_lines(self, name: str) -> Tuple[int, ...]:
+        found = set(self._plain.get(name, ()))
+        for pattern, line_index in self._wildcards:
+            if line_index not in found and _pattern_matches(pattern, name):
+                found.add(line_index)
+        encoded = name.encode("utf-8")
+        for salt, digests in self._hashed.items():
+            computed = hmac.new(salt, encoded, hashlib.sha1).digest()
+            found.update(digests.get(computed, ()))
+        return tuple(
+            sorted(
+                line_index
+                for line_index in found
+                if not any(
+                    _pattern_matches(pattern, name)
+                    for pattern in self._negations.get(line_index, ())
+                )
+            )
+        )
+
+    def refresh(self, document: "KnownHostsDocument") -> "KnownHostsIndex":
+        """Return an index for *document*, reusing this one where possible.
+
+        The same revision returns ``self``. A document that only appended
+        whole lines to this one indexes just the appended lines; any other
+        change builds a fresh index.
+        """
+        if document.revision == self.revision:
+            return self
+        previous = self._document.original
+        if (
+            document.original.startswith(previous)
+            and (not previous or previous.endswith(b"\n"))
+        ):
+            with self._lock:
+                first_new = self._physical_lines
+                self._document = document
+                self._physical_lines = _physical_line_count(document.original)
+                self._entries = {entry.line_index: entry for entry in document.entries}
+                self._add_entries(
+                    entry for entry in document.entries if entry.line_index >= first_new
+                )
+                self._memo.clear()
+            return self
+        return KnownHostsIndex(document)
+
+    def apply_removal(
+        self,
+        document: "KnownHostsDocument",
+        removed_line_indices: Sequence[int],
+    ) -> "KnownHostsIndex":
+        """Move this index to *document*, the result of removing those lines.
+
+        Remaining lines keep their host keys; only their line numbers shift,
+        so nothing is re-parsed or re-hashed.
+        """
+        removed = sorted(set(removed_line_indices))
+        gone = set(removed)
+
+        def shift(line_indices: Iterable[int]) -> List[int]:
+            return [
+                line_index - bisect_left(removed, line_index)
+                for line_index in line_indices
+                if line_index not in gone
+            ]
+
+        with self._lock:
+            plain: Dict[str, List[int]] = {}
+            for name, line_indices in self._plain.items():
+                kept = shift(line_indices)
+                if kept:
+                    plain[name] = kept
+            hashed: Dict[bytes, Dict[bytes, List[int]]] = {}
+            for salt, digests in self._hashed.items():
+                for digest, line_indices in digests.items():
+                    kept = shift(line_indices)
+                    if kept:
+                        hashed.setdefault(salt, {})[digest] = kept
+            self._plain = plain
+            self._hashed = hashed
+            self._wildcards = [
+                (pattern, line_index - bisect_left(removed, line_index))
+                for pattern, line_index in self._wildcards
+                if line_index not in gone
+            ]
+            self._negations = {
+                line_index - bisect_left(removed, line_index): patterns
+                for line_index, patterns in self._negations.items()
+                if line_index not in gone
+            }
+            self._document = document
+            self._physical_lines = _physical_line_count(document.original)
+            self._entries = {entry.line_index: entry for entry in document.entries}
+            self._memo.clear()
+        return self
+
+
+def _physical_line_count(content: bytes) -> int:
+    count = content.count(b"\n")
+    if content and not content.endswith(b"\n"):
+        count += 1
+    return count
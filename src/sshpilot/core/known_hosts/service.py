@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Tuple
 
 from ..errors import CoreError, ErrorCode
+from .index import host_field, host_field_matches, host_lookup_name
 
 logger = logging.getLogger(__name__)
 
@@ -85,18 +86,20 @@ def plan_remove_entries(
 
 
 def find_host_matches(
-    entries: Sequence[KnownHostEntry], host: str
+    entries: Sequence[KnownHostEntry], host: str, port: int = 22
 ) -> List[KnownHostEntry]:
-    """Match entries whose hostname field mentions *host* (hash-aware substring)."""
-    needle = (host or "").strip().lower()
-    if not needle:
+    """Entries whose host field matches *host* on *port*, as ``ssh`` would.
+
+    Plain names, ``[host]:port`` forms, wildcard and negated patterns and
+    hashed ``|1|salt|hash`` names are all recognised. For repeated lookups
+    over one document, build a :class:`~.index.KnownHostsIndex` instead.
+    """
+    name = host_lookup_name(host, port)
+    if not name:
         return []
-    matches: List[KnownHostEntry] = []
-    for entry in entries:
-        # Hashed hostnames start with '|1|'; still allow substring on raw line.
-        if needle in entry.hostname.lower() or needle in entry.line.lower():
-            matches.append(entry)
-    return matches
+    return [
+        entry for entry in entries if host_field_matches(host_field(entry.line), name)
+    ]
 
 
 def save_known_hosts(
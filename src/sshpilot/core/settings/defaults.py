@@ -102,6 +102,10 @@ def get_default_config() -> Dict[str, Any]:
             # 'none' | 'minimize' (icon strip) | 'hide'.
             'sidebar_on_terminal_open': 'none',
             'sidebar_minimal_row_style': 'initials',  # 'initials' | 'icon'
+            # Report shown rows so the daemon probes their hosts' reachability.
+            # Off until sidebar rows show the result: each probe is a TCP
+            # connect that sshd logs.
+            'reachability_probes': False,
             # Header-bar button visibility (Settings ▸ Interface ▸ Header Bar)
             'headerbar_show_sidebar_toggle': False,
             'headerbar_show_split_view': False,
@@ -0,0 +1,443 @@
+"""What the local OpenSSH binaries can do, probed once per binary (GTK-free).
+
+Several features depend on the installed ``ssh``/``scp`` rather than on any
+host: the readiness diagnostics need ``-E`` on a working ``ssh -G``,
+ControlMaster accounting needs ``ssh -G`` to expand ``ControlPath`` tokens,
+and the native SCP backend only retries with ``-O`` when ``scp`` knows that
+flag. :class:`SshCapabilityRegistry` answers all of these from one probe per
+binary, keyed by ``(path, inode, mtime, size)`` so an upgraded or replaced
+binary is probed again, and optionally persists the answers as JSON so a
+restarted daemon does not fork the probes on its first launch. Only
+definitive answers (a probe that ran to completion) are kept for good; a
+probe that timed out or could not start is retried after a short delay and
+never persisted.
+
+Probes never reach the network: ``ssh -G -F /dev/null`` only evaluates
+configuration, ``ssh -V`` prints the version and ``scp -O`` without operands
+prints usage.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+from .import_export import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERSION_TIMEOUT_SECONDS = 2.0
+DEFAULT_PROBE_TIMEOUT_SECONDS = 3.0
+# How long an inconclusive answer (timeout, spawn error) is reused.
+DEFAULT_RETRY_AFTER_SECONDS = 30.0
+DEFAULT_WARMUP_EXECUTABLES = ("ssh", "scp")
+
+_CACHE_FORMAT_VERSION = 1
+_OPENSSH_VERSION_RE = re.compile(r"OpenSSH_(\d+)\.(\d+)")
+_UNKNOWN_OPTION_MARKERS = ("unknown option", "illegal option", "invalid option")
+# Prompting and session variables are never handed to a probe.
+_PROBE_ENV_DROP_PREFIXES = ("SSH_ASKPASS", "SSHPILOT_")
+
+# File signature used to validate cached entries: (inode, mtime_ns, size).
+_Signature = Tuple[int, int, int]
+# (signature, capabilities, monotonic expiry or None for a definitive answer)
+_Entry = Tuple[_Signature, "SshCapabilities", Optional[float]]
+
+
+@dataclass(frozen=True)
+class SshCapabilities:
+    """Probe results for one ``ssh`` or ``scp`` executable."""
+
+    executable: str
+    version: str = "unknown"
+    config_dump: bool = False
+    error_log: bool = False
+    expands_control_path: bool = False
+    legacy_scp_protocol: Optional[bool] = None
+
+    @property
+    def openssh_version(self) -> Optional[Tuple[int, int]]:
+        """``(major, minor)`` from an ``OpenSSH_X.Y`` version string."""
+        match = _OPENSSH_VERSION_RE.search(self.version)
+        if match is None:
+            return None
+        return int(match.group(1)), int(match.group(2))
+
+
+def _tool_name(executable: str) -> str:
+    name = os.path.basename(executable)
+    return name[:-4] if name.lower().endswith(".exe") else name
+
+
+def _probe_environment(environment: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    probe_env = {
+        name: value
+        for name, value in (environment or os.environ).items()
+        if not name.startswith(_PROBE_ENV_DROP_PREFIXES)
+    }
+    probe_env.pop("DISPLAY", None)
+    probe_env.setdefault("HOME", os.path.expanduser("~"))
+    probe_env.setdefault("PATH", "/usr/bin:/bin")
+    return probe_env
+
+
+def _output_text(value) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return value or ""
+
+
+class SshCapabilityRegistry:
+    """Capabilities of local ``ssh``/``scp`` binaries, cached per binary file.
+
+    :meth:`get` probes a binary the first time its current file signature is
+    seen; concurrent callers for the same binary wait for that one probe.
+    :meth:`peek` only reads what is already known. With a *path*, results are
+    loaded from and saved to a JSON file after every probe. Inconclusive
+    probes are answered from memory for *retry_after* seconds and then rerun.
+    """
+
+    def __init__(
+        self,
+        path: Optional[os.PathLike] = None,
+        *,
+        probe_root: Optional[os.PathLike] = None,
+        version_timeout: float = DEFAULT_VERSION_TIMEOUT_SECONDS,
+        probe_timeout: float = DEFAULT_PROBE_TIMEOUT_SECONDS,
+        max_entries: int = 64,
+        retry_after: float = DEFAULT_RETRY_AFTER_SECONDS,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if version_timeout <= 0 or probe_timeout <= 0:
+            raise ValueError("probe timeouts must be positive")
+        if retry_after < 0:
+            raise ValueError("retry_after must not be negative")
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self._path = Path(path) if path is not None else None
+        self._probe_root = os.fspath(probe_root) if probe_root is not None else None
+        self._version_timeout = float(version_timeout)
+        self._probe_timeout = float(probe_timeout)
+        self._max_entries = max_entries
+        self._retry_after = float(retry_after)
+        self._monotonic = monotonic
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self._probing: Dict[str, threading.Event] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if self._path is None:
+            return
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logger.debug("Ignoring unreadable ssh capability cache", exc_info=True)
+            return
+        if not isinstance(payload, dict) or payload.get("version") != _CACHE_FORMAT_VERSION:
+            return
+        executables = payload.get("executables")
+        if not isinstance(executables, dict):
+            return
+        for executable, entry in executables.items():
+            try:
+                signature = (int(entry["inode"]), int(entry["mtime_ns"]), int(entry["size"]))
+                legacy = entry.get("legacy_scp_protocol")
+                capabilities = SshCapabilities(
+                    executable=str(executable),
+                    version=str(entry["ssh_version"]),
+                    config_dump=bool(entry["config_dump"]),
+                    error_log=bool(entry["error_log"]),
+                    expands_control_path=bool(entry["expands_control_path"]),
+                    legacy_scp_protocol=None if legacy is None else bool(legacy),
+                )
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+            self._entries[str(executable)] = (signature, capabilities, None)
+
+    # -- lookups -------------------------------------------------------------
+
+    def _resolve(
+        self, executable: str, environment: Optional[Mapping[str, str]]
+    ) -> Tuple[str, _Signature]:
+        """Absolute path of *executable* and its file signature.
+
+        A binary that cannot be found keeps its name and a zero signature; its
+        failed probe is inconclusive, so it is retried after *retry_after*.
+        """
+        executable = os.fspath(executable)
+        if os.sep in executable or (os.altsep and os.altsep in executable):
+            resolved = os.path.abspath(executable)
+        else:
+            search = (environment or os.environ).get("PATH")
+            resolved = shutil.which(executable, path=search) or executable
+        try:
+            info = os.stat(resolved)
+        except OSError:
+            return resolved, (0, 0, 0)
+        return resolved, (info.st_ino, info.st_mtime_ns, info.st_size)
+
+    def peek(
+        self,
+        executable: str,
+        environment: Optional[Mapping[str, str]] = None,
+    ) -> Optional[SshCapabilities]:
+        """Known capabilities of *executable*, or None without probing."""
+        resolved, signature = self._resolve(executable, environment)
+        with self._lock:
+            return self._cached_locked(resolved, signature)
+
+    def _cached_locked(
+        self, resolved: str, signature: _Signature
+    ) -> Optional[SshCapabilities]:
+        cached = self._entries.get(resolved)
+        if cached is None or cached[0] != signature:
+            return None
+        expires_at = cached[2]
+        if expires_at is not None and self._monotonic() >= expires_at:
+            return None
+        return cached[1]
+
+    def get(
+        self,
+        executable: str,
+        environment: Optional[Mapping[str, str]] = None,
+    ) -> SshCapabilities:
+        """Capabilities of *executable*, probing it if its file changed."""
+        resolved, signature = self._resolve(executable, environment)
+        while True:
+            with self._lock:
+                cached = self._cached_locked(resolved, signature)
+                if cached is not None:
+                    return cached
+                pending = self._probing.get(resolved)
+                if pending is None:
+                    pending = threading.Event()
+                    self._probing[resolved] = pending
+                    break
+            pending.wait()
+        try:
+            capabilities, definitive = self._probe(resolved, environment)
+            expires_at = None if definitive else self._monotonic() + self._retry_after
+            with self._lock:
+                self._entries.pop(resolved, None)
+                self._entries[resolved] = (signature, capabilities, expires_at)
+                while len(self._entries) > self._max_entries:
+                    del self._entries[next(iter(self._entries))]
+        finally:
+            with self._lock:
+                self._probing.pop(resolved, None)
+            pending.set()
+        if definitive:
+            self.save()
+        return capabilities
+
+    def warm(
+        self,
+        executables: Iterable[str] = DEFAULT_WARMUP_EXECUTABLES,
+        environment: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Probe every binary in *executables* whose file changed."""
+        for executable in executables:
+            try:
+                self.get(executable, environment)
+            except Exception:
+                logger.debug("ssh capability warmup failed for %s", executable, exc_info=True)
+
+    def start_warmup(
+        self,
+        executables: Iterable[str] = DEFAULT_WARMUP_EXECUTABLES,
+        environment: Optional[Mapping[str, str]] = None,
+    ) -> threading.Thread:
+        """Run :meth:`warm` on a background daemon thread and return it."""
+        thread = threading.Thread(
+            target=self.warm,
+            args=(tuple(executables), dict(environment) if environment else None),
+            name="sshpilot-ssh-capabilities",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    # -- probes --------------------------------------------------------------
+
+    def _probe(
+        self, executable: str, environment: Optional[Mapping[str, str]]
+    ) -> Tuple[SshCapabilities, bool]:
+        """Probe *executable*; the flag is False unless every probe completed."""
+        probe_env = _probe_environment(environment)
+        if _tool_name(executable) == "scp":
+            legacy_flag = self._probe_scp_legacy_flag(executable, probe_env)
+            definitive = legacy_flag is not None
+            capabilities = SshCapabilities(
+                executable=executable,
+                legacy_scp_protocol=legacy_flag,
+            )
+        else:
+            version, version_known = self._probe_version(executable, probe_env)
+            dump = self._probe_config_dump(executable, probe_env)
+            definitive = version_known and dump is not None
+            config_dump, error_log, expands = dump or (False, False, False)
+            capabilities = SshCapabilities(
+                executable=executable,
+                version=version,
+                config_dump=config_dump,
+                error_log=error_log,
+                expands_control_path=expands,
+            )
+        logger.debug(
+            "ssh capabilities for %s: %s definitive=%s", executable, capabilities, definitive
+        )
+        return capabilities, definitive
+
+    def _probe_version(
+        self, executable: str, probe_env: Dict[str, str]
+    ) -> Tuple[str, bool]:
+        """The ``-V`` banner, and whether ``ssh -V`` ran to completion."""
+        try:
+            result = subprocess.run(
+                (executable, "-V"),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=self._version_timeout,
+                env=probe_env,
+                check=False,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return "unknown", False
+        return (
+            _output_text(result.stderr) or _output_text(result.stdout)
+        ).strip() or "unknown", True
+
+    def _probe_config_dump(
+        self, executable: str, probe_env: Dict[str, str]
+    ) -> Optional[Tuple[bool, bool, bool]]:
+        """``(config_dump, error_log, expands_control_path)`` from one ``ssh -G``.
+
+        None when the probe could not run to completion.
+        """
+        try:
+            probe_dir = tempfile.mkdtemp(prefix="ssh-probe-", dir=self._probe_root)
+        except OSError:
+            logger.debug("no directory for the ssh capability probe", exc_info=True)
+            return None
+        log_path = os.path.join(probe_dir, "probe.log")
+        try:
+            result = subprocess.run(
+                (
+                    executable,
+                    "-G",
+                    "-F",
+                    "/dev/null",
+                    "-E",
+                    log_path,
+                    "-o",
+                    f"ControlPath={probe_dir}/%C",
+                    "localhost",
+                ),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=self._probe_timeout,
+                env=probe_env,
+                check=False,
+            )
+            if result.returncode != 0:
+                return False, False, False
+            control_path = ""
+            for line in _output_text(result.stdout).splitlines():
+                key, _, value = line.strip().partition(" ")
+                if key.lower() == "controlpath":
+                    control_path = value.strip()
+                    break
+            expands = control_path.startswith(probe_dir) and "%" not in control_path
+            return True, os.path.exists(log_path), expands
+        except (OSError, subprocess.SubprocessError):
+            return None
+        finally:
+            shutil.rmtree(probe_dir, ignore_errors=True)
+
+    def _probe_scp_legacy_flag(
+        self, executable: str, probe_env: Dict[str, str]
+    ) -> Optional[bool]:
+        """Whether ``scp`` accepts ``-O``; None when its usage never came back."""
+        try:
+            result = subprocess.run(
+                (executable, "-O"),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=self._version_timeout,
+                env=probe_env,
+                check=False,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        output = (_output_text(result.stderr) + _output_text(result.stdout)).lower()
+        if not output.strip():
+            return None
+        return not any(marker in output for marker in _UNKNOWN_OPTION_MARKERS)
+
+    # -- persistence ---------------------------------------------------------
+
+    def save(self) -> None:
+        """Write the registry to its JSON file, if it has one."""
+        if self._path is None:
+            return
+        with self._lock:
+            executables = {
+                executable: {
+                    "inode": inode,
+                    "mtime_ns": mtime_ns,
+                    "size": size,
+                    "ssh_version": capabilities.version,
+                    "config_dump": capabilities.config_dump,
+                    "error_log": capabilities.error_log,
+                    "expands_control_path": capabilities.expands_control_path,
+                    "legacy_scp_protocol": capabilities.legacy_scp_protocol,
+                }
+                for executable, (
+                    (inode, mtime_ns, size),
+                    capabilities,
+                    expires_at,
+                ) in self._entries.items()
+                # Missing binaries and inconclusive probes are never persisted.
+                if inode and expires_at is None
+            }
+        payload = {"version": _CACHE_FORMAT_VERSION, "executables": executables}
+        try:
+            atomic_write_json(self._path, payload)
+        except OSError:
+            logger.debug("Could not save ssh capability cache", exc_info=True)
+
+
+_default_registry: Optional[SshCapabilityRegistry] = None
+_default_lock = threading.Lock()
+
+
+def get_default_registry() -> SshCapabilityRegistry:
+    """The process-wide registry; memory-only unless one was installed."""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = SshCapabilityRegistry()
+        return _default_registry
+
+
+def set_default_registry(registry: Optional[SshCapabilityRegistry]) -> None:
+    """Install *registry* as the process-wide one (None resets it)."""
+    global _default_registry
+    with _default_lock:
+        _default_registry = registry
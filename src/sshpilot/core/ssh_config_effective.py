@@ -1,7 +1,11 @@
 """Canonical GTK-free OpenSSH configuration resolution for the daemon core.
 
 This module owns Include discovery, ``ssh -G`` execution, repeated-option
-parsing, and authored/effective comparison.  The legacy top-level
+parsing, and authored/effective comparison.  Effective lookups are memoized
+per (arguments, config revision); callers that only need the destination
+fields are answered by an in-process ``Host``/``Match host`` evaluator and
+fall back to ``ssh -G`` for constructs it cannot prove (``Match exec``,
+canonicalization, runtime tokens).  The legacy top-level
 ``ssh_config_utils`` module is only a compatibility facade for these read
 helpers plus its unrelated atomic editor/validation helpers.
 """
@@ -17,11 +21,14 @@ import shlex
 import socket
 import subprocess
 import tempfile
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
-from typing import Dict, FrozenSet, List, Optional, Set, Union
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
-from ..ssh_config_document import SSHConfigDocument
+from ..ssh_config_document import SSHConfigDocument, split_config_option
+from .connections.ssh_config_loader import cached_config_text
+from .ssh_capabilities import get_default_registry
 
 logger = logging.getLogger(__name__)
 
@@ -193,6 +200,353 @@ def collect_host_block_lines(
     return combined
 
 
+# ---------------------------------------------------------------------------
+# Native first-match-wins evaluator
+# ---------------------------------------------------------------------------
+
+# Fields the native evaluator reproduces byte-for-byte with ``ssh -G``. Other
+# options carry OpenSSH defaults/normalisation that only ssh itself knows.
+NATIVE_EFFECTIVE_FIELDS = frozenset(
+    {"hostname", "user", "port", "proxyjump", "proxycommand"}
+)
+_SYSTEM_SSH_CONFIG = "/etc/ssh/ssh_config"
+_MAX_NATIVE_INCLUDE_DEPTH = 16
+_EFFECTIVE_CACHE_SIZE = 512
+_INCLUDE_CACHE_SIZE = 256
+_SUPPORTED_MATCH_CRITERIA = frozenset({"all", "host", "originalhost", "user", "localuser"})
+
+ConfigSources = Tuple[Tuple[str, Optional[str]], ...]
+
+
+class _UnsupportedConfig(Exception):
+    """The configuration uses a construct only ``ssh -G`` can evaluate."""
+
+
+def _pattern_regex(pattern: str) -> "re.Pattern[str]":
+    # OpenSSH patterns only know ``*`` and ``?``; ``[`` is literal.
+    parts = []
+    for char in pattern:
+        if char == "*":
+            parts.append(".*")
+        elif char == "?":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+    return re.compile("".join(parts) + r"\Z", re.DOTALL)
+
+
+def _match_pattern_list(
+    value: str, patterns: Iterable[str], *, casefold: bool = False
+) -> bool:
+    """OpenSSH ``match_pattern_list``: any positive match, no negated match.
+
+    ``Host`` and ``Match user`` compare case-sensitively; ``Match host`` and
+    ``Match originalhost`` go through ``match_hostname`` and fold case.
+    """
+    if casefold:
+        value = value.lower()
+    matched = False
+    for pattern in patterns:
+        if casefold:
+            pattern = pattern.lower()
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:]
+        if _pattern_regex(pattern).match(value):
+            if negated:
+                return False
+            matched = True
+    return matched
+
+
+def _cached_lines(path: str) -> Optional[Tuple[str, List[str]]]:
+    """Return ``(digest, lines)`` for *path*, or ``None`` when it is missing."""
+    try:
+        digest, text = cached_config_text(path)
+        return digest, text.splitlines()
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeError):
+        raise _UnsupportedConfig("unreadable configuration file") from None
+
+
+def _include_targets(line_args: List[str], system: bool) -> List[str]:
+    base = "/etc/ssh" if system else os.path.expanduser("~/.ssh")
+    targets: List[str] = []
+    for pattern in line_args:
+        expanded = os.path.expanduser(expand_ssh_tokens(pattern))
+        if not os.path.isabs(expanded):
+            expanded = os.path.join(base, expanded)
+        targets.extend(sorted(glob.glob(expanded)))
+    return targets
+
+
+def _config_roots(config_file: Optional[str]) -> List[Tuple[str, bool]]:
+    if config_file:
+        return [(config_file, False)]
+    return [
+        (os.path.expanduser("~/.ssh/config"), False),
+        (_SYSTEM_SSH_CONFIG, True),
+    ]
+
+
+# Include arguments per file, keyed by path and reused while its digest holds.
+_INCLUDE_CACHE: "OrderedDict[str, Tuple[str, Tuple[Tuple[str, ...], ...]]]" = OrderedDict()
+_INCLUDE_CACHE_LOCK = threading.Lock()
+
+
+def _include_arguments(
+    path: str,
+) -> Optional[Tuple[str, Tuple[Tuple[str, ...], ...]]]:
+    """Return ``(digest, Include argument lists)`` for *path*, or ``None``.
+
+    Only a file whose digest changed is split into lines again; the globs
+    are expanded by the caller on every walk, since a new file matching an
+    Include pattern changes the tree without touching the including file.
+    """
+    try:
+        digest, text = cached_config_text(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeError):
+        raise _UnsupportedConfig("unreadable configuration file") from None
+    with _INCLUDE_CACHE_LOCK:
+        cached = _INCLUDE_CACHE.get(path)
+        if cached is not None and cached[0] == digest:
+            _INCLUDE_CACHE.move_to_end(path)
+            return cached
+    includes: List[Tuple[str, ...]] = []
+    for raw_line in text.splitlines():
+        keyword, value = split_config_option(raw_line.strip())
+        if not keyword or keyword.lower() != "include" or not value:
+            continue
+        try:
+            includes.append(tuple(shlex.split(value)))
+        except ValueError:
+            continue
+    entry = (digest, tuple(includes))
+    with _INCLUDE_CACHE_LOCK:
+        _INCLUDE_CACHE[path] = entry
+        _INCLUDE_CACHE.move_to_end(path)
+        while len(_INCLUDE_CACHE) > _INCLUDE_CACHE_SIZE:
+            _INCLUDE_CACHE.popitem(last=False)
+    return entry
+
+
+def _config_sources(config_file: Optional[str]) -> ConfigSources:
+    """Revision of every file reachable from the roots, Includes included.
+
+    Files are read through the loader's stat-keyed cache and their Include
+    lines are parsed once per digest, so an unchanged tree costs one
+    ``stat`` per file plus the Include globs.
+    """
+    sources: List[Tuple[str, Optional[str]]] = []
+    seen: Set[str] = set()
+
+    def walk(path: str, system: bool, depth: int) -> None:
+        absolute = os.path.abspath(path)
+        if absolute in seen or depth > _MAX_NATIVE_INCLUDE_DEPTH:
+            return
+        seen.add(absolute)
+        try:
+            cached = _include_arguments(absolute)
+        except _UnsupportedConfig:
+            sources.append((absolute, "unreadable"))
+            return
+        if cached is None:
+            sources.append((absolute, None))
+            return
+        digest, includes = cached
+        sources.append((absolute, digest))
+        for args in includes:
+            for target in _include_targets(list(args), system):
+                walk(target, system, depth + 1)
+
+    for root, system in _config_roots(config_file):
+        walk(root, system, 1)
+    return tuple(sources)
+
+
+def _native_effective_config(
+    host: str,
+    config_file: Optional[str],
+    *,
+    user: Optional[str],
+    port: Optional[int],
+    proxy_jump: Optional[str],
+) -> Dict[str, str]:
+    """Evaluate the destination fields the way ``ssh -G`` would.
+
+    Raises ``_UnsupportedConfig`` for ``Match exec``/``canonical``/``final``,
+    hostname canonicalization, and values carrying runtime tokens or
+    environment references.
+    """
+    original_host = host
+    values: Dict[str, str] = {}
+    proxy_taken = False
+    if user:
+        values["user"] = user
+    if port is not None:
+        values["port"] = str(port)
+    if proxy_jump:
+        values["proxyjump"] = proxy_jump
+        proxy_taken = True
+    try:
+        local_user = getpass.getuser()
+    except Exception:
+        local_user = ""
+
+    def current_hostname() -> str:
+        return _expand_hostname(values.get("hostname"), original_host)
+
+    def match_active(args: List[str]) -> bool:
+        index = 0
+        result = True
+        if not args:
+            raise _UnsupportedConfig("empty Match")
+        while index < len(args):
+            criterion = args[index].lower()
+            negated = criterion.startswith("!")
+            if negated:
+                criterion = criterion[1:]
+            if criterion not in _SUPPORTED_MATCH_CRITERIA:
+                raise _UnsupportedConfig(f"Match {criterion}")
+            if criterion == "all":
+                index += 1
+                outcome = True
+            else:
+                if index + 1 >= len(args):
+                    raise _UnsupportedConfig("Match without argument")
+                patterns = args[index + 1].split(",")
+                subject = {
+                    "host": current_hostname(),
+                    "originalhost": original_host,
+                    "user": values.get("user") or local_user,
+                    "localuser": local_user,
+                }[criterion]
+                outcome = _match_pattern_list(
+                    subject,
+                    patterns,
+                    casefold=criterion in ("host", "originalhost"),
+                )
+                index += 2
+            if negated:
+                outcome = not outcome
+            result = result and outcome
+        return result
+
+    def apply(keyword: str, args: List[str]) -> None:
+        nonlocal proxy_taken
+        if keyword == "canonicalizehostname":
+            if args and args[0].lower() not in ("no", "false"):
+                raise _UnsupportedConfig("CanonicalizeHostname")
+            return
+        if keyword in ("proxyjump", "proxycommand"):
+            if proxy_taken:
+                return
+            proxy_taken = True
+            if args and args[0].lower() != "none":
+                values[keyword] = args[0] if keyword == "proxyjump" else " ".join(args)
+            return
+        if keyword in NATIVE_EFFECTIVE_FIELDS and keyword not in values and args:
+            values[keyword] = args[0]
+
+    def process(path: str, system: bool, depth: int, active: bool) -> None:
+        if depth > _MAX_NATIVE_INCLUDE_DEPTH:
+            return
+        cached = _cached_lines(os.path.abspath(path))
+        if cached is None:
+            return
+        _digest, lines = cached
+        for raw_line in lines:
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+            keyword, value = split_config_option(line)
+            if not keyword:
+                continue
+            keyword = keyword.lower()
+            try:
+                args = shlex.split(value or "")
+            except ValueError:
+                raise _UnsupportedConfig("unbalanced quotes") from None
+            if keyword == "host":
+                active = _match_pattern_list(original_host, args)
+            elif keyword == "match":
+                active = match_active(args)
+            elif keyword == "include":
+                if active:
+                    for target in _include_targets(args, system):
+                        process(target, system, depth + 1, True)
+            elif active:
+                apply(keyword, args)
+
+    for root, system in _config_roots(config_file):
+        process(root, system, 1, True)
+
+    resolved: Dict[str, str] = {}
+    resolved["hostname"] = current_hostname()
+    resolved_user = values.get("user") or local_user
+    resolved_port = values.get("port") or "22"
+    for value in (resolved_user, resolved_port, values.get("proxyjump", "")):
+        if "%" in value or "${" in value:
+            raise _UnsupportedConfig("runtime token")
+    if not resolved_port.isdigit():
+        raise _UnsupportedConfig("non-numeric port")
+    resolved["user"] = resolved_user
+    resolved["port"] = str(int(resolved_port))
+    for keyword in ("proxyjump", "proxycommand"):
+        if values.get(keyword):
+            resolved[keyword] = values[keyword]
+    return resolved
+
+
+def _expand_hostname(value: Optional[str], original_host: str) -> str:
+    if not value:
+        return original_host.lower()
+    if "${" in value:
+        raise _UnsupportedConfig("environment reference in HostName")
+
+    def replace(match: "re.Match[str]") -> str:
+        token = match.group(1)
+        if token == "%":
+            return "%"
+        if token == "h":
+            return original_host
+        raise _UnsupportedConfig("runtime token in HostName")
+
+    return _TOKEN_RE.sub(replace, value).lower()
+
+
+_EFFECTIVE_CACHE: "OrderedDict[tuple, Dict[str, Union[str, List[str]]]]" = OrderedDict()
+_EFFECTIVE_CACHE_LOCK = threading.Lock()
+
+
+def invalidate_effective_config_cache() -> None:
+    """Drop memoized effective configs (called by the daemon config watcher)."""
+    with _EFFECTIVE_CACHE_LOCK:
+        _EFFECTIVE_CACHE.clear()
+    with _INCLUDE_CACHE_LOCK:
+        _INCLUDE_CACHE.clear()
+
+
+def _cache_get(key: tuple) -> Optional[Dict[str, Union[str, List[str]]]]:
+    with _EFFECTIVE_CACHE_LOCK:
+        value = _EFFECTIVE_CACHE.get(key)
+        if value is None:
+            return None
+        _EFFECTIVE_CACHE.move_to_end(key)
+    return {k: list(v) if isinstance(v, list) else v for k, v in value.items()}
+
+
+def _cache_put(key: tuple, value: Dict[str, Union[str, List[str]]]) -> None:
+    stored = {k: list(v) if isinstance(v, list) else v for k, v in value.items()}
+    with _EFFECTIVE_CACHE_LOCK:
+        _EFFECTIVE_CACHE[key] = stored
+        while len(_EFFECTIVE_CACHE) > _EFFECTIVE_CACHE_SIZE:
+            _EFFECTIVE_CACHE.popitem(last=False)
+
+
 def get_effective_ssh_config(
     host: str,
     config_file: Optional[str] = None,
@@ -200,18 +554,61 @@ def get_effective_ssh_config(
     user: Optional[str] = None,
     port: Optional[int] = None,
     proxy_jump: Optional[str] = None,
+    fields: Optional[Iterable[str]] = None,
 ) -> Dict[str, Union[str, List[str]]]:
-    """Resolve *host* through OpenSSH without allowing option confusion."""
+    """Resolve *host* through OpenSSH without allowing option confusion.
+
+    Results are memoized per arguments and config revision. When *fields*
+    names only ``NATIVE_EFFECTIVE_FIELDS`` the in-process evaluator answers
+    without spawning ssh; the result then carries just those destination
+    fields (still ``ssh -G``-equivalent). Anything the evaluator cannot
+    prove falls back to the full ``ssh -G`` output.
+    """
     host = _safe_host_identifier(host)
     if not host:
         return {}
-    command = ["ssh"]
+    expanded: Optional[str] = None
     if config_file:
         expanded = os.path.abspath(os.path.expanduser(os.path.expandvars(config_file)))
         if not os.path.isfile(expanded):
             logger.warning("Requested SSH config override %s does not exist", expanded)
             return {}
-        command.extend(["-F", expanded])
+    wanted = frozenset(field.lower() for field in fields) if fields is not None else None
+    native = wanted is not None and wanted <= NATIVE_EFFECTIVE_FIELDS
+    sources = _config_sources(expanded)
+    arguments = (host, expanded, user, port, proxy_jump)
+    cached = _cache_get(("ssh-G", arguments, sources))
+    if cached is None and native:
+        cached = _cache_get(("native", arguments, sources))
+    if cached is not None:
+        return cached
+    if native:
+        try:
+            config = _native_effective_config(
+                host, expanded, user=user, port=port, proxy_jump=proxy_jump
+            )
+        except _UnsupportedConfig as exc:
+            logger.debug("Native effective config unavailable (%s); using ssh -G", exc)
+        else:
+            _cache_put(("native", arguments, sources), config)
+            return dict(config)
+    config = _run_ssh_g(host, expanded, user=user, port=port, proxy_jump=proxy_jump)
+    if config:
+        _cache_put(("ssh-G", arguments, sources), config)
+    return config
+
+
+def _run_ssh_g(
+    host: str,
+    config_file: Optional[str],
+    *,
+    user: Optional[str],
+    port: Optional[int],
+    proxy_jump: Optional[str],
+) -> Dict[str, Union[str, List[str]]]:
+    command = ["ssh"]
+    if config_file:
+        command.extend(["-F", config_file])
     if user:
         command.extend(["-o", f"User={user}"])
     if port is not None:
@@ -219,6 +616,10 @@ def get_effective_ssh_config(
     if proxy_jump:
         command.extend(["-o", f"ProxyJump={proxy_jump}"])
     command.extend(["-G", host])
+    # A binary already known to lack ``-G`` is not forked once per host.
+    known = get_default_registry().peek("ssh")
+    if known is not None and not known.config_dump:
+        return {}
     try:
         result = subprocess.run(
             command, capture_output=True, text=True, check=True, timeout=10
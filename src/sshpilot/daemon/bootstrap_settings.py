@@ -100,6 +100,14 @@ class DaemonBootstrapSettings:
     def idle_shutdown_seconds(self):
         return self.get_setting("daemon.idle_shutdown_seconds", None)
 
+    @property
+    def forward_health_probes(self) -> bool:
+        return bool(self.get_setting("daemon.forward_health_probes", False))
+
+    @property
+    def forward_health_restart(self) -> bool:
+        return bool(self.get_setting("daemon.forward_health_restart", False))
+
     @property
     def service_mode(self) -> bool:
         return bool(
@@ -294,6 +294,7 @@ def _production_core_services():
         default_root=get_ssh_dir() / "config",
         isolated_root=get_config_dir() / "ssh_config",
     )
+
     def _build_ssh_overrides_service():
         from sshpilot.core.ssh_overrides_service import SshOverridesService
         from sshpilot.ssh_multiplex import controlmaster_args, expire_all_masters
@@ -320,22 +321,55 @@ def _production_core_services():
         return IdentityStateService(get_config_dir() / "config.json")
 
     identity_state_service = _build_identity_state_service()
-    secret_provider = DaemonConnectionSecretProvider(repository.get_record)
-    launch_provider = DaemonConnectionLaunchProvider(
-        repository.get_record,
-        secret_provider=secret_provider,
-        app_config=overrides_service,
-        headless_settings=settings,
-        identity_env=identity_state_service.agent_environment,
-    )
-    connections = ConnectionApplicationService(
-        repository,
-        launch_provider=launch_provider,
-        secret_provider=secret_provider,
-        ssh_overrides=overrides_service,
-        client_name="sshpilotd",
-        allow_cross_thread_commands=True,
-    )
+
+    def _build_ssh_capabilities():
+        from sshpilot.core.ssh_capabilities import (
+            SshCapabilityRegistry,
+            set_default_registry,
+        )
+        from sshpilot.platform.paths import get_state_dir
+
+        registry = SshCapabilityRegistry(
+            get_state_dir() / "ssh-capabilities.json",
+            probe_root=os.environ.get("XDG_RUNTIME_DIR") or None,
+        )
+        # Core helpers running in the daemon read the same answers.
+        set_default_registry(registry)
+        return registry
+
+    ssh_capabilities = _build_ssh_capabilities()
+
+    def _build_control_master_prewarm():
+        from functools import partial
+
+        from sshpilot.platform.paths import get_state_dir
+
+        from .control_master_prewarm import (
+            ControlMasterPrewarmer,
+            HostUsageModel,
+            resolve_control_path,
+        )
+
+        usage = HostUsageModel(get_state_dir() / "control-master-usage.json")
+        # The launch provider is bound below; the prewarmer only calls it
+        # once the server has started it.
+        return ControlMasterPrewarmer(
+            lambda connection_id: launch_provider.prepare_control_master_launch(
+                connection_id
+            ),
+            usage=usage,
+            path_resolver=partial(resolve_control_path, capabilities=ssh_capabilities),
+        )
+
+    control_master_prewarm = _build_control_master_prewarm()
+
+    def _forget_deleted_connections(change) -> None:
+        remaining = {connection.id for connection in change.after.connections}
+        for connection in change.before.connections:
+            if connection.id not in remaining:
+                control_master_prewarm.forget(connection.id)
+
+    repository.add_listener(_forget_deleted_connections)
 
     def _build_secrets_service():
         from sshpilot.daemon.secret_backend_service import SecretBackendService
@@ -353,12 +387,46 @@ def _production_core_services():
         )
 
     secrets_service = _build_secrets_service()
+    secret_provider = DaemonConnectionSecretProvider(
+        repository.get_record,
+        # Askpass lookups share the secrets service's cache and its lock and
+        # logout invalidation.
+        secret_manager_factory=secrets_service.cached_secret_manager,
+    )
+    launch_provider = DaemonConnectionLaunchProvider(
+        repository.get_record,
+        secret_provider=secret_provider,
+        app_config=overrides_service,
+        headless_settings=settings,
+        identity_env=identity_state_service.agent_environment,
+        control_masters=control_master_prewarm,
+    )
+    connections = ConnectionApplicationService(
+        repository,
+        launch_provider=launch_provider,
+        secret_provider=secret_provider,
+        ssh_overrides=overrides_service,
+        client_name="sshpilotd",
+        allow_cross_thread_commands=True,
+    )
 
     def _build_identity_services():
+        import atexit
+        from functools import partial
+
+        from sshpilot.core.keys import FingerprintCache, KeyService
         from sshpilot.daemon.identity_service import DaemonIdentityService
         from sshpilot.daemon.operation_runtime import OperationRuntime
-
-        key_service = DaemonKeyService(_resolve_key_root)
+        from sshpilot.platform.paths import get_state_dir
+
+        # One stat-keyed cache for every per-call KeyService, written when
+        # the daemon exits so a restart does not re-read every key.
+        fingerprint_cache = FingerprintCache(get_state_dir() / "key-fingerprints.json")
+        atexit.register(fingerprint_cache.save)
+        key_service = DaemonKeyService(
+            _resolve_key_root,
+            service_factory=partial(KeyService, fingerprint_cache=fingerprint_cache),
+        )
         operation_runtime = OperationRuntime()
         identity_service = DaemonIdentityService(
             identity_state_service,
@@ -381,6 +449,10 @@ def _production_core_services():
         operations=operation_runtime,
         operation_mode=operation_mode,
         plugin_settings=PluginSettingsService(get_config_dir() / "config.json"),
+        control_master_prewarm=control_master_prewarm,
+        ssh_capabilities=ssh_capabilities,
+        forward_health_probes=settings.forward_health_probes,
+        forward_health_restart=settings.forward_health_restart,
     )
 
 
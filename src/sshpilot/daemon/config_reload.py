@@ -13,6 +13,7 @@ from typing import Callable, FrozenSet, Optional, Protocol
 
 from sshpilot.api.models.connections import ConnectionSummary
 from sshpilot.core.connections.repository import ConnectionRepository
+from sshpilot.core.ssh_config_effective import invalidate_effective_config_cache
 
 from .command_executor import BoundedCommandExecutor, DeferredCommand
 
@@ -187,6 +188,9 @@ class AuthoritativeConfigurationBackend:
     def reload(self) -> ConnectionReloadResult:
         before_snapshot = self.repository.snapshot()
         self._validate_root_stability(bool(before_snapshot.connections))
+        # Memoized effective configs are revision-keyed already; dropping
+        # them here bounds memory to the current include tree.
+        invalidate_effective_config_cache()
         try:
             after_snapshot = self.repository.reload()
         except (OSError, UnicodeError) as error:
@@ -343,6 +343,7 @@ class DaemonConnectionLaunchProvider:
         app_config: Any = None,
         headless_settings: Any = None,
         identity_env: Optional[Callable[[Dict[str, str]], Dict[str, str]]] = None,
+        control_masters: Any = None,
     ) -> None:
         if resolver is None:
             raise ValueError("a connection resolver is required")
@@ -354,6 +355,9 @@ class DaemonConnectionLaunchProvider:
         # environment (effective ``SSH_AUTH_SOCK``) to every spawned OpenSSH
         # command.  Optional so legacy tests/compositions keep working.
         self._identity_env = identity_env
+        # Optional ``ControlMasterPrewarmer``: adapts ``ControlPersist`` per
+        # host and counts which launches found a live master.
+        self._control_masters = control_masters
 
     def _apply_identity_env(self, environment: Dict[str, str]) -> Dict[str, str]:
         if self._identity_env is None:
@@ -498,7 +502,23 @@ class DaemonConnectionLaunchProvider:
                 "The OpenSSH executable is unavailable",
                 connection_id=connection.id,
             )
-        return (executable, *argv[1:]), environment
+        argv = (executable, *argv[1:])
+        if self._control_masters is not None:
+            argv = self._control_masters.adapt_launch(connection.id, argv)
+        return argv, environment
+
+    def _note_launch(
+        self,
+        connection_id: ConnectionId,
+        argv: Tuple[str, ...],
+        environment: Dict[str, str],
+    ) -> None:
+        if self._control_masters is None:
+            return
+        try:
+            self._control_masters.note_launch(connection_id, argv, environment)
+        except Exception:
+            logger.debug("ControlMaster launch accounting failed", exc_info=True)
 
     def prepare_terminal_launch(
         self,
@@ -522,6 +542,7 @@ class DaemonConnectionLaunchProvider:
             remote_command=remote_command,
             force_tty=force_tty,
         )
+        self._note_launch(connection_id, argv, environment)
         # The daemon PTY is the semantic boundary for interactive SSH
         # terminals.  Authentication helpers intentionally preserve the
         # caller environment, but a missing or ``dumb`` TERM is not usable for
@@ -547,13 +568,15 @@ class DaemonConnectionLaunchProvider:
                 "SCP transfers require an SSH connection",
                 connection_id=connection_id,
             )
-        return self._prepare_ssh_launch(
+        argv, environment = self._prepare_ssh_launch(
             connection,
             interaction_policy=interaction_policy,
             command_type="scp",
             extra_args=extra_args,
             target_override=target_override,
         )
+        self._note_launch(connection_id, argv, environment)
+        return argv, environment
 
     def scp_target(self, connection_id: ConnectionId) -> str:
         record = self._resolve(connection_id)
@@ -586,12 +609,14 @@ class DaemonConnectionLaunchProvider:
                 "The SFTP session could not be prepared",
                 connection_id=connection_id,
             )
-        return self._prepare_ssh_launch(
+        argv, environment = self._prepare_ssh_launch(
             connection,
             interaction_policy=interaction_policy,
             command_type="sftp",
             extra_args=["-s"],
         )
+        self._note_launch(connection_id, argv, environment)
+        return argv, environment
 
     def prepare_forward_launch(
         self,
@@ -666,13 +691,41 @@ class DaemonConnectionLaunchProvider:
                 "Remote commands require an SSH connection",
                 connection_id=connection_id,
             )
-        return self._prepare_ssh_launch(
+        argv, environment = self._prepare_ssh_launch(
             connection,
             interaction_policy=interaction_policy,
             command_type="ssh",
             extra_args=["-T"],
             remote_command=remote_command,
         )
+        self._note_launch(connection_id, argv, environment)
+        return argv, environment
+
+    def prepare_control_master_launch(
+        self, connection_id: ConnectionId
+    ) -> Tuple[Tuple[str, ...], Dict[str, str]]:
+        """Non-interactive ``ssh <alias> true`` that leaves a master behind.
+
+        Used by the prewarm scheduler. It never prompts and is not counted as
+        a launch: it is the scheduler's own guess, not the user's.
+        """
+        from .control_master_prewarm import PREWARM_REMOTE_COMMAND
+
+        record = self._resolve(connection_id)
+        connection = HeadlessConnectionView(record)
+        if connection.protocol != "ssh":
+            raise SshPilotError(
+                ErrorCode.UNSUPPORTED_SESSION_PROTOCOL,
+                "Only SSH connections have a ControlMaster",
+                connection_id=connection_id,
+            )
+        return self._prepare_ssh_launch(
+            connection,
+            interaction_policy="none",
+            command_type="ssh",
+            extra_args=["-T"],
+            remote_command=PREWARM_REMOTE_COMMAND,
+        )
 
     def prepare_copy_id_launch(
         self,
@@ -214,25 +214,33 @@ class DaemonConnectionSecretProvider:
     # -- key passphrases ------------------------------------------------------
 
     def lookup_key_passphrase(self, key_path: str) -> Optional[str]:
-        from ..askpass_utils import lookup_passphrase
+        from ..secret_storage import key_path_lookup_candidates, passphrase_spec
 
         if not key_path:
             return None
-        passphrase = lookup_passphrase(key_path)
-        return passphrase if passphrase else None
+        # Same candidate walk as ``askpass_utils.lookup_passphrase``, but
+        # through the injected manager so the daemon's secret cache applies.
+        manager = self._secret_manager_factory()
+        for candidate in key_path_lookup_candidates(key_path):
+            passphrase = manager.lookup(passphrase_spec(candidate))
+            if passphrase:
+                return passphrase
+        return None
 
     def has_key_passphrase(self, key_path: str) -> bool:
         return self.lookup_key_passphrase(key_path) is not None
 
     def store_key_passphrase(self, key_path: str, passphrase: str) -> bool:
-        from ..askpass_utils import store_passphrase
+        from ..secret_storage import normalize_key_path_for_storage, passphrase_spec
 
         if not key_path or not isinstance(passphrase, str):
             return False
-        return bool(store_passphrase(key_path, passphrase))
+        manager = self._secret_manager_factory()
+        spec = passphrase_spec(normalize_key_path_for_storage(key_path))
+        return bool(manager.store(spec, passphrase))
 
     def delete_key_passphrase(self, key_path: str) -> bool:
-        from ..askpass_utils import clear_passphrase
+        from ..secret_storage import key_path_lookup_candidates, passphrase_spec
 
         if not key_path:
             return True
@@ -242,7 +250,12 @@ class DaemonConnectionSecretProvider:
         existing = self.lookup_key_passphrase(key_path)
         if existing is None:
             return True
-        return bool(clear_passphrase(key_path))
+        manager = self._secret_manager_factory()
+        removed = False
+        for candidate in key_path_lookup_candidates(key_path):
+            if manager.delete(passphrase_spec(candidate)):
+                removed = True
+        return removed
 
     # -- plugin secrets --------------------------------------------------------
 
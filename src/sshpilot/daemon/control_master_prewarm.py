@@ -0,0 +1,609 @@
+"""Predictive ControlMaster prewarming.
+
+A launch that finds a live master for its host rides the existing transport:
+no TCP connect, key exchange or authentication. One that does not pays all
+three. With a fixed ``ControlPersist`` of a minute, the masters for hosts
+used all day keep expiring between tabs, and the first tab of every burst
+pays the full handshake.
+
+This module learns when hosts are used and acts on it in two ways:
+
+* :class:`HostUsageModel` keeps, per connection, exponentially decayed launch
+  counts in 24 hour-of-day buckets, persisted in the state directory. A
+  host's *score* is how often it has recently been opened around the current
+  hour.
+* :class:`ControlMasterPrewarmer` turns the score into an adaptive
+  ``ControlPersist`` for every SSH launch (hot hosts keep their master for up
+  to half an hour; cold ones keep the default), builds masters speculatively
+  when the sidebar hovers or selects a connection, and counts how often a
+  launch found a live master so the benefit is visible in
+  ``daemon.diagnostics``.
+
+Prewarms never prompt: they run ``ssh <target> true`` with the non-interactive
+launch policy, so a host that needs a password simply fails to prewarm. At
+most :data:`MAX_CONCURRENT_PREWARMS` run at once; a request beyond that is
+dropped rather than queued, because a stale hover is not worth acting on
+later.
+
+Which socket a launch uses is OpenSSH's to decide (``ControlPath`` tokens,
+``Host`` blocks, ``ProxyJump``), so it is resolved with ``ssh -G`` on the
+launch's own argv once per distinct command line and cached. Resolving and
+probing happen on a worker thread, never on the launch path.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..api.models.common import ConnectionId
+from ..api.models.daemon import ControlMasterPrewarmStats
+from ..api.models.sessions import PrewarmReason
+from ..core.import_export import atomic_write_json
+from ..core.ssh_capabilities import SshCapabilityRegistry
+from .control_masters import MasterState, probe_control_master
+from .process_registry import (
+    KIND_HELPER,
+    forget_owned_process,
+    record_owned_process_or_abandon,
+)
+
+logger = logging.getLogger(__name__)
+
+HOURS = 24
+# Launches older than this count half as much.
+USAGE_HALF_LIFE_SECONDS = 14 * 24 * 3600.0
+# Connections beyond this many are forgotten, least used first.
+MAX_TRACKED_CONNECTIONS = 512
+
+# (minimum score, ControlPersist seconds), hottest first. A host opened most
+# days around this hour scores well above the top tier after a week or two.
+PERSIST_TIERS: Tuple[Tuple[float, int], ...] = ((6.0, 1800), (2.0, 900), (0.5, 300))
+
+MAX_CONCURRENT_PREWARMS = 2
+# A hover only prewarms a host that is already somewhat used at this hour.
+HOVER_MIN_SCORE = 0.5
+# A selection prewarms any host opened at all lately (one launch decays below
+# this after about seven weeks), so restoring the selection at startup does
+# not dial hosts that were never used from sshPilot.
+SELECTION_MIN_TOTAL = 0.1
+# The same connection is not prewarmed again within this window.
+PREWARM_COOLDOWN_SECONDS = 30.0
+PREWARM_TIMEOUT_SECONDS = 20.0
+PROBE_TIMEOUT_SECONDS = 0.5
+# Launch accounting writes the usage model at most this often; closing the
+# prewarmer writes whatever is left.
+USAGE_SAVE_INTERVAL_SECONDS = 300.0
+# Prewarms need a command that returns; the master outlives it.
+PREWARM_REMOTE_COMMAND = "true"
+
+_CONTROL_PERSIST = "ControlPersist="
+
+
+def _hour_of(when: float) -> int:
+    return time.localtime(when).tm_hour
+
+
+class HostUsageModel:
+    """Decayed per-hour launch counts per connection.
+
+    Each connection holds 24 buckets plus the time they were last decayed to.
+    Decay is applied lazily on read and write, so an idle model costs
+    nothing. ``path`` is optional; without it the model is memory-only.
+    """
+
+    def __init__(
+        self,
+        path: Optional[os.PathLike] = None,
+        *,
+        half_life: float = USAGE_HALF_LIFE_SECONDS,
+        max_connections: int = MAX_TRACKED_CONNECTIONS,
+    ) -> None:
+        if half_life <= 0:
+            raise ValueError("usage half-life must be positive")
+        self._path = Path(path) if path is not None else None
+        self._half_life = half_life
+        self._max_connections = max_connections
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Tuple[float, List[float]]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if self._path is None:
+            return
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logger.debug("Ignoring unreadable host usage file", exc_info=True)
+            return
+        hosts = payload.get("connections") if isinstance(payload, dict) else None
+        if not isinstance(hosts, dict):
+            return
+        for connection_id, entry in hosts.items():
+            try:
+                as_of = float(entry["as_of"])
+                buckets = [float(value) for value in entry["hours"]]
+            except (KeyError, TypeError, ValueError):
+                continue
+            if len(buckets) == HOURS and all(value >= 0 for value in buckets):
+                self._hosts[str(connection_id)] = (as_of, buckets)
+
+    def _decayed(self, connection_id: str, now: float) -> Optional[List[float]]:
+        entry = self._hosts.get(connection_id)
+        if entry is None:
+            return None
+        as_of, buckets = entry
+        if now > as_of:
+            factor = 0.5 ** ((now - as_of) / self._half_life)
+            buckets = [value * factor for value in buckets]
+            self._hosts[connection_id] = (now, buckets)
+        return buckets
+
+    def record(self, connection_id: ConnectionId, when: Optional[float] = None) -> None:
+        """Count one launch of *connection_id* at *when* (default: now)."""
+        now = time.time() if when is None else when
+        with self._lock:
+            buckets = self._decayed(connection_id, now)
+            if buckets is None:
+                buckets = [0.0] * HOURS
+                self._hosts[connection_id] = (now, buckets)
+            buckets[_hour_of(now)] += 1.0
+            self._dirty = True
+            if len(self._hosts) > self._max_connections:
+                coldest = min(
+                    [key for key in self._hosts if key != connection_id],
+                    key=lambda key: sum(self._decayed(key, now) or ()),
+                )
+                del self._hosts[coldest]
+
+    def score(self, connection_id: ConnectionId, when: Optional[float] = None) -> float:
+        """Recent launches around the hour of *when*; neighbours count half."""
+        now = time.time() if when is None else when
+        with self._lock:
+            buckets = self._decayed(connection_id, now)
+        if buckets is None:
+            return 0.0
+        hour = _hour_of(now)
+        return (
+            buckets[hour]
+            + 0.5 * buckets[(hour - 1) % HOURS]
+            + 0.5 * buckets[(hour + 1) % HOURS]
+        )
+
+    def total(self, connection_id: ConnectionId, when: Optional[float] = None) -> float:
+        """Recent launches of *connection_id* at any hour."""
+        now = time.time() if when is None else when
+        with self._lock:
+            buckets = self._decayed(connection_id, now)
+        return 0.0 if buckets is None else sum(buckets)
+
+    def forget(self, connection_id: ConnectionId) -> None:
+        """Drop everything known about *connection_id*."""
+        with self._lock:
+            if self._hosts.pop(connection_id, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the model if it changed since the last save."""
+        if self._path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "version": 1,
+                "connections": {
+                    key: {"as_of": as_of, "hours": [round(value, 6) for value in buckets]}
+                    for key, (as_of, buckets) in self._hosts.items()
+                },
+            }
+            self._dirty = False
+        try:
+            atomic_write_json(self._path, payload)
+        except OSError:
+            with self._lock:
+                self._dirty = True
+            logger.debug("Could not save host usage", exc_info=True)
+
+
+def persist_for_score(score: float) -> Optional[int]:
+    """Adaptive ``ControlPersist`` seconds for *score*; ``None`` keeps the default."""
+    for minimum, seconds in PERSIST_TIERS:
+        if score >= minimum:
+            return seconds
+    return None
+
+
+def with_control_persist(argv: Sequence[str], seconds: int) -> Tuple[str, ...]:
+    """*argv* with its first numeric ``-o ControlPersist=`` raised to *seconds*.
+
+    OpenSSH uses the first value it sees, so only that one matters. It is
+    never lowered, and non-numeric values (``yes``, ``10m``) are left alone.
+    """
+    result = list(argv)
+    for index in range(1, len(result)):
+        item = result[index]
+        if result[index - 1] != "-o" or not item.startswith(_CONTROL_PERSIST):
+            continue
+        current = item[len(_CONTROL_PERSIST):]
+        if current.isdigit() and int(current) < seconds:
+            result[index] = f"{_CONTROL_PERSIST}{seconds}"
+        break
+    return tuple(result)
+
+
+def resolve_control_path(
+    argv: Sequence[str],
+    env: Mapping[str, str],
+    *,
+    timeout: float = 5.0,
+    capabilities: Optional[SshCapabilityRegistry] = None,
+) -> Optional[str]:
+    """The expanded ControlPath *argv* would use, or ``None`` if it would not multiplex.
+
+    Runs ``ssh -G`` with the launch's own options and target, which applies
+    the user's configuration and expands ``%C`` exactly as the launch will.
+    Versions that print the path unexpanded are treated as unknown; with a
+    *capabilities* registry such a binary is never asked.
+    """
+    # scp takes ssh options but has no ``-G``; its masters are found by the
+    # ssh launches around it.
+    if not argv or os.path.basename(argv[0]).split(".")[0] != "ssh":
+        return None
+    if capabilities is not None:
+        known = capabilities.get(argv[0], env)
+        if not (known.config_dump and known.expands_control_path):
+            return None
+    try:
+        result = subprocess.run(
+            [argv[0], "-G", *argv[1:]],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            env=dict(env),
+            timeout=timeout,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        logger.debug("ssh -G failed while resolving a ControlPath", exc_info=True)
+        return None
+    if result.returncode != 0:
+        return None
+    options: Dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.strip().partition(" ")
+        options.setdefault(key.lower(), value.strip())
+    if options.get("controlmaster", "false").lower() in ("false", "no"):
+        return None
+    path = options.get("controlpath", "")
+    if not path or path.lower() == "none" or "%" in path:
+        return None
+    return path
+
+
+class ControlMasterPrewarmer:
+    """Adaptive persistence, speculative masters and hit/miss accounting.
+
+    *prepare_launch* returns the ``(argv, env)`` of a non-interactive
+    ``ssh <target> true`` for a connection; the daemon passes the launch
+    provider's :meth:`prepare_control_master_launch`. Nothing is spawned
+    until :meth:`start` enables prewarming, which the daemon does only when
+    it owns the ControlMaster directory.
+    """
+
+    def __init__(
+        self,
+        prepare_launch: Callable[[ConnectionId], Tuple[Sequence[str], Mapping[str, str]]],
+        *,
+        usage: Optional[HostUsageModel] = None,
+        max_concurrent: int = MAX_CONCURRENT_PREWARMS,
+        cooldown: float = PREWARM_COOLDOWN_SECONDS,
+        prewarm_timeout: float = PREWARM_TIMEOUT_SECONDS,
+        save_interval: float = USAGE_SAVE_INTERVAL_SECONDS,
+        path_resolver: Callable[
+            [Sequence[str], Mapping[str, str]], Optional[str]
+        ] = resolve_control_path,
+        popen: Callable[..., subprocess.Popen] = subprocess.Popen,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError("at least one concurrent prewarm is required")
+        self._prepare_launch = prepare_launch
+        self._usage = usage if usage is not None else HostUsageModel()
+        self._max_concurrent = max_concurrent
+        self._cooldown = cooldown
+        self._prewarm_timeout = prewarm_timeout
+        self._save_interval = save_interval
+        self._path_resolver = path_resolver
+        self._popen = popen
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_save = clock()
+        self._enabled = False
+        self._closed = False
+        self._in_flight: Dict[str, float] = {}
+        self._last_prewarm: Dict[str, float] = {}
+        self._paths: Dict[Tuple[str, Tuple[str, ...]], Optional[str]] = {}
+        self._prewarmed_paths: Dict[str, str] = {}
+        self._counters = dict.fromkeys(
+            (
+                "hits",
+                "misses",
+                "prewarmed_hits",
+                "prewarms_started",
+                "prewarms_succeeded",
+                "prewarms_failed",
+                "prewarms_skipped",
+            ),
+            0,
+        )
+        self._prewarm_pool = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="sshpilot-prewarm"
+        )
+        # Launch accounting: ControlPath resolution, master probes and usage
+        # saves, in launch order.
+        self._launch_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sshpilot-prewarm-launch"
+        )
+
+    # -- lifecycle --------------------------------------------------------
+    def start(self) -> None:
+        """Allow speculative prewarms."""
+        with self._lock:
+            self._enabled = not self._closed
+
+    def close(self) -> None:
+        """Stop prewarming, wait for running work and save the usage model."""
+        with self._lock:
+            self._enabled = False
+            self._closed = True
+        self._launch_pool.shutdown(wait=True)
+        self._prewarm_pool.shutdown(wait=True, cancel_futures=True)
+        self._usage.save()
+
+    # -- launch hooks -----------------------------------------------------
+    def persist_for(self, connection_id: ConnectionId) -> Optional[int]:
+        return persist_for_score(self._usage.score(connection_id, self._clock()))
+
+    def adapt_launch(
+        self, connection_id: ConnectionId, argv: Sequence[str]
+    ) -> Tuple[str, ...]:
+        """Apply the connection's adaptive ``ControlPersist`` to *argv*."""
+        seconds = self.persist_for(connection_id)
+        if seconds is None:
+            return tuple(argv)
+        return with_control_persist(argv, seconds)
+
+    def note_launch(
+        self,
+        connection_id: ConnectionId,
+        argv: Sequence[str],
+        env: Mapping[str, str],
+    ) -> None:
+        """Record a user-initiated launch and whether it will find a master.
+
+        Called just before the launch is spawned. The caller's thread only
+        records the launch and stats the cached ControlPath; the master
+        probe runs on the launch worker afterwards. A socket that was missing
+        before the launch, or that the launch replaced, counts as a miss, so
+        the launch's own new master is never taken for a hit. The first
+        launch of a command line is not classified: its ControlPath is only
+        resolved on the worker, once the launch may already own a master.
+        """
+        now = self._clock()
+        argv = tuple(argv)
+        with self._lock:
+            resolved = (connection_id, argv) in self._paths
+            path = self._paths.get((connection_id, argv))
+        before = _socket_identity(path) if path is not None else None
+        self._usage.record(connection_id, now)
+        try:
+            self._launch_pool.submit(
+                self._account_launch,
+                connection_id,
+                argv,
+                dict(env),
+                resolved,
+                before,
+                now,
+            )
+        except RuntimeError:
+            pass  # closed; close() saves the usage model
+
+    def _account_launch(
+        self,
+        connection_id: ConnectionId,
+        argv: Tuple[str, ...],
+        env: Mapping[str, str],
+        resolved: bool,
+        before: Optional[Tuple[int, int]],
+        now: float,
+    ) -> None:
+        try:
+            path = self._control_path(connection_id, argv, env)
+            if resolved and path is not None:
+                self._classify_launch(connection_id, path, before)
+        except Exception:
+            logger.debug("Could not classify a launch", exc_info=True)
+        with self._lock:
+            due = not self._closed and now - self._last_save >= self._save_interval
+            if due:
+                self._last_save = now
+        if due:
+            self._usage.save()
+
+    def _classify_launch(
+        self,
+        connection_id: ConnectionId,
+        path: str,
+        before: Optional[Tuple[int, int]],
+    ) -> None:
+        if before is None:
+            state = MasterState.ABSENT
+        else:
+            state = _master_state(path)
+            if _socket_identity(path) != before:
+                # A stale socket the launch has since replaced.
+                state = MasterState.ABSENT
+        with self._lock:
+            if state is MasterState.LIVE:
+                self._counters["hits"] += 1
+                if self._prewarmed_paths.get(path) == connection_id:
+                    self._counters["prewarmed_hits"] += 1
+            elif state is MasterState.ABSENT:
+                self._counters["misses"] += 1
+                self._prewarmed_paths.pop(path, None)
+
+    def forget(self, connection_id: ConnectionId) -> None:
+        """Drop the usage and cached paths of a deleted connection."""
+        self._usage.forget(connection_id)
+        with self._lock:
+            self._last_prewarm.pop(connection_id, None)
+            for key in [key for key in self._paths if key[0] == connection_id]:
+                del self._paths[key]
+            for path in [
+                path
+                for path, owner in self._prewarmed_paths.items()
+                if owner == connection_id
+            ]:
+                del self._prewarmed_paths[path]
+
+    def _control_path(
+        self,
+        connection_id: ConnectionId,
+        argv: Tuple[str, ...],
+        env: Mapping[str, str],
+    ) -> Optional[str]:
+        key = (connection_id, argv)
+        with self._lock:
+            if key in self._paths:
+                return self._paths[key]
+        path = self._path_resolver(argv, env)
+        with self._lock:
+            if len(self._paths) >= 4 * MAX_TRACKED_CONNECTIONS:
+                self._paths.clear()
+            self._paths[key] = path
+        return path
+
+    # -- speculative prewarm ----------------------------------------------
+    def request_prewarm(
+        self, connection_id: ConnectionId, reason: PrewarmReason
+    ) -> bool:
+        """Start building a master for *connection_id*; ``False`` if declined.
+
+        A hover only qualifies for hosts with usage around this hour, a
+        selection for hosts used at all lately. Requests for a connection already in flight or
+        prewarmed within the cooldown, and requests beyond the concurrency
+        cap, are counted as skipped.
+        """
+        now = self._clock()
+        if reason is PrewarmReason.HOVER:
+            if self._usage.score(connection_id, now) < HOVER_MIN_SCORE:
+                return False
+        elif self._usage.total(connection_id, now) < SELECTION_MIN_TOTAL:
+            return False
+        with self._lock:
+            if not self._enabled:
+                return False
+            recent = self._last_prewarm.get(connection_id)
+            if (
+                connection_id in self._in_flight
+                or len(self._in_flight) >= self._max_concurrent
+                or (recent is not None and now - recent < self._cooldown)
+            ):
+                self._counters["prewarms_skipped"] += 1
+                return False
+            self._in_flight[connection_id] = now
+            self._last_prewarm[connection_id] = now
+        try:
+            self._prewarm_pool.submit(self._prewarm, connection_id)
+        except RuntimeError:
+            with self._lock:
+                self._in_flight.pop(connection_id, None)
+            return False
+        return True
+
+    def _prewarm(self, connection_id: ConnectionId) -> None:
+        outcome = "prewarms_skipped"
+        try:
+            outcome = self._build_master(connection_id)
+        except Exception:
+            outcome = "prewarms_failed"
+            logger.debug("ControlMaster prewarm failed", exc_info=True)
+        finally:
+            with self._lock:
+                self._in_flight.pop(connection_id, None)
+                self._counters[outcome] += 1
+
+    def _build_master(self, connection_id: ConnectionId) -> str:
+        argv, env = self._prepare_launch(connection_id)
+        argv = tuple(argv)
+        path = self._control_path(connection_id, argv, env)
+        if path is None or _master_state(path) is not MasterState.ABSENT:
+            return "prewarms_skipped"
+        with self._lock:
+            if self._closed:
+                return "prewarms_skipped"
+            self._counters["prewarms_started"] += 1
+        process = self._popen(
+            list(argv),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=dict(env),
+            start_new_session=(os.name != "nt"),
+            shell=False,
+        )
+        record_owned_process_or_abandon(
+            process, kind=KIND_HELPER, label="control-master-prewarm"
+        )
+        try:
+            returncode = process.wait(timeout=self._prewarm_timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            returncode = process.wait()
+        finally:
+            forget_owned_process(process.pid)
+        if returncode != 0:
+            return "prewarms_failed"
+        with self._lock:
+            self._prewarmed_paths[path] = connection_id
+        return "prewarms_succeeded"
+
+    # -- reporting --------------------------------------------------------
+    def stats(self) -> ControlMasterPrewarmStats:
+        with self._lock:
+            return ControlMasterPrewarmStats(**self._counters)
+
+
+def _socket_identity(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.lstat(path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+def _master_state(path: str) -> MasterState:
+    if not os.path.lexists(path):
+        return MasterState.ABSENT
+    return probe_control_master(Path(path), timeout=PROBE_TIMEOUT_SECONDS).state
+
+
+__all__ = [
+    "ControlMasterPrewarmer",
+    "HostUsageModel",
+    "persist_for_score",
+    "resolve_control_path",
+    "with_control_persist",
+]
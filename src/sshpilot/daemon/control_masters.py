@@ -20,6 +20,12 @@ the user's real daemon and owns none of it, so both the daemon's own shutdown
 and the GUI's forced-teardown fallback must ask the same question before
 sweeping. That question is :func:`owns_default_control_master_namespace`,
 defined once here so the two callers cannot drift apart.
+
+Checks and exits normally speak the mux protocol to the socket directly
+(:mod:`.ssh_mux`) and run concurrently, so a survey of many masters costs no
+forks and about one round trip. ``ssh -O`` remains the fallback for anything
+the native client cannot settle: a path that is not a socket, a peer that
+does not answer like a mux master, or a platform without Unix sockets.
 """
 
 from __future__ import annotations
@@ -27,12 +33,16 @@ from __future__ import annotations
 import logging
 import os
 import re
+import stat
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Optional, Sequence, Tuple, TypeVar
 
+from . import ssh_mux
 from .lifecycle import resolve_socket_path
 
 logger = logging.getLogger(__name__)
@@ -51,6 +61,12 @@ _ABSENT_PATTERN = re.compile(
 )
 
 DEFAULT_CONTROL_COMMAND_TIMEOUT = 2.0
+# Sockets probed (or told to exit) at once during a survey.
+MAX_CONCURRENT_PROBES = 16
+# How often a terminate re-surveys while masters it told to exit wind down.
+_EXIT_POLL_INTERVAL = 0.05
+
+_T = TypeVar("_T")
 
 
 def owns_default_control_master_namespace(socket_path: Optional[os.PathLike]) -> bool:
@@ -169,16 +185,61 @@ def _run_control_command(
         return None
 
 
+def _is_socket(path: Path) -> bool:
+    try:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def _probe_natively(path: Path, *, timeout: float) -> Optional[ControlMasterProbe]:
+    """Alive-check *path* over the mux protocol; ``None`` defers to ssh.
+
+    A socket file that refuses connections is a crashed master's leftover:
+    that is the same positive evidence ``ssh -O check`` reports as
+    "Connection refused". A timeout is UNKNOWN. Everything else the native
+    client cannot interpret goes to the ssh fallback rather than being
+    guessed at.
+    """
+
+    if not _is_socket(path):
+        return None
+    try:
+        pid = ssh_mux.alive_check(path, timeout=timeout)
+    except (ConnectionRefusedError, FileNotFoundError):
+        return ControlMasterProbe(path=path, state=MasterState.ABSENT)
+    except TimeoutError:
+        return ControlMasterProbe(
+            path=path, state=MasterState.UNKNOWN, reason="the check timed out"
+        )
+    except (ssh_mux.MuxProtocolError, OSError):
+        logger.debug("Native mux check failed for %s", path.name, exc_info=True)
+        return None
+    return ControlMasterProbe(path=path, state=MasterState.LIVE, pid=pid)
+
+
 def probe_control_master(
     path: Path, *, timeout: float = DEFAULT_CONTROL_COMMAND_TIMEOUT
 ) -> ControlMasterProbe:
     """Ask one ControlPath whether a master is behind it.
 
-    Only a completed ``ssh -O check`` that reports failure is evidence of
-    ABSENT — that is a socket whose master is gone. A probe that could not
-    run or could not finish tells us nothing, and saying "absent" there would
-    unlink the socket of a master that is alive and holding a remote
-    connection open.
+    Tries the native mux alive check first and falls back to
+    ``ssh -O check`` when that cannot settle the question.
+    """
+
+    probe = _probe_natively(path, timeout=timeout)
+    if probe is not None:
+        return probe
+    return _probe_with_ssh(path, timeout=timeout)
+
+
+def _probe_with_ssh(path: Path, *, timeout: float) -> ControlMasterProbe:
+    """``ssh -O check`` one ControlPath.
+
+    Only a completed check that reports failure is evidence of ABSENT — that
+    is a socket whose master is gone. A probe that could not run or could
+    not finish tells us nothing, and saying "absent" there would unlink the
+    socket of a master that is alive and holding a remote connection open.
     """
 
     try:
@@ -234,6 +295,15 @@ def probe_control_master(
     )
 
 
+def _run_concurrently(func: Callable[[Path], _T], paths: Sequence[Path]) -> Tuple[_T, ...]:
+    """``func`` over ``paths`` on a bounded pool, results in input order."""
+    if len(paths) <= 1:
+        return tuple(func(path) for path in paths)
+    workers = min(MAX_CONCURRENT_PROBES, len(paths))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="control-master-probe") as pool:
+        return tuple(pool.map(func, paths))
+
+
 def survey_control_masters(
     *, directory: Optional[Path] = None, timeout: float = DEFAULT_CONTROL_COMMAND_TIMEOUT
 ) -> Tuple[ControlMasterProbe, ...]:
@@ -248,8 +318,8 @@ def survey_control_masters(
     base = directory if directory is not None else control_master_directory()
     if base is None:
         raise LookupError("the ControlMaster directory could not be resolved")
-    return tuple(
-        probe_control_master(path, timeout=timeout) for path in list_control_paths(base)
+    return _run_concurrently(
+        lambda path: probe_control_master(path, timeout=timeout), list_control_paths(base)
     )
 
 
@@ -269,6 +339,30 @@ def list_owned_control_masters(
     )
 
 
+def _exit_control_master(path: Path, *, timeout: float) -> bool:
+    """Tell one master to exit: natively, else with ``ssh -O exit``.
+
+    Returns whether the master acknowledged the request.
+    """
+    if _is_socket(path):
+        try:
+            ssh_mux.terminate(path, timeout=timeout)
+            return True
+        except ssh_mux.MuxRequestDenied as error:
+            # ssh -O exit would be refused the same way.
+            logger.debug("ControlMaster on %s refused to exit: %s", path.name, error)
+            return False
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False  # already gone
+        except TimeoutError:
+            logger.debug("Native mux exit timed out for %s", path.name)
+            return False
+        except (ssh_mux.MuxProtocolError, OSError):
+            logger.debug("Native mux exit failed for %s", path.name, exc_info=True)
+    result = _run_control_command(path, "exit", timeout=timeout)
+    return result is not None and result.returncode == 0
+
+
 def terminate_owned_control_masters(
     *,
     directory: Optional[Path] = None,
@@ -276,8 +370,10 @@ def terminate_owned_control_masters(
 ) -> Tuple[ControlMasterProbe, ...]:
     """Ask every owned master to exit; return everything not proven gone.
 
-    ``ssh -O exit`` terminates the master immediately and unlinks its socket.
-    A ControlPath positively proven ABSENT is a crashed master's leftover and
+    A terminate request (``ssh -O exit``) makes the master exit and unlink
+    its socket. The master acknowledges before it is gone, so the final
+    survey is repeated for up to *timeout* while a master that acknowledged
+    the exit still answers. A ControlPath positively proven ABSENT is a crashed master's leftover and
     its socket file is removed here. A path we could not check is left
     strictly alone — unlinking it would strand a live master with an open
     authenticated connection and no way to reach it again.
@@ -287,6 +383,7 @@ def terminate_owned_control_masters(
     """
 
     probes = survey_control_masters(directory=directory, timeout=timeout)
+    live = []
     for probe in probes:
         if probe.state is MasterState.ABSENT:
             try:
@@ -294,9 +391,23 @@ def terminate_owned_control_masters(
             except OSError:
                 pass
         elif probe.state is MasterState.LIVE:
-            _run_control_command(probe.path, "exit", timeout=timeout)
-
-    remaining = survey_control_masters(directory=directory, timeout=timeout)
-    return tuple(
-        probe for probe in remaining if probe.state is not MasterState.ABSENT
+            live.append(probe.path)
+    acknowledged = _run_concurrently(
+        lambda path: _exit_control_master(path, timeout=timeout), live
     )
+
+    exiting = {path for path, ok in zip(live, acknowledged) if ok}
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = tuple(
+            probe
+            for probe in survey_control_masters(directory=directory, timeout=timeout)
+            if probe.state is not MasterState.ABSENT
+        )
+        winding_down = any(
+            probe.state is MasterState.LIVE and probe.path in exiting
+            for probe in remaining
+        )
+        if not winding_down or time.monotonic() >= deadline:
+            return remaining
+        time.sleep(_EXIT_POLL_INTERVAL)
@@ -47,6 +47,7 @@ from sshpilot.api.transport.codec import (
     identity_provider_registry_to_wire,
     identity_state_to_wire,
     key_list_to_wire,
+    find_known_host_entries_request_from_wire,
     known_hosts_mutation_result_to_wire,
     known_hosts_snapshot_to_wire,
     list_authorized_keys_request_from_wire,
@@ -96,6 +97,11 @@ from sshpilot.api.transport.codec import (
     delete_connection_password_request_from_wire,
     delete_connection_request_from_wire,
     delete_connection_result_to_wire,
+    delete_connections_request_from_wire,
+    update_connections_request_from_wire,
+    connection_batch_result_to_wire,
+    connection_reachability_request_from_wire,
+    connection_reachability_to_wire,
     delete_group_request_from_wire,
     detach_session_request_from_wire,
     forward_summary_to_wire,
@@ -109,6 +115,7 @@ from sshpilot.api.transport.codec import (
     lookup_key_passphrase_request_from_wire,
     open_forward_request_from_wire,
     open_session_request_from_wire,
+    prewarm_connection_request_from_wire,
     open_sftp_request_from_wire,
     cancel_transfer_request_from_wire,
     release_terminal_input_request_from_wire,
@@ -178,9 +185,12 @@ DAEMON_METHOD_CAPABILITIES = {
     "connections.get": Capability.CONNECTIONS_READ,
     "connections.list": Capability.CONNECTIONS_READ,
     "connections.snapshot": Capability.CONNECTIONS_READ,
+    "connections.reachability": Capability.CONNECTIONS_READ,
     "connections.create": Capability.CONNECTIONS_WRITE,
     "connections.duplicate": Capability.CONNECTIONS_WRITE,
     "connections.delete": Capability.CONNECTIONS_WRITE,
+    "connections.delete_many": Capability.CONNECTIONS_WRITE,
+    "connections.update_many": Capability.CONNECTIONS_WRITE,
     "connections.update": Capability.CONNECTIONS_WRITE,
     "connections.get_editor": Capability.CONNECTIONS_CONFIG_READ,
     "connections.get_effective_config": Capability.CONNECTIONS_CONFIG_READ,
@@ -238,6 +248,7 @@ DAEMON_METHOD_CAPABILITIES = {
     "sessions.attach": Capability.SESSIONS_WRITE,
     "sessions.detach": Capability.SESSIONS_WRITE,
     "sessions.close": Capability.SESSIONS_WRITE,
+    "sessions.prewarm": Capability.SESSIONS_WRITE,
     "terminal.replay": Capability.TERMINAL_REPLAY,
     "terminal.resize": Capability.TERMINAL_RESIZE,
     "terminal.broadcast_input": Capability.TERMINAL_INPUT,
@@ -276,6 +287,7 @@ DAEMON_METHOD_CAPABILITIES = {
     "forwards.close": Capability.FORWARDS_WRITE,
     "forwards.claim": Capability.FORWARDS_WRITE,
     "known_hosts.list": Capability.KNOWN_HOSTS_READ,
+    "known_hosts.find": Capability.KNOWN_HOSTS_READ,
     "known_hosts.remove": Capability.KNOWN_HOSTS_WRITE,
     "keys.list": Capability.KEYS_READ,
     "keys.get_public": Capability.KEYS_READ,
@@ -345,6 +357,8 @@ DRAIN_REJECTED_METHODS = frozenset(
         "connections.duplicate",
         "connections.update",
         "connections.delete",
+        "connections.update_many",
+        "connections.delete_many",
         "connections.split",
         "connections.save_ssh_config_text",
         "groups.create",
@@ -360,6 +374,7 @@ DRAIN_REJECTED_METHODS = frozenset(
         "connections.update_metadata",
         "sessions.open",
         "sessions.attach",
+        "sessions.prewarm",
         "sftp.open",
         "sftp.attach",
         "sftp.mkdir",
@@ -424,6 +439,8 @@ DEFERRED_DAEMON_METHODS = frozenset(
         "connections.duplicate",
         "connections.update",
         "connections.delete",
+        "connections.update_many",
+        "connections.delete_many",
         "connections.split",
         "connections.get_editor",
         "connections.get_effective_config",
@@ -488,6 +505,7 @@ DEFERRED_DAEMON_METHODS = frozenset(
         "forwards.open",
         "forwards.close",
         "known_hosts.list",
+        "known_hosts.find",
         "known_hosts.remove",
         "keys.list",
         "keys.get_public",
@@ -617,6 +635,8 @@ class RequestDispatcher:
         operation_mode: Any = None,
         broadcast_service: Any = None,
         plugin_settings: Any = None,
+        control_master_prewarm: Any = None,
+        host_reachability: Any = None,
         command_input_waiter: Optional[Callable[..., Any]] = None,
     ) -> None:
         self._connections = connection_service
@@ -635,6 +655,8 @@ class RequestDispatcher:
         self._operation_mode = operation_mode
         self._broadcast_service = broadcast_service
         self._plugin_settings = plugin_settings
+        self._control_master_prewarm = control_master_prewarm
+        self._host_reachability = host_reachability
         self._command_input_waiter = command_input_waiter
         self._diagnostics_provider = diagnostics_provider
         self.server_instance_id = (
@@ -667,11 +689,14 @@ class RequestDispatcher:
             "daemon.set_log_level": self._handle_daemon_set_log_level,
             "connections.list": self._handle_list_connections,
             "connections.snapshot": self._handle_connection_snapshot,
+            "connections.reachability": self._handle_connection_reachability,
             "connections.get": self._handle_get_connection,
             "connections.create": self._handle_create_connection,
             "connections.duplicate": self._handle_duplicate_connection,
             "connections.update": self._handle_update_connection,
             "connections.delete": self._handle_delete_connection,
+            "connections.update_many": self._handle_update_connections,
+            "connections.delete_many": self._handle_delete_connections,
             "connections.get_editor": self._handle_get_connection_editor,
             "connections.get_effective_config": self._handle_get_effective_config,
             "connections.check_unsaved_host": self._handle_check_unsaved_host,
@@ -723,6 +748,7 @@ class RequestDispatcher:
             "sessions.attach": self._handle_attach_session,
             "sessions.detach": self._handle_detach_session,
             "sessions.close": self._handle_close_session,
+            "sessions.prewarm": self._handle_prewarm_connection,
             "terminal.replay": self._handle_replay_terminal,
             "terminal.resize": self._handle_resize_terminal,
             "terminal.broadcast_input": self._handle_broadcast_terminal_input,
@@ -761,6 +787,7 @@ class RequestDispatcher:
             "forwards.close": self._handle_close_forward,
             "forwards.claim": self._handle_claim_forward,
             "known_hosts.list": self._handle_list_known_hosts,
+            "known_hosts.find": self._handle_find_known_host_entries,
             "known_hosts.remove": self._handle_remove_known_host_entries,
             "keys.list": self._handle_list_keys,
             "keys.get_public": self._handle_get_public_key,
@@ -1084,6 +1111,26 @@ class RequestDispatcher:
         self._require_empty_params(request)
         return connection_store_snapshot_to_wire(self._connections.snapshot_connection_store())
 
+    def _handle_connection_reachability(
+        self,
+        request: RequestEnvelope,
+        _state: ClientProtocolState,
+    ) -> list:
+        reachability_request = connection_reachability_request_from_wire(
+            request.params
+        )
+        if self._host_reachability is None:
+            return []
+        # Records the hint and returns cached results; probes never run on
+        # a command slot.
+        return [
+            connection_reachability_to_wire(item)
+            for item in self._host_reachability.report_visible(
+                reachability_request.visible_connection_ids,
+                read_banner=reachability_request.read_ssh_banner,
+            )
+        ]
+
     def _handle_get_connection(
         self,
         request: RequestEnvelope,
@@ -1183,6 +1230,36 @@ class RequestDispatcher:
             connection_id=mutation.connection_id,
         )
 
+    def _handle_update_connections(
+        self,
+        request: RequestEnvelope,
+        state: ClientProtocolState,
+    ) -> DeferredResult:
+        typed_request = update_connections_request_from_wire(request.params)
+        if any(item.update.config_patch for item in typed_request.items):
+            self._require_capability(state, Capability.CONNECTIONS_CONFIG_WRITE)
+        return DeferredResult(
+            operation=lambda: connection_batch_result_to_wire(
+                self._connections.update_connections(typed_request)
+            ),
+            command_key=CONFIGURATION_COMMAND_KEY,
+            on_rejected=lambda: None,
+        )
+
+    def _handle_delete_connections(
+        self,
+        request: RequestEnvelope,
+        _state: ClientProtocolState,
+    ) -> DeferredResult:
+        typed_request = delete_connections_request_from_wire(request.params)
+        return DeferredResult(
+            operation=lambda: connection_batch_result_to_wire(
+                self._connections.delete_connections(typed_request)
+            ),
+            command_key=CONFIGURATION_COMMAND_KEY,
+            on_rejected=lambda: None,
+        )
+
     def _handle_get_connection_editor(
         self,
         request: RequestEnvelope,
@@ -1956,6 +2033,20 @@ class RequestDispatcher:
             on_cancel=lambda: self._session_runtime.reject_pending_start(prepared.id),
         )
 
+    def _handle_prewarm_connection(
+        self,
+        request: RequestEnvelope,
+        _state: ClientProtocolState,
+    ) -> bool:
+        prewarm_request = prewarm_connection_request_from_wire(request.params)
+        if self._control_master_prewarm is None:
+            return False
+        # Only queues work: the master is built on the scheduler's own
+        # workers, so a hover never waits on (or occupies) a command slot.
+        return self._control_master_prewarm.request_prewarm(
+            prewarm_request.connection_id, prewarm_request.reason
+        )
+
     def _handle_attach_session(
         self,
         request: RequestEnvelope,
@@ -2634,6 +2725,21 @@ class RequestDispatcher:
             on_rejected=lambda: None,
         )
 
+    def _handle_find_known_host_entries(
+        self,
+        request: RequestEnvelope,
+        _state: ClientProtocolState,
+    ) -> DeferredResult:
+        typed_request = find_known_host_entries_request_from_wire(request.params)
+        service = self._required_known_hosts_service()
+        return DeferredResult(
+            operation=lambda: known_hosts_snapshot_to_wire(
+                service.find_known_host_entries(typed_request)
+            ),
+            command_key="known_hosts",
+            on_rejected=lambda: None,
+        )
+
     def _handle_remove_known_host_entries(
         self,
         request: RequestEnvelope,
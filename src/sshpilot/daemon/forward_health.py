@@ -0,0 +1,512 @@
+"""Periodic health probes for ``ACTIVE`` local and dynamic forwards.
+
+An ssh process can outlive its usefulness: the listener still accepts while
+every tunnelled connection is refused, or ssh stops servicing its sockets.
+:class:`ForwardHealthMonitor` probes each tracked forward on a jittered
+interval from one thread and one selector, whatever the number of forwards:
+
+* dynamic (SOCKS) forwards get a SOCKS5 greeting and then a CONNECT to
+  ``socks_probe_destination`` (by default the server's own sshd). ssh
+  answers both SOCKS replies itself, so the probe only succeeds once the
+  destination's first bytes have come back through the channel;
+* local forwards are connected to and wait for the destination to speak.
+  ssh opens a channel per accepted connection and closes the socket at once
+  when the server refuses it, so an EOF or reset is a failed probe. A
+  destination that waits for its client to talk first leaves the probe
+  inconclusive at the timeout: it is counted but changes no status.
+
+Either way a probe is healthy only on data that crossed the ssh transport,
+and its latency is that full round trip, not the loopback hop to ssh.
+
+Successful probes feed a per-forward latency histogram. A forward turns
+``DEGRADED`` after consecutive failed probes and ``HEALTHY`` again on the
+next success. With a restart callback, degraded forwards are handed back for
+a process restart on an exponential backoff.
+
+At most ``max_in_flight`` probes run at once; due probes wait their turn, so
+hundreds of forwards cost a bounded number of sockets and wakeups. Remote
+forwards bind on the server and are not probed.
+"""
+
+from __future__ import annotations
+
+import errno
+import heapq
+import logging
+import os
+import random
+import selectors
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from sshpilot.api.models.common import utc_now
+from sshpilot.api.models.operations import (
+    FORWARD_PROBE_LATENCY_BUCKETS_MS,
+    ForwardHealth,
+    ForwardHealthStatus,
+    ForwardType,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROBE_INTERVAL_SECONDS = 30.0
+DEFAULT_PROBE_JITTER_FRACTION = 0.2
+DEFAULT_PROBE_TIMEOUT_SECONDS = 3.0
+# Reached through the tunnel by dynamic-forward probes; sshd greets first.
+DEFAULT_SOCKS_PROBE_DESTINATION = ("localhost", 22)
+DEFAULT_MAX_PROBES_IN_FLIGHT = 16
+DEFAULT_DEGRADED_AFTER_FAILURES = 2
+DEFAULT_RESTART_BACKOFF_SECONDS = 5.0
+DEFAULT_RESTART_BACKOFF_MAX_SECONDS = 300.0
+
+_SOCKS5_NO_AUTH_GREETING = b"\x05\x01\x00"
+_SOCKS5_NO_AUTH_REPLY = b"\x05\x00"
+_SOCKS5_CONNECT_SUCCEEDED = b"\x05\x00"
+# Bound-address length by SOCKS5 address type (domain names are prefixed).
+_SOCKS5_ADDRESS_LENGTHS = {1: 4, 4: 16}
+_IN_PROGRESS = frozenset({errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY})
+
+HealthCallback = Callable[[Hashable, ForwardHealth], None]
+RestartCallback = Callable[[Hashable], None]
+
+
+@dataclass
+class _Target:
+    key: Hashable
+    forward_type: ForwardType
+    address: Tuple[int, tuple]
+    generation: int
+    status: ForwardHealthStatus = ForwardHealthStatus.UNKNOWN
+    probes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_probe_at: Optional[datetime] = None
+    last_latency_ms: Optional[float] = None
+    histogram: List[int] = field(
+        default_factory=lambda: [0] * (len(FORWARD_PROBE_LATENCY_BUCKETS_MS) + 1)
+    )
+    restarts: int = 0
+    restart_delay: float = DEFAULT_RESTART_BACKOFF_SECONDS
+    restart_at: Optional[float] = None
+    # In-flight probe.
+    probe: Optional[socket.socket] = None
+    phase: str = ""
+    started: float = 0.0
+    # Start of the timed round trip; SOCKS probes skip their loopback greeting.
+    timed_from: float = 0.0
+    latency: float = 0.0
+    reply: bytes = b""
+
+    def snapshot(self) -> ForwardHealth:
+        return ForwardHealth(
+            status=self.status,
+            probes=self.probes,
+            failures=self.failures,
+            consecutive_failures=self.consecutive_failures,
+            last_probe_at=self.last_probe_at,
+            last_latency_ms=self.last_latency_ms,
+            latency_histogram=tuple(self.histogram),
+            restarts=self.restarts,
+        )
+
+
+def _socks5_reply_length(reply: bytes) -> Optional[int]:
+    """Length of the SOCKS5 reply at the head of *reply*.
+
+    ``None`` while more bytes are needed, ``-1`` for a malformed reply.
+    """
+    if len(reply) < 5:
+        return None
+    if reply[0] != 0x05:
+        return -1
+    address_type = reply[3]
+    if address_type == 3:
+        length = 4 + 1 + reply[4] + 2
+    elif address_type in _SOCKS5_ADDRESS_LENGTHS:
+        length = 4 + _SOCKS5_ADDRESS_LENGTHS[address_type] + 2
+    else:
+        return -1
+    return length if len(reply) >= length else None
+
+
+def _latency_bucket(latency_ms: float) -> int:
+    for index, bound in enumerate(FORWARD_PROBE_LATENCY_BUCKETS_MS):
+        if latency_ms <= bound:
+            return index
+    return len(FORWARD_PROBE_LATENCY_BUCKETS_MS)
+
+
+class ForwardHealthMonitor:
+    """Probe tracked forwards on one daemon-scoped thread.
+
+    ``on_change`` receives a snapshot whenever a forward's status changes;
+    ``restart`` (optional) receives the key of a degraded forward once its
+    backoff has elapsed. Both run on the monitor thread without its lock held
+    and must not block for long.
+    """
+
+    def __init__(
+        self,
+        *,
+        on_change: Optional[HealthCallback] = None,
+        restart: Optional[RestartCallback] = None,
+        interval_seconds: float = DEFAULT_PROBE_INTERVAL_SECONDS,
+        jitter_fraction: float = DEFAULT_PROBE_JITTER_FRACTION,
+        timeout_seconds: float = DEFAULT_PROBE_TIMEOUT_SECONDS,
+        socks_probe_destination: Tuple[str, int] = DEFAULT_SOCKS_PROBE_DESTINATION,
+        max_in_flight: int = DEFAULT_MAX_PROBES_IN_FLIGHT,
+        degraded_after: int = DEFAULT_DEGRADED_AFTER_FAILURES,
+        restart_backoff_seconds: float = DEFAULT_RESTART_BACKOFF_SECONDS,
+        restart_backoff_max_seconds: float = DEFAULT_RESTART_BACKOFF_MAX_SECONDS,
+        monotonic: Callable[[], float] = time.monotonic,
+        clock: Callable[[], datetime] = utc_now,
+        random_fraction: Callable[[], float] = random.random,
+    ) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("forward probe interval must be positive")
+        if not 0.0 <= jitter_fraction < 1.0:
+            raise ValueError("forward probe jitter must be in [0, 1)")
+        if timeout_seconds <= 0:
+            raise ValueError("forward probe timeout must be positive")
+        socks_host, socks_port = socks_probe_destination
+        encoded_host = socks_host.encode("idna")
+        if not 0 < len(encoded_host) < 256 or not 0 < socks_port < 65536:
+            raise ValueError("SOCKS probe destination must be a host name and port")
+        if type(max_in_flight) is not int or max_in_flight < 1:
+            raise ValueError("forward probe budget must be positive")
+        if type(degraded_after) is not int or degraded_after < 1:
+            raise ValueError("degraded threshold must be positive")
+        if restart_backoff_seconds <= 0 or restart_backoff_max_seconds < restart_backoff_seconds:
+            raise ValueError("restart backoff must be positive and bounded")
+        self._on_change = on_change
+        self._restart = restart
+        self._interval = float(interval_seconds)
+        self._jitter = float(jitter_fraction)
+        self._timeout = float(timeout_seconds)
+        self._socks_connect = (
+            b"\x05\x01\x00\x03"
+            + bytes((len(encoded_host),))
+            + encoded_host
+            + socks_port.to_bytes(2, "big")
+        )
+        self._max_in_flight = max_in_flight
+        self._degraded_after = degraded_after
+        self._restart_backoff = float(restart_backoff_seconds)
+        self._restart_backoff_max = float(restart_backoff_max_seconds)
+        self._monotonic = monotonic
+        self._clock = clock
+        self._random = random_fraction
+        self._lock = threading.Lock()
+        self._targets: Dict[Hashable, _Target] = {}
+        # (due, sequence, key, generation); stale entries are skipped.
+        self._schedule: List[Tuple[float, int, Hashable, int]] = []
+        self._sequence = 0
+        self._generation = 0
+        self._in_flight = 0
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup_read = self._wakeup_write = -1
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    # -- public ---------------------------------------------------------
+    def track(self, key: Hashable, forward_type: ForwardType, address: Tuple[int, tuple]) -> None:
+        """Start probing *key*; the first probe lands somewhere in one interval."""
+        if forward_type is ForwardType.REMOTE:
+            raise ValueError("remote forwards bind on the server and are not probed")
+        with self._lock:
+            if self._closed:
+                return
+            self._start_thread_locked()
+            previous = self._targets.get(key)
+            if previous is not None:
+                self._close_probe_locked(previous)
+            self._generation += 1
+            target = _Target(key, forward_type, address, self._generation)
+            target.restart_delay = self._restart_backoff
+            self._targets[key] = target
+            self._push_locked(target, self._monotonic() + self._interval * self._random())
+        self._wake()
+
+    def untrack(self, key: Hashable) -> None:
+        with self._lock:
+            target = self._targets.pop(key, None)
+            if target is not None:
+                self._close_probe_locked(target)
+        if target is not None:
+            self._wake()
+
+    def health(self, key: Hashable) -> Optional[ForwardHealth]:
+        with self._lock:
+            target = self._targets.get(key)
+            return target.snapshot() if target is not None else None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        self._wake()
+        if thread is not threading.current_thread():
+            thread.join(timeout=1.5)
+        for descriptor in (self._wakeup_read, self._wakeup_write):
+            try:
+                os.close(descriptor)
+            except OSError:
+                pass
+
+    # -- scheduling -----------------------------------------------------
+    def _start_thread_locked(self) -> None:
+        if self._thread is not None:
+            return
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_read, False)
+        os.set_blocking(self._wakeup_write, False)
+        self._selector.register(self._wakeup_read, selectors.EVENT_READ, None)
+        self._thread = threading.Thread(
+            target=self._run, name="sshpilot-forward-health", daemon=True
+        )
+        self._thread.start()
+
+    def _push_locked(self, target: _Target, due: float) -> None:
+        self._sequence += 1
+        heapq.heappush(self._schedule, (due, self._sequence, target.key, target.generation))
+
+    def _next_interval(self) -> float:
+        spread = self._interval * self._jitter
+        return self._interval - spread + 2.0 * spread * self._random()
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wakeup_write, b"x")
+        except (BlockingIOError, OSError):
+            pass
+
+    # -- thread ---------------------------------------------------------
+    def _run(self) -> None:
+        selector = self._selector
+        assert selector is not None
+        try:
+            while True:
+                with self._lock:
+                    if self._closed:
+                        return
+                    timeout = self._next_timeout_locked()
+                try:
+                    events = selector.select(timeout)
+                except OSError:
+                    return
+                callbacks: list = []
+                with self._lock:
+                    if self._closed:
+                        return
+                    for key, _mask in events:
+                        if key.data is None:
+                            try:
+                                while os.read(self._wakeup_read, 1024):
+                                    pass
+                            except (BlockingIOError, OSError):
+                                pass
+                            continue
+                        target = key.data
+                        if target.probe is not None and self._targets.get(target.key) is target:
+                            self._advance_probe_locked(target, callbacks)
+                    self._run_timers_locked(callbacks)
+                for callback, *arguments in callbacks:
+                    try:
+                        callback(*arguments)
+                    except Exception:
+                        logger.debug("forward health callback failed", exc_info=True)
+        finally:
+            with self._lock:
+                for target in tuple(self._targets.values()):
+                    self._close_probe_locked(target)
+            selector.close()
+
+    def _next_timeout_locked(self) -> Optional[float]:
+        now = self._monotonic()
+        moments = []
+        if self._schedule and self._in_flight < self._max_in_flight:
+            moments.append(self._schedule[0][0])
+        for target in self._targets.values():
+            if target.probe is not None:
+                moments.append(target.started + self._timeout)
+            if target.restart_at is not None:
+                moments.append(target.restart_at)
+        if not moments:
+            return None
+        return max(0.0, min(moments) - now)
+
+    def _run_timers_locked(self, callbacks: list) -> None:
+        now = self._monotonic()
+        for target in tuple(self._targets.values()):
+            if target.probe is not None and now >= target.started + self._timeout:
+                # A silent local destination may simply wait for its client;
+                # a SOCKS probe's destination always greets first.
+                inconclusive = (
+                    target.phase == "destination"
+                    and target.forward_type is ForwardType.LOCAL
+                )
+                self._finish_locked(target, None if inconclusive else False, callbacks)
+            if target.restart_at is not None and now >= target.restart_at:
+                target.restart_at = None
+                target.restarts += 1
+                target.restart_delay = min(target.restart_delay * 2, self._restart_backoff_max)
+                if self._restart is not None:
+                    callbacks.append((self._restart, target.key))
+        while self._schedule and self._in_flight < self._max_in_flight:
+            due, _sequence, key, generation = self._schedule[0]
+            if due > now:
+                break
+            heapq.heappop(self._schedule)
+            target = self._targets.get(key)
+            if target is None or target.generation != generation or target.probe is not None:
+                continue
+            self._start_probe_locked(target, callbacks)
+
+    # -- probes ---------------------------------------------------------
+    def _start_probe_locked(self, target: _Target, callbacks: list) -> None:
+        family, sockaddr = target.address
+        target.started = target.timed_from = self._monotonic()
+        target.reply = b""
+        try:
+            probe = socket.socket(family, socket.SOCK_STREAM)
+        except OSError:
+            self._record_locked(target, False, callbacks)
+            return
+        probe.setblocking(False)
+        result = probe.connect_ex(sockaddr)
+        if result != 0 and result not in _IN_PROGRESS:
+            probe.close()
+            self._record_locked(target, False, callbacks)
+            return
+        target.probe = probe
+        target.phase = "connect"
+        self._in_flight += 1
+        self._selector.register(probe, selectors.EVENT_WRITE, target)
+        if result == 0:
+            self._advance_probe_locked(target, callbacks)
+
+    def _advance_probe_locked(self, target: _Target, callbacks: list) -> None:
+        probe = target.probe
+        if target.phase == "connect":
+            if probe.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0:
+                self._finish_locked(target, False, callbacks)
+                return
+            if target.forward_type is ForwardType.DYNAMIC:
+                if not self._send_locked(target, _SOCKS5_NO_AUTH_GREETING, callbacks):
+                    return
+                target.phase = "greeting"
+            else:
+                target.phase = "destination"
+            self._selector.modify(probe, selectors.EVENT_READ, target)
+            return
+        try:
+            data = probe.recv(4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            # ssh closes the socket when the server refuses the channel.
+            self._finish_locked(target, False, callbacks)
+            return
+        target.reply += data
+        if target.phase == "greeting":
+            if not _SOCKS5_NO_AUTH_REPLY.startswith(target.reply[:2]):
+                self._finish_locked(target, False, callbacks)
+                return
+            if len(target.reply) < len(_SOCKS5_NO_AUTH_REPLY):
+                return
+            target.timed_from = self._monotonic()
+            target.reply = target.reply[len(_SOCKS5_NO_AUTH_REPLY):]
+            if not self._send_locked(target, self._socks_connect, callbacks):
+                return
+            target.phase = "connect-reply"
+        if target.phase == "connect-reply":
+            length = _socks5_reply_length(target.reply)
+            if length is None:
+                return
+            if length < 0 or not target.reply.startswith(_SOCKS5_CONNECT_SUCCEEDED):
+                self._finish_locked(target, False, callbacks)
+                return
+            # OpenSSH answers CONNECT before the server confirms the channel;
+            # only the destination's own bytes prove the tunnel carries data.
+            target.reply = target.reply[length:]
+            target.phase = "destination"
+        if target.phase == "destination" and target.reply:
+            target.latency = self._monotonic() - target.timed_from
+            self._finish_locked(target, True, callbacks)
+
+    def _send_locked(self, target: _Target, payload: bytes, callbacks: list) -> bool:
+        try:
+            # A few bytes on a fresh loopback socket never fill its buffer.
+            target.probe.send(payload)
+        except OSError:
+            self._finish_locked(target, False, callbacks)
+            return False
+        return True
+
+    def _finish_locked(
+        self, target: _Target, healthy: Optional[bool], callbacks: list
+    ) -> None:
+        self._close_probe_locked(target)
+        self._record_locked(target, healthy, callbacks)
+
+    def _record_locked(
+        self, target: _Target, healthy: Optional[bool], callbacks: list
+    ) -> None:
+        """Count a probe; ``None`` is inconclusive and changes no status."""
+        previous = target.status
+        target.probes += 1
+        target.last_probe_at = self._clock()
+        if healthy is None:
+            pass
+        elif healthy:
+            latency_ms = target.latency * 1000.0
+            target.last_latency_ms = latency_ms
+            target.histogram[_latency_bucket(latency_ms)] += 1
+            target.consecutive_failures = 0
+            target.status = ForwardHealthStatus.HEALTHY
+            target.restart_at = None
+            target.restart_delay = self._restart_backoff
+        else:
+            target.failures += 1
+            target.consecutive_failures += 1
+            if target.consecutive_failures >= self._degraded_after:
+                target.status = ForwardHealthStatus.DEGRADED
+        if (
+            target.status is ForwardHealthStatus.DEGRADED
+            and self._restart is not None
+            and target.restart_at is None
+        ):
+            target.restart_at = self._monotonic() + target.restart_delay
+        self._push_locked(target, self._monotonic() + self._next_interval())
+        if target.status is not previous and self._on_change is not None:
+            callbacks.append((self._on_change, target.key, target.snapshot()))
+
+    def _close_probe_locked(self, target: _Target) -> None:
+        probe = target.probe
+        if probe is None:
+            return
+        target.probe = None
+        target.phase = ""
+        self._in_flight -= 1
+        try:
+            self._selector.unregister(probe)
+        except (KeyError, ValueError):
+            pass
+        probe.close()
+
+
+__all__ = [
+    "DEFAULT_PROBE_INTERVAL_SECONDS",
+    "ForwardHealthMonitor",
+]
@@ -0,0 +1,376 @@
+"""Event-driven readiness for daemon-owned ``ssh -N`` forwards.
+
+A forward is usable once OpenSSH has bound its listener (local/dynamic) or
+the server has accepted the remote bind. OpenSSH says so itself at ``-v``:
+
+* ``debug1: Local forwarding listening on 127.0.0.1 port 8080.``
+* ``debug1: remote forward success for: listen 8080, connect host:80``
+
+:class:`ForwardReadinessWatcher` owns one thread and one selector for every
+pending forward. It drains each process's stderr for those lines and, for
+local and dynamic forwards, confirms the bind with a non-blocking connect
+registered on the same selector. The connect is retried on a short backoff
+until the marker arrives, so launches without a readable stderr (an ssh the
+daemon must not add ``-v`` to, or a test runner) still activate. Remote
+forwards fall back to the short process-alive window when no line arrives
+(no stream, or a ``LogLevel`` that silences it).
+
+The stream stays registered after readiness until ssh closes it: ssh keeps
+logging at ``-v`` for every tunnelled connection and must never block on a
+full pipe. Callbacks run on the watcher thread without its lock held.
+"""
+
+from __future__ import annotations
+
+import errno
+import logging
+import os
+import queue
+import selectors
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import IO, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FORWARD_READY_MARKERS = (
+    b"local forwarding listening on",
+    b"remote forward success for",
+)
+
+DEFAULT_PROBE_INITIAL_SECONDS = 0.05
+DEFAULT_PROBE_MAX_SECONDS = 1.0
+_READ_CHUNK = 4096
+# Only the unterminated tail of the stream is kept between reads.
+_MAX_PARTIAL_LINE = 4096
+
+_IN_PROGRESS = frozenset({errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY})
+
+ReadyCallback = Callable[[Hashable], None]
+
+
+@dataclass
+class _Watch:
+    key: Hashable
+    deadline: float
+    on_ready: ReadyCallback
+    on_failed: ReadyCallback
+    stream: Optional[IO[bytes]] = None
+    address: Optional[Tuple[int, tuple]] = None
+    stable_at: Optional[float] = None
+    partial: bytes = b""
+    probe: Optional[socket.socket] = None
+    next_probe_at: Optional[float] = None
+    probe_delay: float = DEFAULT_PROBE_INITIAL_SECONDS
+    settled: bool = False
+
+
+def resolve_probe_address(host: str, port: int) -> Tuple[int, tuple]:
+    """``(family, sockaddr)`` to connect to for a forward bound on *host*."""
+    target = "127.0.0.1" if host in {"", "*", "0.0.0.0", "::"} else host
+    family, _type, _proto, _name, sockaddr = socket.getaddrinfo(
+        target, port, type=socket.SOCK_STREAM
+    )[0]
+    return family, sockaddr
+
+
+class ForwardReadinessWatcher:
+    """Watch many pending forwards on one daemon-scoped thread."""
+
+    def __init__(
+        self,
+        *,
+        monotonic: Callable[[], float] = time.monotonic,
+        probe_max_seconds: float = DEFAULT_PROBE_MAX_SECONDS,
+    ) -> None:
+        self._monotonic = monotonic
+        self._probe_max_seconds = float(probe_max_seconds)
+        self._lock = threading.Lock()
+        self._commands: "queue.Queue[tuple]" = queue.Queue()
+        self._watches: Dict[Hashable, _Watch] = {}
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup_read = self._wakeup_write = -1
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def watch(
+        self,
+        key: Hashable,
+        *,
+        deadline: float,
+        on_ready: ReadyCallback,
+        on_failed: ReadyCallback,
+        stream: Optional[IO[bytes]] = None,
+        address: Optional[Tuple[int, tuple]] = None,
+        stable_at: Optional[float] = None,
+    ) -> None:
+        """Report *key* ready through *on_ready*, or *on_failed* at *deadline*.
+
+        With *address* the forward is ready once a connect to it succeeds; a
+        readiness line on *stream* only triggers that connect early. Without
+        one it is ready on the stream's line or at *stable_at*, whichever
+        comes first. The watcher takes ownership of *stream* and closes it.
+        """
+        if stream is not None:
+            os.set_blocking(stream.fileno(), False)
+        watch = _Watch(
+            key=key,
+            deadline=deadline,
+            on_ready=on_ready,
+            on_failed=on_failed,
+            stream=stream,
+            address=address,
+            stable_at=stable_at if address is None else None,
+            next_probe_at=self._monotonic() if address is not None else None,
+        )
+        self._submit(("watch", watch))
+
+    def cancel(self, key: Hashable) -> None:
+        """Stop watching *key* without calling back; closes its stream."""
+        try:
+            self._submit(("cancel", key))
+        except RuntimeError:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        self._commands.put(("close",))
+        self._wake()
+        if thread is not threading.current_thread():
+            thread.join(timeout=1.5)
+        for descriptor in (self._wakeup_read, self._wakeup_write):
+            try:
+                os.close(descriptor)
+            except OSError:
+                pass
+
+    # -- thread ---------------------------------------------------------
+    def _submit(self, command: tuple) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("forward readiness watcher is closed")
+            if self._thread is None:
+                self._selector = selectors.DefaultSelector()
+                self._wakeup_read, self._wakeup_write = os.pipe()
+                os.set_blocking(self._wakeup_read, False)
+                os.set_blocking(self._wakeup_write, False)
+                self._selector.register(self._wakeup_read, selectors.EVENT_READ, None)
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="sshpilot-forward-readiness",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._commands.put(command)
+        self._wake()
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wakeup_write, b"x")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _run(self) -> None:
+        selector = self._selector
+        assert selector is not None
+        try:
+            while True:
+                try:
+                    events = selector.select(self._next_timeout())
+                except OSError:
+                    return
+                callbacks = []
+                for key, mask in events:
+                    if key.data is None:
+                        try:
+                            while os.read(self._wakeup_read, 1024):
+                                pass
+                        except (BlockingIOError, OSError):
+                            pass
+                        if self._drain_commands():
+                            return
+                        continue
+                    role, watch = key.data
+                    # A command drained earlier in this batch may have
+                    # dropped the watch this event belongs to.
+                    if role == "stream" and watch.stream is not None:
+                        self._read_stream(watch, callbacks)
+                    elif role == "probe" and watch.probe is not None:
+                        self._finish_probe(watch, callbacks)
+                self._run_timers(callbacks)
+                for callback, watch_key in callbacks:
+                    try:
+                        callback(watch_key)
+                    except Exception:
+                        logger.debug("forward readiness callback failed", exc_info=True)
+        finally:
+            for watch in tuple(self._watches.values()):
+                self._drop(watch)
+            selector.close()
+
+    def _drain_commands(self) -> bool:
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                return False
+            kind = command[0]
+            if kind == "close":
+                return True
+            if kind == "watch":
+                watch: _Watch = command[1]
+                previous = self._watches.pop(watch.key, None)
+                if previous is not None:
+                    self._drop(previous)
+                self._watches[watch.key] = watch
+                if watch.stream is not None:
+                    self._selector.register(
+                        watch.stream, selectors.EVENT_READ, ("stream", watch)
+                    )
+            elif kind == "cancel":
+                watch = self._watches.pop(command[1], None)
+                if watch is not None:
+                    self._drop(watch)
+
+    def _next_timeout(self) -> Optional[float]:
+        moments = []
+        for watch in self._watches.values():
+            if watch.settled:
+                continue
+            moments.append(watch.deadline)
+            if watch.next_probe_at is not None and watch.probe is None:
+                moments.append(watch.next_probe_at)
+            if watch.stable_at is not None:
+                moments.append(watch.stable_at)
+        if not moments:
+            return None
+        return max(0.0, min(moments) - self._monotonic())
+
+    def _read_stream(self, watch: _Watch, callbacks: list) -> None:
+        try:
+            data = os.read(watch.stream.fileno(), _READ_CHUNK)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            # ssh exited (or closed stderr); its exit is reported elsewhere.
+            self._close_stream(watch)
+            if watch.settled:
+                self._watches.pop(watch.key, None)
+            return
+        if watch.settled:
+            return
+        text = (watch.partial + data).lower()
+        lines = text.split(b"\n")
+        watch.partial = lines.pop()[-_MAX_PARTIAL_LINE:]
+        if not any(marker in line for line in lines for marker in FORWARD_READY_MARKERS):
+            return
+        if watch.address is None:
+            self._settle(watch, watch.on_ready, callbacks)
+        elif watch.probe is None:
+            watch.next_probe_at = self._monotonic()
+            watch.probe_delay = DEFAULT_PROBE_INITIAL_SECONDS
+
+    def _start_probe(self, watch: _Watch, callbacks: list) -> None:
+        family, sockaddr = watch.address
+        watch.next_probe_at = None
+        try:
+            probe = socket.socket(family, socket.SOCK_STREAM)
+        except OSError:
+            self._schedule_probe(watch)
+            return
+        probe.setblocking(False)
+        result = probe.connect_ex(sockaddr)
+        if result == 0:
+            probe.close()
+            self._settle(watch, watch.on_ready, callbacks)
+        elif result in _IN_PROGRESS:
+            watch.probe = probe
+            self._selector.register(probe, selectors.EVENT_WRITE, ("probe", watch))
+        else:
+            probe.close()
+            self._schedule_probe(watch)
+
+    def _finish_probe(self, watch: _Watch, callbacks: list) -> None:
+        probe = watch.probe
+        watch.probe = None
+        self._selector.unregister(probe)
+        result = probe.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        probe.close()
+        if result == 0:
+            self._settle(watch, watch.on_ready, callbacks)
+        else:
+            self._schedule_probe(watch)
+
+    def _schedule_probe(self, watch: _Watch) -> None:
+        watch.next_probe_at = self._monotonic() + watch.probe_delay
+        watch.probe_delay = min(watch.probe_delay * 2, self._probe_max_seconds)
+
+    def _run_timers(self, callbacks: list) -> None:
+        now = self._monotonic()
+        for watch in tuple(self._watches.values()):
+            if watch.settled:
+                continue
+            if watch.stable_at is not None and now >= watch.stable_at:
+                self._settle(watch, watch.on_ready, callbacks)
+            elif now >= watch.deadline:
+                self._settle(watch, watch.on_failed, callbacks)
+            elif (
+                watch.next_probe_at is not None
+                and watch.probe is None
+                and now >= watch.next_probe_at
+            ):
+                self._start_probe(watch, callbacks)
+
+    def _settle(self, watch: _Watch, callback: ReadyCallback, callbacks: list) -> None:
+        watch.settled = True
+        watch.next_probe_at = watch.stable_at = None
+        self._close_probe(watch)
+        if watch.stream is None:
+            self._watches.pop(watch.key, None)
+        callbacks.append((callback, watch.key))
+
+    def _drop(self, watch: _Watch) -> None:
+        self._close_probe(watch)
+        self._close_stream(watch)
+
+    def _close_probe(self, watch: _Watch) -> None:
+        probe = watch.probe
+        if probe is None:
+            return
+        watch.probe = None
+        try:
+            self._selector.unregister(probe)
+        except (KeyError, ValueError):
+            pass
+        probe.close()
+
+    def _close_stream(self, watch: _Watch) -> None:
+        stream = watch.stream
+        if stream is None:
+            return
+        watch.stream = None
+        try:
+            self._selector.unregister(stream)
+        except (KeyError, ValueError):
+            pass
+        try:
+            stream.close()
+        except OSError:
+            pass
+
+
+__all__ = [
+    "FORWARD_READY_MARKERS",
+    "ForwardReadinessWatcher",
+    "resolve_probe_address",
+]
@@ -39,6 +39,8 @@ from sshpilot.api.models.common import (
 )
 from sshpilot.api.models.operations import (
     CloseForwardRequest,
+    ForwardHealth,
+    ForwardHealthStatus,
     ForwardState,
     ForwardSummary,
     ForwardType,
@@ -48,7 +50,10 @@ from sshpilot.api.models.operations import (
 from sshpilot.api.forward_identity import new_forward_id
 from sshpilot.logging_support import log_context
 
+from .forward_health import ForwardHealthMonitor
+from .forward_readiness import ForwardReadinessWatcher, resolve_probe_address
 from .session_runtime import SessionLaunchSpec
+from .ssh_readiness import launch_eligible_for_diagnostics
 
 from .process_registry import KIND_FORWARD, forget_owned_process, record_owned_process_or_abandon
 
@@ -120,6 +125,8 @@ class _OwnedForwardProcess:
         unregister: Callable[["_OwnedForwardProcess"], None],
     ) -> None:
         self._process = process
+        # ssh's ``-v`` stderr, handed to the readiness watcher by the runtime.
+        self.readiness_stream = process.stderr
         self._on_exit = on_exit
         self._unregister = unregister
         self._lock = threading.Lock()
@@ -203,11 +210,18 @@ class SubprocessForwardProcessRunner:
         with self._lock:
             if self._closed:
                 raise RuntimeError("forward process runner is closed")
+        # ``-v`` makes ssh announce its bound listeners on stderr, which the
+        # runtime's readiness watcher reads instead of polling the port. A
+        # user's own -v/-E, or a non-ssh launcher, keeps stderr untouched.
+        verbose = launch_eligible_for_diagnostics(argv)
+        if verbose:
+            insert_at = 3 if len(argv) >= 3 and argv[1] == "-F" else 1
+            argv = (*argv[:insert_at], "-v", *argv[insert_at:])
         process = subprocess.Popen(
             argv,
             stdin=subprocess.DEVNULL,
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+            stderr=subprocess.PIPE if verbose else subprocess.DEVNULL,
             env=dict(environment),
             close_fds=True,
         )
@@ -216,6 +230,8 @@ class SubprocessForwardProcessRunner:
         with self._lock:
             if self._closed:
                 handle.terminate()
+                if process.stderr is not None:
+                    process.stderr.close()
                 forget_owned_process(process.pid)
                 raise RuntimeError("forward process runner is closed")
             self._handles.add(handle)
@@ -257,6 +273,10 @@ class _ForwardRecord:
     handle: Optional[ForwardProcessHandle] = None
     launch_spec: Optional[SessionLaunchSpec] = None
     close_scheduled: bool = False
+    # Bumped when a degraded forward's process is replaced, so the retired
+    # process's exit is not mistaken for the forward failing.
+    generation: int = 0
+    probe_address: Optional[Tuple[int, tuple]] = None
 
 
 _ALLOWED_TRANSITIONS = {
@@ -303,6 +323,10 @@ class ForwardRuntime:
         max_retained_closed_forwards: int = DEFAULT_MAX_RETAINED_CLOSED_FORWARDS,
         active_timeout_seconds: float = DEFAULT_FORWARD_ACTIVE_TIMEOUT_SECONDS,
         remote_stable_seconds: float = DEFAULT_REMOTE_FORWARD_STABLE_SECONDS,
+        readiness_watcher: Optional[ForwardReadinessWatcher] = None,
+        forward_health_probes: bool = False,
+        health_monitor_factory: Callable[..., ForwardHealthMonitor] = ForwardHealthMonitor,
+        restart_degraded_forwards: bool = False,
     ) -> None:
         if shutdown_timeout_seconds < 0:
             raise ValueError("forward shutdown timeout must not be negative")
@@ -321,6 +345,19 @@ class ForwardRuntime:
         self._max_retained_closed_forwards = max_retained_closed_forwards
         self._active_timeout_seconds = float(active_timeout_seconds)
         self._remote_stable_seconds = float(remote_stable_seconds)
+        self._readiness = readiness_watcher or ForwardReadinessWatcher(
+            monotonic=monotonic
+        )
+        # Probes open a tunnelled connection per forward per interval, so
+        # they only run when the daemon settings ask for them.
+        self._health: Optional[ForwardHealthMonitor] = None
+        if forward_health_probes:
+            self._health = health_monitor_factory(
+                on_change=self._on_health_changed,
+                restart=self._restart_degraded if restart_degraded_forwards else None,
+                monotonic=monotonic,
+                clock=clock,
+            )
         self._lock = threading.RLock()
         self._publisher = EventPublisher()
         self._records: Dict[ForwardId, _ForwardRecord] = {}
@@ -414,6 +451,7 @@ class ForwardRuntime:
                 return
             spec = record.launch_spec
             currently_starting = record.state is ForwardState.STARTING
+            generation = record.generation
         if currently_starting:
             try:
                 self._check_bind_available(record)
@@ -423,7 +461,9 @@ class ForwardRuntime:
         try:
             handle = self._runner.start(
                 spec,
-                lambda return_code, fid=forward_id: self._on_process_exit(fid, return_code),
+                lambda return_code, fid=forward_id, gen=generation: self._on_process_exit(
+                    fid, return_code, gen
+                ),
             )
             if handle is None:
                 raise TypeError("forward runner returned no process handle")
@@ -444,24 +484,14 @@ class ForwardRuntime:
                 record.handle = handle
                 should_terminate = False
                 closing = record.state is ForwardState.CLOSING
-        if should_terminate:
-            handle.terminate()
-            return
-        if closing:
-            return
-        if not self._detect_active(record):
-            self._fail(
-                record,
-                ErrorCode.FORWARD_STARTUP_FAILED,
-                "The forward did not become active",
-            )
+        stream = getattr(handle, "readiness_stream", None)
+        if should_terminate or closing:
+            if stream is not None:
+                stream.close()
+            if should_terminate:
+                handle.terminate()
             return
-        with self._lock:
-            if record.state is not ForwardState.STARTING:
-                return
-            record.active_at = self._clock()
-            event = self._transition_locked(record, ForwardState.ACTIVE)
-        self._publish((event,))
+        self._watch_readiness(record, stream)
 
     def reject_pending_start(self, forward_id: ForwardId) -> None:
         self.fail_pending_start(
@@ -503,49 +533,83 @@ class ForwardRuntime:
         finally:
             probe.close()
 
-    def _detect_active(self, record: _ForwardRecord) -> bool:
-        """Wait until the forward is truthfully usable.
+    def _watch_readiness(self, record: _ForwardRecord, stream: Any) -> None:
+        """Hand the started forward to the readiness watcher and return.
 
         Local and dynamic forwards must accept a TCP connect on the bind
         address before ``ACTIVE`` — process-alive alone is not enough
-        (auth can still be in progress). Remote forwards bind on the SSH
-        server, so a short process-alive window after
-        ``ExitOnForwardFailure=yes`` is the honest signal OpenSSH exposes.
+        (auth can still be in progress); ssh's "listening" line triggers
+        that connect immediately. Remote forwards bind on the SSH server:
+        ssh's "remote forward success" line is the signal, or, when stderr
+        is not readable, a short process-alive window after
+        ``ExitOnForwardFailure=yes``.
         """
 
         started = self._monotonic()
-        deadline = started + self._active_timeout_seconds
-        check_bind = record.forward_type is not ForwardType.REMOTE
-        remote_ready_at = started + self._remote_stable_seconds
-        while self._monotonic() < deadline:
+        address = None
+        if record.forward_type is not ForwardType.REMOTE:
+            try:
+                address = resolve_probe_address(record.bind_host, record.bind_port)
+            except OSError:
+                if stream is not None:
+                    stream.close()
+                self._fail_start(record.forward_id)
+                return
             with self._lock:
-                handle = record.handle
-            if handle is None or handle.poll() is not None:
-                return False
-            if check_bind:
-                if self._can_connect(record.bind_host, record.bind_port):
-                    return True
-            elif self._monotonic() >= remote_ready_at:
-                return True
-            time.sleep(0.05)
+                record.probe_address = address
+        try:
+            self._readiness.watch(
+                record.forward_id,
+                deadline=started + self._active_timeout_seconds,
+                on_ready=self._on_forward_ready,
+                on_failed=self._fail_start,
+                stream=stream,
+                address=address,
+                stable_at=started
+                + min(self._remote_stable_seconds, self._active_timeout_seconds),
+            )
+        except RuntimeError:
+            if stream is not None:
+                stream.close()
+            self._fail_start(record.forward_id)
+
+    def _on_forward_ready(self, forward_id: ForwardId) -> None:
         with self._lock:
-            handle = record.handle
-        if handle is None or handle.poll() is not None:
-            return False
-        if check_bind:
-            return self._can_connect(record.bind_host, record.bind_port)
-        return True
+            record = self._records.get(forward_id)
+            if record is None or record.state is not ForwardState.STARTING:
+                return
+            if record.handle is None or record.handle.poll() is not None:
+                return
+            record.active_at = self._clock()
+            event = self._transition_locked(record, ForwardState.ACTIVE)
+        self._publish((event,))
 
-    @staticmethod
-    def _can_connect(host: str, port: int) -> bool:
-        target = "127.0.0.1" if host in _BIND_ANY_HOSTS else host
-        try:
-            with socket.create_connection((target, port), timeout=0.2):
-                return True
-        except OSError:
-            return False
+    def _fail_start(self, forward_id: ForwardId) -> None:
+        with self._lock:
+            record = self._records.get(forward_id)
+            if record is None or record.state is not ForwardState.STARTING:
+                return
+            handle = record.handle
+        self._fail(
+            record,
+            ErrorCode.FORWARD_STARTUP_FAILED,
+            "The forward did not become active",
+        )
+        # A process that never bound is of no use; do not leave it running.
+        if handle is not None:
+            handle.terminate()
 
-    def _on_process_exit(self, forward_id: ForwardId, return_code: Optional[int]) -> None:
+    def _on_process_exit(
+        self,
+        forward_id: ForwardId,
+        return_code: Optional[int],
+        generation: int = 0,
+    ) -> None:
+        with self._lock:
+            record = self._records.get(forward_id)
+            if record is not None and record.generation != generation:
+                return
+        self._readiness.cancel(forward_id)
         with self._lock:
             record = self._records.get(forward_id)
             if record is None or record.state in {ForwardState.CLOSED, ForwardState.FAILED}:
@@ -562,6 +626,125 @@ class ForwardRuntime:
             self._exit_message(return_code),
         )
 
+    # -- health -------------------------------------------------------
+    def _on_health_changed(self, forward_id: ForwardId, health: ForwardHealth) -> None:
+        with self._lock:
+            record = self._records.get(forward_id)
+            if record is None:
+                return
+        with log_context(
+            forward=forward_id,
+            client=record.owner_client_id,
+            connection=record.connection_id,
+        ):
+            if health.status is ForwardHealthStatus.DEGRADED:
+                logger.warning(
+                    "forward degraded failed_probes=%d", health.consecutive_failures
+                )
+            else:
+                logger.info("forward health=%s", health.status.value)
+
+    def _restart_degraded(self, forward_id: ForwardId) -> None:
+        # Runs on the health monitor thread, which must not wait for ssh.
+        threading.Thread(
+            target=self._restart_forward,
+            args=(forward_id,),
+            name="sshpilot-forward-restart",
+            daemon=True,
+        ).start()
+
+    def _restart_forward(self, forward_id: ForwardId) -> None:
+        """Replace the ssh process of a degraded ``ACTIVE`` forward.
+
+        The forward stays ``ACTIVE`` throughout; the retired process's exit is
+        ignored by generation and the new one must bind within the usual
+        readiness deadline or the forward fails.
+        """
+
+        with self._lock:
+            record = self._records.get(forward_id)
+            if (
+                self._closed
+                or record is None
+                or record.state is not ForwardState.ACTIVE
+                or record.handle is None
+            ):
+                return
+            retired = record.handle
+            record.handle = None
+            record.generation += 1
+            generation = record.generation
+            spec = record.launch_spec
+        with log_context(forward=forward_id, connection=record.connection_id):
+            logger.info("restarting degraded forward")
+        self._readiness.cancel(forward_id)
+        retired.terminate()
+        if retired.wait(DEFAULT_TERMINATE_GRACE_SECONDS) is None:
+            retired.kill()
+            retired.wait(DEFAULT_TERMINATE_GRACE_SECONDS)
+        with self._lock:
+            if record.state is not ForwardState.ACTIVE or record.generation != generation:
+                # Closed while the old process went away; nothing else will
+                # observe an exit for it.
+                event = None
+                if record.state is ForwardState.CLOSING and record.handle is None:
+                    event = self._transition_locked(record, ForwardState.CLOSED)
+                self._publish((event,))
+                return
+        try:
+            handle = self._runner.start(
+                spec,
+                lambda return_code, gen=generation: self._on_process_exit(
+                    forward_id, return_code, gen
+                ),
+            )
+            if handle is None:
+                raise TypeError("forward runner returned no process handle")
+        except Exception:
+            self._fail(
+                record,
+                ErrorCode.FORWARD_NOT_ACTIVE,
+                "The degraded forward could not be restarted",
+            )
+            return
+        with self._lock:
+            current = record.state is ForwardState.ACTIVE and record.generation == generation
+            if current:
+                record.handle = handle
+        stream = getattr(handle, "readiness_stream", None)
+        if not current:
+            # Its exit, with the current generation, completes any close.
+            if stream is not None:
+                stream.close()
+            handle.terminate()
+            return
+        try:
+            self._readiness.watch(
+                forward_id,
+                deadline=self._monotonic() + self._active_timeout_seconds,
+                on_ready=lambda _key: None,
+                on_failed=self._fail_restart,
+                stream=stream,
+                address=record.probe_address,
+            )
+        except RuntimeError:
+            if stream is not None:
+                stream.close()
+
+    def _fail_restart(self, forward_id: ForwardId) -> None:
+        with self._lock:
+            record = self._records.get(forward_id)
+            if record is None or record.state is not ForwardState.ACTIVE:
+                return
+            handle = record.handle
+        self._fail(
+            record,
+            ErrorCode.FORWARD_NOT_ACTIVE,
+            "The restarted forward did not become active",
+        )
+        if handle is not None:
+            handle.terminate()
+
     @staticmethod
     def _exit_message(return_code: Optional[int]) -> str:
         if return_code is None:
@@ -720,6 +903,9 @@ class ForwardRuntime:
         try:
             self._runner.close()
         finally:
+            if self._health is not None:
+                self._health.close()
+            self._readiness.close()
             self._publisher.close()
 
     # -- eligibility ----------------------------------------------------
@@ -763,6 +949,13 @@ class ForwardRuntime:
             )
         previous_state = record.state
         record.state = new_state
+        if self._health is not None:
+            if new_state is ForwardState.ACTIVE and record.probe_address is not None:
+                self._health.track(
+                    record.forward_id, record.forward_type, record.probe_address
+                )
+            elif previous_state is ForwardState.ACTIVE:
+                self._health.untrack(record.forward_id)
         if new_state is ForwardState.CLOSED:
             record.closed_at = self._clock()
             self._evict_closed_locked()
@@ -816,8 +1009,7 @@ class ForwardRuntime:
             )
         return record
 
-    @staticmethod
-    def _summary_locked(record: _ForwardRecord) -> ForwardSummary:
+    def _summary_locked(self, record: _ForwardRecord) -> ForwardSummary:
         return ForwardSummary(
             id=record.forward_id,
             connection_id=record.connection_id,
@@ -832,6 +1024,11 @@ class ForwardRuntime:
             closed_at=record.closed_at,
             owner_client_id=record.owner_client_id,
             failure=record.failure,
+            health=(
+                self._health.health(record.forward_id)
+                if record.state is ForwardState.ACTIVE and self._health is not None
+                else None
+            ),
         )
 
     def _evict_closed_locked(self) -> None:
@@ -0,0 +1,703 @@
+"""Background reachability and latency probes for the connection list.
+
+The sidebar used to learn that a host was down only when a session failed to
+start. :class:`HostReachabilityScheduler` probes the ``HostName:Port`` of each
+direct SSH connection with a non-blocking TCP connect (and, on request, reads
+the server's ``SSH-2.0-...`` identification line) and publishes
+``connection.reachability_changed`` with rolling RTT percentiles and the last
+time the host answered.
+
+Probing is kept cheap and polite:
+
+* One daemon thread and one selector carry every probe. Names resolve on a
+  single helper thread behind a short cache, so a slow resolver never stalls
+  probes in flight.
+* Connections a client reported visible are probed every 30 s, connections
+  launched in the last day every 2 min and the rest every 10 min, each with
+  ±20 % jitter so a long list never fires in lockstep. When more probes are
+  due than the budget allows, visible hosts go first.
+* At most ``max_in_flight`` sockets are open at once, and every /24 (IPv4) or
+  /64 (IPv6) subnet has a small token bucket, so a rack of hosts behind one
+  firewall is not swept in a burst.
+* Nothing is probed unless a client asked for reachability recently: a
+  daemon without a window stays quiet.
+
+Connections that reach their host through ProxyJump or ProxyCommand are not
+offered as targets; a direct connect would measure the wrong network path.
+Every probe shows up in the target's sshd log: sshd logs any connection that
+closes before key exchange ("kex_exchange_identification: Connection
+closed"), and a bare TCP connect is such a connection just as a banner read
+is. The GUI therefore leaves probing off unless the user turns on
+``ui.reachability_probes``.
+"""
+
+from __future__ import annotations
+
+import errno
+import ipaddress
+import logging
+import math
+import os
+import queue
+import random
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+from sshpilot.api.events import (
+    CoreEventCallback,
+    EventPublisher,
+    EventType,
+    Subscription,
+)
+from sshpilot.api.models.common import ConnectionId, utc_now
+from sshpilot.api.models.connections import (
+    MAX_SSH_BANNER_LENGTH,
+    ConnectionHealth,
+    ConnectionReachability,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VISIBLE_INTERVAL_SECONDS = 30.0
+DEFAULT_RECENT_INTERVAL_SECONDS = 120.0
+DEFAULT_IDLE_INTERVAL_SECONDS = 600.0
+DEFAULT_RECENT_WINDOW_SECONDS = 24 * 3600.0
+DEFAULT_JITTER_FRACTION = 0.2
+DEFAULT_TIMEOUT_SECONDS = 3.0
+# A failed probe is confirmed this soon instead of after a full interval.
+DEFAULT_CONFIRM_SECONDS = 5.0
+DEFAULT_UNREACHABLE_AFTER = 2
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_SUBNET_BURST = 2
+DEFAULT_SUBNET_RATE_PER_SECOND = 1.0
+# Probing stops when no client has asked for this long.
+DEFAULT_HINT_TTL_SECONDS = 600.0
+DEFAULT_TARGETS_REFRESH_SECONDS = 30.0
+DEFAULT_DNS_TTL_SECONDS = 300.0
+DEFAULT_RTT_WINDOW = 20
+# A new sample is only published when the median moved at least this much.
+_PUBLISH_RTT_CHANGE = 0.2
+
+_IN_PROGRESS = frozenset({errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY})
+_VISIBLE, _RECENT, _IDLE = range(3)
+
+Address = Tuple[int, tuple]
+
+
+@dataclass(frozen=True)
+class ReachabilityTarget:
+    """One direct SSH endpoint to probe."""
+
+    connection_id: ConnectionId
+    host: str
+    port: int
+
+
+@dataclass
+class _Probe:
+    sock: socket.socket
+    started: float
+    deadline: float
+    rtt_ms: Optional[float] = None
+    # ``None`` when the banner is not read.
+    banner: Optional[bytes] = None
+
+
+@dataclass
+class _Host:
+    target: ReachabilityTarget
+    due_at: float
+    last_probe_at: Optional[float] = None
+    resolving: bool = False
+    probe: Optional[_Probe] = None
+    rtts: Deque[float] = field(default_factory=deque)
+    probes: int = 0
+    consecutive_failures: int = 0
+    health: ConnectionHealth = ConnectionHealth.UNKNOWN
+    last_checked_at: Optional[datetime] = None
+    last_seen_at: Optional[datetime] = None
+    banner: Optional[str] = None
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated: float
+
+
+def _nearest_rank(ordered, fraction: float) -> float:
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def subnet_key(address: Address) -> str:
+    """The /24 (IPv4) or /64 (IPv6) network an address is rate-limited in."""
+    _family, sockaddr = address
+    ip = ipaddress.ip_address(str(sockaddr[0]).split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    prefix = 24 if ip.version == 4 else 64
+    return str(ipaddress.ip_network(f"{ip}/{prefix}", strict=False))
+
+
+def _literal_address(host: str, port: int) -> Optional[Address]:
+    try:
+        ip = ipaddress.ip_address(host.strip("[]"))
+    except ValueError:
+        return None
+    if ip.version == 4:
+        return socket.AF_INET, (str(ip), port)
+    return socket.AF_INET6, (str(ip), port, 0, 0)
+
+
+def _resolve(host: str, port: int) -> Optional[Address]:
+    try:
+        family, _type, _proto, _name, sockaddr = socket.getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )[0]
+    except (OSError, UnicodeError, IndexError):
+        return None
+    return family, sockaddr
+
+
+class HostReachabilityScheduler:
+    """Probe many SSH endpoints on one budgeted, daemon-scoped thread.
+
+    *targets* returns the connections to probe; it is called on the probe
+    thread at most every ``targets_refresh_seconds``. The thread starts on
+    the first :meth:`report_visible` call.
+    """
+
+    def __init__(
+        self,
+        targets: Callable[[], Iterable[ReachabilityTarget]],
+        *,
+        visible_interval_seconds: float = DEFAULT_VISIBLE_INTERVAL_SECONDS,
+        recent_interval_seconds: float = DEFAULT_RECENT_INTERVAL_SECONDS,
+        idle_interval_seconds: float = DEFAULT_IDLE_INTERVAL_SECONDS,
+        recent_window_seconds: float = DEFAULT_RECENT_WINDOW_SECONDS,
+        jitter_fraction: float = DEFAULT_JITTER_FRACTION,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        confirm_seconds: float = DEFAULT_CONFIRM_SECONDS,
+        unreachable_after: int = DEFAULT_UNREACHABLE_AFTER,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        subnet_burst: int = DEFAULT_SUBNET_BURST,
+        subnet_rate_per_second: float = DEFAULT_SUBNET_RATE_PER_SECOND,
+        hint_ttl_seconds: float = DEFAULT_HINT_TTL_SECONDS,
+        targets_refresh_seconds: float = DEFAULT_TARGETS_REFRESH_SECONDS,
+        dns_ttl_seconds: float = DEFAULT_DNS_TTL_SECONDS,
+        rtt_window: int = DEFAULT_RTT_WINDOW,
+        resolver: Callable[[str, int], Optional[Address]] = _resolve,
+        monotonic: Callable[[], float] = time.monotonic,
+        clock: Callable[[], datetime] = utc_now,
+        random_fraction: Callable[[], float] = random.random,
+    ) -> None:
+        if not callable(targets):
+            raise TypeError("reachability targets must be callable")
+        if min(visible_interval_seconds, recent_interval_seconds, idle_interval_seconds) <= 0:
+            raise ValueError("reachability intervals must be positive")
+        if not 0 <= jitter_fraction < 1:
+            raise ValueError("reachability jitter must be in [0, 1)")
+        if timeout_seconds <= 0:
+            raise ValueError("reachability timeout must be positive")
+        if type(unreachable_after) is not int or unreachable_after < 1:
+            raise ValueError("at least one failure is required to be unreachable")
+        if type(max_in_flight) is not int or max_in_flight < 1:
+            raise ValueError("at least one probe in flight is required")
+        if type(subnet_burst) is not int or subnet_burst < 1 or subnet_rate_per_second <= 0:
+            raise ValueError("subnet rate limit must allow probes")
+        if type(rtt_window) is not int or rtt_window < 1:
+            raise ValueError("RTT window must be positive")
+        self._targets = targets
+        self._intervals = {
+            _VISIBLE: float(visible_interval_seconds),
+            _RECENT: float(recent_interval_seconds),
+            _IDLE: float(idle_interval_seconds),
+        }
+        self._recent_window = float(recent_window_seconds)
+        self._jitter = float(jitter_fraction)
+        self._timeout = float(timeout_seconds)
+        self._confirm = float(confirm_seconds)
+        self._unreachable_after = unreachable_after
+        self._max_in_flight = max_in_flight
+        self._subnet_burst = subnet_burst
+        self._subnet_rate = float(subnet_rate_per_second)
+        self._hint_ttl = float(hint_ttl_seconds)
+        self._targets_refresh = float(targets_refresh_seconds)
+        self._dns_ttl = float(dns_ttl_seconds)
+        self._rtt_window = rtt_window
+        self._resolver = resolver
+        self._monotonic = monotonic
+        self._clock = clock
+        self._random = random_fraction
+        self._publisher = EventPublisher()
+        # Shared with request threads; everything else is probe-thread only.
+        self._lock = threading.Lock()
+        self._visible: frozenset = frozenset()
+        self._read_banner = False
+        self._hint_at: Optional[float] = None
+        self._used_at: Dict[ConnectionId, float] = {}
+        self._results: Dict[ConnectionId, ConnectionReachability] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._hosts: Dict[ConnectionId, _Host] = {}
+        self._in_flight = 0
+        self._buckets: Dict[str, _Bucket] = {}
+        self._dns: Dict[Tuple[str, int], Tuple[Optional[Address], float]] = {}
+        self._targets_at: Optional[float] = None
+        self._resolved: "queue.Queue[tuple]" = queue.Queue()
+        self._resolve_requests: "queue.Queue[Optional[Tuple[str, int]]]" = queue.Queue()
+        self._pending_names: set = set()
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup_read = self._wakeup_write = -1
+
+    def subscribe_events(self, callback: CoreEventCallback) -> Subscription:
+        return self._publisher.subscribe(callback)
+
+    # -- requests -----------------------------------------------------
+    def report_visible(
+        self,
+        connection_ids: Iterable[ConnectionId],
+        *,
+        read_banner: bool = False,
+    ) -> Tuple[ConnectionReachability, ...]:
+        """Record a client's visible rows and return every known result.
+
+        Each call keeps probing alive for ``hint_ttl_seconds``; newly visible
+        connections are probed at once.
+        """
+        with self._lock:
+            if self._closed:
+                return ()
+            self._visible = frozenset(connection_ids)
+            self._read_banner = bool(read_banner)
+            self._hint_at = self._monotonic()
+            if self._thread is None:
+                self._start_locked()
+            results = tuple(
+                self._results[connection_id] for connection_id in sorted(self._results)
+            )
+        self._wake()
+        return results
+
+    def note_used(self, connection_id: ConnectionId) -> None:
+        """Record a launch so the host moves to the recently used tier."""
+        now = self._monotonic()
+        with self._lock:
+            self._used_at[connection_id] = now
+            if len(self._used_at) > 4096:
+                cutoff = now - self._recent_window
+                self._used_at = {
+                    key: used for key, used in self._used_at.items() if used >= cutoff
+                }
+
+    def reachability(self, connection_id: ConnectionId) -> Optional[ConnectionReachability]:
+        with self._lock:
+            return self._results.get(connection_id)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        self._publisher.close()
+        if thread is None:
+            return
+        self._resolve_requests.put(None)
+        self._wake()
+        if thread is not threading.current_thread():
+            thread.join(timeout=1.5)
+        for descriptor in (self._wakeup_read, self._wakeup_write):
+            try:
+                os.close(descriptor)
+            except OSError:
+                pass
+
+    # -- thread -------------------------------------------------------
+    def _start_locked(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_read, False)
+        os.set_blocking(self._wakeup_write, False)
+        self._selector.register(self._wakeup_read, selectors.EVENT_READ, None)
+        self._thread = threading.Thread(
+            target=self._run, name="sshpilot-host-reachability", daemon=True
+        )
+        self._thread.start()
+        threading.Thread(
+            target=self._resolve_loop,
+            name="sshpilot-host-resolver",
+            daemon=True,
+        ).start()
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wakeup_write, b"x")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _resolve_loop(self) -> None:
+        while True:
+            name = self._resolve_requests.get()
+            if name is None:
+                return
+            address = self._resolver(*name)
+            self._resolved.put((name, address))
+            self._wake()
+
+    def _run(self) -> None:
+        selector = self._selector
+        assert selector is not None
+        try:
+            while True:
+                try:
+                    events = selector.select(self._next_timeout())
+                except OSError:
+                    return
+                with self._lock:
+                    if self._closed:
+                        return
+                published = []
+                for key, mask in events:
+                    if key.data is None:
+                        try:
+                            while os.read(self._wakeup_read, 1024):
+                                pass
+                        except (BlockingIOError, OSError):
+                            pass
+                        continue
+                    host = key.data
+                    if host.probe is not None:
+                        self._on_probe_event(host, published)
+                self._drain_resolved(published)
+                self._run_timers(published)
+                for reachability in published:
+                    try:
+                        self._publisher.publish(
+                            EventType.CONNECTION_REACHABILITY_CHANGED,
+                            reachability,
+                            connection_id=reachability.connection_id,
+                        )
+                    except RuntimeError:
+                        return
+        finally:
+            for host in tuple(self._hosts.values()):
+                self._close_probe(host)
+            selector.close()
+
+    def _hint(self) -> Tuple[frozenset, bool, bool, Dict[ConnectionId, float]]:
+        with self._lock:
+            fresh = (
+                self._hint_at is not None
+                and self._monotonic() - self._hint_at <= self._hint_ttl
+            )
+            return self._visible, self._read_banner, fresh, dict(self._used_at)
+
+    def _next_timeout(self) -> Optional[float]:
+        now = self._monotonic()
+        moments = [
+            host.probe.deadline for host in self._hosts.values() if host.probe is not None
+        ]
+        _visible, _banner, fresh, _used = self._hint()
+        if fresh:
+            if self._targets_at is not None:
+                moments.append(self._targets_at + self._targets_refresh)
+            else:
+                moments.append(now)
+            if self._in_flight < self._max_in_flight:
+                moments.extend(
+                    host.due_at
+                    for host in self._hosts.values()
+                    if host.probe is None and not host.resolving
+                )
+        if not moments:
+            return None
+        return max(0.0, min(moments) - now)
+
+    def _tier(self, connection_id, visible, used, now) -> int:
+        if connection_id in visible:
+            return _VISIBLE
+        used_at = used.get(connection_id)
+        if used_at is not None and now - used_at <= self._recent_window:
+            return _RECENT
+        return _IDLE
+
+    def _interval(self, tier: int) -> float:
+        spread = self._jitter * (2.0 * self._random() - 1.0)
+        return self._intervals[tier] * (1.0 + spread)
+
+    def _refresh_targets(self, now: float) -> None:
+        self._targets_at = now
+        try:
+            targets = {target.connection_id: target for target in self._targets()}
+        except Exception:
+            logger.debug("Could not list reachability targets", exc_info=True)
+            return
+        for connection_id in tuple(self._hosts):
+            host = self._hosts[connection_id]
+            if targets.get(connection_id) != host.target:
+                self._close_probe(host)
+                del self._hosts[connection_id]
+        fresh = set()
+        for connection_id, target in targets.items():
+            if connection_id not in self._hosts:
+                self._hosts[connection_id] = _Host(target=target, due_at=now)
+                fresh.add(connection_id)
+        with self._lock:
+            for connection_id in tuple(self._results):
+                if connection_id in fresh or connection_id not in targets:
+                    del self._results[connection_id]
+
+    def _run_timers(self, published: list) -> None:
+        now = self._monotonic()
+        for host in tuple(self._hosts.values()):
+            if host.probe is not None and now >= host.probe.deadline:
+                self._finish_probe(host, published)
+        visible, read_banner, fresh, used = self._hint()
+        if not fresh:
+            return
+        if self._targets_at is None or now - self._targets_at >= self._targets_refresh:
+            self._refresh_targets(now)
+        due = []
+        for connection_id, host in self._hosts.items():
+            if host.probe is not None or host.resolving:
+                continue
+            tier = self._tier(connection_id, visible, used, now)
+            if host.last_probe_at is not None and host.consecutive_failures == 0:
+                # A host that became visible is pulled forward to its tier.
+                host.due_at = min(
+                    host.due_at, host.last_probe_at + self._intervals[tier]
+                )
+            if host.due_at <= now:
+                due.append((tier, host.due_at, connection_id))
+        due.sort()
+        for tier, _due_at, connection_id in due:
+            if self._in_flight >= self._max_in_flight:
+                break
+            self._start_probe(self._hosts[connection_id], now, read_banner, published)
+
+    def _address(self, host: _Host, now: float) -> Tuple[bool, Optional[Address]]:
+        """``(known, address)``; unknown names are queued for the resolver."""
+        target = host.target
+        literal = _literal_address(target.host, target.port)
+        if literal is not None:
+            return True, literal
+        name = (target.host, target.port)
+        cached = self._dns.get(name)
+        if cached is not None and cached[1] > now:
+            return True, cached[0]
+        host.resolving = True
+        if name not in self._pending_names:
+            self._pending_names.add(name)
+            self._resolve_requests.put(name)
+        return False, None
+
+    def _drain_resolved(self, published: list) -> None:
+        now = self._monotonic()
+        while True:
+            try:
+                name, address = self._resolved.get_nowait()
+            except queue.Empty:
+                return
+            self._pending_names.discard(name)
+            # Failed lookups are cached briefly so a typo is not re-resolved
+            # on every pass.
+            ttl = self._dns_ttl if address is not None else self._confirm
+            self._dns[name] = (address, now + ttl)
+            for host in self._hosts.values():
+                if host.resolving and (host.target.host, host.target.port) == name:
+                    host.resolving = False
+
+    def _take_token(self, address: Address, now: float) -> float:
+        """Consume a subnet token; otherwise return seconds until one refills."""
+        key = subnet_key(address)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(float(self._subnet_burst), now)
+        bucket.tokens = min(
+            float(self._subnet_burst),
+            bucket.tokens + (now - bucket.updated) * self._subnet_rate,
+        )
+        bucket.updated = now
+        if bucket.tokens >= 1.0:
+            bucket.tokens -= 1.0
+            return 0.0
+        return (1.0 - bucket.tokens) / self._subnet_rate
+
+    def _start_probe(self, host: _Host, now: float, read_banner: bool, published: list) -> None:
+        known, address = self._address(host, now)
+        if not known:
+            return
+        if address is None:
+            self._record(host, now, None, None, published)
+            return
+        wait = self._take_token(address, now)
+        if wait > 0:
+            host.due_at = now + wait
+            return
+        family, sockaddr = address
+        try:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+        except OSError:
+            self._record(host, now, None, None, published)
+            return
+        sock.setblocking(False)
+        result = sock.connect_ex(sockaddr)
+        if result not in _IN_PROGRESS and result != 0:
+            sock.close()
+            self._record(host, now, None, None, published)
+            return
+        host.probe = _Probe(
+            sock=sock,
+            started=now,
+            deadline=now + self._timeout,
+            rtt_ms=0.0 if result == 0 else None,
+            banner=b"" if read_banner else None,
+        )
+        self._in_flight += 1
+        if result == 0 and not read_banner:
+            self._finish_probe(host, published)
+            return
+        self._selector.register(
+            sock,
+            selectors.EVENT_READ if result == 0 else selectors.EVENT_WRITE,
+            host,
+        )
+
+    def _on_probe_event(self, host: _Host, published: list) -> None:
+        probe = host.probe
+        if probe.rtt_ms is None:
+            error = probe.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if error:
+                self._finish_probe(host, published)
+                return
+            probe.rtt_ms = (self._monotonic() - probe.started) * 1000.0
+            if probe.banner is None:
+                self._finish_probe(host, published)
+            else:
+                self._selector.modify(probe.sock, selectors.EVENT_READ, host)
+            return
+        try:
+            data = probe.sock.recv(MAX_SSH_BANNER_LENGTH + 2 - len(probe.banner))
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        probe.banner += data
+        if not data or b"\n" in probe.banner or len(probe.banner) > MAX_SSH_BANNER_LENGTH:
+            self._finish_probe(host, published)
+
+    def _finish_probe(self, host: _Host, published: list) -> None:
+        probe = host.probe
+        self._close_probe(host)
+        banner = None
+        if probe.banner:
+            line = probe.banner.split(b"\n", 1)[0].rstrip(b"\r")
+            text = line.decode("utf-8", "replace")[:MAX_SSH_BANNER_LENGTH]
+            banner = text if text.isprintable() else None
+        # A connect that completed before the deadline counts even when the
+        # banner never arrived.
+        self._record(host, probe.started, probe.rtt_ms, banner, published)
+
+    def _close_probe(self, host: _Host) -> None:
+        probe = host.probe
+        if probe is None:
+            return
+        host.probe = None
+        self._in_flight -= 1
+        try:
+            self._selector.unregister(probe.sock)
+        except (KeyError, ValueError):
+            pass
+        probe.sock.close()
+
+    def _record(
+        self,
+        host: _Host,
+        started: float,
+        rtt_ms: Optional[float],
+        banner: Optional[str],
+        published: list,
+    ) -> None:
+        now = self._monotonic()
+        visible, _banner, _fresh, used = self._hint()
+        tier = self._tier(host.target.connection_id, visible, used, now)
+        host.last_probe_at = started
+        host.probes += 1
+        host.last_checked_at = self._clock()
+        previous = self.reachability(host.target.connection_id)
+        if rtt_ms is None:
+            host.consecutive_failures += 1
+            if host.consecutive_failures >= self._unreachable_after:
+                host.health = ConnectionHealth.UNREACHABLE
+                host.due_at = now + self._interval(tier)
+            else:
+                host.due_at = now + min(self._confirm, self._interval(tier))
+        else:
+            host.consecutive_failures = 0
+            host.health = ConnectionHealth.REACHABLE
+            host.last_seen_at = host.last_checked_at
+            host.rtts.append(rtt_ms)
+            while len(host.rtts) > self._rtt_window:
+                host.rtts.popleft()
+            if banner is not None:
+                host.banner = banner
+            host.due_at = now + self._interval(tier)
+        reachability = self._snapshot(host)
+        with self._lock:
+            if self._hosts.get(host.target.connection_id) is not host:
+                return
+            self._results[host.target.connection_id] = reachability
+        if self._significant(previous, reachability):
+            published.append(reachability)
+
+    def _snapshot(self, host: _Host) -> ConnectionReachability:
+        ordered = sorted(host.rtts)
+        return ConnectionReachability(
+            connection_id=host.target.connection_id,
+            health=host.health,
+            probes=host.probes,
+            consecutive_failures=host.consecutive_failures,
+            last_checked_at=host.last_checked_at,
+            last_seen_at=host.last_seen_at,
+            rtt_p50_ms=_nearest_rank(ordered, 0.5) if ordered else None,
+            rtt_p90_ms=_nearest_rank(ordered, 0.9) if ordered else None,
+            rtt_max_ms=ordered[-1] if ordered else None,
+            ssh_banner=host.banner,
+        )
+
+    @staticmethod
+    def _significant(
+        previous: Optional[ConnectionReachability],
+        current: ConnectionReachability,
+    ) -> bool:
+        """Publish state changes and large RTT moves, not every sample."""
+        if previous is None:
+            return current.health is not ConnectionHealth.UNKNOWN
+        if previous.health is not current.health or previous.ssh_banner != current.ssh_banner:
+            return True
+        if previous.rtt_p50_ms is None or current.rtt_p50_ms is None:
+            return previous.rtt_p50_ms != current.rtt_p50_ms
+        change = abs(current.rtt_p50_ms - previous.rtt_p50_ms)
+        return change >= max(1.0, previous.rtt_p50_ms * _PUBLISH_RTT_CHANGE)
+
+
+__all__ = [
+    "HostReachabilityScheduler",
+    "ReachabilityTarget",
+    "subnet_key",
+]
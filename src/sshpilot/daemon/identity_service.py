@@ -8,10 +8,11 @@ This service orchestrates native OpenSSH — it never recreates it:
   ``.ssh``/``authorized_keys`` creation, duplicate detection, permissions and
   shell quoting);
 * authorized-key listing/removal — the one management surface OpenSSH does
-  not provide — uses ordinary ``ssh`` transport, preserves unknown lines
-  byte-for-byte, and derives fingerprints with ``ssh-keygen``;
-* key metadata and fingerprints come from ``ssh-keygen``, not from custom
-  key-format parsing.
+  not provide — uses ordinary ``ssh`` transport and preserves unknown lines
+  byte-for-byte;
+* fingerprints of plain OpenSSH public keys are computed in-process from the
+  key blob, exactly as ``ssh-keygen -lf`` prints them; ``ssh-keygen`` still
+  runs for certificates and types the in-process parser does not know.
 
 Passphrases, passwords and host-key decisions raised by those children are
 bridged through the interaction broker's askpass transport as typed
@@ -56,6 +57,7 @@ from sshpilot.authorized_keys_parser import (
     parse_file,
 )
 from sshpilot.core.identity_service import IdentityStateService
+from sshpilot.core.keys import fingerprint_public_key
 from sshpilot.daemon.key_service import DaemonKeyService
 from sshpilot.daemon.operation_runtime import OperationHandle, OperationRuntime
 from sshpilot.runtime_identity import new_operation_id
@@ -511,13 +513,19 @@ class DaemonIdentityService:
     def _native_fingerprint(
         self, parsed: ParsedKeyEntry
     ) -> Optional[Tuple[str, str]]:
-        """Derive ``(key_type, fingerprint)`` via native ``ssh-keygen -lf -``.
-
-        Returns None when ssh-keygen is unavailable or cannot process the
-        key — the caller keeps the parser's fallback metadata, so a malformed
-        key stays representable and is never silently dropped.
+        """Derive ``(key_type, fingerprint)`` as ``ssh-keygen -lf -`` reports it.
+
+        Plain OpenSSH key blobs are fingerprinted in-process; only formats
+        the in-process parser does not understand (certificates, unknown
+        types) start ``ssh-keygen``. Returns None when ssh-keygen is
+        unavailable or cannot process the key — the caller keeps the
+        parser's fallback metadata, so a malformed key stays representable
+        and is never silently dropped.
         """
         key_line = f"{parsed.keytype} {parsed.key_b64} {parsed.comment}".rstrip()
+        local = fingerprint_public_key(key_line)
+        if local is not None and local.complete:
+            return local.key_type, local.sha256
         try:
             process = self._popen(
                 ["ssh-keygen", "-lf", "-"],
@@ -62,6 +62,7 @@ from sshpilot.askpass_utils import (
     classify_prompt,
 )
 from sshpilot.daemon.session_runtime import SessionLaunchSpec
+from sshpilot.daemon.session_startup_timing import SessionStartupTimings
 from sshpilot.logging_support import log_context
 
 DEFAULT_SECRET_INTERACTION_TIMEOUT = 120.0
@@ -169,6 +170,7 @@ class InteractionBroker:
         passphrase_store: Optional[Callable[[str, str], bool]] = None,
         askpass_workers: int = DEFAULT_ASKPASS_WORKERS,
         askpass_queue_limit: int = DEFAULT_ASKPASS_QUEUE_LIMIT,
+        startup_timings: Optional[SessionStartupTimings] = None,
     ) -> None:
         if secret_timeout <= 0 or host_key_timeout <= 0 or presence_timeout <= 0:
             raise ValueError("interaction timeouts must be positive")
@@ -185,6 +187,9 @@ class InteractionBroker:
         self._password_store = password_store
         self._passphrase_lookup = passphrase_lookup
         self._passphrase_store = passphrase_store
+        # Askpass round trips and stored-secret lookups count towards the
+        # launching session's time to prompt.
+        self._startup_timings = startup_timings
         self._condition = threading.Condition(threading.RLock())
         self._records: Dict[InteractionId, _InteractionRecord] = {}
         self._completed: Deque[InteractionId] = deque()
@@ -1423,12 +1428,16 @@ class InteractionBroker:
                     f"ASKPASS called with prompt: {prompt[:200]!r} "
                     f"hint={(os.environ.get('SSH_ASKPASS_PROMPT') or '').strip().lower()!r}"
                 )
-                secret = self._resolve_askpass_secret(
-                    token,
-                    prompt,
-                    hint=hint,
-                    helper_transport=transport,
-                )
+                started = monotonic()
+                try:
+                    secret = self._resolve_askpass_secret(
+                        token,
+                        prompt,
+                        hint=hint,
+                        helper_transport=transport,
+                    )
+                finally:
+                    self._record_startup_time(token, "askpass", started)
                 if secret is None or len(secret) > _MAX_SECRET_SIZE:
                     continue
                 transport.sendall(
@@ -1453,6 +1462,16 @@ class InteractionBroker:
                 with self._condition:
                     self._askpass_transports.discard(transport)
 
+    def _record_startup_time(self, token: str, stage: str, started: float) -> None:
+        timings = self._startup_timings
+        if timings is None:
+            return
+        with self._condition:
+            context = self._askpass_contexts.get(token)
+            session_id = context.session_id if context is not None else None
+        if session_id is not None:
+            timings.add(session_id, stage, monotonic() - started)
+
     @staticmethod
     def _receive_exact(transport: socket.socket, size: int) -> bytes:
         chunks = bytearray()
@@ -1543,6 +1562,7 @@ class InteractionBroker:
             interaction_mode = context.interaction_mode
         stored: Optional[str] = None
         if try_stored:
+            lookup_started = monotonic()
             try:
                 if interaction_type is InteractionType.PASSWORD:
                     if self._password_lookup is not None:
@@ -1564,6 +1584,7 @@ class InteractionBroker:
                     key_path,
                 )
                 stored = None
+            self._record_startup_time(token, "secret_lookup", lookup_started)
             if interaction_type is InteractionType.PRIVATE_KEY_PASSPHRASE:
                 logger.info(
                     "askpass passphrase: prompt=%r key=%s stored=%s lookup=%s "
@@ -3,16 +3,22 @@
 Owns authoritative access to the known-hosts file: listing parses the exact
 bytes and removal commits a batched mutation against a revision loaded by the
 caller. The service never exposes the filesystem path.
+
+The parsed document and its host index are kept for the current revision, so
+repeated lists and lookups of an unchanged file skip parsing; removals and
+appended lines update the index instead of rebuilding it.
 """
 
 from __future__ import annotations
 
+import hashlib
 import threading
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
 
 from sshpilot.api.errors import ErrorCode, SshPilotError
 from sshpilot.api.models.known_hosts import (
+    FindKnownHostEntriesRequest,
     KnownHostEntryId,
     KnownHostEntrySummary,
     KnownHostsMutationResult,
@@ -27,6 +33,7 @@ from sshpilot.core.known_hosts.file_io import (
     atomic_write_known_hosts_bytes,
     read_known_hosts_bytes,
 )
+from sshpilot.core.known_hosts.index import KnownHostsIndex
 
 
 class KnownHostsService:
@@ -35,12 +42,42 @@ class KnownHostsService:
     def __init__(self, path_resolver: Callable[[], Path]) -> None:
         self._path_resolver = path_resolver
         self._lock = threading.RLock()
+        self._index: Optional[KnownHostsIndex] = None
+
+    def _indexed(self, content: bytes) -> KnownHostsIndex:
+        """Return the index for *content*, reusing the cached revision."""
+        with self._lock:
+            index = self._index
+            if index is not None and index.revision == hashlib.sha256(content).hexdigest():
+                return index
+            document = parse_known_hosts_document(content)
+            self._index = (
+                KnownHostsIndex(document) if index is None else index.refresh(document)
+            )
+            return self._index
 
     def list_known_hosts(self) -> KnownHostsSnapshot:
         path = self._path_resolver()
         content = read_known_hosts_bytes(path)
-        document = parse_known_hosts_document(content)
-        return _document_snapshot(document)
+        return _document_snapshot(self._indexed(content).document)
+
+    def find_known_host_entries(
+        self,
+        request: FindKnownHostEntriesRequest,
+    ) -> KnownHostsSnapshot:
+        """Entries matching one host and port, with ids for the same revision."""
+        path = self._path_resolver()
+        content = read_known_hosts_bytes(path)
+        with self._lock:
+            # The index is updated in place by removals; hold the lock so the
+            # entries and the revision they are keyed by stay consistent.
+            index = self._indexed(content)
+            matches = index.lookup(request.host, request.port)
+            revision = index.revision
+        return KnownHostsSnapshot(
+            revision=revision,
+            entries=tuple(_entry_summary(entry) for entry in matches),
+        )
 
     def remove_known_host_entries(
         self,
@@ -48,7 +85,8 @@ class KnownHostsService:
     ) -> KnownHostsMutationResult:
         with self._lock:
             path = self._path_resolver()
-            current = parse_known_hosts_document(read_known_hosts_bytes(path))
+            index = self._indexed(read_known_hosts_bytes(path))
+            current = index.document
             if current.revision != request.revision:
                 raise SshPilotError(
                     ErrorCode.STALE_EDITOR,
@@ -71,32 +109,33 @@ class KnownHostsService:
                     details={"resource": "known_hosts"},
                 ) from exc
             atomic_write_known_hosts_bytes(path, content)
-            refreshed = parse_known_hosts_document(read_known_hosts_bytes(path))
+            written = read_known_hosts_bytes(path)
+            if written == content:
+                line_of = {entry.entry_id: entry.line_index for entry in current.entries}
+                refreshed = parse_known_hosts_document(written)
+                self._index = index.apply_removal(
+                    refreshed, [line_of[entry_id] for entry_id in entry_ids]
+                )
+            else:
+                refreshed = self._indexed(written).document
             return KnownHostsMutationResult(
                 revision=refreshed.revision,
                 removed_count=len(entry_ids),
-                entries=tuple(
-                    KnownHostEntrySummary(
-                        entry_id=KnownHostEntryId(entry.entry_id),
-                        hostname=entry.parsed.hostname,
-                        key_type=entry.parsed.key_type,
-                        display_line=entry.parsed.line,
-                    )
-                    for entry in refreshed.entries
-                ),
+                entries=tuple(_entry_summary(entry) for entry in refreshed.entries),
             )
 
 
+def _entry_summary(entry) -> KnownHostEntrySummary:
+    return KnownHostEntrySummary(
+        entry_id=KnownHostEntryId(entry.entry_id),
+        hostname=entry.parsed.hostname,
+        key_type=entry.parsed.key_type,
+        display_line=entry.parsed.line,
+    )
+
+
 def _document_snapshot(document) -> KnownHostsSnapshot:
     return KnownHostsSnapshot(
         revision=document.revision,
-        entries=tuple(
-            KnownHostEntrySummary(
-                entry_id=KnownHostEntryId(entry.entry_id),
-                hostname=entry.parsed.hostname,
-                key_type=entry.parsed.key_type,
-                display_line=entry.parsed.line,
-            )
-            for entry in document.entries
-        ),
+        entries=tuple(_entry_summary(entry) for entry in document.entries),
     )
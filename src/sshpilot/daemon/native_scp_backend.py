@@ -7,11 +7,12 @@ import signal
 import subprocess
 import threading
 from dataclasses import dataclass
-from typing import Callable, Mapping, Sequence
+from typing import Callable, Mapping, Optional, Sequence
 
 from sshpilot.api.errors import ErrorCode, SshPilotError
 from sshpilot.api.models.common import SessionId, TransferId
 from sshpilot.api.models.transfers import StartScpTransferRequest
+from sshpilot.core.ssh_capabilities import SshCapabilityRegistry
 from sshpilot.transfer_scp import (
     assemble_scp_transfer_args,
     classify_sftp_error,
@@ -77,11 +78,13 @@ class NativeScpBackend:
         *,
         popen: Callable[..., object] = subprocess.Popen,
         wait_timeout: float = 5.0,
+        capabilities: Optional[SshCapabilityRegistry] = None,
     ) -> None:
         self._launch_provider = launch_provider
         self._interaction_broker = interaction_broker
         self._popen = popen
         self._wait_timeout = float(wait_timeout)
+        self._capabilities = capabilities
 
     def build_operands(
         self,
@@ -162,7 +165,7 @@ class NativeScpBackend:
                     ErrorCode.OPERATION_CANCELLED,
                     "The SCP transfer was cancelled",
                 )
-            if classify_sftp_error(result.stderr):
+            if classify_sftp_error(result.stderr) and self._legacy_flag_usable(argv, env):
                 legacy_argv = insert_legacy_scp_flag(list(argv))
                 legacy = self._run_attempt(
                     legacy_argv,
@@ -192,6 +195,18 @@ class NativeScpBackend:
                 self._interaction_broker.mark_authenticated(scope_id)
             self._interaction_broker.cancel_session(scope_id)
 
+    def _legacy_flag_usable(self, argv: Sequence[str], env: Mapping[str, str]) -> bool:
+        """False only when the registry knows this scp rejects ``-O``.
+
+        Skipping the retry then spares a second connection, and a second
+        authentication prompt, that could only fail.
+        """
+        if self._capabilities is None or not argv:
+            return True
+        if os.path.basename(argv[0]).split(".")[0] != "scp":
+            return True
+        return self._capabilities.get(argv[0], env).legacy_scp_protocol is not False
+
     def _run_attempt(
         self,
         argv: Sequence[str],
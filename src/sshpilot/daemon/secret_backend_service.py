@@ -22,6 +22,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from sshpilot.api.errors import ErrorCode, SshPilotError
 from sshpilot.api.models.common import ConnectionId, SessionId
+from sshpilot.api.models.daemon import SecretCacheStats
 from sshpilot.api.models.interactions import (
     InteractionType,
     PasswordPrompt,
@@ -62,6 +63,7 @@ from sshpilot.core.settings import (
     set_nested,
     settings_transaction_lock,
 )
+from sshpilot.daemon.secret_cache import CachingSecretManager, SecretCache
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +106,7 @@ class SecretBackendService:
         connections_source: Any = None,
         connection_store_snapshot: Any = None,
         connection_store_restore: Any = None,
+        secret_cache: Optional[SecretCache] = None,
     ) -> None:
         self._path = Path(settings_path)
         if secret_manager is None:
@@ -138,12 +141,30 @@ class SecretBackendService:
         # Bounded re-prompts for a wrong import passphrase; each retry goes through
         # a fresh protected interaction so the secret never travels as an RPC param.
         self._MAX_IMPORT_PASSPHRASE_ATTEMPTS = 3
+        # Found passwords/passphrases for askpass, so a burst of launches does
+        # not spawn ``bw``/``rbw``/``pass`` once per prompt. It has its own
+        # lock: lookups must never wait behind ``self._lock``, which is held
+        # while unlock dialogs are open. Every lock/logout/selection/import
+        # route below invalidates it.
+        self._secret_cache = secret_cache if secret_cache is not None else SecretCache()
+        self._cached_manager = CachingSecretManager(self._manager, self._secret_cache)
 
     def attach_interaction_broker(self, broker: Any) -> None:
         """Inject the daemon's interaction broker once it exists (the broker is
         created per-session-runtime, after this service is composed)."""
         self._broker = broker
 
+    def cached_secret_manager(self) -> CachingSecretManager:
+        """The shared manager behind the daemon's secret cache.
+
+        Bound as the connection-secret provider's ``secret_manager_factory``
+        so askpass lookups are cached and its writes invalidate the cache.
+        """
+        return self._cached_manager
+
+    def secret_cache_stats(self) -> SecretCacheStats:
+        return self._secret_cache.stats()
+
     # ------------------------------------------------------------------
     # Configuration (daemon-owned ``secrets.*``)
     # ------------------------------------------------------------------
@@ -197,6 +218,8 @@ class SecretBackendService:
                         details={"code": SETTINGS_PERSISTENCE_FAILED},
                     ) from exc
                 self._apply_environment(config)
+                # A new backend or profile answers lookups differently.
+                self._secret_cache.invalidate()
                 return self._snapshot(config)
 
     def update_selection(
@@ -356,6 +379,7 @@ class SecretBackendService:
                     logger.debug("secret backend lock failed", exc_info=True)
             # Locking invalidates any decrypted preview manifests.
             self._clear_cached_manifests()
+            self._secret_cache.invalidate()
             return self._state_from(semantic)
 
     # ------------------------------------------------------------------
@@ -629,6 +653,7 @@ class SecretBackendService:
                 except Exception:
                     logger.debug("Bitwarden lock failed", exc_info=True)
             self._clear_cached_manifests()
+            self._secret_cache.invalidate()
             return _bitwarden_status(bw)
 
     def bitwarden_logout(self) -> BitwardenStatus:
@@ -642,6 +667,7 @@ class SecretBackendService:
                 bw.logout()
             except Exception:
                 logger.debug("Bitwarden logout failed", exc_info=True)
+            self._secret_cache.invalidate()
             return _bitwarden_status(bw, force_refresh=True)
 
     # ------------------------------------------------------------------
@@ -703,6 +729,7 @@ class SecretBackendService:
                 command_ok = False
                 cache_ok = True
             self._clear_cached_manifests()
+            self._secret_cache.invalidate()
             ok = command_ok and cache_ok
             return _rbw_status(rbw, message="" if ok else "rbw lock failed")
 
@@ -833,6 +860,7 @@ class SecretBackendService:
                 except Exception:
                     logger.debug("KDBX lock failed", exc_info=True)
             self._clear_cached_manifests()
+            self._secret_cache.invalidate()
             return SecretOperationResult(
                 state=SecretOperationState.SUCCESS,
                 backend="keepassxc",
@@ -1197,6 +1225,8 @@ class SecretBackendService:
                     manifest=manifest,
                     connection_store_restore=self._connection_store_restore,
                 )
+                # Imported credentials replace whatever lookups cached.
+                self._secret_cache.invalidate()
                 last_attempt = attempt + 1 >= self._MAX_IMPORT_PASSPHRASE_ATTEMPTS
                 if (
                     result.status is SecretOperationState.FAILED
@@ -1270,9 +1300,10 @@ class SecretBackendService:
         self._manifest_cache.clear()
 
     def shutdown(self) -> None:
-        """Clear cached decrypted manifests (daemon exit hook)."""
+        """Clear cached decrypted manifests and secrets (daemon exit hook)."""
         with self._lock:
             self._clear_cached_manifests()
+            self._secret_cache.close()
 
     def list_bitwarden_backups(self) -> List[Dict[str, str]]:
         """List Bitwarden backup-note metadata (id/name/date only)."""
@@ -1318,17 +1349,20 @@ class SecretBackendService:
             manifest = self._pop_cached_manifest(
                 self._manifest_key("ssh", f"{connection_id}:{entry_id}")
             )
-            return daemon_import_ssh_backup(
-                self._manager,
-                connection_id=connection_id,
-                remote_dir=remote_dir,
-                entry_id=entry_id,
-                options=options,
-                connections_source=self._connections_source,
-                settings_path=self._path,
-                manifest=manifest,
-                connection_store_restore=self._connection_store_restore,
-            )
+            try:
+                return daemon_import_ssh_backup(
+                    self._manager,
+                    connection_id=connection_id,
+                    remote_dir=remote_dir,
+                    entry_id=entry_id,
+                    options=options,
+                    connections_source=self._connections_source,
+                    settings_path=self._path,
+                    manifest=manifest,
+                    connection_store_restore=self._connection_store_restore,
+                )
+            finally:
+                self._secret_cache.invalidate()
 
     def import_bitwarden_backup(
         self,
@@ -1342,14 +1376,17 @@ class SecretBackendService:
             from sshpilot.daemon.secret_transfer import daemon_import_bitwarden_backup
 
             manifest = self._pop_cached_manifest(self._manifest_key("bw", entry_id))
-            return daemon_import_bitwarden_backup(
-                self._manager,
-                entry_id=entry_id,
-                options=options,
-                settings_path=self._path,
-                manifest=manifest,
-                connection_store_restore=self._connection_store_restore,
-            )
+            try:
+                return daemon_import_bitwarden_backup(
+                    self._manager,
+                    entry_id=entry_id,
+                    options=options,
+                    settings_path=self._path,
+                    manifest=manifest,
+                    connection_store_restore=self._connection_store_restore,
+                )
+            finally:
+                self._secret_cache.invalidate()
 
     # ------------------------------------------------------------------
     # Internal helpers
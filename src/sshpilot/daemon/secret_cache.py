@@ -0,0 +1,258 @@
+"""Short-lived daemon cache for stored passwords and key passphrases.
+
+Every askpass prompt the daemon answers from storage goes through
+``SecretManager.lookup``. A cold lookup against ``bw``, ``rbw`` or ``pass``
+spawns a CLI that costs hundreds of milliseconds to seconds, and opening a
+window full of tabs to key-protected hosts asks for the same few secrets
+dozens of times at once.
+
+:class:`SecretCache` keeps found values for a bounded time and collapses
+concurrent lookups of one key into a single backend call (single flight).
+Misses are never cached: a vault that was locked a moment ago must not keep
+answering "absent" after it is unlocked.
+
+Each value lives in its own anonymous page-aligned mapping that is
+``mlock``'d where the platform and ``RLIMIT_MEMLOCK`` allow and excluded
+from core dumps where ``MADV_DONTDUMP`` exists. The mapping is zeroed
+before it is released. The ``str`` handed back to callers is an ordinary
+Python object, as every consumer of ``SecretManager.lookup`` already expects.
+
+The owner invalidates the cache on every lock, logout, backend change and
+import; a lookup in flight when that happens returns its value to its own
+callers but never populates the cache.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import mmap
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from ..api.models.daemon import SecretCacheStats
+
+DEFAULT_SECRET_CACHE_TTL_SECONDS = 300.0
+DEFAULT_SECRET_CACHE_MAX_ENTRIES = 256
+
+try:
+    _LIBC = ctypes.CDLL(None, use_errno=True)
+    _MLOCK = _LIBC.mlock
+    _MUNLOCK = _LIBC.munlock
+except (OSError, AttributeError):
+    _MLOCK = _MUNLOCK = None
+else:
+    for _fn in (_MLOCK, _MUNLOCK):
+        _fn.restype = ctypes.c_int
+        _fn.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    del _fn
+
+
+class _LockedSecret:
+    """One secret value in its own locked, non-dumpable mapping."""
+
+    __slots__ = ("_map", "_buffer", "_length", "locked", "expires_at")
+
+    def __init__(self, value: bytes, expires_at: float) -> None:
+        pages = max(1, -(-len(value) // mmap.PAGESIZE))
+        self._map: Optional[mmap.mmap] = mmap.mmap(-1, pages * mmap.PAGESIZE)
+        dontdump = getattr(mmap, "MADV_DONTDUMP", None)
+        if dontdump is not None:
+            try:
+                self._map.madvise(dontdump)
+            except OSError:
+                pass
+        self._buffer: Any = (ctypes.c_char * len(self._map)).from_buffer(self._map)
+        # Locked before the value is written so it never reaches swap.
+        self.locked = (
+            _MLOCK is not None
+            and _MLOCK(ctypes.addressof(self._buffer), len(self._map)) == 0
+        )
+        self._map[: len(value)] = value
+        self._length = len(value)
+        self.expires_at = expires_at
+
+    def reveal(self) -> str:
+        return self._map[: self._length].decode("utf-8")
+
+    def wipe(self) -> None:
+        if self._map is None:
+            return
+        size = len(self._map)
+        ctypes.memset(ctypes.addressof(self._buffer), 0, size)
+        if self.locked:
+            _MUNLOCK(ctypes.addressof(self._buffer), size)
+            self.locked = False
+        # The ctypes view pins the mapping; it must go before ``close``.
+        self._buffer = None
+        self._map.close()
+        self._map = None
+
+
+@dataclass
+class _Flight:
+    done: threading.Event
+    value: Optional[str] = None
+    error: Optional[BaseException] = None
+    stale: bool = False
+
+
+class SecretCache:
+    """TTL-bounded, single-flight cache of found secret values."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_SECRET_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_SECRET_CACHE_MAX_ENTRIES,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("secret cache TTL must be positive")
+        if type(max_entries) is not int or max_entries < 1:
+            raise ValueError("secret cache must hold at least one entry")
+        self._ttl = float(ttl_seconds)
+        self._max_entries = max_entries
+        self._monotonic = monotonic
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _LockedSecret]" = OrderedDict()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._counters = dict.fromkeys(
+            ("hits", "misses", "coalesced", "invalidations", "evictions"), 0
+        )
+        self._closed = False
+
+    def lookup(self, key: Hashable, load: Callable[[], Optional[str]]) -> Optional[str]:
+        """Return the cached value for *key*, or the result of *load*.
+
+        Callers that arrive while another thread is loading *key* wait for
+        that load instead of starting their own; an exception from *load*
+        is raised to every one of them.
+        """
+        with self._lock:
+            if self._closed:
+                leader = None
+            else:
+                entry = self._entries.get(key)
+                if entry is not None and entry.expires_at > self._monotonic():
+                    self._counters["hits"] += 1
+                    self._entries.move_to_end(key)
+                    return entry.reveal()
+                if entry is not None:
+                    del self._entries[key]
+                    entry.wipe()
+                flight = self._flights.get(key)
+                if flight is not None:
+                    self._counters["coalesced"] += 1
+                    leader = False
+                else:
+                    self._counters["misses"] += 1
+                    flight = self._flights[key] = _Flight(done=threading.Event())
+                    leader = True
+        if leader is None:
+            return load()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        try:
+            flight.value = load()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                if flight.error is None and flight.value and not flight.stale:
+                    self._store_locked(key, flight.value)
+            flight.done.set()
+        return flight.value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Forget *key*, or every entry when *key* is ``None``."""
+        with self._lock:
+            self._counters["invalidations"] += 1
+            if key is None:
+                entries = list(self._entries.values())
+                self._entries.clear()
+                flights = list(self._flights.values())
+                self._flights.clear()
+            else:
+                entry = self._entries.pop(key, None)
+                entries = [entry] if entry is not None else []
+                flight = self._flights.pop(key, None)
+                flights = [flight] if flight is not None else []
+            for flight in flights:
+                flight.stale = True
+            for entry in entries:
+                entry.wipe()
+
+    def stats(self) -> SecretCacheStats:
+        with self._lock:
+            return SecretCacheStats(
+                entries=len(self._entries),
+                locked_entries=sum(1 for entry in self._entries.values() if entry.locked),
+                **self._counters,
+            )
+
+    def close(self) -> None:
+        """Wipe every entry; later lookups go straight to the backend."""
+        self.invalidate()
+        with self._lock:
+            self._closed = True
+
+    def _store_locked(self, key: Hashable, value: str) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            previous.wipe()
+        self._entries[key] = _LockedSecret(
+            value.encode("utf-8"), self._monotonic() + self._ttl
+        )
+        while len(self._entries) > self._max_entries:
+            _key, evicted = self._entries.popitem(last=False)
+            evicted.wipe()
+            self._counters["evictions"] += 1
+
+
+class CachingSecretManager:
+    """``SecretManager`` view whose lookups go through a :class:`SecretCache`.
+
+    Only ``lookup``, ``store`` and ``delete`` are offered: they are all the
+    daemon's connection-secret provider needs. Writes go to the real manager
+    first and then drop the key, so a changed secret is never served stale.
+    """
+
+    def __init__(self, manager: Any, cache: SecretCache) -> None:
+        self._manager = manager
+        self._cache = cache
+
+    @staticmethod
+    def _key(spec: Any) -> tuple:
+        return (spec.keyring_service, spec.keyring_account)
+
+    def lookup(self, spec: Any) -> Optional[str]:
+        return self._cache.lookup(self._key(spec), lambda: self._manager.lookup(spec))
+
+    def store(self, spec: Any, secret: str) -> bool:
+        try:
+            return self._manager.store(spec, secret)
+        finally:
+            self._cache.invalidate(self._key(spec))
+
+    def delete(self, spec: Any) -> bool:
+        try:
+            return self._manager.delete(spec)
+        finally:
+            self._cache.invalidate(self._key(spec))
+
+
+__all__ = [
+    "DEFAULT_SECRET_CACHE_MAX_ENTRIES",
+    "DEFAULT_SECRET_CACHE_TTL_SECONDS",
+    "CachingSecretManager",
+    "SecretCache",
+]
@@ -171,6 +171,14 @@ _FORWARDED_EVENT_TYPES = frozenset(
         EventType.FORWARD_FAILED,
         EventType.DAEMON_STATE_CHANGED,
         EventType.BROADCAST_OUTPUT,
+        EventType.CONNECTION_REACHABILITY_CHANGED,
+    }
+)
+# Events the daemon publishes on its own; they must not keep it from idling.
+_BACKGROUND_EVENT_TYPES = frozenset(
+    {
+        EventType.DAEMON_STATE_CHANGED,
+        EventType.CONNECTION_REACHABILITY_CHANGED,
     }
 )
 _INTERACTION_CANCELLING_EVENT_TYPES = frozenset(
@@ -209,6 +217,10 @@ class CoreServices:
     operation_mode: Any = None
     scp_backend: Any = None
     plugin_settings: Any = None
+    control_master_prewarm: Any = None
+    ssh_capabilities: Any = None
+    forward_health_probes: bool = False
+    forward_health_restart: bool = False
 
 
 @dataclass
@@ -332,6 +344,11 @@ class DaemonServer:
         self._identity_service: Any = None
         self._operation_runtime: Any = None
         self._operation_mode_service: Any = None
+        self._control_master_prewarm: Any = None
+        self._ssh_capabilities: Any = None
+        self._forward_health_probes = False
+        self._forward_health_restart = False
+        self._host_reachability: Any = None
         self._readiness_manager: Optional[Any] = None
         self._session_runtime: Optional[SessionRuntime] = None
         self._sftp_runtime: Optional[SftpServiceRuntime] = None
@@ -365,6 +382,7 @@ class DaemonServer:
         self._transfer_subscription: Optional[Subscription] = None
         self._forward_subscription: Optional[Subscription] = None
         self._operation_subscription: Optional[Subscription] = None
+        self._reachability_subscription: Optional[Subscription] = None
         self._broadcast_publisher = EventPublisher()
         self._broadcast_subscription: Optional[Subscription] = None
         self._command_input_condition = threading.Condition()
@@ -605,6 +623,10 @@ class DaemonServer:
                 self._operation_mode_service = core.operation_mode
                 scp_backend = core.scp_backend
                 plugin_settings = core.plugin_settings
+                self._control_master_prewarm = core.control_master_prewarm
+                self._ssh_capabilities = core.ssh_capabilities
+                self._forward_health_probes = core.forward_health_probes
+                self._forward_health_restart = core.forward_health_restart
             else:
                 self._connection_service = core
                 plugin_settings = None
@@ -615,6 +637,10 @@ class DaemonServer:
             )
             if callable(enable_workers):
                 enable_workers()
+            if self._ssh_capabilities is not None:
+                # Probe ssh/scp now, off the first launch's critical path;
+                # binaries unchanged since the last run are not re-probed.
+                self._ssh_capabilities.start_warmup()
             if self._session_runtime_factory is None:
                 launch_builder = getattr(
                     self._connection_service,
@@ -676,6 +702,9 @@ class DaemonServer:
                         "store_daemon_passphrase",
                         None,
                     ),
+                    startup_timings=getattr(
+                        self._session_runtime, "startup_timings", None
+                    ),
                 )
             )
             sftp_builder = getattr(
@@ -709,10 +738,14 @@ class DaemonServer:
                     lambda spec: self._prepare_forward_launch(spec, forward_builder)
                 )
                 self._forward_runtime = ForwardRuntime(
-                    self._connection_service, runner=forward_runner
+                    self._connection_service,
+                    runner=forward_runner,
+                    forward_health_probes=self._forward_health_probes,
+                    restart_degraded_forwards=self._forward_health_restart,
                 )
             else:
                 self._forward_runtime = ForwardRuntime(self._connection_service)
+            self._host_reachability = self._build_host_reachability()
             if scp_backend is None:
                 scp_provider = getattr(
                     getattr(self._connection_service, "_launch_provider", None),
@@ -730,6 +763,7 @@ class DaemonServer:
                     scp_backend = NativeScpBackend(
                         self._connection_service,
                         self._interaction_broker,
+                        capabilities=self._ssh_capabilities,
                     )
             self._transfer_runtime = TransferRuntime(
                 self._sftp_runtime,
@@ -785,10 +819,13 @@ class DaemonServer:
                 operation_mode=self._operation_mode_service,
                 broadcast_service=self._broadcast_service,
                 plugin_settings=plugin_settings,
+                control_master_prewarm=self._control_master_prewarm,
+                host_reachability=self._host_reachability,
                 command_input_waiter=self._wait_command_input,
                 lifecycle_controller=self._lifecycle,
                 diagnostics_provider=self.build_diagnostics,
             )
+            self._start_control_master_prewarm()
             self._session_executor = BoundedCommandExecutor(
                 max_workers=self.session_command_workers,
                 max_commands=self.session_command_queue_limit,
@@ -833,6 +870,10 @@ class DaemonServer:
         self._broadcast_subscription = self._broadcast_publisher.subscribe(
             self._on_core_event
         )
+        if self._host_reachability is not None:
+            self._reachability_subscription = (
+                self._host_reachability.subscribe_events(self._on_core_event)
+            )
         # Defer `_accepting_core_events` until after `mark_ready()` so the
         # initial READY lifecycle publication is not sequenced onto the
         # shared event bus (clients still poll `daemon.status`).
@@ -898,6 +939,7 @@ class DaemonServer:
             return SshReadinessManager(
                 instance_id=self._instance_id,
                 grace_seconds=self.ssh_readiness_grace_seconds,
+                capabilities=self._ssh_capabilities,
             )
         except (OSError, ValueError, RuntimeError):
             logger.debug("ssh readiness is unavailable", exc_info=True)
@@ -926,6 +968,11 @@ class DaemonServer:
                 from .ssh_readiness import insert_ssh_diagnostics_options
 
                 argv = insert_ssh_diagnostics_options(argv, diagnostics_path)
+        timings = getattr(self._session_runtime, "startup_timings", None)
+        if timings is not None:
+            timings.mark(spec.session_id, "command_ready")
+        if self._host_reachability is not None:
+            self._host_reachability.note_used(spec.connection_id)
         return argv, environment
 
     def _prepare_sftp_launch(
@@ -2052,6 +2099,21 @@ class DaemonServer:
 
     def _cleanup(self) -> None:
         self._stop_configuration_reload()
+        reachability = self._host_reachability
+        self._host_reachability = None
+        if reachability is not None:
+            try:
+                reachability.close()
+            except Exception:
+                logger.debug("Host reachability shutdown failed", exc_info=True)
+        prewarm = self._control_master_prewarm
+        self._control_master_prewarm = None
+        if prewarm is not None:
+            # Before the ControlMaster sweep, so no prewarm outlives it.
+            try:
+                prewarm.close()
+            except Exception:
+                logger.debug("ControlMaster prewarm shutdown failed", exc_info=True)
         operation_runtime = self._operation_runtime
         self._operation_runtime = None
         if operation_runtime is not None:
@@ -2159,6 +2221,39 @@ class DaemonServer:
         except Exception:
             logger.debug("Could not release the process registry", exc_info=True)
 
+    def _build_host_reachability(self) -> Optional[Any]:
+        """Reachability prober over the connection service's direct endpoints."""
+
+        endpoints = getattr(self._connection_service, "direct_ssh_endpoints", None)
+        if not callable(endpoints):
+            return None
+        from .host_reachability import HostReachabilityScheduler, ReachabilityTarget
+
+        return HostReachabilityScheduler(
+            lambda: [ReachabilityTarget(*endpoint) for endpoint in endpoints()]
+        )
+
+    def _start_control_master_prewarm(self) -> None:
+        """Let the prewarm scheduler build masters, if this daemon owns them.
+
+        Speculative masters land in the per-user ControlMaster directory, so
+        only the daemon that retires that directory at shutdown may create
+        them (see :meth:`_expire_control_masters`). Launch accounting and
+        adaptive persistence work either way.
+        """
+
+        if self._control_master_prewarm is None:
+            return
+        from .control_masters import owns_default_control_master_namespace
+
+        try:
+            owns = owns_default_control_master_namespace(self.socket_path)
+        except Exception:
+            logger.debug("ControlMaster namespace ownership unknown", exc_info=True)
+            return
+        if owns:
+            self._control_master_prewarm.start()
+
     def _expire_control_masters(self) -> None:
         """Terminate the ControlMasters this daemon's sessions left behind.
 
@@ -2312,6 +2407,8 @@ class DaemonServer:
             rss = pages * os.sysconf("SC_PAGE_SIZE")
         except (OSError, IndexError, ValueError):
             rss = None
+        timings = getattr(self._session_runtime, "startup_timings", None)
+        secret_cache_stats = getattr(self._secrets_service, "secret_cache_stats", None)
         return DaemonDiagnostics(
             status=status,
             uptime_seconds=uptime,
@@ -2321,6 +2418,17 @@ class DaemonServer:
             rss_bytes=rss,
             socket_bound=self._listener is not None,
             keep_alive_lease=self._lifecycle.keep_alive_lease,
+            control_master_prewarm=(
+                self._control_master_prewarm.stats()
+                if self._control_master_prewarm is not None
+                else None
+            ),
+            session_startup=(
+                timings.percentiles() if timings is not None else ()
+            ),
+            secret_cache=(
+                secret_cache_stats() if callable(secret_cache_stats) else None
+            ),
         )
 
     def _on_lifecycle_shutdown_request(self) -> None:
@@ -2459,7 +2567,7 @@ class DaemonServer:
 
         if event.type not in _FORWARDED_EVENT_TYPES:
             return
-        if event.type is not EventType.DAEMON_STATE_CHANGED:
+        if event.type not in _BACKGROUND_EVENT_TYPES:
             self._note_lifecycle_activity()
         if (
             event.type in _INTERACTION_CANCELLING_EVENT_TYPES
@@ -2606,6 +2714,8 @@ class DaemonServer:
             self._forward_subscription = None
             operation_subscription = self._operation_subscription
             self._operation_subscription = None
+            reachability_subscription = self._reachability_subscription
+            self._reachability_subscription = None
         if subscription is not None:
             subscription.unsubscribe()
         if session_subscription is not None:
@@ -2622,3 +2732,5 @@ class DaemonServer:
             forward_subscription.unsubscribe()
         if operation_subscription is not None:
             operation_subscription.unsubscribe()
+        if reachability_subscription is not None:
+            reachability_subscription.unsubscribe()
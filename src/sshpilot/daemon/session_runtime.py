@@ -54,10 +54,14 @@ from sshpilot.api.models.terminal import (
     TerminalOutput,
 )
 from sshpilot.api.session_identity import new_session_id
-from sshpilot.core.connection_evidence import classify_connection_evidence
+from sshpilot.core.connection_evidence import (
+    classify_connection_evidence,
+    looks_like_shell_prompt,
+)
 from sshpilot.core.ssh_diagnostics import SshDiagnosticResult, SshDiagnosticState
 from sshpilot.logging_support import log_context
 
+from .session_startup_timing import SessionStartupTimings
 from .terminal_stream import (
     DEFAULT_GLOBAL_REPLAY_BYTES,
     DEFAULT_SESSION_REPLAY_BYTES,
@@ -405,6 +409,7 @@ class SessionRuntime:
         replay_bytes: int = DEFAULT_SESSION_REPLAY_BYTES,
         global_replay_bytes: int = DEFAULT_GLOBAL_REPLAY_BYTES,
         readiness_manager: Optional[Any] = None,
+        startup_timings: Optional[SessionStartupTimings] = None,
     ) -> None:
         if close_grace_seconds < 0 or shutdown_timeout_seconds < 0:
             raise ValueError("session close timeouts must not be negative")
@@ -431,6 +436,9 @@ class SessionRuntime:
         self._auth_gate_timeout_seconds = 60.0
         self._connection_evidence_gate = False
         self._readiness_manager = readiness_manager
+        self._startup_timings = startup_timings or SessionStartupTimings(
+            clock=monotonic
+        )
         self._lock = threading.RLock()
         self._publisher = EventPublisher()
         self._records: Dict[SessionId, _SessionRecord] = {}
@@ -440,6 +448,11 @@ class SessionRuntime:
         self._terminal_callbacks: Dict[int, Callable[[TerminalOutput], None]] = {}
         self._next_terminal_callback = 1
 
+    @property
+    def startup_timings(self) -> SessionStartupTimings:
+        """Per-launch stage timings and their rolling per-connection percentiles."""
+        return self._startup_timings
+
     def subscribe_events(self, callback: CoreEventCallback) -> Subscription:
         with self._lock:
             if self._closed:
@@ -613,6 +626,7 @@ class SessionRuntime:
             spec = record.launch_spec
             if spec is None:
                 raise RuntimeError("starting session has no launch specification")
+            self._startup_timings.begin(session_id, record.connection_id)
         try:
             readiness = self._readiness_manager
             if readiness is not None:
@@ -635,6 +649,7 @@ class SessionRuntime:
                 )
             if handle is None:
                 raise TypeError("session runner returned no process handle")
+            self._startup_timings.mark(session_id, "spawned")
         except SshPilotError as error:
             self._startup_failed(
                 record,
@@ -835,9 +850,19 @@ class SessionRuntime:
         """
         if record.state is not SessionState.STARTING:
             return None, False
+        self._startup_timings.mark(record.session_id, "authenticated")
+        # The output that proved the login may already end in the prompt.
+        self._note_startup_prompt_locked(record)
         event = self._transition_locked(record, SessionState.RUNNING)
         return event, True
 
+    def _note_startup_prompt_locked(self, record: _SessionRecord) -> None:
+        timings = self._startup_timings
+        if timings.is_waiting_for_prompt(record.session_id) and looks_like_shell_prompt(
+            self._recent_terminal_text_locked(record, 256)
+        ):
+            timings.mark(record.session_id, "first_prompt")
+
     def _on_ssh_diagnostic_result(
         self,
         session_id: SessionId,
@@ -901,6 +926,7 @@ class SessionRuntime:
                 SshDiagnosticState.MUX_SESSION_OPENED,
             }:
                 record.authenticated = True
+                self._startup_timings.mark(session_id, "authenticated")
                 if parked:
                     record.diagnostic_result = result
                 elif (
@@ -1824,6 +1850,8 @@ class SessionRuntime:
                 return
             start, _end = record.replay.append(data)
             self._enforce_global_replay_budget_locked(prefer=session_id)
+            self._startup_timings.mark(session_id, "first_output")
+            self._note_startup_prompt_locked(record)
             output = TerminalOutput(
                 session_id=session_id,
                 sequence=start,
@@ -2021,6 +2049,8 @@ class SessionRuntime:
         now = self._clock()
         record.state = new_state
         record.updated_at = now
+        if new_state in {SessionState.EXITED, SessionState.FAILED}:
+            self._startup_timings.finish(record.session_id)
         if new_state is SessionState.EXITED:
             record.exited_at = now
         elif new_state is SessionState.CLOSED:
@@ -2029,6 +2059,7 @@ class SessionRuntime:
             record.client_attachments.clear()
             record.output_clients.clear()
             record.input_owner_attachment_id = None
+            self._startup_timings.finish(record.session_id)
             self._evict_closed_locked()
         with log_context(
             session=record.session_id,
@@ -2096,8 +2127,7 @@ class SessionRuntime:
             )
         return record
 
-    @staticmethod
-    def _summary_locked(record: _SessionRecord) -> SessionSummary:
+    def _summary_locked(self, record: _SessionRecord) -> SessionSummary:
         input_owner = None
         if record.input_owner_attachment_id is not None:
             attachment_record = record.attachments.get(record.input_owner_attachment_id)
@@ -2128,6 +2158,7 @@ class SessionRuntime:
             exit_info=record.exit_info,
             failure=record.failure,
             attachment_count=len(record.attachments),
+            startup_timing=self._startup_timings.timing(record.session_id),
         )
 
     def _evict_closed_locked(self) -> None:
@@ -2142,6 +2173,7 @@ class SessionRuntime:
         excess = len(closed) - self._max_retained_closed_sessions
         for session_id in closed[: max(0, excess)]:
             self._records.pop(session_id, None)
+            self._startup_timings.discard(session_id)
             try:
                 self._creation_order.remove(session_id)
             except ValueError:
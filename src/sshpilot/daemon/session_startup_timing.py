@@ -0,0 +1,212 @@
+"""Stage-by-stage time to a usable prompt for daemon session launches.
+
+Every launch records monotonic offsets from the moment the daemon started it:
+the ssh command assembled (``command_ready``), the PTY child exec'd
+(``spawned``), the first byte read from the PTY (``first_output``),
+authentication proven (``authenticated``) and the first prompt-shaped output
+after that (``first_prompt``). Secret lookups and askpass round trips are
+durations summed over the launch; askpass includes the time the user spends
+typing, which is usually the point.
+
+When a launch reaches its prompt, fails or exits, its timing is folded into a
+rolling window per connection so ``daemon.diagnostics`` can report p50/p90/max
+for each stage without keeping unbounded history.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Mapping, Optional, Tuple
+
+from sshpilot.api.models.common import ConnectionId, SessionId
+from sshpilot.api.models.daemon import (
+    ConnectionStartupPercentiles,
+    StartupStagePercentiles,
+)
+from sshpilot.api.models.sessions import (
+    SESSION_STARTUP_MILESTONES,
+    SESSION_STARTUP_STAGES,
+    SessionStartupTiming,
+)
+
+DEFAULT_TIMING_WINDOW = 50
+DEFAULT_MAX_TIMED_CONNECTIONS = 256
+
+_DURATION_STAGES = ("secret_lookup", "askpass")
+
+
+@dataclass
+class _Launch:
+    connection_id: ConnectionId
+    started: float
+    milestones: Dict[str, float] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+    askpass_requests: int = 0
+    finished: bool = False
+
+    def timing(self) -> SessionStartupTiming:
+        values = {
+            f"{stage}_ms": self.milestones.get(stage)
+            for stage in SESSION_STARTUP_MILESTONES
+        }
+        for stage in _DURATION_STAGES:
+            values[f"{stage}_ms"] = self.durations.get(stage, 0.0)
+        return SessionStartupTiming(**values, askpass_requests=self.askpass_requests)
+
+    def samples(self) -> Dict[str, float]:
+        samples = dict(self.milestones)
+        for stage in _DURATION_STAGES:
+            if stage in self.durations:
+                samples[stage] = self.durations[stage]
+        return samples
+
+
+def _nearest_rank(ordered, fraction: float) -> float:
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class SessionStartupTimings:
+    """Thread-safe recorder of per-launch startup stages.
+
+    Calls naming a session that was never begun (or already discarded) are
+    ignored, so instrumentation points never need to know whether timing is
+    wired for a given launch.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = DEFAULT_TIMING_WINDOW,
+        max_connections: int = DEFAULT_MAX_TIMED_CONNECTIONS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if type(window) is not int or window < 1:
+            raise ValueError("timing window must be positive")
+        if type(max_connections) is not int or max_connections < 1:
+            raise ValueError("timed connection limit must be positive")
+        self._window = window
+        self._max_connections = max_connections
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._launches: Dict[SessionId, _Launch] = {}
+        self._history: "OrderedDict[ConnectionId, Deque[Mapping[str, float]]]" = (
+            OrderedDict()
+        )
+
+    def begin(self, session_id: SessionId, connection_id: ConnectionId) -> None:
+        """Start timing a launch; a relaunch of the same id starts over."""
+        with self._lock:
+            self._launches[session_id] = _Launch(connection_id, self._clock())
+
+    def mark(self, session_id: SessionId, milestone: str) -> None:
+        """Record *milestone* now. The first mark of each milestone wins."""
+        if milestone not in SESSION_STARTUP_MILESTONES:
+            raise ValueError(f"unknown startup milestone {milestone!r}")
+        with self._lock:
+            launch = self._launches.get(session_id)
+            if launch is None or launch.finished or milestone in launch.milestones:
+                return
+            launch.milestones[milestone] = (self._clock() - launch.started) * 1000.0
+            if milestone == "first_prompt":
+                self._fold_locked(launch)
+
+    def add(self, session_id: SessionId, stage: str, seconds: float) -> None:
+        """Add *seconds* spent in a duration stage (secret lookup, askpass)."""
+        if stage not in _DURATION_STAGES:
+            raise ValueError(f"unknown startup duration stage {stage!r}")
+        with self._lock:
+            launch = self._launches.get(session_id)
+            if launch is None or launch.finished:
+                return
+            launch.durations[stage] = (
+                launch.durations.get(stage, 0.0) + max(0.0, seconds) * 1000.0
+            )
+            if stage == "askpass":
+                launch.askpass_requests += 1
+
+    def is_waiting_for_prompt(self, session_id: SessionId) -> bool:
+        """Whether the launch authenticated and has not yet shown a prompt."""
+        with self._lock:
+            launch = self._launches.get(session_id)
+            return bool(
+                launch is not None
+                and not launch.finished
+                and "authenticated" in launch.milestones
+            )
+
+    def timing(self, session_id: SessionId) -> Optional[SessionStartupTiming]:
+        with self._lock:
+            launch = self._launches.get(session_id)
+            return launch.timing() if launch is not None else None
+
+    def finish(self, session_id: SessionId) -> None:
+        """Stop timing a launch that failed, exited or closed before its prompt."""
+        with self._lock:
+            launch = self._launches.get(session_id)
+            if launch is not None and not launch.finished:
+                self._fold_locked(launch)
+
+    def discard(self, session_id: SessionId) -> None:
+        """Forget a launch whose session record is gone."""
+        with self._lock:
+            self._launches.pop(session_id, None)
+
+    def _fold_locked(self, launch: _Launch) -> None:
+        launch.finished = True
+        samples = launch.samples()
+        if not samples:
+            return
+        history = self._history.get(launch.connection_id)
+        if history is None:
+            history = self._history[launch.connection_id] = deque(maxlen=self._window)
+            while len(self._history) > self._max_connections:
+                self._history.popitem(last=False)
+        else:
+            self._history.move_to_end(launch.connection_id)
+        history.append(samples)
+
+    def percentiles(self) -> Tuple[ConnectionStartupPercentiles, ...]:
+        """Nearest-rank p50/p90/max per connection over the rolling window."""
+        with self._lock:
+            history = {
+                connection_id: tuple(launches)
+                for connection_id, launches in self._history.items()
+            }
+        results = []
+        for connection_id in sorted(history):
+            launches = history[connection_id]
+            stages = []
+            for stage in SESSION_STARTUP_STAGES:
+                values = sorted(
+                    samples[stage] for samples in launches if stage in samples
+                )
+                if not values:
+                    continue
+                stages.append(
+                    StartupStagePercentiles(
+                        stage=stage,
+                        samples=len(values),
+                        p50_ms=_nearest_rank(values, 0.5),
+                        p90_ms=_nearest_rank(values, 0.9),
+                        max_ms=values[-1],
+                    )
+                )
+            results.append(
+                ConnectionStartupPercentiles(
+                    connection_id=connection_id,
+                    launches=len(launches),
+                    stages=tuple(stages),
+                )
+            )
+        return tuple(results)
+
+
+__all__ = [
+    "DEFAULT_TIMING_WINDOW",
+    "SessionStartupTimings",
+]
@@ -0,0 +1,232 @@
+"""Client side of OpenSSH's ControlMaster multiplexing protocol.
+
+``ssh -O check`` and ``ssh -O exit`` each fork a full ssh client only to send
+one request over the master's ControlPath socket. This module speaks that
+exchange directly (``PROTOCOL.mux`` in the OpenSSH sources): both ends send a
+hello carrying the protocol version, then the client sends one request and
+reads the master's reply. Only the requests sshPilot needs are implemented:
+the alive check, which answers with the master's PID, terminate, and stop
+listening (``ssh -O stop``).
+
+Every packet is a ``uint32`` length followed by the payload; integers are
+big-endian ``uint32`` and strings are length-prefixed. Socket errors
+(``FileNotFoundError``, ``ConnectionRefusedError``, ``TimeoutError``...)
+propagate unchanged so callers can tell "nothing is listening" from "could
+not find out"; anything the peer says that does not fit the protocol raises
+:class:`MuxProtocolError`.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import struct
+import time
+from typing import Optional, Tuple
+
+MUX_MSG_HELLO = 0x00000001
+MUX_C_ALIVE_CHECK = 0x10000004
+MUX_C_TERMINATE = 0x10000005
+MUX_C_STOP_LISTENING = 0x10000009
+MUX_S_OK = 0x80000001
+MUX_S_PERMISSION_DENIED = 0x80000002
+MUX_S_FAILURE = 0x80000003
+MUX_S_ALIVE = 0x80000005
+
+SSHMUX_VERSION = 4
+
+# Replies to the requests above are a few dozen bytes; the master's hello may
+# carry extensions. Anything larger is not a mux master.
+_MAX_PACKET = 64 * 1024
+
+_UINT32 = struct.Struct(">I")
+
+
+class MuxProtocolError(Exception):
+    """The peer did not answer the way an OpenSSH mux master does."""
+
+
+class MuxRequestDenied(MuxProtocolError):
+    """The master understood the request and refused it."""
+
+
+def _pack(*fields) -> bytes:
+    payload = b"".join(
+        _UINT32.pack(len(field)) + field if isinstance(field, bytes) else _UINT32.pack(field)
+        for field in fields
+    )
+    return _UINT32.pack(len(payload)) + payload
+
+
+class _Payload:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._offset = 0
+
+    def u32(self) -> int:
+        end = self._offset + 4
+        if end > len(self._data):
+            raise MuxProtocolError("truncated mux packet")
+        (value,) = _UINT32.unpack_from(self._data, self._offset)
+        self._offset = end
+        return value
+
+    def string(self) -> bytes:
+        length = self.u32()
+        end = self._offset + length
+        if end > len(self._data):
+            raise MuxProtocolError("truncated mux packet")
+        value = self._data[self._offset:end]
+        self._offset = end
+        return value
+
+
+class MuxClient:
+    """One request/reply conversation with a master over a connected socket.
+
+    The socket is owned by the client and closed by :meth:`close` (or the
+    context manager). *timeout* bounds the whole conversation, not each read.
+    """
+
+    def __init__(self, sock: socket.socket, *, timeout: Optional[float] = None) -> None:
+        self._sock = sock
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        self._request_id = 0
+        self._hello_done = False
+
+    def __enter__(self) -> "MuxClient":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+
+    def _arm(self) -> None:
+        if self._deadline is None:
+            return
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("mux exchange timed out")
+        self._sock.settimeout(remaining)
+
+    def _send(self, *fields) -> None:
+        self._arm()
+        self._sock.sendall(_pack(*fields))
+
+    def _recv_exact(self, size: int) -> bytes:
+        chunks = []
+        while size:
+            self._arm()
+            chunk = self._sock.recv(size)
+            if not chunk:
+                raise MuxProtocolError("the master closed the connection")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def _receive(self) -> Tuple[int, _Payload]:
+        (length,) = _UINT32.unpack(self._recv_exact(4))
+        if length < 4 or length > _MAX_PACKET:
+            raise MuxProtocolError(f"implausible mux packet length {length}")
+        payload = _Payload(self._recv_exact(length))
+        return payload.u32(), payload
+
+    def hello(self) -> None:
+        """Exchange hellos; every request does this first if needed."""
+        if self._hello_done:
+            return
+        self._send(MUX_MSG_HELLO, SSHMUX_VERSION)
+        kind, payload = self._receive()
+        if kind != MUX_MSG_HELLO:
+            raise MuxProtocolError(f"expected a hello, got message 0x{kind:08x}")
+        version = payload.u32()
+        if version != SSHMUX_VERSION:
+            raise MuxProtocolError(f"unsupported mux protocol version {version}")
+        # Extensions (name/value string pairs) may follow; none are needed.
+        self._hello_done = True
+
+    def _request(self, kind: int) -> Tuple[int, _Payload]:
+        self.hello()
+        self._request_id += 1
+        request_id = self._request_id
+        self._send(kind, request_id)
+        reply, payload = self._receive()
+        if payload.u32() != request_id:
+            raise MuxProtocolError("the master answered a different request")
+        if reply in (MUX_S_PERMISSION_DENIED, MUX_S_FAILURE):
+            reason = payload.string().decode("utf-8", errors="replace")
+            raise MuxRequestDenied(reason or "request refused")
+        return reply, payload
+
+    def alive_check(self) -> int:
+        """Return the PID of the master behind this socket."""
+        reply, payload = self._request(MUX_C_ALIVE_CHECK)
+        if reply != MUX_S_ALIVE:
+            raise MuxProtocolError(f"unexpected reply 0x{reply:08x} to an alive check")
+        return payload.u32()
+
+    def terminate(self) -> None:
+        """Ask the master to exit (what ``ssh -O exit`` sends)."""
+        reply, _payload = self._request(MUX_C_TERMINATE)
+        if reply != MUX_S_OK:
+            raise MuxProtocolError(f"unexpected reply 0x{reply:08x} to terminate")
+
+    def stop_listening(self) -> None:
+        """Stop accepting new clients; live sessions drain (``ssh -O stop``)."""
+        reply, _payload = self._request(MUX_C_STOP_LISTENING)
+        if reply != MUX_S_OK:
+            raise MuxProtocolError(f"unexpected reply 0x{reply:08x} to stop listening")
+
+
+def connect(path: os.PathLike, *, timeout: float) -> MuxClient:
+    """Connect to the ControlPath at *path*.
+
+    Raises ``OSError`` subclasses from ``connect`` as they are, and
+    :class:`MuxProtocolError` on platforms without Unix sockets.
+    """
+    family = getattr(socket, "AF_UNIX", None)
+    if family is None:
+        raise MuxProtocolError("Unix domain sockets are unavailable")
+    started = time.monotonic()
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(os.fspath(path))
+    except BaseException:
+        sock.close()
+        raise
+    return MuxClient(sock, timeout=max(0.0, timeout - (time.monotonic() - started)))
+
+
+def alive_check(path: os.PathLike, *, timeout: float) -> int:
+    """PID of the master listening on *path*."""
+    with connect(path, timeout=timeout) as client:
+        return client.alive_check()
+
+
+def terminate(path: os.PathLike, *, timeout: float) -> None:
+    """Ask the master listening on *path* to exit."""
+    with connect(path, timeout=timeout) as client:
+        client.terminate()
+
+
+def stop_listening(path: os.PathLike, *, timeout: float) -> None:
+    """Ask the master listening on *path* to stop accepting new clients."""
+    with connect(path, timeout=timeout) as client:
+        client.stop_listening()
+
+
+__all__ = [
+    "MuxClient",
+    "MuxProtocolError",
+    "MuxRequestDenied",
+    "alive_check",
+    "connect",
+    "stop_listening",
+    "terminate",
+]
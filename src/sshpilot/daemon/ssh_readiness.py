@@ -8,8 +8,9 @@ module owns everything around that evidence:
 * a secure per-daemon runtime directory under
   ``$XDG_RUNTIME_DIR/sshpilot/diagnostics/<instance>/`` (0700 dirs, 0600
   files, no symlinks, no ``/tmp`` escape);
-* a cached per-executable capability probe (``ssh -G -F /dev/null -E file
-  localhost`` — no network) plus ``ssh -V`` for logging/cache invalidation;
+* the per-executable capability check (``ssh -G -F /dev/null -E file
+  localhost`` — no network), answered by the shared
+  :class:`~sshpilot.core.ssh_capabilities.SshCapabilityRegistry`;
 * per-session leases: create the file before OpenSSH execs, install the
   inotify watch, parse appended bytes with :class:`SshDiagnosticParser`, and
   deliver the decisive verdict to the session runtime (also on a bounded
@@ -29,13 +30,13 @@ import os
 import re
 import secrets
 import stat
-import subprocess
 import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, Mapping, Optional, Sequence
 
+from sshpilot.core.ssh_capabilities import SshCapabilityRegistry
 from sshpilot.core.ssh_diagnostics import SshDiagnosticParser, SshDiagnosticResult
 from sshpilot.daemon.lifecycle import ensure_private_runtime_directory
 from sshpilot.daemon.ssh_diagnostics_monitor import (
@@ -224,14 +225,13 @@ class SshReadinessManager:
         version_timeout: float = DEFAULT_VERSION_TIMEOUT_SECONDS,
         runtime_dir: Optional[str] = None,
         clock: Callable[[], float] = time.monotonic,
+        capabilities: Optional[SshCapabilityRegistry] = None,
     ) -> None:
         if not instance_id:
             raise ValueError("readiness manager requires a daemon instance id")
         if grace_seconds <= 0 or probe_timeout <= 0 or version_timeout <= 0:
             raise ValueError("readiness timeouts must be positive")
         self._grace_seconds = float(grace_seconds)
-        self._probe_timeout = float(probe_timeout)
-        self._version_timeout = float(version_timeout)
         self._clock = clock
         if runtime_dir is None:
             runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
@@ -245,8 +245,17 @@ class SshReadinessManager:
                 logger.debug("inotify diagnostics monitor is unavailable")
         self._lock = threading.Lock()
         self._sessions: Dict[object, _SessionDiagnostics] = {}
-        self._capability_cache: Dict[tuple, bool] = {}
-        self._versions: Dict[str, str] = {}
+        # The daemon shares its persisted registry; a standalone manager
+        # probes into its own private diagnostics directory.
+        self._capabilities = (
+            capabilities
+            if capabilities is not None
+            else SshCapabilityRegistry(
+                probe_root=self._root,
+                version_timeout=version_timeout,
+                probe_timeout=probe_timeout,
+            )
+        )
         self._closed = False
 
     @property
@@ -443,78 +452,15 @@ class SshReadinessManager:
     # -- capability probe ----------------------------------------------------
 
     def _ssh_version(self, executable: str, environment: Mapping[str, str]) -> str:
-        with self._lock:
-            cached = self._versions.get(executable)
-        if cached is not None:
-            return cached
-        try:
-            result = subprocess.run(
-                (executable, "-V"),
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=self._version_timeout,
-                env=_sanitized_probe_env(environment),
-                check=False,
-            )
-        except (OSError, subprocess.SubprocessError):
-            version = "unknown"
-        else:
-            version = (
-                (result.stderr or result.stdout).decode("utf-8", errors="replace")
-                .strip()
-                or "unknown"
-            )
-        with self._lock:
-            self._versions[executable] = version
-        logger.debug("ssh readiness probe: %s is %s", executable, version)
-        return version
+        return self._capabilities.get(
+            executable, _sanitized_probe_env(environment)
+        ).version
 
     def _capable(self, executable: str, environment: Mapping[str, str]) -> bool:
-        version = self._ssh_version(executable, environment)
-        key = (executable, version)
-        with self._lock:
-            cached = self._capability_cache.get(key)
-        if cached is not None:
-            return cached
-        probe_path = self._probe_path()
-        if probe_path is None:
-            return False
-        capable = False
-        try:
-            result = subprocess.run(
-                (
-                    executable,
-                    "-G",
-                    "-F",
-                    "/dev/null",
-                    "-E",
-                    str(probe_path),
-                    "localhost",
-                ),
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=self._probe_timeout,
-                env=_sanitized_probe_env(environment),
-                check=False,
-            )
-            capable = result.returncode == 0 and probe_path.exists()
-        except (OSError, subprocess.SubprocessError):
-            capable = False
-        finally:
-            try:
-                probe_path.unlink()
-            except OSError:
-                pass
-        with self._lock:
-            self._capability_cache[key] = capable
-        logger.debug(
-            "ssh readiness capability for %s: %s",
-            executable,
-            "available" if capable else "unavailable",
+        capabilities = self._capabilities.get(
+            executable, _sanitized_probe_env(environment)
         )
-        return capable
+        return capabilities.config_dump and capabilities.error_log
 
     # -- file plumbing ---------------------------------------------------------
 
@@ -526,21 +472,6 @@ class SshReadinessManager:
             return None
         return self._root / f"{name}.log"
 
-    def _probe_path(self) -> Optional[Path]:
-        if self._root is None:
-            return None
-        path = self._root / f"probe-{secrets.token_hex(6)}.log"
-        try:
-            fd = os.open(
-                str(path),
-                os.O_CREAT | os.O_EXCL | os.O_WRONLY,
-                0o600,
-            )
-        except OSError:
-            return None
-        os.close(fd)
-        return path
-
     def _file_reader(self, session_id: object) -> Callable[[bytes], None]:
         def _on_data(data: bytes) -> None:
             self._consume(session_id, data)
@@ -0,0 +1,202 @@
+"""Background listing of local directories for the file manager.
+
+``os.scandir`` plus a ``stat`` per entry can take seconds on NFS mounts or slow
+USB disks, so listings run on a worker thread and are handed back to the main
+loop in batches. Folder item counts are not part of the listing; panes ask for
+them per visible row and they are computed on a separate worker.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .common import FileEntry, _MainThreadDispatcher
+
+# The first batch is small so something paints quickly; later batches double
+# so a huge directory costs a handful of pane refreshes rather than hundreds.
+LISTING_FIRST_BATCH = 128
+LISTING_MAX_BATCH = 4096
+
+
+def iter_local_entries(
+    path: str,
+    cancelled: Optional[threading.Event] = None,
+    batch_size: int = LISTING_FIRST_BATCH,
+    max_batch_size: int = LISTING_MAX_BATCH,
+) -> Iterator[List[FileEntry]]:
+    """Yield the entries of *path* in batches.
+
+    Batches start at *batch_size* entries and double up to *max_batch_size*.
+    Entries that cannot be stat'ed are skipped. Stops early once *cancelled*
+    is set. Raises ``NotADirectoryError``/``OSError`` if *path* cannot be
+    listed.
+    """
+    if not os.path.isdir(path):
+        raise NotADirectoryError(f"Not a directory: {path}")
+    batch: List[FileEntry] = []
+    with os.scandir(path) as it:
+        for dirent in it:
+            if cancelled is not None and cancelled.is_set():
+                return
+            try:
+                stat = dirent.stat(follow_symlinks=False)
+                is_dir = dirent.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            batch.append(
+                FileEntry(
+                    name=dirent.name,
+                    is_dir=is_dir,
+                    size=getattr(stat, "st_size", 0) or 0,
+                    modified=getattr(stat, "st_mtime", 0.0) or 0.0,
+                )
+            )
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+                batch_size = min(batch_size * 2, max_batch_size)
+    if batch:
+        yield batch
+
+
+def count_local_children(path: str) -> Optional[int]:
+    """Return the number of entries in *path*, or ``None`` if unreadable."""
+    try:
+        with os.scandir(path) as it:
+            return sum(1 for _ in it)
+    except OSError:
+        return None
+
+
+class LocalDirectoryLoader:
+    """Run local listings and folder counts off the main thread.
+
+    Every :meth:`load` supersedes the previous one: the older worker is told
+    to stop and any of its batches still queued for the main loop are
+    dropped. Count requests for a directory that is no longer the one being
+    shown are dropped the same way. All callbacks run through *dispatch*,
+    which defaults to the GTK main loop.
+    """
+
+    def __init__(self, dispatch: Optional[Callable[..., None]] = None) -> None:
+        self._dispatch = dispatch or _MainThreadDispatcher.dispatch
+        self._generation = 0
+        self._cancel = threading.Event()
+        self._path: Optional[str] = None
+        self._counts: "queue.Queue[Tuple[int, str, str, Callable]]" = queue.Queue()
+        self._requested: set = set()
+        self._count_worker: Optional[threading.Thread] = None
+        self._count_lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def is_current(self, generation: int) -> bool:
+        return not self._closed and generation == self._generation
+
+    def load(
+        self,
+        path: str,
+        on_batch: Callable[[str, List[FileEntry], bool], None],
+        on_done: Callable[[str, bool], None],
+        on_error: Callable[[str, BaseException], None],
+    ) -> int:
+        """List *path* in the background and return the load's generation.
+
+        ``on_batch(path, entries, first)`` receives each batch,
+        ``on_done(path, empty)`` runs once the listing completes and
+        ``on_error(path, exc)`` replaces it on failure. None of them run
+        for a load that has been superseded.
+        """
+        self.cancel()
+        self._generation += 1
+        generation = self._generation
+        cancel = threading.Event()
+        self._cancel = cancel
+        self._path = path
+        self._requested = set()
+
+        def deliver(callback, *args) -> None:
+            def _run() -> None:
+                if self.is_current(generation):
+                    callback(*args)
+
+            self._dispatch(_run)
+
+        def worker() -> None:
+            first = True
+            try:
+                for batch in iter_local_entries(path, cancel):
+                    deliver(on_batch, path, batch, first)
+                    first = False
+            except Exception as exc:
+                deliver(on_error, path, exc)
+                return
+            if not cancel.is_set():
+                deliver(on_done, path, first)
+
+        threading.Thread(
+            target=worker, name="sshpilot-local-listing", daemon=True
+        ).start()
+        return generation
+
+    def request_count(
+        self, path: str, name: str, on_counts: Callable[[str, Dict[str, int]], None]
+    ) -> None:
+        """Count the entries of ``path/name`` once, for the current listing."""
+        if self._closed or path != self._path or (path, name) in self._requested:
+            return
+        self._requested.add((path, name))
+        with self._count_lock:
+            self._counts.put((self._generation, path, name, on_counts))
+            if self._count_worker is None:
+                self._count_worker = threading.Thread(
+                    target=self._count_loop, name="sshpilot-local-counts", daemon=True
+                )
+                self._count_worker.start()
+
+    def _count_loop(self) -> None:
+        while True:
+            with self._count_lock:
+                try:
+                    request = self._counts.get_nowait()
+                except queue.Empty:
+                    # Exit while holding the lock so a concurrent request
+                    # either sees this worker gone or is picked up above.
+                    self._count_worker = None
+                    return
+            generation, path, name, on_counts = request
+            if not self.is_current(generation):
+                continue
+            count = count_local_children(os.path.join(path, name))
+            if count is None:
+                continue
+
+            def _run(generation=generation, path=path, name=name, count=count, on_counts=on_counts) -> None:
+                if self.is_current(generation):
+                    on_counts(path, {name: count})
+
+            self._dispatch(_run)
+
+    def cancel(self) -> None:
+        """Stop the running listing and drop its pending results."""
+        self._cancel.set()
+        self._generation += 1
+
+    def close(self) -> None:
+        self.cancel()
+        self._closed = True
+
+
+__all__ = [
+    "LISTING_FIRST_BATCH",
+    "LISTING_MAX_BATCH",
+    "LocalDirectoryLoader",
+    "count_local_children",
+    "iter_local_entries",
+]
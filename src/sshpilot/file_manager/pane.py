@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 import logging
 import mimetypes
+import operator
 import os
 import pathlib
 import posixpath
@@ -169,6 +170,10 @@ class FilePane(Gtk.Box):
         # written into visible rows in place (no list-store rebuild).
         self._bound_list_boxes: set = set()
         self._bound_grid_images: set = set()
+        # Set by the window for panes whose folder counts are computed on
+        # demand: called with (directory, folder name) when a folder row
+        # without a count is bound, so only visible folders are counted.
+        self._item_count_requester: Optional[Callable[[str, str], None]] = None
 
         self._stack = Gtk.Stack()
         self._stack.set_transition_type(Gtk.StackTransitionType.CROSSFADE)
@@ -467,6 +472,12 @@ class FilePane(Gtk.Box):
         self._entries: List[FileEntry] = []
         self._cached_entries: List[FileEntry] = []
         self._raw_entries: List[FileEntry] = []
+        # Per-listing caches keyed by ``id(entry)`` (the entries stay alive in
+        # ``_cached_entries``): the casefolded name used for sorting, and the
+        # list-store item for the row, so re-sorting or re-filtering reorders
+        # existing items instead of allocating new ones.
+        self._collation_keys: Dict[int, str] = {}
+        self._store_items: Dict[int, Any] = {}
         self._show_hidden = False
         self.toolbar.set_show_hidden_state(self._show_hidden)
         self._sort_key = "name"  # Default sort by name
@@ -667,6 +678,9 @@ class FilePane(Gtk.Box):
             else:
                 metadata_label.set_text("—")
                 metadata_label.set_tooltip_text(None)
+                requester = getattr(self, "_item_count_requester", None)
+                if requester is not None and self._current_path:
+                    requester(self._current_path, entry.name)
         else:
             size_text = self._format_size(entry.size)
             metadata_label.set_text(size_text)
@@ -696,7 +710,7 @@ class FilePane(Gtk.Box):
         visible folder row in place — no list-store rebuild, so scroll position
         and selection are preserved. Ignored if the user has navigated away.
         """
-        if not counts or path != self._current_path or not self._is_remote:
+        if not counts or path != self._current_path:
             return
         for entry in self._cached_entries:
             if entry.is_dir and entry.name in counts:
@@ -1406,6 +1420,16 @@ class FilePane(Gtk.Box):
     def _get_selected_indices(self) -> List[int]:
         indices: List[int] = []
         total = len(self._entries)
+        get_selection = getattr(self._selection_model, "get_selection", None)
+        if callable(get_selection):
+            # The selection bitset costs O(selected) rather than one
+            # is_selected() round trip per row.
+            selection = get_selection()
+            for nth in range(selection.get_size()):
+                index = selection.get_nth(nth)
+                if index < total:
+                    indices.append(index)
+            return indices
         if hasattr(self._selection_model, "is_selected"):
             for index in range(total):
                 try:
@@ -2134,10 +2158,31 @@ class FilePane(Gtk.Box):
         self._current_path = path
         self._set_current_pathbar_text(path)
         self._cached_entries = entries_list
+        self._collation_keys = {}
+        self._store_items = {}
+        self._index_entries(entries_list)
         self._apply_entry_filter(preserve_selection=False)
         
         logger.debug(f"FilePane.show_entries: {pane_type} pane update completed")
 
+    def append_entries(self, path: str, entries: Iterable[FileEntry]) -> None:
+        """Add another batch to the listing already shown for *path*.
+
+        Used while a large directory is still streaming in; selection is kept.
+        Ignored if the pane has moved on to a different path.
+        """
+        if path != self._current_path:
+            return
+        batch = list(entries)
+        self._cached_entries.extend(batch)
+        self._index_entries(batch)
+        self._apply_entry_filter(preserve_selection=True)
+
+    def _index_entries(self, entries: Iterable[FileEntry]) -> None:
+        keys = self._collation_keys
+        for entry in entries:
+            keys[id(entry)] = entry.name.casefold()
+
     def highlight_entry(self, name: str) -> None:
         if not name:
             return
@@ -2168,16 +2213,29 @@ class FilePane(Gtk.Box):
         ]
 
         # Apply sorting to get final entries
-        self._entries = self._sort_entries(self._raw_entries)
-        
-        # Update the list store
-        self._list_store.remove_all()
+        entries = self._sort_entries(self._raw_entries)
+        previous = self._entries
+        unchanged = len(entries) == len(previous) and all(
+            new is old for new, old in zip(entries, previous)
+        )
+        self._entries = entries
+        if unchanged and preserve_selection:
+            # Same rows in the same order: the model and selection stand.
+            self._update_menu_state()
+            return
+
+        # One splice emits a single items-changed, where remove_all() plus an
+        # append per row made the views process one change per entry.
+        self._list_store.splice(
+            0,
+            self._list_store.get_n_items(),
+            [self._store_item(entry) for entry in entries],
+        )
         restored_selection: List[int] = []
-        for idx, entry in enumerate(self._entries):
-            suffix = "/" if entry.is_dir else ""
-            self._list_store.append(Gtk.StringObject.new(entry.name + suffix))
-            if preserve_selection and entry.name in selected_names:
-                restored_selection.append(idx)
+        if preserve_selection and selected_names:
+            restored_selection = [
+                idx for idx, entry in enumerate(entries) if entry.name in selected_names
+            ]
 
         self._selection_model.unselect_all()
         self._selection_anchor = None
@@ -2188,6 +2246,15 @@ class FilePane(Gtk.Box):
 
         self._update_menu_state()
 
+    def _store_item(self, entry: FileEntry):
+        key = id(entry)
+        item = self._store_items.get(key)
+        if item is None:
+            suffix = "/" if entry.is_dir else ""
+            item = Gtk.StringObject.new(entry.name + suffix)
+            self._store_items[key] = item
+        return item
+
 
 
     # -- navigation helpers --------------------------------------------
@@ -2212,12 +2279,16 @@ class FilePane(Gtk.Box):
         self._navigate_to_entry(position)
 
     def _sort_entries(self, entries: Iterable[FileEntry]) -> List[FileEntry]:
-        def key_func(item: FileEntry):
-            if self._sort_key == "size":
-                return item.size
-            if self._sort_key == "modified":
-                return item.modified
-            return item.name.casefold()
+        if self._sort_key == "size":
+            key_func = operator.attrgetter("size")
+        elif self._sort_key == "modified":
+            key_func = operator.attrgetter("modified")
+        else:
+            keys = self._collation_keys
+
+            def key_func(item: FileEntry):
+                key = keys.get(id(item))
+                return key if key is not None else item.name.casefold()
 
         dirs = [entry for entry in entries if entry.is_dir]
         files = [entry for entry in entries if not entry.is_dir]
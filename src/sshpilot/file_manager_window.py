@@ -58,6 +58,7 @@ from .file_manager import (
     _load_first_doc_path,
     _load_grant_for_host,
 )
+from .file_manager.local_listing import LocalDirectoryLoader
 
 import logging
 
@@ -864,6 +865,9 @@ class FileManagerWindow(Adw.Window):
     def _cleanup_manager(self) -> None:
         """Close the file manager backend and clear UI state."""
         self._is_disposed = True
+        loader = getattr(self, "_local_loader", None)
+        if loader is not None:
+            loader.close()
         manager = getattr(self, "_manager", None)
         if isinstance(manager, (types.FunctionType, types.MethodType)):
             manager = None
@@ -990,62 +994,54 @@ class FileManagerWindow(Adw.Window):
     def _load_local(self, path: str) -> None:
         """Load local directory contents into the left pane.
 
-        This is a synchronous operation using the local filesystem.
+        The listing runs on a worker thread and streams into the pane in
+        batches; starting another load abandons this one. Folder item counts
+        are requested by the pane for the rows it actually binds.
         """
-        try:
-            path = os.path.expanduser(path or "~")
-            if not os.path.isabs(path):
-                path = os.path.abspath(path)
-            if not os.path.isdir(path):
-                raise NotADirectoryError(f"Not a directory: {path}")
-
-            entries: List[FileEntry] = []
-            with os.scandir(path) as it:
-                for dirent in it:
-                    try:
-                        stat = dirent.stat(follow_symlinks=False)
-                        is_dir = dirent.is_dir(follow_symlinks=False)
-                        item_count = None
-                        
-                        # Count items in directory
-                        if is_dir:
-                            try:
-                                with os.scandir(dirent.path) as dir_it:
-                                    item_count = len(list(dir_it))
-                            except Exception:
-                                # If we can't read the directory, set count to None
-                                item_count = None
-                        
-                        entries.append(
-                            FileEntry(
-                                name=dirent.name,
-                                is_dir=is_dir,
-                                size=getattr(stat, "st_size", 0) or 0,
-                                modified=getattr(stat, "st_mtime", 0.0) or 0.0,
-                                item_count=item_count,
-                            )
-                        )
-                    except Exception:
-                        # Skip entries we cannot stat
-                        continue
+        path = os.path.expanduser(path or "~")
+        if not os.path.isabs(path):
+            path = os.path.abspath(path)
+        loader = getattr(self, "_local_loader", None)
+        if loader is None:
+            loader = self._local_loader = LocalDirectoryLoader()
+            self._left_pane._item_count_requester = self._request_local_item_count
+        loader.load(
+            path,
+            self._on_local_batch,
+            self._on_local_listing_done,
+            self._on_local_listing_error,
+        )
 
-            # Show results in the left pane
+    def _on_local_batch(self, path: str, entries: List[FileEntry], first: bool) -> None:
+        if first:
             self._left_pane.show_entries(path, entries)
-            self._apply_pending_highlight(self._left_pane)
-            
-            # Show success toast if this was a refresh
-            if self._left_pane in self._refreshing_panes:
-                try:
-                    self._left_pane.show_toast("Directory reloadeds", timeout=2)
-                    logger.debug(f"_load_local: showed refresh success toast for local pane")
-                except (AttributeError, RuntimeError, GLib.Error):
-                    pass
-                finally:
-                    self._refreshing_panes.discard(self._left_pane)
-        except Exception as exc:
-            self._left_pane.show_toast(str(exc))
-            # Clear refresh flag on error
-            self._refreshing_panes.discard(self._left_pane)
+        else:
+            self._left_pane.append_entries(path, entries)
+
+    def _on_local_listing_done(self, path: str, empty: bool) -> None:
+        if empty:
+            self._left_pane.show_entries(path, [])
+        self._apply_pending_highlight(self._left_pane)
+
+        # Show success toast if this was a refresh
+        if self._left_pane in self._refreshing_panes:
+            try:
+                self._left_pane.show_toast("Directory reloaded", timeout=2)
+                logger.debug("_load_local: showed refresh success toast for local pane")
+            except (AttributeError, RuntimeError, GLib.Error):
+                pass
+            finally:
+                self._refreshing_panes.discard(self._left_pane)
+
+    def _on_local_listing_error(self, path: str, exc: BaseException) -> None:
+        self._left_pane.show_toast(str(exc))
+        # Clear refresh flag on error
+        self._refreshing_panes.discard(self._left_pane)
+
+    def _request_local_item_count(self, path: str, name: str) -> None:
+        loader = getattr(self, "_local_loader", None)
+        if loader is not None:
+            loader.request_count(path, name, self._left_pane.update_item_counts)
 
     def _on_path_changed(self, pane: FilePane, path: str, user_data=None) -> None:
         # Detect if this is a refresh (same path as current)
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from threading import RLock
-from typing import Callable, Iterable, Optional
+from typing import Callable, Dict, Iterable, Optional
 from dataclasses import replace
 
 from sshpilot.api.events import CoreEvent, EventType
 from sshpilot.api.models.connection_store import ConnectionStoreSnapshot
 from sshpilot.api.models.connections import (
     ConnectionId,
+    ConnectionReachability,
     ConnectionSummary,
 )
 
@@ -51,6 +52,9 @@ class ConnectionPresentationStore:
         self._dispatch = dispatch or (lambda callback: callback())
         self._handlers = {}
         self._next_handler_id = 1
+        # Probe results ride beside the snapshot: they never bump its
+        # generation or take part in event sequencing.
+        self._reachability: Dict[str, ConnectionReachability] = {}
 
     def snapshot(self) -> ConnectionStoreSnapshot:
         with self._lock:
@@ -102,6 +106,39 @@ class ConnectionPresentationStore:
     def get_groups(self):
         return self.groups
 
+    def get_reachability(self, connection_id: str) -> Optional[ConnectionReachability]:
+        with self._lock:
+            return self._reachability.get(connection_id)
+
+    def apply_reachability(self, results: Iterable[ConnectionReachability]) -> None:
+        """Install results from ``get_connection_reachability``.
+
+        Emits ``connection-reachability`` for each result newer than the one
+        held; events and polled results may arrive in either order.
+        """
+        with self._lock:
+            generation = self._attach_generation
+        for item in tuple(results):
+            self._apply_reachability(item, generation)
+
+    def _apply_reachability(self, item, generation: int) -> None:
+        if type(item) is not ConnectionReachability:
+            return
+        with self._lock:
+            if generation != self._attach_generation:
+                return
+            current = self._reachability.get(item.connection_id)
+            if current is not None and (
+                item.last_checked_at is None
+                or (
+                    current.last_checked_at is not None
+                    and item.last_checked_at <= current.last_checked_at
+                )
+            ):
+                return
+            self._reachability[item.connection_id] = item
+        self._emit("connection-reachability", item)
+
     def rebuild(self, connections: Iterable[ConnectionSummary]) -> None:
         """Compatibility helper for callers that only have connection DTOs."""
         values = tuple(connections)
@@ -142,6 +179,7 @@ class ConnectionPresentationStore:
             self._last_sequence = -1
             self._buffering = True
             self._pending_events = []
+            self._reachability = {}
         if old_subscription is not None:
             old_subscription.unsubscribe()
         instance_id = getattr(client, "server_instance_id", None)
@@ -242,10 +280,15 @@ class ConnectionPresentationStore:
             self._client = None
             self._buffering = False
             self._pending_events = []
+            self._reachability = {}
         if subscription is not None:
             subscription.unsubscribe()
 
     def _accept_event(self, event: CoreEvent, generation: int, instance_id: Optional[str]):
+        if event.type is EventType.CONNECTION_REACHABILITY_CHANGED:
+            if getattr(self._client, "server_instance_id", None) == instance_id:
+                self._apply_reachability(event.payload, generation)
+            return
         if event.type not in _CONNECTION_EVENTS:
             return
         with self._lock:
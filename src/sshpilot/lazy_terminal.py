@@ -0,0 +1,31 @@
+"""Deferred TerminalWidget import shared by the window and terminal modules.
+
+Kept free of GTK and of the terminal stack so modules on the startup import
+path can use it.
+"""
+
+
+def lazy_terminal_widget(namespace):
+    """Return ``(widget_class, __getattr__)`` for a module's *namespace*.
+
+    The terminal stack (VTE, the PyXterm backend, process management) is not
+    needed to show the main window, so modules that check for terminals
+    import TerminalWidget on first use. ``widget_class()`` caches the class
+    as the module attribute ``TerminalWidget``, which tests may replace, and
+    the returned ``__getattr__`` makes that attribute resolvable before it.
+    """
+    module_name = namespace["__name__"]
+
+    def widget_class():
+        cls = namespace.get("TerminalWidget")
+        if cls is None:
+            from .terminal import TerminalWidget as cls
+            namespace["TerminalWidget"] = cls
+        return cls
+
+    def module_getattr(name):
+        if name == "TerminalWidget":
+            return widget_class()
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return widget_class, module_getattr
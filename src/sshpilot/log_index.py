@@ -0,0 +1,286 @@
+"""Random access to large, growing log files for the log viewer.
+
+The viewer needs the last few hundred lines of logs that may be gigabytes
+long, older pages on demand, and newly appended lines while following. None
+of that should mean reading the file from the start. This module reads tails
+and earlier pages by seeking backwards in blocks, and keeps a sparse line
+index (one byte offset every ``stride`` lines) that is extended incrementally
+as the file grows and discarded only when the file is rotated or truncated.
+
+Nothing here touches GTK; the viewer runs :meth:`LogLineIndex.extend` on a
+worker thread and reads results back on the main loop.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+from typing import List, Optional, Tuple
+
+_BLOCK_SIZE = 64 * 1024
+_INDEX_STRIDE = 1024
+# Bytes remembered from the start of the file to tell a rotated or truncated
+# and regrown file apart from one that was only appended to.
+_SIGNATURE_BYTES = 256
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace").rstrip("\r")
+
+
+def count_lines(path: str, block_size: int = 1024 * 1024) -> int:
+    """Count the lines in *path* (a final unterminated line counts too)."""
+    total = 0
+    last = b"\n"
+    with open(path, "rb") as fh:
+        while True:
+            block = fh.read(block_size)
+            if not block:
+                break
+            total += block.count(b"\n")
+            last = block[-1:]
+    return total + (0 if last == b"\n" else 1)
+
+
+def read_lines_before(
+    path: str, end: int, n: int, block_size: int = _BLOCK_SIZE
+) -> Tuple[List[str], int]:
+    """Return up to *n* complete lines ending at byte offset *end*.
+
+    Reads backwards from *end* in blocks, so the cost depends on *n* and not
+    on the size of the file. Returns ``(lines, start)``, where *start* is
+    the byte offset of the first returned line. Pass *start* back as *end*
+    to page further up the file.
+    """
+    if n <= 0 or end <= 0:
+        return [], max(0, end)
+    with open(path, "rb") as fh:
+        position = end
+        data = b""
+        # n lines need n newlines before them, plus the one ending the last.
+        while position > 0 and data.count(b"\n") <= n:
+            step = min(block_size, position)
+            position -= step
+            fh.seek(position)
+            data = fh.read(step) + data
+    terminated = data.endswith(b"\n")
+    pieces = (data[:-1] if terminated else data).split(b"\n")
+    # Unless the read reached the start of the file, the first piece is the
+    # tail of an earlier line; the loop above guarantees n whole ones after it.
+    pieces = pieces[-n:]
+    start = end - len(b"\n".join(pieces)) - (1 if terminated else 0)
+    return [_decode(piece) for piece in pieces], start
+
+
+def tail_lines(
+    path: str, n: int, block_size: int = _BLOCK_SIZE
+) -> Tuple[List[str], int, int]:
+    """Return the last *n* complete lines of *path*.
+
+    Returns ``(lines, start, end)``: *start* is the byte offset of the first
+    returned line and *end* the offset just past the last complete line. A
+    trailing partial line (a record still being written) is left for the
+    next :func:`read_appended` call.
+    """
+    size = os.path.getsize(path)
+    end = _last_line_end(path, size, block_size)
+    lines, start = read_lines_before(path, end, n, block_size)
+    return lines, start, end
+
+
+def _last_line_end(path: str, size: int, block_size: int) -> int:
+    with open(path, "rb") as fh:
+        position = size
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            fh.seek(position)
+            block = fh.read(step)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                return position + newline + 1
+    return 0
+
+
+def read_appended(path: str, start: int, end: Optional[int] = None) -> Tuple[List[str], int]:
+    """Return the complete lines in ``[start, end)`` and the offset after them.
+
+    A partial last line is not returned and not consumed, so the next call
+    picks it up once it is finished.
+    """
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        data = fh.read() if end is None else fh.read(max(0, end - start))
+    last = data.rfind(b"\n")
+    if last < 0:
+        return [], start
+    return [_decode(piece) for piece in data[:last].split(b"\n")], start + last + 1
+
+
+class LogLineIndex:
+    """Sparse line-number -> byte-offset index over one log file.
+
+    Records the offset of every ``stride``-th line. :meth:`extend` indexes a
+    bounded number of bytes per call, so a worker can build the index for a
+    huge file in slices and later calls only cover newly appended data.
+    :meth:`refresh` notices rotation (a different inode) and truncation (a
+    smaller size or changed leading bytes) and starts over only then.
+    """
+
+    def __init__(self, path: str, stride: int = _INDEX_STRIDE) -> None:
+        self.path = path
+        self.stride = stride
+        self._lock = threading.Lock()
+        self._epoch = 0
+        self._reset(None, b"")
+
+    def _reset(self, identity, signature: bytes) -> None:
+        self._epoch += 1
+        self._identity = identity
+        self._signature = signature
+        self._checkpoints: List[int] = [0]
+        self._indexed_to = 0
+        self._line_count = 0
+
+    @property
+    def indexed_to(self) -> int:
+        return self._indexed_to
+
+    @property
+    def line_count(self) -> int:
+        """Complete lines indexed so far."""
+        return self._line_count
+
+    def complete(self) -> bool:
+        try:
+            return self._indexed_to >= os.path.getsize(self.path)
+        except OSError:
+            return True
+
+    def refresh(self) -> bool:
+        """Drop the index if the file was rotated or truncated.
+
+        Returns ``True`` when the index was reset.
+        """
+        with self._lock:
+            known = self._signature
+        try:
+            stat = os.stat(self.path)
+            with open(self.path, "rb") as fh:
+                leading = fh.read(len(known))
+        except OSError:
+            with self._lock:
+                self._reset(None, b"")
+            return True
+        identity = (stat.st_dev, stat.st_ino)
+        with self._lock:
+            if (
+                identity == self._identity
+                and stat.st_size >= self._indexed_to
+                and leading == self._signature
+            ):
+                return False
+            self._reset(identity, b"")
+            return True
+
+    def extend(self, max_bytes: int = 8 * 1024 * 1024) -> bool:
+        """Index up to *max_bytes* more of the file; ``True`` when caught up."""
+        with self._lock:
+            epoch = self._epoch
+            start = self._indexed_to
+            line_count = self._line_count
+        try:
+            with open(self.path, "rb") as fh:
+                fh.seek(start)
+                data = fh.read(max_bytes)
+        except OSError:
+            return True
+        last = data.rfind(b"\n")
+        if last < 0:
+            return len(data) < max_bytes
+        checkpoints: List[int] = []
+        position = 0
+        stride = self.stride
+        while True:
+            newline = data.find(b"\n", position, last + 1)
+            if newline < 0:
+                break
+            line_count += 1
+            position = newline + 1
+            if line_count % stride == 0:
+                checkpoints.append(start + position)
+        with self._lock:
+            if self._epoch != epoch or self._indexed_to != start:
+                # A concurrent refresh() reset the index, or another caller
+                # already indexed this range; drop this slice.
+                return False
+            self._checkpoints.extend(checkpoints)
+            self._line_count = line_count
+            self._indexed_to = start + last + 1
+            if start < _SIGNATURE_BYTES:
+                # The signature always holds the first min(256, indexed) bytes.
+                self._signature += data[:min(_SIGNATURE_BYTES, self._indexed_to) - start]
+        return len(data) < max_bytes
+
+    def offset_of_line(self, line: int) -> Optional[int]:
+        """Byte offset where 0-based *line* starts, if it is indexed."""
+        with self._lock:
+            if line < 0 or line > self._line_count:
+                return None
+            checkpoint = line // self.stride
+            offset = self._checkpoints[checkpoint]
+        skip = line - checkpoint * self.stride
+        if not skip:
+            return offset
+        with open(self.path, "rb") as fh:
+            fh.seek(offset)
+            for _ in range(skip):
+                if not fh.readline():
+                    return None
+            return fh.tell()
+
+    def read_lines(self, line: int, count: int) -> Tuple[List[str], int]:
+        """Return up to *count* lines starting at 0-based *line*.
+
+        Returns ``(lines, end)`` where *end* is the byte offset after them.
+        """
+        offset = self.offset_of_line(line)
+        if offset is None or count <= 0:
+            return [], offset or 0
+        with self._lock:
+            available = self._line_count - line
+        lines: List[str] = []
+        with open(self.path, "rb") as fh:
+            fh.seek(offset)
+            for _ in range(min(count, available)):
+                raw = fh.readline()
+                if not raw.endswith(b"\n"):
+                    break
+                lines.append(_decode(raw[:-1]))
+            return lines, fh.tell()
+
+    def line_at_offset(self, offset: int) -> Optional[int]:
+        """0-based number of the line starting at byte *offset*, if indexed."""
+        with self._lock:
+            if offset > self._indexed_to:
+                return None
+            checkpoints = list(self._checkpoints)
+        checkpoint = bisect.bisect_right(checkpoints, offset) - 1
+        line = checkpoint * self.stride
+        with open(self.path, "rb") as fh:
+            fh.seek(checkpoints[checkpoint])
+            while fh.tell() < offset:
+                if not fh.readline():
+                    return None
+                line += 1
+        return line
+
+
+__all__ = [
+    "LogLineIndex",
+    "count_lines",
+    "read_appended",
+    "read_lines_before",
+    "tail_lines",
+]
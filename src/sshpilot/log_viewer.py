@@ -9,19 +9,26 @@ Lives under the main window's Help submenu (``win.view-logs``).
 
 from __future__ import annotations
 
-import collections
 import glob
 import json
 import logging
 import os
 import re
+import threading
 import zipfile
 from gettext import gettext as _
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 from gi.repository import Adw, Gdk, Gio, GLib, Gtk, Pango
 
 from .platform_utils import get_state_dir
+from .log_index import (
+    LogLineIndex,
+    count_lines,
+    read_appended,
+    read_lines_before,
+    tail_lines,
+)
 from .logging_support import sanitize_log_text
 from .shortcut_utils import install_esc_to_close, install_search_esc
 
@@ -34,6 +41,9 @@ logger = logging.getLogger(__name__)
 # from the menu — they almost never need to.
 _DEFAULT_TAIL_LINES = 500
 _DIAGNOSTICS_LOG_MAX_BYTES = 1024 * 1024
+# Bytes the main thread indexes per idle call when catching up with lines
+# appended while the background index worker ran.
+_IDLE_INDEX_SLICE_BYTES = 256 * 1024
 
 
 # (display label, filename in state-dir or absolute) — drives the category
@@ -122,15 +132,15 @@ def _tail_file(path: str, n: int) -> tuple[List[str], int]:
     if not os.path.isfile(path):
         return [], 0
     try:
-        # Use a deque so we don't materialise the whole file. ~10 MB log =
-        # ~100k lines; deque(maxlen=n) keeps memory bounded to n entries.
-        with open(path, encoding='utf-8', errors='replace') as fh:
-            dq: 'collections.deque[str]' = collections.deque(maxlen=n)
-            total = 0
-            for line in fh:
-                dq.append(line.rstrip('\n'))
-                total += 1
-            return list(dq), total
+        # Seek from the end rather than iterating the file; the total comes
+        # from a byte-level newline count, which never builds line objects.
+        lines, _start, end = tail_lines(path, n)
+        with open(path, 'rb') as fh:
+            fh.seek(end)
+            partial = fh.read()
+        if partial:
+            lines = (lines + [partial.decode('utf-8', errors='replace')])[-n:] if n > 0 else []
+        return lines, count_lines(path)
     except Exception as exc:
         logger.warning("Could not read log file %s: %s", path, exc)
         return [], 0
@@ -513,6 +523,21 @@ class LogViewerWindow(Adw.Window):
         # file on every change event.
         self._file_monitor: Optional[Gio.FileMonitor] = None
         self._tail_pos: int = 0
+        # Byte offset of the oldest loaded line, for paging further back when
+        # the user scrolls to the top, and the line cap that grows with it.
+        self._first_loaded_pos: int = 0
+        self._line_cap: int = _DEFAULT_TAIL_LINES
+        # Sparse line indexes per log path, built on a worker thread. They
+        # survive refreshes and category switches and are only rebuilt when
+        # the file is rotated or truncated.
+        self._line_indexes: Dict[str, LogLineIndex] = {}
+        self._line_index: Optional[LogLineIndex] = None
+        # Indexes with a worker running, so a refresh never starts a second
+        # worker on the same index. Guarded by _index_lock together with
+        # _line_index, which is what a worker checks before giving up.
+        self._indexing: Set[LogLineIndex] = set()
+        self._index_lock = threading.Lock()
+        self._total_pending: bool = False
         # When True, new lines auto-append AND we auto-scroll to the end.
         # Toggled by the Follow switch in the header.
         self._follow_enabled: bool = True
@@ -607,6 +632,10 @@ class LogViewerWindow(Adw.Window):
             foreground="#000000",
         )
 
+        scroller = self._scrolled_window()
+        if scroller is not None:
+            scroller.connect("edge-reached", self._on_edge_reached)
+
         # Make sure we drop the file monitor when the window closes —
         # otherwise the GFile handle stays bound for the rest of the session.
         self.connect("close-request", self._on_close_request)
@@ -615,6 +644,7 @@ class LogViewerWindow(Adw.Window):
 
     def _on_close_request(self, _window) -> bool:
         self._stop_monitor()
+        self._line_index = None  # lets a running index worker stop
         return False  # let the window close normally
 
     # ------------------------------------------------------------------ load
@@ -627,18 +657,18 @@ class LogViewerWindow(Adw.Window):
         # converge on a single code path.
         self._stop_monitor()
 
+        self._line_cap = self._tail_lines
+        self._total_pending = False
         if self._showing_full_file:
             text = _read_full_file(self._log_path)
             self._current_lines = text.splitlines()
             self._current_total = len(self._current_lines)
+            self._first_loaded_pos = 0
+            # Record the byte position so future live-tail reads only pick
+            # up what's been appended since now.
+            self._tail_pos = self._current_file_size()
         else:
-            self._current_lines, self._current_total = _tail_file(
-                self._log_path, self._tail_lines
-            )
-
-        # Record the byte position so future live-tail reads only pick up
-        # what's been appended since now.
-        self._tail_pos = self._current_file_size()
+            self._load_tail()
 
         self._render_buffer()
 
@@ -653,6 +683,75 @@ class LogViewerWindow(Adw.Window):
         # Start watching the file we just loaded.
         self._start_monitor()
 
+    def _load_tail(self) -> None:
+        """Read the last ``_tail_lines`` lines by seeking from the end.
+
+        The total line count for the stats label comes from the path's
+        :class:`LogLineIndex`, which is brought up to date in the background.
+        """
+        self._current_lines = []
+        self._current_total = 0
+        self._tail_pos = 0
+        self._first_loaded_pos = 0
+        self._line_index = None
+        if not os.path.isfile(self._log_path):
+            return
+        try:
+            lines, start, end = tail_lines(self._log_path, self._tail_lines)
+        except OSError as exc:
+            logger.warning("Could not read log file %s: %s", self._log_path, exc)
+            return
+        self._current_lines = lines
+        self._current_total = len(lines)
+        self._first_loaded_pos = start
+        self._tail_pos = end
+        if start > 0:
+            self._total_pending = True
+            self._start_line_index()
+
+    def _start_line_index(self) -> None:
+        index = self._line_indexes.get(self._log_path)
+        if index is None:
+            index = self._line_indexes[self._log_path] = LogLineIndex(self._log_path)
+        # Rotation/truncation resets the index; plain growth keeps it, so a
+        # refresh only indexes the bytes appended since last time.
+        index.refresh()
+        with self._index_lock:
+            self._line_index = index
+            if index in self._indexing:
+                # The running worker sees the index is wanted again and
+                # carries on; it reports back when it is done.
+                return
+            self._indexing.add(index)
+
+        def _worker() -> None:
+            while not index.extend():
+                with self._index_lock:
+                    if self._line_index is not index:
+                        self._indexing.discard(index)
+                        return
+            with self._index_lock:
+                self._indexing.discard(index)
+            GLib.idle_add(self._on_line_index_ready, index)
+
+        threading.Thread(target=_worker, name="sshpilot-log-index", daemon=True).start()
+
+    def _on_line_index_ready(self, index: LogLineIndex) -> bool:
+        if index is not self._line_index or self._showing_full_file:
+            return False
+        # Catch up with anything appended while the worker ran, one slice
+        # per idle call so a burst of appends never stalls the main loop.
+        if index.indexed_to < self._tail_pos and not index.extend(
+            _IDLE_INDEX_SLICE_BYTES
+        ):
+            return True
+        total = index.line_at_offset(self._tail_pos)
+        if total is not None:
+            self._current_total = total
+            self._total_pending = False
+            self._update_stats_label(scroll=False)
+        return False
+
     def _level_tag(self, level: int):
         """Pick the TextTag for *level*, or None for unstyled (INFO/DEBUG)."""
         if level >= logging.CRITICAL:
@@ -736,11 +835,13 @@ class LogViewerWindow(Adw.Window):
                 buf.apply_tag(self._tag_match, m_start, m_end)
                 search_from = idx + len(query)
 
-    def _update_stats_label(self) -> None:
+    def _update_stats_label(self, scroll: bool = True) -> None:
         """Refresh the right-aligned ``last N of M lines`` indicator."""
         filtered_count = getattr(self, "_filtered_visible", len(self._current_lines))
         if self._showing_full_file:
             base = _("{n} lines (full file)").format(n=self._current_total)
+        elif self._total_pending:
+            base = _("last {shown} lines").format(shown=len(self._current_lines))
         elif self._current_total > len(self._current_lines):
             base = _("last {shown} of {total} lines").format(
                 shown=len(self._current_lines), total=self._current_total,
@@ -753,7 +854,8 @@ class LogViewerWindow(Adw.Window):
         self._stats_label.set_text(base)
 
         # Auto-scroll to the bottom — newest log lines are what's interesting.
-        GLib.idle_add(self._scroll_to_end)
+        if scroll:
+            GLib.idle_add(self._scroll_to_end)
 
     def _scroll_to_end(self) -> bool:
         buf = self._textview.get_buffer()
@@ -829,8 +931,7 @@ class LogViewerWindow(Adw.Window):
         if new_size == self._tail_pos:
             return  # nothing actually new
 
-        self._append_since(self._tail_pos, new_size)
-        self._tail_pos = new_size
+        self._tail_pos = self._append_since(self._tail_pos, new_size)
 
     def _reload_after_rotation(self) -> None:
         # Defer to idle so we don't fight ongoing FileMonitor events.
@@ -840,32 +941,21 @@ class LogViewerWindow(Adw.Window):
             return False
         GLib.idle_add(_do)
 
-    def _append_since(self, start_pos: int, end_pos: int) -> None:
-        """Read bytes ``[start_pos, end_pos)`` and append survivors to the view."""
+    def _append_since(self, start_pos: int, end_pos: int) -> int:
+        """Read bytes ``[start_pos, end_pos)`` and append survivors to the view.
+
+        Returns the offset just past the last complete line consumed; a
+        trailing partial line is left for the next tick.
+        """
+        if end_pos == start_pos:
+            return start_pos
         try:
-            with open(self._log_path, 'rb') as fh:
-                fh.seek(start_pos)
-                chunk = fh.read(max(0, end_pos - start_pos))
+            new_lines, consumed = read_appended(self._log_path, start_pos, end_pos)
         except Exception as exc:
             logger.debug("Could not read appended log bytes: %s", exc)
-            return
-        if not chunk:
-            return
-        try:
-            text = chunk.decode('utf-8', errors='replace')
-        except Exception:
-            return
-
-        # Split into individual lines; ignore a trailing partial line by
-        # leaving it for the next tick (rare in practice — log handlers
-        # flush whole records).
-        new_lines = text.split('\n')
+            return start_pos
         if not new_lines:
-            return
-        if new_lines[-1] == '':
-            new_lines.pop()
-        if not new_lines:
-            return
+            return consumed
 
         # Track full set (for refilter on dropdown change) and filter for
         # display in one pass.
@@ -876,8 +966,14 @@ class LogViewerWindow(Adw.Window):
         # live-tail running must not grow without limit as the log file does.
         # _current_total keeps the true running count for the stats line.
         # Full-file mode is an explicit request to hold everything, so skip it.
-        if not self._showing_full_file and len(self._current_lines) > self._tail_lines:
-            del self._current_lines[:-self._tail_lines]
+        if not self._showing_full_file and len(self._current_lines) > self._line_cap:
+            del self._current_lines[:-self._line_cap]
+            try:
+                _kept, self._first_loaded_pos = read_lines_before(
+                    self._log_path, consumed, len(self._current_lines)
+                )
+            except OSError:
+                pass
 
         min_level = _LEVEL_FILTER_OPTIONS[self._level_filter_idx][1]
         visible = [
@@ -889,7 +985,7 @@ class LogViewerWindow(Adw.Window):
             # the stats line so the user can see the running totals.
             self._filtered_visible = getattr(self, "_filtered_visible", 0)
             self._update_stats_label()
-            return
+            return consumed
 
         was_at_bottom = self._user_is_at_bottom()
 
@@ -910,7 +1006,7 @@ class LogViewerWindow(Adw.Window):
         # from _current_lines, so any divergence self-heals. Trimming the top
         # doesn't affect the bottom-scroll handling below.
         if not self._showing_full_file:
-            overflow = self._filtered_visible - self._tail_lines
+            overflow = self._filtered_visible - self._line_cap
             if overflow > 0:
                 start = buf.get_start_iter()
                 end = buf.get_start_iter()
@@ -922,6 +1018,53 @@ class LogViewerWindow(Adw.Window):
 
         if was_at_bottom:
             GLib.idle_add(self._scroll_to_end)
+        return consumed
+
+    def _load_older_lines(self) -> None:
+        """Prepend the page of lines before the oldest one loaded.
+
+        Reads backwards from ``_first_loaded_pos``, so paging up through a
+        huge log costs one page per step, never a rescan.
+        """
+        if self._showing_full_file or self._first_loaded_pos <= 0:
+            return
+        try:
+            older, start = read_lines_before(
+                self._log_path, self._first_loaded_pos, self._tail_lines
+            )
+        except OSError as exc:
+            logger.debug("Could not read earlier log lines: %s", exc)
+            return
+        if not older:
+            return
+        self._first_loaded_pos = start
+        self._line_cap = len(self._current_lines) + len(older)
+        self._current_lines[:0] = older
+        min_level = _LEVEL_FILTER_OPTIONS[self._level_filter_idx][1]
+        prepended = sum(1 for line in older if self._line_passes_filters(line, min_level))
+        self._render_buffer()
+        self._update_stats_label(scroll=False)
+
+        def _keep_position() -> bool:
+            # Hold the previously-top line in place instead of jumping.
+            buf = self._textview.get_buffer()
+            anchor = buf.get_iter_at_line(prepended)
+            if isinstance(anchor, tuple):  # (found, iter) on newer PyGObject
+                anchor = anchor[-1]
+            self._textview.scroll_to_iter(anchor, 0.0, True, 0.0, 0.0)
+            return False
+
+        GLib.idle_add(_keep_position)
+
+    def _on_edge_reached(self, _scroller, position) -> None:
+        if position == Gtk.PositionType.TOP:
+            self._load_older_lines()
+
+    def _scrolled_window(self) -> Optional[Gtk.ScrolledWindow]:
+        parent = self._textview.get_parent()
+        while parent is not None and not isinstance(parent, Gtk.ScrolledWindow):
+            parent = parent.get_parent()
+        return parent
 
     def _user_is_at_bottom(self, epsilon: float = 4.0) -> bool:
         """True when the scroll position is at (or within a few px of) the end.
@@ -931,10 +1074,7 @@ class LogViewerWindow(Adw.Window):
         worse UX than them missing a few live lines.
         """
         try:
-            parent = self._textview.get_parent()
-            # Walk up to the ScrolledWindow.
-            while parent is not None and not isinstance(parent, Gtk.ScrolledWindow):
-                parent = parent.get_parent()
+            parent = self._scrolled_window()
             if parent is None:
                 return True  # no scrolling possible → always at end
             vadj = parent.get_vadjustment()
@@ -953,8 +1093,7 @@ class LogViewerWindow(Adw.Window):
             # Pull in anything that arrived while we were paused.
             new_size = self._current_file_size()
             if new_size > self._tail_pos:
-                self._append_since(self._tail_pos, new_size)
-                self._tail_pos = new_size
+                self._tail_pos = self._append_since(self._tail_pos, new_size)
 
     def _on_level_filter_changed(self, dropdown: Gtk.DropDown, _pspec) -> None:
         idx = int(dropdown.get_selected())
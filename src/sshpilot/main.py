@@ -11,6 +11,11 @@ import resource
 import logging
 import threading
 
+# Opt-in (SSHPILOT_PROFILE_STARTUP). Armed before GTK and the rest of the app
+# are imported so their import cost is part of the profile.
+from . import startup_profile
+startup_profile.install_from_environment()
+
 
 def _clamp_thirdparty_loggers() -> None:
     """Pin chatty third-party loggers to WARNING.
@@ -167,6 +172,8 @@ from .platform_utils import is_macos, get_data_dir, get_state_dir
 from .file_manager_integration import should_hide_file_manager_options
 from .startup_info import print_startup_info
 
+startup_profile.mark("imports")
+
 class SshPilotApplication(Adw.Application):
     """Main application class for sshPilot"""
 
@@ -527,6 +534,7 @@ class SshPilotApplication(Adw.Application):
             from .window import MainWindow
             self.window = MainWindow(application=app, isolated=self.isolated_mode)
             self.window.present()
+            startup_profile.mark("window_presented")
 
             # The window UI is built and presented and plugins are bound, so
             # it is now safe for plugins to do live UI/terminal work.
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import difflib
 import gettext
+import heapq
 import math
 import re
 import shlex
 import warnings
 from dataclasses import dataclass
-from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 import gi
 
@@ -31,6 +32,9 @@ from .shortcut_utils import DOUBLE_SHIFT_SHORTCUT
 _ = gettext.gettext
 
 _MAX_RESULTS = 8
+# Highest score a fuzzy (difflib) match can reach: 350 + ratio*100 with
+# ratio < 1, plus the connection bonus. Literal matches start at 650.
+_FUZZY_SCORE_CEILING = 500
 
 # Transient "look here" tracer on the docked omni-search box when the Start tab
 # becomes active: a short accent-colored segment travels clockwise once around
@@ -253,32 +257,46 @@ def _normalize(value: str) -> str:
     return " ".join(re.findall(r"[\w@.-]+", (value or "").casefold()))
 
 
-def _match_score(query: str, phrases: Iterable[str]) -> int:
-    normalized_query = _normalize(query)
-    if not normalized_query:
-        return 0
-    query_tokens = normalized_query.split()
+def _literal_score(
+    normalized_query: str, query_tokens: Sequence[str], normalized_phrases: Iterable[str]
+) -> int:
     best = 0
-    for phrase in phrases:
-        normalized = _normalize(phrase)
-        if not normalized:
-            continue
+    for normalized in normalized_phrases:
         if normalized == normalized_query:
-            best = max(best, 1000)
-            continue
+            return 1000
         if normalized.startswith(normalized_query):
             best = max(best, 820)
-            continue
-        if all(token in normalized for token in query_tokens):
+        elif all(token in normalized for token in query_tokens):
             best = max(best, 650)
-            continue
-        if len(normalized_query) >= 4:
-            ratio = difflib.SequenceMatcher(None, normalized_query, normalized).ratio()
-            if ratio >= 0.72:
-                best = max(best, 350 + int(ratio * 100))
     return best
 
 
+def _fuzzy_score(normalized_query: str, normalized_phrases: Iterable[str]) -> int:
+    if len(normalized_query) < 4:
+        return 0
+    best = 0
+    for normalized in normalized_phrases:
+        ratio = difflib.SequenceMatcher(None, normalized_query, normalized).ratio()
+        if ratio >= 0.72:
+            best = max(best, 350 + int(ratio * 100))
+    return best
+
+
+def _match_score(query: str, phrases: Iterable[str]) -> int:
+    normalized_query = _normalize(query)
+    if not normalized_query:
+        return 0
+    normalized_phrases = [
+        normalized for normalized in (_normalize(phrase) for phrase in phrases)
+        if normalized
+    ]
+    # Any literal hit outranks every fuzzy one, so fuzzy is only a fallback.
+    return (
+        _literal_score(normalized_query, normalized_query.split(), normalized_phrases)
+        or _fuzzy_score(normalized_query, normalized_phrases)
+    )
+
+
 def _connection_phrases(connection) -> Tuple[str, ...]:
     nickname = str(getattr(connection, "nickname", "") or "")
     display_name = str(getattr(connection, "display_name", "") or "")
@@ -485,10 +503,187 @@ def _recent_and_pinned(window, connections: Sequence[Any]) -> List[Any]:
     return ordered
 
 
+def _normalized_phrases(phrases: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(
+        normalized for normalized in (_normalize(phrase) for phrase in phrases)
+        if normalized
+    )
+
+
+class OmniCatalog:
+    """Per-window cache of the command and connection search candidates.
+
+    Walking the menus and normalising every connection's phrases used to
+    happen on each keystroke. Commands are kept until the plugin menu section
+    reports ``items-changed`` (or :meth:`invalidate_commands` is called);
+    connection phrases are kept per connection object and recomputed only when
+    the connection manager hands back a different object or tag list.
+
+    The catalog also remembers which candidates matched the previous query
+    literally. Literal matching only narrows as a query grows, so a query that
+    extends the previous one rescans just that subset.
+    """
+
+    def __init__(self) -> None:
+        self._commands: Optional[List[CommandSpec]] = None
+        self._command_phrases: List[Tuple[str, ...]] = []
+        self._watched_menu = None
+        self._connection_cache: Dict[int, Tuple[Any, Any, Tuple[str, ...]]] = {}
+        self._connection_ids: Tuple[int, ...] = ()
+        self._connection_phrases: List[Tuple[str, ...]] = []
+        self._previous: Optional[Tuple[str, Set[int], Set[int]]] = None
+
+    def invalidate_commands(self, *_args) -> None:
+        self._commands = None
+        self._previous = None
+
+    def commands(self, window) -> List[CommandSpec]:
+        if self._commands is None:
+            self._watch_menu(window)
+            self._commands = collect_commands(window)
+            self._command_phrases = [
+                _normalized_phrases((command.title, *command.aliases))
+                for command in self._commands
+            ]
+            self._previous = None
+        return self._commands
+
+    def _watch_menu(self, window) -> None:
+        section = getattr(window, "_plugins_menu_section", None)
+        if section is None or section is self._watched_menu:
+            return
+        try:
+            section.connect("items-changed", self.invalidate_commands)
+        except Exception:
+            return
+        self._watched_menu = section
+
+    def sync_connections(self, connections: Sequence[Any]) -> None:
+        ids = tuple(id(connection) for connection in connections)
+        tags = [getattr(connection, "tags", None) for connection in connections]
+        cache = self._connection_cache
+        stale = ids != self._connection_ids or any(
+            cache[key][1] is not tag_list for key, tag_list in zip(ids, tags)
+        )
+        if not stale:
+            return
+        fresh: Dict[int, Tuple[Any, Any, Tuple[str, ...]]] = {}
+        for key, connection, tag_list in zip(ids, connections, tags):
+            cached = cache.get(key)
+            if cached is None or cached[0] is not connection or cached[1] is not tag_list:
+                cached = (
+                    connection, tag_list,
+                    _normalized_phrases(_connection_phrases(connection)),
+                )
+            fresh[key] = cached
+        self._connection_cache = fresh
+        self._connection_ids = ids
+        self._connection_phrases = [fresh[key][2] for key in ids]
+        self._previous = None
+
+    def score(
+        self, query: str, connections: Sequence[Any]
+    ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]], Set[int], Set[int]]:
+        """Return literal ``(index, score)`` hits for connections and commands.
+
+        Also returns the indexes that missed literally, for the fuzzy pass.
+        """
+        normalized_query = _normalize(query)
+        if not normalized_query:
+            return [], [], set(), set()
+        tokens = normalized_query.split()
+        connection_pool: Iterable[int] = range(len(self._connection_phrases))
+        command_pool: Iterable[int] = range(len(self._command_phrases))
+        previous = self._previous
+        if previous is not None and normalized_query.startswith(previous[0]):
+            connection_pool = sorted(previous[1])
+            command_pool = sorted(previous[2])
+
+        connection_hits = []
+        for index in connection_pool:
+            score = _literal_score(normalized_query, tokens, self._connection_phrases[index])
+            if score:
+                connection_hits.append((index, score))
+        command_hits = []
+        for index in command_pool:
+            score = _literal_score(normalized_query, tokens, self._command_phrases[index])
+            if score:
+                command_hits.append((index, score))
+        connection_matched = {index for index, _score in connection_hits}
+        command_matched = {index for index, _score in command_hits}
+        self._previous = (normalized_query, connection_matched, command_matched)
+        return connection_hits, command_hits, connection_matched, command_matched
+
+    def fuzzy(
+        self, query: str, connection_skip: Set[int], command_skip: Set[int]
+    ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        normalized_query = _normalize(query)
+        connection_hits = []
+        for index, phrases in enumerate(self._connection_phrases):
+            if index not in connection_skip:
+                score = _fuzzy_score(normalized_query, phrases)
+                if score:
+                    connection_hits.append((index, score))
+        command_hits = []
+        for index, phrases in enumerate(self._command_phrases):
+            if index not in command_skip:
+                score = _fuzzy_score(normalized_query, phrases)
+                if score:
+                    command_hits.append((index, score))
+        return connection_hits, command_hits
+
+
+def _catalog_for(window) -> OmniCatalog:
+    catalog = getattr(window, "_omni_catalog", None)
+    if catalog is None:
+        catalog = OmniCatalog()
+        try:
+            window._omni_catalog = catalog
+        except Exception:
+            pass
+    return catalog
+
+
+def cached_commands(window) -> List[CommandSpec]:
+    """Return :func:`collect_commands` for ``window``, cached until the menu changes."""
+    return _catalog_for(window).commands(window)
+
+
+def _result_key(result: OmniResult):
+    if result.kind == "command":
+        spec = result.payload
+        return ("command", spec.action, str(spec.target))
+    if result.kind == "connection":
+        return ("connection", getattr(result.payload, "nickname", result.title))
+    return (result.kind, result.title)
+
+
+def _top_results(results: Sequence[OmniResult], limit: int) -> List[OmniResult]:
+    """Best ``limit`` results by score then title, one per result key.
+
+    Same order as a full stable sort followed by deduplication, but only the
+    winning entry per key reaches the size-``limit`` heap.
+    """
+    best: Dict[Any, Tuple[Tuple[int, str, int], OmniResult]] = {}
+    for position, result in enumerate(results):
+        order = (-result.score, result.title.casefold(), position)
+        key = _result_key(result)
+        current = best.get(key)
+        if current is None or order < current[0]:
+            best[key] = (order, result)
+    return [
+        result for _order, result in heapq.nsmallest(
+            limit, best.values(), key=lambda item: item[0]
+        )
+    ]
+
+
 def search_omni(window, query: str, limit: int = _MAX_RESULTS) -> List[OmniResult]:
     """Return ranked, deduplicated omni-search results."""
     connections = list(window.connection_manager.get_connections())
-    commands = collect_commands(window)
+    catalog = _catalog_for(window)
+    commands = catalog.commands(window)
+    catalog.sync_connections(connections)
     query = query.strip()
 
     if not query:
@@ -519,37 +714,26 @@ def search_omni(window, query: str, limit: int = _MAX_RESULTS) -> List[OmniResul
         results.append(ssh)
         results.extend(_ssh_host_suggestions(window, query, connections))
 
-    for connection in connections:
-        score = _match_score(query, _connection_phrases(connection))
-        if score:
-            results.append(_connection_result(connection, score + 50))
-
-    for command in commands:
-        score = _match_score(query, (command.title, *command.aliases))
-        if score:
+    def extend(connection_hits, command_hits):
+        for index, score in connection_hits:
+            results.append(_connection_result(connections[index], score + 50))
+        for index, score in command_hits:
+            command = commands[index]
             results.append(OmniResult(
                 "command", command.title, _("Command"), command.icon_name,
                 score, command,
             ))
 
-    results.sort(key=lambda result: (-result.score, result.title.casefold()))
-    deduped: List[OmniResult] = []
-    seen = set()
-    for result in results:
-        if result.kind == "command":
-            spec = result.payload
-            key = ("command", spec.action, str(spec.target))
-        elif result.kind == "connection":
-            key = ("connection", getattr(result.payload, "nickname", result.title))
-        else:
-            key = (result.kind, result.title)
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(result)
-        if len(deduped) >= limit:
-            break
-    return deduped
+    connection_hits, command_hits, connection_matched, command_matched = (
+        catalog.score(query, connections)
+    )
+    extend(connection_hits, command_hits)
+    top = _top_results(results, limit)
+    if len(top) >= limit and top[-1].score > _FUZZY_SCORE_CEILING:
+        # A full page already outranks anything difflib could add.
+        return top
+    extend(*catalog.fuzzy(query, connection_matched, command_matched))
+    return _top_results(results, limit)
 
 
 class OmniSearchController:
@@ -1526,6 +1526,20 @@ class PreferencesWindow(Adw.NavigationPage):
         )
         sidebar_behavior_group.add(hide_on_startup_switch)
 
+        reachability_switch = Adw.SwitchRow()
+        reachability_switch.set_title(_("Check Host Reachability"))
+        reachability_switch.set_subtitle(
+            _("Periodically test whether hosts shown in the sidebar answer on their SSH port")
+        )
+        reachability_switch.set_active(
+            bool(self.config.get_setting('ui.reachability_probes', False))
+        )
+        reachability_switch.connect(
+            'notify::active',
+            lambda r, _p: self.config.set_setting('ui.reachability_probes', bool(r.get_active())),
+        )
+        sidebar_behavior_group.add(reachability_switch)
+
         # When a terminal opens: do nothing / minimize to icons / hide.
         self._on_terminal_open_values = ['none', 'minimize', 'hide']
         on_terminal_open_row = Adw.ComboRow()
@@ -4437,14 +4451,47 @@ class PreferencesWindow(Adw.NavigationPage):
         self._populate_plugins_page()
 
     def _populate_plugins_page(self):
-        from .plugins.loader import discover_plugins, _user_plugin_dir
+        """Show a placeholder and scan plugin manifests off the main thread.
 
+        Discovery reads every manifest on disk; the page is filled in by
+        :meth:`_on_plugins_discovered` once the scan is done.
+        """
+        page = self._plugins_page
+        loading_group = Adw.PreferencesGroup(title=_("Installed Plugins"))
+        loading_row = Adw.ActionRow(title=_("Loading plugins…"))
+        spinner = Gtk.Spinner()
+        spinner.start()
+        loading_row.add_prefix(spinner)
+        loading_group.add(loading_row)
+        page.add(loading_group)
+        self._plugin_groups.append(loading_group)
+        self._plugins_loading_group = loading_group
+
+        def worker():
+            from .plugins.loader import discover_plugins
+            try:
+                infos = discover_plugins()
+            except Exception:
+                logger.exception("Plugin discovery failed")
+                infos = []
+            GLib.idle_add(self._on_plugins_discovered, loading_group, infos)
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_plugins_discovered(self, loading_group, infos):
+        from .plugins.loader import _user_plugin_dir
+
+        if loading_group is not getattr(self, '_plugins_loading_group', None):
+            return False  # page was rebuilt; ignore a stale scan
+        self._plugins_loading_group = None
         page = self._plugins_page
         try:
-            infos = discover_plugins()
+            page.remove(loading_group)
         except Exception:
-            logger.exception("Plugin discovery failed")
-            infos = []
+            pass
+        try:
+            self._plugin_groups.remove(loading_group)
+        except ValueError:
+            pass
         loaded_ids = {
             getattr(p, 'plugin_id', None)
             for p in getattr(self.parent_window, 'loaded_plugins', []) or []
@@ -4556,6 +4603,7 @@ class PreferencesWindow(Adw.NavigationPage):
         page.add(self._available_group)
         self._plugin_groups.append(self._available_group)
         self._load_registry_async()
+        return False
 
     # --- available plugins (discovery registry) ----------------------
     def _registry_url(self):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
 
 
 def connection_matches(connection: Any, query: str) -> bool:
@@ -20,17 +20,217 @@ def connection_matches(connection: Any, query: str) -> bool:
     keywords = query.lower().split()
     if not keywords:
         return True
-    fields = [
-        getattr(connection, "nickname", ""),
-        getattr(connection, "host", ""),
-        getattr(connection, "hostname", ""),
-        " ".join(getattr(connection, "tags", None) or []),
-    ]
-    fields = [(field or "").lower() for field in fields]
+    fields = _search_fields(connection, getattr(connection, "tags", None))
     return all(
         any(keyword in field for field in fields)
         for keyword in keywords
     )
 
 
-__all__ = ["connection_matches"]
+def _search_fields(connection: Any, tags: Optional[Iterable[Any]]) -> Tuple[str, ...]:
+    fields = (
+        getattr(connection, "nickname", ""),
+        getattr(connection, "host", ""),
+        getattr(connection, "hostname", ""),
+        " ".join(str(tag) for tag in (tags or [])),
+    )
+    return tuple((field or "").lower() for field in fields)
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
+
+def _is_subsequence(needle: str, haystack: str) -> Optional[int]:
+    """Return the span ``needle`` covers in ``haystack`` as a subsequence."""
+    start = -1
+    position = 0
+    for char in needle:
+        position = haystack.find(char, position)
+        if position < 0:
+            return None
+        if start < 0:
+            start = position
+        position += 1
+    return position - start
+
+
+class ConnectionSearchIndex:
+    """Incrementally maintained index over the searchable connection fields.
+
+    Holds the lowercased fields used by :func:`connection_matches`, a trigram
+    posting list over them and a casefolded tag facet. :meth:`upsert` and
+    :meth:`discard` apply one added, changed or removed connection;
+    :meth:`update` reconciles a full snapshot, reindexing only connections
+    whose searchable fields changed. :meth:`matching_ids` has exactly the semantics of
+    :func:`connection_matches`; long keywords are narrowed through the
+    trigram postings before any substring test runs.
+    """
+
+    def __init__(self) -> None:
+        self._fields: Dict[str, Tuple[str, ...]] = {}
+        self._entry_tags: Dict[str, FrozenSet[str]] = {}
+        self._nicknames: Dict[str, str] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._tags: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    @staticmethod
+    def key_for(connection: Any) -> str:
+        return str(getattr(connection, "id", None) or getattr(connection, "nickname", ""))
+
+    def update(
+        self,
+        connections: Iterable[Any],
+        *,
+        tags: Optional[Mapping[str, Iterable[Any]]] = None,
+    ) -> None:
+        """Bring the index in line with ``connections``.
+
+        Tags come from ``tags`` (keyed by connection id) when given, else from
+        each connection's ``tags`` attribute. Connections absent from the
+        snapshot are dropped.
+        """
+        seen = set()
+        for connection in connections:
+            key = self.key_for(connection)
+            if not key:
+                continue
+            seen.add(key)
+            self.upsert(
+                connection,
+                tags=tags.get(key, ()) if tags is not None else None,
+            )
+        for key in [key for key in self._fields if key not in seen]:
+            self.discard(key)
+
+    def upsert(self, connection: Any, *, tags: Optional[Iterable[Any]] = None) -> None:
+        """Index one added or changed connection.
+
+        Tags come from ``tags`` when given, else from the connection's
+        ``tags`` attribute. Unchanged fields cost one comparison.
+        """
+        key = self.key_for(connection)
+        if not key:
+            return
+        entry_tags = (tags if tags is not None else getattr(connection, "tags", None)) or ()
+        fields = _search_fields(connection, entry_tags)
+        facet = frozenset(str(tag).casefold() for tag in entry_tags)
+        if self._fields.get(key) == fields and self._entry_tags.get(key) == facet:
+            return
+        self.discard(key)
+        self._add(key, fields, facet)
+
+    def _add(self, key: str, fields: Tuple[str, ...], facet: FrozenSet[str]) -> None:
+        self._fields[key] = fields
+        self._entry_tags[key] = facet
+        self._nicknames[key] = fields[0]
+        for field in fields:
+            for gram in _trigrams(field):
+                self._postings.setdefault(gram, set()).add(key)
+        for tag in facet:
+            self._tags.setdefault(tag, set()).add(key)
+
+    def discard(self, key: str) -> None:
+        """Remove one connection from the index, if present."""
+        fields = self._fields.pop(key, None)
+        if fields is None:
+            return
+        self._nicknames.pop(key, None)
+        for field in fields:
+            for gram in _trigrams(field):
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    posting.discard(key)
+                    if not posting:
+                        del self._postings[gram]
+        for tag in self._entry_tags.pop(key, ()):
+            members = self._tags.get(tag)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._tags[tag]
+
+    def tags(self) -> List[str]:
+        """Return every indexed (casefolded) tag, sorted."""
+        return sorted(self._tags)
+
+    def _candidates(self, tag: Optional[str]) -> Set[str]:
+        if tag is None:
+            return set(self._fields)
+        return set(self._tags.get(str(tag).casefold(), ()))
+
+    def matching_ids(self, query: str, *, tag: Optional[str] = None) -> Set[str]:
+        """Return the ids :func:`connection_matches` would accept.
+
+        ``tag`` restricts the result to connections carrying that tag.
+        """
+        candidates = self._candidates(tag)
+        # Longest keywords first: they have the most selective postings.
+        for keyword in sorted((query or "").lower().split(), key=len, reverse=True):
+            if not candidates:
+                break
+            if len(keyword) >= 3:
+                postings = sorted(
+                    (self._postings.get(gram, ()) for gram in _trigrams(keyword)),
+                    key=len,
+                )
+                for posting in postings:
+                    candidates.intersection_update(posting)
+                    if not candidates:
+                        break
+                if len(keyword) == 3:
+                    # The keyword is its own trigram: the posting is exact.
+                    continue
+            candidates = {
+                key for key in candidates
+                if any(keyword in field for field in self._fields[key])
+            }
+        return candidates
+
+    def rank(
+        self,
+        query: str,
+        *,
+        tag: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Return matching ids, best first.
+
+        Exact and prefix nickname hits rank above substring hits, which rank
+        above hits in other fields. When nothing matches literally, fall back
+        to fuzzy matches where every keyword is a subsequence of the nickname,
+        tightest span first.
+        """
+        keywords = (query or "").lower().split()
+        matched = self.matching_ids(query, tag=tag)
+        if matched or not keywords:
+            scored = [
+                (sum(self._keyword_score(key, keyword) for keyword in keywords), self._nicknames[key], key)
+                for key in matched
+            ]
+        else:
+            scored = []
+            for key in self._candidates(tag):
+                nickname = self._nicknames[key]
+                spans = [_is_subsequence(keyword, nickname) for keyword in keywords]
+                if all(span is not None for span in spans):
+                    scored.append((100 + sum(spans), nickname, key))
+        scored.sort()
+        ranked = [key for _score, _nickname, key in scored]
+        return ranked if limit is None else ranked[:limit]
+
+    def _keyword_score(self, key: str, keyword: str) -> int:
+        nickname = self._nicknames[key]
+        if nickname == keyword:
+            return 0
+        if nickname.startswith(keyword):
+            return 1
+        if keyword in nickname:
+            return 2
+        return 3
+
+
+__all__ = ["ConnectionSearchIndex", "connection_matches"]
@@ -1188,6 +1188,19 @@ class GroupRow(Gtk.ListBoxRow):
         """Track a direct child group row for in-place expand/collapse."""
         self._child_group_rows.append(row)
 
+    def rebind(self, group_info: Dict, connections_dict: Dict | None = None) -> None:
+        """Point a recycled header at fresh group data (see SidebarRowCache)."""
+        self.group_info = group_info
+        self.connections_dict = connections_dict or {}
+        self._member_rows = []
+        self._child_group_rows = []
+        self.set_visible(True)
+        self.hide_drop_indicators()
+        if self._compact:
+            self.set_compact(False)  # also refreshes the display
+        else:
+            self._update_display()
+
     def apply_descendant_visibility(self, parent_visible: bool = True) -> None:
         """Show or hide child rows without rebuilding the whole sidebar."""
         expanded = bool(self.group_info.get("expanded", True))
@@ -1484,6 +1497,7 @@ class ConnectionRow(Gtk.ListBoxRow):
         status_resolver=None,
         display_group_id: Optional[str] = None,
         in_tag_section: bool = False,
+        prewarm_callback=None,
     ):
         super().__init__()
         _install_sidebar_color_css()
@@ -1495,6 +1509,7 @@ class ConnectionRow(Gtk.ListBoxRow):
         _apply_sidebar_row_style(self, config, in_tag_section=in_tag_section)
         self._file_manager_callback = file_manager_callback
         self._effective_warning_callback = effective_warning_callback
+        self._prewarm_callback = prewarm_callback
         self._status_resolver = status_resolver
         self._tint_provider = None
         self._color_badge_provider = None
@@ -1505,6 +1520,7 @@ class ConnectionRow(Gtk.ListBoxRow):
         self._group_display_mode = None
         self._row_margin_base = None
         self._content_margin_base = None
+        self._bound_signature = None
 
         # Main container with drop indicators
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -1654,6 +1670,42 @@ class ConnectionRow(Gtk.ListBoxRow):
         self._group_id = group_id
         self._apply_group_color_style()
 
+    def rebind(
+        self,
+        connection: Connection,
+        *,
+        display_group_id: Optional[str] = None,
+        status_resolver=None,
+    ) -> None:
+        """Point a recycled row at fresh connection data (see SidebarRowCache).
+
+        Clears the transient per-placement state (visibility from a collapsed
+        parent group, drop indicators, the icon-strip layout) that a freshly
+        constructed row would not have. Labels, badges and colours are only
+        redrawn when something they depend on changed, so rebinding the rows
+        of an unchanged host is constant work.
+        """
+        self.set_visible(True)
+        self.hide_drop_indicators()
+        rgba = _resolve_group_color_by_id(self.group_manager, display_group_id)
+        signature = (
+            connection,
+            getattr(connection, 'forwarding_rules', None),
+            display_group_id,
+            status_resolver,
+            rgba.to_string() if rgba is not None else None,
+        )
+        if signature == self._bound_signature:
+            self.connection = connection
+            return
+        self._bound_signature = signature
+        self.connection = connection
+        self._group_id = display_group_id
+        self._status_resolver = status_resolver
+        self.set_compact(False)
+        self.update_display()
+        self._apply_group_color_style()
+
     def _on_file_manager_clicked(self, button):
         """Handle file manager button click"""
         if self._file_manager_callback:
@@ -1695,11 +1747,15 @@ class ConnectionRow(Gtk.ListBoxRow):
             except Exception:
                 logger.debug("Failed to request effective-config check",
                              exc_info=True)
+        if self._prewarm_callback and getattr(self.connection, 'protocol', 'ssh') == 'ssh':
+            self._prewarm_callback(self.connection)
         self._update_effective_warning_reveal()
 
     def _on_row_leave(self, controller):
         """Hide file manager button when mouse leaves row"""
         self._is_hovering = False
+        if self._prewarm_callback:
+            self._prewarm_callback(None)
         # Use a small delay to allow moving to the button
         GLib.timeout_add(100, self._maybe_hide_button)
 
@@ -2383,6 +2439,154 @@ class ConnectionRow(Gtk.ListBoxRow):
             self.set_compact(True)
 
 
+class SidebarRowCache:
+    """Keep sidebar row widgets alive across ``rebuild_connection_list()``.
+
+    Constructing a row builds its whole widget tree plus gestures and CSS
+    providers, which used to be repeated for every host on each search
+    keystroke, sort or refresh. Rows are keyed by the slot they occupy (the
+    connection or group plus where it is listed); when a rebuild shows the
+    same slot again the existing row is rebound to fresh data instead of
+    recreated. Rows without a ``rebind()`` method are never cached.
+
+    Rows that are not shown are only kept up to ``max_detached``, least
+    recently shown first out, so a narrow search over a large inventory does
+    not pin every other row's widget tree. Rows of a removed connection or
+    group are evicted at once.
+
+    This is recycling, not virtualization: the sidebar is still a
+    ``Gtk.ListBox`` holding one realized row per shown connection and
+    group, so a rebuild still walks, rebinds and lays out every shown row.
+    It saves the widget construction, not the per-row cost of a long list.
+    """
+
+    def __init__(self, max_detached: int = 256) -> None:
+        self._rows: Dict[tuple, Gtk.ListBoxRow] = {}
+        self._live: set = set()
+        self._max_detached = max_detached
+
+    def begin(self) -> None:
+        """Start a rebuild pass; no cached row is handed out yet."""
+        self._live = set()
+
+    def take(self, key: tuple, create, rebind) -> Gtk.ListBoxRow:
+        """Return the cached row for ``key`` rebound via ``rebind(row)``, or
+        a new one from ``create()``."""
+        row = self._rows.get(key)
+        if row is not None and key not in self._live:
+            rebind(row)
+            # Most recently shown last, for trim().
+            del self._rows[key]
+            self._rows[key] = row
+        else:
+            row = create()
+            if callable(getattr(row, 'rebind', None)) and key not in self._live:
+                self._rows[key] = row
+        self._live.add(key)
+        return row
+
+    def prune(self, valid_ids) -> None:
+        """Forget detached rows whose connection or group no longer exists."""
+        for key in [
+            key for key in self._rows
+            if key not in self._live and key[1] not in valid_ids
+        ]:
+            del self._rows[key]
+
+    def evict(self, item_id) -> None:
+        """Forget every row, shown or not, of one connection or group id."""
+        for key in [key for key in self._rows if key[1] == item_id]:
+            del self._rows[key]
+            self._live.discard(key)
+
+    def trim(self) -> None:
+        """Drop the least recently shown detached rows beyond the limit."""
+        excess = len(self._rows) - len(self._live) - self._max_detached
+        if excess <= 0:
+            return
+        for key in [key for key in self._rows if key not in self._live][:excess]:
+            del self._rows[key]
+
+    def drop_detached(self) -> None:
+        """Forget rows not currently shown.
+
+        Display-preference changes are applied to the rows in the list only,
+        so detached rows would otherwise come back with stale styling.
+        """
+        for key in [key for key in self._rows if key not in self._live]:
+            del self._rows[key]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+def _longest_increasing_run(values: List[int]) -> set:
+    """Return the values of one longest strictly increasing subsequence."""
+    tails: List[int] = []  # index into values of the smallest tail per length
+    previous: List[int] = [-1] * len(values)
+    for index, value in enumerate(values):
+        low, high = 0, len(tails)
+        while low < high:
+            middle = (low + high) // 2
+            if values[tails[middle]] < value:
+                low = middle + 1
+            else:
+                high = middle
+        if low:
+            previous[index] = tails[low - 1]
+        if low == len(tails):
+            tails.append(index)
+        else:
+            tails[low] = index
+    keep = set()
+    index = tails[-1] if tails else -1
+    while index >= 0:
+        keep.add(values[index])
+        index = previous[index]
+    return keep
+
+
+def reconcile_list_rows(listbox, rows) -> None:
+    """Make ``listbox`` show exactly ``rows``, in order, with minimal churn.
+
+    Rows that are already attached in the right relative order stay where
+    they are, so they keep their selection, focus and realized state; only
+    rows that appeared, disappeared or moved are removed or inserted. Any
+    other child (a drag placeholder, a stale row) is removed.
+    """
+    desired = list(rows)
+    wanted = {id(row) for row in desired}
+    current = []
+    child = listbox.get_first_child()
+    while child is not None:
+        next_child = child.get_next_sibling()
+        if id(child) in wanted:
+            current.append(child)
+        else:
+            listbox.remove(child)
+        child = next_child
+
+    insert = getattr(listbox, 'insert', None)
+    if not callable(insert):
+        for row in current:
+            listbox.remove(row)
+        for row in desired:
+            listbox.append(row)
+        return
+
+    position = {id(row): index for index, row in enumerate(current)}
+    stay = _longest_increasing_run(
+        [position[id(row)] for row in desired if id(row) in position]
+    )
+    for index, row in enumerate(current):
+        if index not in stay:
+            listbox.remove(row)
+    for index, row in enumerate(desired):
+        if position.get(id(row)) not in stay:
+            # Everything before ``index`` is already in final order.
+            insert(row, index)
+
+
 # ---------------------------------------------------------------------------
 # Drag-and-drop helpers
 # ---------------------------------------------------------------------------
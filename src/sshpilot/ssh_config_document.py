@@ -31,7 +31,7 @@ from typing import List, Optional, Tuple, Union
 _CONFIG_OPTION_RE = re.compile(r'^(\S+?)(?:\s*=\s*|\s+)(.*)$')
 
 
-def _split_config_option(line: str) -> Tuple[Optional[str], Optional[str]]:
+def split_config_option(line: str) -> Tuple[Optional[str], Optional[str]]:
     """Split a config line into (key, value) honouring whitespace and '=' separators.
 
     Returns ``(None, None)`` for lines that carry no value (a bare keyword).
@@ -14,7 +14,7 @@ rendering here:
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
-from .ssh_config_document import HostBlock, _split_config_option, _split_keyword
+from .ssh_config_document import HostBlock, split_config_option, _split_keyword
 
 SSH_UUID_MARKER = "# sshpilot:ConnectionUUID"
 
@@ -329,7 +329,7 @@ def merged_block_lines(old_block: Optional[HostBlock],
     remaining_extras: List[Tuple[Tuple[str, str], str]] = []
     for line in str(new_data.get('extra_ssh_config') or '').splitlines():
         stripped_extra = line.strip()
-        key, value = _split_config_option(stripped_extra)
+        key, value = split_config_option(stripped_extra)
         if key is not None:
             remaining_extras.append(((key.lower(), value), stripped_extra))
 
@@ -365,7 +365,7 @@ def merged_block_lines(old_block: Optional[HostBlock],
         if not has_extra_key:
             out_body.append(raw)
             continue
-        parsed_key, parsed_value = _split_config_option(stripped)
+        parsed_key, parsed_value = split_config_option(stripped)
         entry = (parsed_key.lower(), parsed_value) if parsed_key else None
         match = next((item for item in remaining_extras if item[0] == entry), None)
         if match is not None:
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import os
+import stat
 import subprocess
 import threading
 from pathlib import Path
@@ -88,8 +89,32 @@ def expire_all_masters(
     immediately and is what shutdown uses, where nothing is left to drain.
     Sockets that don't answer are stale leftovers (crashed master) and are
     unlinked here. Best-effort throughout; ``timeout`` bounds each individual
-    ``ssh`` call so an unresponsive master cannot stall a quit.
+    request so an unresponsive master cannot stall a quit.
+
+    The request is sent over the mux protocol directly; ``ssh -O`` is only
+    spawned for a path the native client cannot handle.
     """
+    from sshpilot.daemon import ssh_mux
+
+    native = ssh_mux.terminate if mode == "exit" else ssh_mux.stop_listening
+
+    def _expire_natively(path: str) -> bool:
+        """``True`` when settled without ssh."""
+        try:
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                return False
+            native(path, timeout=timeout)
+        except (ConnectionRefusedError, FileNotFoundError):
+            try:
+                os.unlink(path)  # stale socket, master already gone
+            except OSError:
+                pass
+        except (TimeoutError, ssh_mux.MuxRequestDenied):
+            logger.debug("expire_all_masters: %s not stopped", path, exc_info=True)
+        except (ssh_mux.MuxProtocolError, OSError):
+            return False
+        return True
+
     def _stop_all() -> None:
         try:
             entries = os.listdir(socket_dir())
@@ -97,6 +122,8 @@ def expire_all_masters(
             return
         for name in entries:
             path = os.path.join(socket_dir(), name)
+            if _expire_natively(path):
+                continue
             try:
                 result = subprocess.run(
                     ["ssh", "-o", f"ControlPath={path}", "-O", mode,
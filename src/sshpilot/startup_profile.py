@@ -0,0 +1,315 @@
+"""Opt-in startup profiling for the GTK frontend.
+
+Set ``SSHPILOT_PROFILE_STARTUP`` to profile one launch. ``1`` writes
+``startup-profile.json`` to the state directory; any other value is used as
+the output path. The profile records when each startup phase was reached and
+what every module cost to import (cumulative and self time, like
+``python -X importtime``), so a slower launch shows which phase grew and
+which import is to blame.
+
+Standard library only: ``sshpilot.main`` arms it before GTK is imported.
+Without the variable every profiling function here is a no-op. The one
+exception is :func:`log_time_to_interactive`, which dialogs use to log how
+long they took from being opened to their first painted frame.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ENV_VAR = "SSHPILOT_PROFILE_STARTUP"
+DEFAULT_FILENAME = "startup-profile.json"
+
+# Phases in the order a normal launch reaches them; the profile is written
+# as soon as the last one is marked (or at exit if startup never got there).
+PHASES = (
+    "imports",
+    "window_presented",
+    "daemon_connect",
+    "first_snapshot",
+    "first_sidebar_paint",
+)
+
+_profiler: Optional["StartupProfiler"] = None
+
+
+class _TimedLoader:
+    """Loader proxy that times ``exec_module`` for one import.
+
+    Everything but ``exec_module`` is delegated, and the real loader is put
+    back on the module before its code runs, so the module never sees the
+    proxy.
+    """
+
+    def __init__(self, loader, profiler: "StartupProfiler", name: str) -> None:
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def exec_module(self, module) -> None:
+        spec = getattr(module, "__spec__", None)
+        if spec is not None and spec.loader is self:
+            spec.loader = self._loader
+        if getattr(module, "__loader__", None) is self:
+            module.__loader__ = self._loader
+        self._profiler._timed_exec(self._name, self._loader, module)
+
+
+class _ImportTimer:
+    """``sys.meta_path`` entry that wraps the loaders other finders return."""
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, name, path, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            spec = None
+            for finder in list(sys.meta_path):
+                find = getattr(finder, "find_spec", None)
+                if finder is self or find is None:
+                    continue
+                spec = find(name, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.finding = False
+        if spec is None:
+            return None
+        loader = spec.loader
+        if loader is not None and hasattr(loader, "exec_module"):
+            spec.loader = _TimedLoader(loader, self._profiler, name)
+        return spec
+
+
+class StartupProfiler:
+    """Phase timestamps and per-module import times for one launch."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._origin = time.perf_counter()
+        self._started_at = time.time()
+        self._phases: Dict[str, float] = {}
+        self._imports: List[dict] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._finder = _ImportTimer(self)
+        self._written = False
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        return dict(self._phases)
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self._origin) * 1000.0
+
+    def start(self) -> None:
+        sys.meta_path.insert(0, self._finder)
+
+    def stop(self) -> None:
+        try:
+            sys.meta_path.remove(self._finder)
+        except ValueError:
+            pass
+
+    def _timed_exec(self, name: str, loader, module) -> None:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                self._imports.append({
+                    "module": name,
+                    "start_ms": round((start - self._origin) * 1000.0, 3),
+                    "cumulative_ms": round(elapsed * 1000.0, 3),
+                    "self_ms": round((elapsed - nested) * 1000.0, 3),
+                    "thread": threading.current_thread().name,
+                })
+
+    def mark(self, phase: str) -> None:
+        with self._lock:
+            if phase in self._phases:
+                return
+            self._phases[phase] = round(self._now_ms(), 3)
+            done = all(name in self._phases for name in PHASES)
+        if done:
+            self.write()
+
+    def report(self) -> dict:
+        with self._lock:
+            imports = sorted(self._imports, key=lambda item: item["start_ms"])
+            phases = dict(self._phases)
+        return {
+            "version": 1,
+            "started_at": self._started_at,
+            "python": sys.version.split()[0],
+            "phases_ms": phases,
+            "missing_phases": [name for name in PHASES if name not in phases],
+            "import_count": len(imports),
+            "import_self_ms": round(sum(item["self_ms"] for item in imports), 3),
+            "imports": imports,
+        }
+
+    def write(self) -> Optional[str]:
+        """Write the report once; later calls are no-ops."""
+        with self._lock:
+            if self._written:
+                return None
+            self._written = True
+        self.stop()
+        report = self.report()
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as handle:
+                json.dump(report, handle, indent=2)
+        except OSError as error:
+            logger.warning("Could not write startup profile: %s", type(error).__name__)
+            return None
+        logger.info(
+            "Startup profile written (%d imports, phases=%s)",
+            report["import_count"],
+            report["phases_ms"],
+        )
+        return self.path
+
+
+def _default_path() -> str:
+    from .platform_utils import get_state_dir
+
+    return os.path.join(get_state_dir(), DEFAULT_FILENAME)
+
+
+def install(path: str) -> StartupProfiler:
+    """Start profiling into *path*, replacing any running profiler."""
+    global _profiler
+    uninstall()
+    _profiler = StartupProfiler(path)
+    _profiler.start()
+    return _profiler
+
+
+def uninstall() -> None:
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is not None:
+        profiler.stop()
+
+
+def install_from_environment() -> Optional[StartupProfiler]:
+    """Arm the profiler when ``SSHPILOT_PROFILE_STARTUP`` is set."""
+    value = os.environ.get(ENV_VAR, "").strip()
+    if not value or value.lower() in {"0", "false", "no", "off"}:
+        return None
+    if value.lower() in {"1", "true", "yes", "on"}:
+        try:
+            path = _default_path()
+        except Exception:
+            path = os.path.abspath(DEFAULT_FILENAME)
+    else:
+        path = os.path.expanduser(value)
+    profiler = install(path)
+    atexit.register(profiler.write)
+    return profiler
+
+
+def active() -> bool:
+    return _profiler is not None
+
+
+def mark(phase: str) -> None:
+    """Record that *phase* was reached; only the first call per phase counts."""
+    profiler = _profiler
+    if profiler is not None:
+        profiler.mark(phase)
+
+
+def _after_next_paint(widget, callback) -> None:
+    """Call *callback* once *widget*'s frame clock has painted the next frame."""
+    get_clock = getattr(widget, "get_frame_clock", None)
+    clock = get_clock() if callable(get_clock) else None
+    if clock is None:
+        callback()
+        return
+    handler_ids: List[int] = []
+
+    def _after_paint(frame_clock):
+        for handler_id in handler_ids:
+            frame_clock.disconnect(handler_id)
+        handler_ids.clear()
+        callback()
+
+    handler_ids.append(clock.connect("after-paint", _after_paint))
+    widget.queue_draw()
+
+
+def mark_after_paint(widget, phase: str) -> None:
+    """Mark *phase* once *widget*'s frame clock has painted the next frame."""
+    profiler = _profiler
+    if profiler is None or phase in profiler.phases:
+        return
+    _after_next_paint(widget, lambda: mark(phase))
+
+
+def log_time_to_interactive(widget, label: str, started: float) -> None:
+    """Log the time from *started* until *widget* is mapped and painted.
+
+    *started* is a ``time.perf_counter()`` value taken when opening began
+    (before the widget was constructed). Works whether or not *widget* is
+    already mapped; the time is logged once.
+    """
+    def _report():
+        logger.info(
+            "%s interactive after %.1f ms", label, (time.perf_counter() - started) * 1000.0
+        )
+
+    handler_ids: List[int] = []
+
+    def _on_map(*_args):
+        while handler_ids:
+            widget.disconnect(handler_ids.pop())
+        _after_next_paint(widget, _report)
+
+    get_mapped = getattr(widget, "get_mapped", None)
+    if callable(get_mapped) and get_mapped():
+        _on_map()
+        return
+    handler_ids.append(widget.connect("map", _on_map))
+
+
+__all__ = [
+    "ENV_VAR",
+    "PHASES",
+    "StartupProfiler",
+    "active",
+    "install",
+    "install_from_environment",
+    "log_time_to_interactive",
+    "mark",
+    "mark_after_paint",
+    "uninstall",
+]
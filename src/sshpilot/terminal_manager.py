@@ -1,4 +1,5 @@
 from .api.connection_identity import connection_id_for
+from .lazy_terminal import lazy_terminal_widget
 import os
 import logging
 import threading
@@ -8,11 +9,14 @@ from typing import Optional
 from gi.repository import Gio, GLib, Adw, Gdk, Gtk
 from gettext import gettext as _
 
-from .terminal import TerminalWidget
-
 logger = logging.getLogger(__name__)
 
 
+# MainWindow builds its TerminalManager during startup; the first terminal
+# pulls in the terminal stack.
+_terminal_widget_class, __getattr__ = lazy_terminal_widget(globals())
+
+
 class TerminalManager:
     """Manage terminal creation and connection lifecycle"""
 
@@ -457,7 +461,7 @@ class TerminalManager:
     ):
         window = self.window
         group_color, group_name = self._resolve_group_color_and_name(connection)
-        terminal = TerminalWidget(
+        terminal = _terminal_widget_class()(
             connection,
             window.config,
             window.connection_manager,
@@ -539,7 +543,7 @@ class TerminalManager:
                 )
                 # Return an inert widget rather than spawning local SSH.
                 group_color, group_name = self._resolve_group_color_and_name(connection)
-                terminal = TerminalWidget(
+                terminal = _terminal_widget_class()(
                     connection,
                     window.config,
                     window.connection_manager,
@@ -552,7 +556,7 @@ class TerminalManager:
 
         group_color, group_name = self._resolve_group_color_and_name(connection)
 
-        terminal = TerminalWidget(
+        terminal = _terminal_widget_class()(
             connection,
             window.config,
             window.connection_manager,
@@ -920,7 +924,7 @@ class TerminalManager:
                     self.is_connected = True
 
             local_connection = LocalConnection()
-            terminal_widget = TerminalWidget(
+            terminal_widget = _terminal_widget_class()(
                 local_connection, self.window.config, self.window.connection_manager
             )
             if pty_prompt and pty_response is not None:
@@ -1020,7 +1024,7 @@ class TerminalManager:
             if child is None:
                 continue
 
-            if isinstance(child, TerminalWidget):
+            if isinstance(child, _terminal_widget_class()):
                 yield child
             elif isinstance(child, SplitViewTab):
                 yield from child.get_all_terminals()
@@ -1051,7 +1055,7 @@ class TerminalManager:
         except Exception:
             return None
 
-        if isinstance(child, TerminalWidget):
+        if isinstance(child, _terminal_widget_class()):
             return child
         if isinstance(child, SplitViewTab):
             return child.get_focused_terminal()
@@ -50,7 +50,8 @@ from .config import Config
 from .key_manager import KeyManager
 from sshpilot.api.models.keys import KeyStoreScope
 from sshpilot.api.models.daemon import OperationMode, SetOperationModeRequest
-from .update_checker import check_for_updates_async
+from sshpilot.api.models.connections import ConnectionReachabilityRequest
+from sshpilot.api.models.sessions import PrewarmConnectionRequest, PrewarmReason
 from .connection_display import (
     get_connection_alias,
     get_connection_host,
@@ -73,8 +74,10 @@ from .session_manager import SessionManager
 from .sidebar import (
     GroupRow,
     ConnectionRow,
+    SidebarRowCache,
     build_sidebar,
     install_sidebar_css,
+    reconcile_list_rows,
     reset_connection_list_drag_session,
 )
 
@@ -98,7 +101,8 @@ from .window_dialogs import (
     show_ssh_password_dialog,
 )
 from . import shutdown
-from .search_utils import connection_matches
+from . import startup_profile
+from .search_utils import ConnectionSearchIndex
 from .shortcut_utils import (
     DOUBLE_SHIFT_SHORTCUT,
     DoubleShiftDetector,
@@ -249,6 +253,14 @@ _format_connection_host_display = format_connection_host_display
 # Width of the minimal (icon-only) sidebar strip.
 _MINIMAL_STRIP_WIDTH = 64
 
+# How long a hovered or selected row must stay put before the daemon is told
+# it may be opened next.
+PREWARM_HINT_DELAY_MS = 250
+
+# How often the rows on screen are reported to the daemon's reachability
+# prober. The daemon stops probing once these hints stop.
+REACHABILITY_HINT_INTERVAL_SECONDS = 30
+
 
 def _effective_max_sidebar_width(saved_value, default: int = 400) -> int:
     """Resolve the startup max sidebar width from a saved setting value.
@@ -426,6 +438,7 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         self.connection_to_terminals: Dict[Connection, List[TerminalWidget]] = {}
         self.terminal_to_connection: Dict[TerminalWidget, Connection] = {}
         self.connection_rows = {}   # connection -> [row_widget, ...] (a connection may appear in several groups)
+        self._sidebar_row_cache = SidebarRowCache()
         self._sidebar_minimal = False   # icon-only strip state
         self._sidebar_overlay = False   # overlay (covers content) vs side-by-side
         self._sidebar_width_animation = None
@@ -565,6 +578,7 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         checker = getattr(self, "effective_config_checker", None)
         if checker is not None:
             checker.invalidate()
+        self._start_reachability_hints()
         self._refresh_operation_mode_scope()
         self.secrets_controller = self._build_secrets_controller()
         self._attach_secrets_interaction_presenter()
@@ -784,6 +798,7 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         if self._is_quitting:
             selection.client.close()
             return
+        startup_profile.mark("daemon_connect")
         self.client = selection.client
         self._attach_client_backed_services()
         preferences = getattr(self, '_preferences_window', None)
@@ -1441,6 +1456,9 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
                         self._handle_update_check_result, latest_version, True
                     )
 
+                # urllib/ssl load here, not on the startup import path.
+                from .update_checker import check_for_updates_async
+
                 check_for_updates_async(on_update_check_complete)
         except Exception as e:
             logger.debug(f"Failed to check for updates on startup: {e}")
@@ -1699,6 +1717,108 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         except Exception:
             logger.debug("Failed to prime effective-config warning", exc_info=True)
 
+    def _schedule_connection_prewarm(self, connection, reason=PrewarmReason.HOVER):
+        """Hint the daemon that ``connection`` is likely to be opened next.
+
+        Hovers and selections settle for ``PREWARM_HINT_DELAY_MS`` first so
+        sweeping the pointer or arrowing through the list sends one hint, not
+        one per row. Each reason has its own pending hint, so leaving a row
+        (``None`` with the hover reason) does not cancel the selection's. The
+        daemon decides whether a ControlMaster is worth building.
+        """
+        sources = getattr(self, '_prewarm_hint_sources', None)
+        if sources is None:
+            sources = self._prewarm_hint_sources = {}
+        pending = sources.pop(reason, None)
+        if pending:
+            GLib.source_remove(pending)
+        if connection is None:
+            return
+
+        def _send():
+            sources.pop(reason, None)
+            self._request_connection_prewarm(connection, reason)
+            return False
+
+        sources[reason] = GLib.timeout_add(PREWARM_HINT_DELAY_MS, _send)
+
+    def _request_connection_prewarm(self, connection, reason) -> None:
+        client = self.client
+        bridge = getattr(self, 'client_bridge', None)
+        if client is None or bridge is None:
+            return
+        try:
+            request = PrewarmConnectionRequest(
+                connection_id=connection_id_for(connection), reason=reason
+            )
+            bridge.submit(
+                lambda: client.prewarm_connection(request),
+                on_success=lambda _started: None,
+                on_error=lambda _error: None,
+            )
+        except Exception:
+            logger.debug("Could not request a ControlMaster prewarm", exc_info=True)
+
+    def _start_reachability_hints(self) -> None:
+        """Report shown rows now and every ``REACHABILITY_HINT_INTERVAL_SECONDS``."""
+        if getattr(self, '_reachability_hint_source', None):
+            return
+        self._reachability_hint_source = GLib.timeout_add_seconds(
+            REACHABILITY_HINT_INTERVAL_SECONDS, self._send_reachability_hint
+        )
+        GLib.idle_add(lambda: (self._send_reachability_hint(), GLib.SOURCE_REMOVE)[1])
+
+    def _send_reachability_hint(self):
+        """Tell the daemon which rows are shown; results land in the store.
+
+        Hidden windows send nothing, so a daemon behind a window minimized to
+        the tray stops probing on its own. Nothing is sent unless the
+        ``ui.reachability_probes`` preference is on (it is off by default).
+        Only rows that intersect the sidebar's viewport count as shown.
+        """
+        client = self.client
+        bridge = getattr(self, 'client_bridge', None)
+        if client is None or bridge is None or not self.get_visible():
+            return GLib.SOURCE_CONTINUE
+        if not self.config.get_setting('ui.reachability_probes', False):
+            return GLib.SOURCE_CONTINUE
+        try:
+            scrolled = getattr(self, 'connection_scrolled', None)
+            viewport_height = scrolled.get_height() if scrolled is not None else 0
+            shown = []
+            for connection, rows in list(self.connection_rows.items()):
+                rows = rows if isinstance(rows, list) else [rows]
+                if any(
+                    self._row_in_viewport(row, scrolled, viewport_height)
+                    for row in rows
+                ):
+                    shown.append(connection_id_for(connection))
+            request = ConnectionReachabilityRequest(
+                visible_connection_ids=tuple(dict.fromkeys(shown)),
+                read_ssh_banner=bool(
+                    self.config.get_setting('ui.reachability_ssh_banner', False)
+                ),
+            )
+            bridge.submit(
+                lambda: client.get_connection_reachability(request),
+                on_success=self.connection_manager.apply_reachability,
+                on_error=lambda _error: None,
+            )
+        except Exception:
+            logger.debug("Could not report visible connections", exc_info=True)
+        return GLib.SOURCE_CONTINUE
+
+    @staticmethod
+    def _row_in_viewport(row, scrolled, viewport_height: int) -> bool:
+        """True when ``row``'s allocation overlaps the scrolled viewport.
+
+        Rows scrolled out of view stay mapped, so mapping alone over-reports.
+        """
+        if scrolled is None or viewport_height <= 0 or not row.get_mapped():
+            return False
+        ok, _x, top = row.translate_coordinates(scrolled, 0, 0)
+        return bool(ok) and top < viewport_height and top + row.get_height() > 0
+
     def _reload_ssh_config(self, create_missing=True):
         """Compatibility callback: refresh only from the attached daemon."""
         try:
@@ -2391,6 +2511,9 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         """Update sidebar display based on current preferences."""
         if not hasattr(self, 'connection_list'):
             return
+        # Preferences are applied to shown rows only; recycled rows would
+        # otherwise come back with the old styling.
+        self._sidebar_rows().drop_detached()
 
         try:
             connections = self.connection_manager.get_connections()
@@ -2722,6 +2845,10 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         lb = getattr(self, 'connection_list', None)
         if lb is None:
             return
+        if not minimal:
+            # Recycled rows skip the layout reset when their data is
+            # unchanged, so forget any left compact while detached.
+            self._sidebar_rows().drop_detached()
         row = lb.get_first_child()
         while row is not None:
             if hasattr(row, 'set_compact'):
@@ -3794,6 +3921,13 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         the re-collapse then.
         """
         self._ungrouped_area_row = None
+        staged = getattr(self, '_sidebar_staged_rows', None)
+        if staged is not None:
+            self._sidebar_staged_rows = None
+            reconcile_list_rows(self.connection_list, staged)
+        row_cache = getattr(self, '_sidebar_row_cache', None)
+        if row_cache is not None:
+            row_cache.trim()
         # Command/settings results in the popup are parked until the welcome-page
         # omnisearch lands — re-enable by calling self._append_command_matches().
         if getattr(self, '_sidebar_minimal', False) and not (getattr(self, "_search_popup", None) and self._search_popup.visible):
@@ -3826,8 +3960,27 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         append_command_rows(self, query)
 
     def rebuild_connection_list(self):
-        """Rebuild the connection list with groups"""
+        """Rebuild the connection list with groups.
+
+        The new presentation is staged and then reconciled against the rows
+        already in the list, so only inserted, removed or moved rows touch
+        the widget tree and selection, focus and scroll position survive.
+        """
         reset_connection_list_drag_session(self)
+        self._sidebar_staged_rows = []
+        try:
+            self._populate_connection_list()
+        finally:
+            self._sidebar_staged_rows = None
+
+    def _sidebar_append(self, row) -> None:
+        staged = getattr(self, '_sidebar_staged_rows', None)
+        if staged is None:
+            self.connection_list.append(row)
+        else:
+            staged.append(row)
+
+    def _populate_connection_list(self):
 
         # Save current scroll position
         scroll_position = None
@@ -3861,16 +4014,18 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
                     (connection_id, getattr(row, '_group_id', None))
                 )
 
-        # Clear existing rows
-        child = self.connection_list.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.connection_list.remove(child)
-            child = next_child
+        # Existing rows stay attached; the row cache hands them back below for
+        # every slot that is still shown and _finish_rebuild() reconciles.
         self.connection_rows.clear()
+        row_cache = self._sidebar_rows()
+        row_cache.begin()
 
         # Get all connections
         connections = self.connection_manager.get_connections()
+        row_cache.prune(
+            {conn.id for conn in connections}
+            | set(getattr(self.group_manager, 'groups', None) or ())
+        )
         # GroupManager is a snapshot-backed presentation adapter. Reapply the
         # selected display order whenever the list is rebuilt so daemon
         # projection refreshes don't silently restore insertion order.
@@ -3904,6 +4059,14 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
             search_text = self.search_entry.get_text().strip().lower()
 
         tag_filter = getattr(self, '_tag_filter', None)
+        matched_ids = None
+        if search_text or tag_filter:
+            matched_ids = self._connection_search_index().matching_ids(
+                search_text, tag=tag_filter
+            )
+
+        def _is_match(conn):
+            return ConnectionSearchIndex.key_for(conn) in matched_ids
 
         # When the search popup asks for a flat list (no group headers), show a
         # plain connection list honouring the active search/tag filters.
@@ -3911,9 +4074,7 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         if popup is not None and popup.visible and not popup.show_groups:
             matches = [
                 c for c in connections
-                if (not tag_filter or tag_filter in {str(t).casefold()
-                    for t in (getattr(c, 'tags', None) or [])})
-                and (not search_text or connection_matches(c, search_text))
+                if matched_ids is None or _is_match(c)
             ]
             for conn in sorted(matches, key=lambda c: c.nickname.lower()):
                 self.add_connection_row(conn)
@@ -3921,11 +4082,7 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
             return
 
         if tag_filter:
-            matches = [
-                c for c in connections
-                if tag_filter in {str(t).casefold() for t in (getattr(c, 'tags', None) or [])}
-                and (not search_text or connection_matches(c, search_text))
-            ]
+            matches = [c for c in connections if _is_match(c)]
             for conn in sorted(matches, key=lambda c: c.nickname.lower()):
                 self.add_connection_row(conn)
             self._finish_rebuild(scroll_position, selected_connection_rows)
@@ -3949,9 +4106,8 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
                 matched_groups = []
 
             for group_info in matched_groups:
-                group_row = GroupRow(group_info, self.group_manager, connections_dict)
-                group_row.connect('group-toggled', self._on_group_toggled)
-                self.connection_list.append(group_row)
+                group_row = self._take_group_row(group_info, connections_dict)
+                self._sidebar_append(group_row)
 
                 for conn_nickname in group_info.get('connections', []):
                     if conn_nickname in connections_dict:
@@ -3965,7 +4121,7 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
 
             matches = [
                 c for c in connections
-                if connection_matches(c, search_text)
+                if _is_match(c)
                 and c.id not in displayed_connections
             ]
             for conn in sorted(matches, key=lambda c: c.nickname.lower()):
@@ -4023,11 +4179,10 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         created_rows = []
         for group_info in hierarchy:
             # Add group row
-            group_row = GroupRow(group_info, self.group_manager, connections_dict)
-            group_row.connect('group-toggled', self._on_group_toggled)
+            group_row = self._take_group_row(group_info, connections_dict)
             if hasattr(group_row, "set_indentation"):
                 group_row.set_indentation(level)
-            self.connection_list.append(group_row)
+            self._sidebar_append(group_row)
 
             # Build direct connection rows once, then let expand/collapse toggle
             # their visibility in place to avoid full-list flicker.
@@ -4058,6 +4213,65 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
             created_rows.append(group_row)
         return created_rows
 
+    def _connection_search_index(self) -> ConnectionSearchIndex:
+        """Search index kept current by the presentation store's signals.
+
+        Built from the store's snapshot on first use; afterwards only
+        connection add/update/remove and projection resets touch it, never
+        a rebuild of the list.
+        """
+        index = getattr(self, '_search_index', None)
+        if index is None:
+            index = self._search_index = ConnectionSearchIndex()
+            self._reindex_connection_search()
+        return index
+
+    def _connection_search_tags(self, connection) -> List[str]:
+        try:
+            return list(
+                self.connection_manager.get_metadata(connection.nickname).get("tags", [])
+            )
+        except Exception:
+            return []
+
+    def _reindex_connection_search(self) -> None:
+        index = getattr(self, '_search_index', None)
+        if index is None:
+            return
+        connections = self.connection_manager.get_connections()
+        index.update(
+            connections,
+            tags={
+                ConnectionSearchIndex.key_for(conn): self._connection_search_tags(conn)
+                for conn in connections
+            },
+        )
+
+    def _on_connection_search_changed(self, manager, connection) -> None:
+        index = getattr(self, '_search_index', None)
+        if index is not None:
+            index.upsert(connection, tags=self._connection_search_tags(connection))
+
+    def _sidebar_rows(self) -> SidebarRowCache:
+        cache = getattr(self, '_sidebar_row_cache', None)
+        if cache is None:
+            cache = self._sidebar_row_cache = SidebarRowCache()
+        return cache
+
+    def _take_group_row(self, group_info, connections_dict):
+        """Return a (possibly recycled) header row for ``group_info``."""
+
+        def _create():
+            group_row = GroupRow(group_info, self.group_manager, connections_dict)
+            group_row.connect('group-toggled', self._on_group_toggled)
+            return group_row
+
+        return self._sidebar_rows().take(
+            ('group', group_info.get('id')),
+            _create,
+            lambda row: row.rebind(group_info, connections_dict),
+        )
+
     def _on_group_toggled(self, group_row, group_id, expanded):
         """Handle group expand/collapse"""
         if hasattr(group_row, "apply_descendant_visibility"):
@@ -4081,21 +4295,30 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         status_resolver = (
             runtime_status.status_for if runtime_status is not None else None
         )
-        row = ConnectionRow(
-            connection,
-            self.group_manager,
-            self.config,
-            file_manager_callback=self._open_manage_files_for_connection,
-            effective_warning_callback=self._request_effective_warning,
-            status_resolver=status_resolver,
-            display_group_id=display_group_id,
-            in_tag_section=in_tag_section,
+        row = self._sidebar_rows().take(
+            ('connection', connection.id, display_group_id, in_tag_section),
+            lambda: ConnectionRow(
+                connection,
+                self.group_manager,
+                self.config,
+                file_manager_callback=self._open_manage_files_for_connection,
+                effective_warning_callback=self._request_effective_warning,
+                status_resolver=status_resolver,
+                display_group_id=display_group_id,
+                in_tag_section=in_tag_section,
+                prewarm_callback=self._schedule_connection_prewarm,
+            ),
+            lambda cached: cached.rebind(
+                connection,
+                display_group_id=display_group_id,
+                status_resolver=status_resolver,
+            ),
         )
 
         # Apply indentation preference for grouped connections
         row.set_indentation(indent_level)
 
-        self.connection_list.append(row)
+        self._sidebar_append(row)
         # A connection can appear under multiple groups, so keep a list of rows
         self.connection_rows.setdefault(connection, []).append(row)
 
@@ -4165,6 +4388,9 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         # Connection manager signals - use connect_after to avoid conflict with GObject.connect
         self.connection_manager.connect_after('connection-added', self.on_connection_added)
         self.connection_manager.connect_after('connection-removed', self.on_connection_removed)
+        self.connection_manager.connect_after(
+            'connection-updated', self._on_connection_search_changed
+        )
         self.connection_manager.connect_after('projection-reset', self.on_projection_reset)
         self.connection_manager.connect_after('connection-status-changed', self.on_connection_status_changed)
 
@@ -5512,6 +5738,8 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
 
             multiple_connections = len(connection_rows) > 1
             selected_conn = getattr(connection_rows[0], 'connection', None)
+            if not multiple_connections and getattr(selected_conn, 'protocol', 'ssh') == 'ssh':
+                self._schedule_connection_prewarm(selected_conn, PrewarmReason.SELECTION)
             caps = capabilities_for(selected_conn) if (not multiple_connections and selected_conn) else frozenset()
             self.edit_button.set_sensitive(not multiple_connections)
             if hasattr(self, 'copy_key_button'):
@@ -5907,10 +6135,10 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
         *,
         close_terminals=False,
     ) -> None:
-        """Delete daemon-owned connections serially without optimistic rows."""
+        """Delete daemon-owned connections in one batch without optimistic rows."""
 
         from .api import SshPilotError
-        from .api.models import DeleteConnectionRequest
+        from .api.models import DeleteConnectionsRequest
 
         bridge = getattr(self, 'client_bridge', None)
         if bridge is None:
@@ -5921,7 +6149,13 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
                     _("Connect to the sshPilot daemon and retry the deletion."),
                 )
             return
-        pending = iter(connection for connection in connections if connection)
+        by_id = {}
+        for connection in connections:
+            if connection:
+                by_id.setdefault(connection_id_for(connection), connection)
+        if not by_id:
+            return
+        request = DeleteConnectionsRequest(connection_ids=tuple(by_id))
         self._deleting_connections_batch = True
 
         def _finish():
@@ -5937,58 +6171,64 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
                     type(error).__name__,
                 )
 
-        def _delete_next():
+        def _success(result):
             if self._is_quitting:
                 self._deleting_connections_batch = False
                 return
-            try:
-                connection = next(pending)
-            except StopIteration:
-                _finish()
-                return
-            request = DeleteConnectionRequest(
-                connection_id=connection_id_for(connection)
-            )
-
-            def _success(_result):
-                if close_terminals:
-                    self._disconnect_connection_terminals(connection)
-                _delete_next()
-
-            def _failure(error):
-                self._deleting_connections_batch = False
-                if isinstance(error, SshPilotError):
+            if close_terminals:
+                for connection_id in result.succeeded_ids:
+                    connection = by_id.get(connection_id)
+                    if connection is not None:
+                        self._disconnect_connection_terminals(connection)
+            _finish()
+            failed = result.failed
+            if failed:
+                for item in failed:
                     logger.warning(
                         "Daemon connection delete failed code=%s",
-                        error.code.value,
-                    )
-                else:
-                    logger.error(
-                        "Daemon connection delete failed type=%s",
-                        type(error).__name__,
-                    )
-                if not self._is_quitting:
-                    self._error_dialog(
-                        _("Failed to delete connection"),
-                        _(
-                            "The connection could not be deleted. "
-                            "No list changes were applied."
-                        ),
+                        item.error_code,
                     )
+                self._error_dialog(
+                    _("Failed to delete connection"),
+                    _(
+                        "{count} connection(s) could not be deleted. "
+                        "The remaining deletions were applied."
+                    ).format(count=len(failed)),
+                )
 
-            try:
-                bridge.submit(
-                    lambda: self.client.delete_connection(request),
-                    on_success=_success,
-                    on_error=_failure,
+        def _failure(error):
+            self._deleting_connections_batch = False
+            if isinstance(error, SshPilotError):
+                logger.warning(
+                    "Daemon connection delete failed code=%s",
+                    error.code.value,
+                )
+            else:
+                logger.error(
+                    "Daemon connection delete failed type=%s",
+                    type(error).__name__,
+                )
+            if not self._is_quitting:
+                self._error_dialog(
+                    _("Failed to delete connection"),
+                    _(
+                        "The connections could not be deleted. "
+                        "No list changes were applied."
+                    ),
                 )
-            except RuntimeError:
-                _failure(RuntimeError("client bridge closed"))
 
-        _delete_next()
+        try:
+            bridge.submit(
+                lambda: self.client.delete_connections(request),
+                on_success=_success,
+                on_error=_failure,
+            )
+        except RuntimeError:
+            _failure(RuntimeError("client bridge closed"))
 
     def on_connection_added(self, manager, connection):
         """Handle new connection added"""
+        self._on_connection_search_changed(manager, connection)
         self.group_manager.bind_connections(self.connection_manager.connections)
         self.group_manager.connections.setdefault(connection.id, None)
         if connection.id not in self.group_manager.root_connections:
@@ -5998,8 +6238,11 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
 
     def on_projection_reset(self, manager, _connection=None):
         """Rebuild presentation state after an authoritative store refresh."""
+        startup_profile.mark("first_snapshot")
         self.group_manager.bind_connections(manager.connections)
+        self._reindex_connection_search()
         self.rebuild_connection_list()
+        startup_profile.mark_after_paint(self.connection_list, "first_sidebar_paint")
         if not self._initial_connection_list_focus_done:
             # The daemon-backed client attaches asynchronously (client_bridge
             # selection + connection store fetch), so this reset — not window
@@ -6026,6 +6269,9 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
     def on_connection_removed(self, manager, connection):
         """Handle connection removed from the connection manager"""
         logger.info(f"Connection removed: {connection.nickname}")
+        index = getattr(self, '_search_index', None)
+        if index is not None:
+            index.discard(ConnectionSearchIndex.key_for(connection))
 
         # Save current scroll position before any UI changes
         scroll_position = None
@@ -6039,6 +6285,8 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
             for row in self._rows_for_connection(connection):
                 self.connection_list.remove(row)
             del self.connection_rows[connection]
+        # Also drops rows cached for slots that are not shown right now.
+        self._sidebar_rows().evict(connection.id)
 
         # Remove from group manager, including any group it was copied into
         self.group_manager.connections.pop(connection.id, None)
@@ -6243,6 +6491,7 @@ class MainWindow(Adw.ApplicationWindow, WindowBroadcastMixin, WindowSessionMixin
 
             # Covers both connection rows and group headers (nested groups
             # honor the same fullwidth/nested layout).
+            self._sidebar_rows().drop_detached()
             for row in self.connection_list:
                 if hasattr(row, 'refresh_group_display_mode'):
                     row.refresh_group_display_mode(normalized)
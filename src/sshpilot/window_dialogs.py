@@ -14,12 +14,15 @@ that historically imported them from there.
 import logging
 import os
 import threading
+import time
 from datetime import datetime
 from typing import Any, Optional
 
 from gi.repository import Adw, Gdk, Gio, GLib, Gtk
 from gettext import gettext as _
 
+from . import startup_profile
+
 logger = logging.getLogger(__name__)
 
 # Minimum content width for export/import backup dialogs.
@@ -539,6 +542,7 @@ class WindowConfigDialogsMixin:
         (e.g. ``plugins``, ``security-&-credentials``).
         """
         logger.info("Show preferences")
+        started = time.perf_counter()
         nav = getattr(self, 'nav_view', None)
         if nav is None:
             logger.error('NavigationView unavailable; cannot open Settings mode')
@@ -566,6 +570,7 @@ class WindowConfigDialogsMixin:
                 nav.push(prefs)
             if page_id:
                 prefs.select_page(page_id)
+            startup_profile.log_time_to_interactive(prefs, "Preferences", started)
         except Exception as e:
             logger.error(f"Failed to show preferences: {e}")
 
@@ -5,19 +5,22 @@ WindowBroadcastMixin) to shrink the window.py god-object. MainWindow inherits
 this; methods keep their signatures and `self.` state access, so this is a pure
 code move with no behavior change.
 
-`TerminalWidget` is imported at module level so the isinstance() checks
-below use the class object the session tests bind via
-``window_session.TerminalWidget`` (window.py only imports it under
-``TYPE_CHECKING``).
+`TerminalWidget` is imported on first use (the terminal module is not
+needed to show the window) and kept as the module attribute
+``window_session.TerminalWidget``, so the isinstance() checks below use the
+class object the session tests bind through it.
 """
 
 import logging
 
 from gettext import gettext as _
 
-from .terminal import TerminalWidget
+from .lazy_terminal import lazy_terminal_widget
+
 logger = logging.getLogger(__name__)
 
+_terminal_widget_class, __getattr__ = lazy_terminal_widget(globals())
+
 
 class WindowSessionMixin:
     """Capture the open tabs to a dict and restore them later."""
@@ -94,7 +97,7 @@ class WindowSessionMixin:
                 })
                 continue
 
-            if isinstance(child, TerminalWidget):
+            if isinstance(child, _terminal_widget_class()):
                 is_local = False
                 try:
                     is_local = bool(child._is_local_terminal())
@@ -207,7 +210,7 @@ class WindowSessionMixin:
                     custom_title = entry.get('custom_title')
                     if custom_title:
                         page = self.tab_view.get_selected_page()
-                        if page is not None and isinstance(page.get_child(), TerminalWidget):
+                        if page is not None and isinstance(page.get_child(), _terminal_widget_class()):
                             self._apply_tab_title(page, custom_title)
             except Exception as exc:
                 logger.error(f"Failed to restore tab {entry!r}: {exc}")
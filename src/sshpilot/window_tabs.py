@@ -15,7 +15,7 @@ local imports are kept as-is.
 """
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from gi.repository import Gtk, Adw, Gio, GLib, Gdk, GObject
 from gettext import gettext as _
@@ -23,7 +23,6 @@ from gettext import gettext as _
 from sshpilot import icon_utils
 from .connection_model import Connection
 from .dnd_payload import decode_dnd_payload, new_internal_drop_target
-from .terminal import TerminalWidget
 from .plugins.api import Capability
 from .plugins.registry import capabilities_for
 from .connection_display import get_connection_alias, get_connection_host
@@ -33,9 +32,16 @@ from .file_manager_integration import (
     should_hide_external_terminal_options,
     should_hide_file_manager_options,
 )
+from .lazy_terminal import lazy_terminal_widget
+
+if TYPE_CHECKING:
+    from .terminal import TerminalWidget
 
 logger = logging.getLogger(__name__)
 
+_terminal_widget_class, __getattr__ = lazy_terminal_widget(globals())
+
+
 # Match window.py's private aliases so the moved methods read unchanged.
 _get_connection_host = get_connection_host
 _get_connection_alias = get_connection_alias
@@ -455,7 +461,7 @@ class WindowTabsMixin:
         # Terminal check must precede the embed search: a terminal with a
         # files panel (set_file_panel) contains a FileManagerTabEmbed in its
         # subtree but is still a terminal tab.
-        if isinstance(child, TerminalWidget):
+        if isinstance(child, _terminal_widget_class()):
             try:
                 is_local = child._is_local_terminal()
             except Exception:
@@ -518,7 +524,7 @@ class WindowTabsMixin:
     def _on_tabmenu_duplicate(self, action, param=None):
         try:
             page, child = self._tab_menu_target()
-            if not isinstance(child, TerminalWidget):
+            if not isinstance(child, _terminal_widget_class()):
                 return
             if child._is_local_terminal():
                 self.terminal_manager.show_local_terminal()
@@ -556,7 +562,7 @@ class WindowTabsMixin:
     def _on_tabmenu_reconnect(self, action, param=None):
         try:
             page, child = self._tab_menu_target()
-            if isinstance(child, TerminalWidget) and hasattr(child, '_on_reconnect_clicked'):
+            if isinstance(child, _terminal_widget_class()) and hasattr(child, '_on_reconnect_clicked'):
                 child._on_reconnect_clicked()
         except Exception as exc:
             logger.error("Tab reconnect failed: %s", exc)
@@ -564,7 +570,7 @@ class WindowTabsMixin:
     def _on_tabmenu_manage_files(self, action, param=None):
         try:
             page, child = self._tab_menu_target()
-            if not isinstance(child, TerminalWidget):
+            if not isinstance(child, _terminal_widget_class()):
                 return
             conn = self.terminal_to_connection.get(child)
             if conn is not None:
@@ -576,7 +582,7 @@ class WindowTabsMixin:
         """Embed the SFTP file manager below the tab's terminal (same session)."""
         try:
             page, child = self._tab_menu_target()
-            if not isinstance(child, TerminalWidget) or child.has_file_panel():
+            if not isinstance(child, _terminal_widget_class()) or child.has_file_panel():
                 return
             conn = self.terminal_to_connection.get(child)
             if conn is None:
@@ -604,7 +610,7 @@ class WindowTabsMixin:
     def _on_tabmenu_hide_files_panel(self, action, param=None):
         try:
             page, child = self._tab_menu_target()
-            if isinstance(child, TerminalWidget):
+            if isinstance(child, _terminal_widget_class()):
                 child.clear_file_panel()
         except Exception as exc:
             logger.error("Hide files below terminal failed: %s", exc)
@@ -676,7 +682,7 @@ class WindowTabsMixin:
     def _on_tabmenu_open_system_terminal(self, action, param=None):
         try:
             page, child = self._tab_menu_target()
-            if not isinstance(child, TerminalWidget):
+            if not isinstance(child, _terminal_widget_class()):
                 return
             conn = self.terminal_to_connection.get(child)
             if conn is not None:
@@ -727,7 +733,7 @@ class WindowTabsMixin:
         from .split_view import SplitViewTab
         if isinstance(child, SplitViewTab):
             child.set_layout_mode(mode)
-        elif isinstance(child, TerminalWidget):
+        elif isinstance(child, _terminal_widget_class()):
             self._convert_terminal_tab_to_split(page, child, mode)
 
     def _on_tabmenu_layout_horizontal(self, action, param=None):
@@ -1084,9 +1090,8 @@ class WindowTabsMixin:
         # Register a drop target on TerminalWidget pages so dragging a
         # connection onto a terminal converts that tab into a split-view tab.
         try:
-            from .terminal import TerminalWidget
             child = page.get_child() if page else None
-            if isinstance(child, TerminalWidget):
+            if isinstance(child, _terminal_widget_class()):
                 self._register_convert_to_split_drop(child, page)
         except Exception as exc:
             logger.debug("Could not register convert-to-split drop: %s", exc)
@@ -1267,7 +1272,7 @@ class WindowTabsMixin:
             from .split_view import SplitViewTab
             if isinstance(child, SplitViewTab):
                 child.set_layout_mode(mode)
-            elif isinstance(child, TerminalWidget):
+            elif isinstance(child, _terminal_widget_class()):
                 self._convert_terminal_tab_to_split(page, child, mode)
         except Exception as exc:
             logger.error("Failed to apply tab layout mode: %s", exc)
@@ -1678,7 +1683,7 @@ class WindowTabsMixin:
         except Exception as e:
             logger.error(f"Failed to cycle or open for {getattr(connection, 'nickname', '')}: {e}")
 
-    def _focus_terminal_widget(self, terminal: TerminalWidget) -> None:
+    def _focus_terminal_widget(self, terminal: "TerminalWidget") -> None:
         """Request focus for a terminal widget, retrying on idle if needed."""
 
         if terminal is None:
@@ -1710,7 +1715,7 @@ class WindowTabsMixin:
         GLib.timeout_add(150, _focus_attempt)
         GLib.timeout_add(350, _focus_attempt)
 
-    def _get_active_terminal_widget(self) -> Optional[TerminalWidget]:
+    def _get_active_terminal_widget(self) -> Optional["TerminalWidget"]:
         """Return the TerminalWidget for the currently selected tab, if any."""
         terminal_manager = getattr(self, 'terminal_manager', None)
         if terminal_manager is not None:
@@ -1832,5 +1837,4 @@ class WindowTabsMixin:
 
 
 def _is_terminal_widget(widget) -> bool:
-    from .terminal import TerminalWidget
-    return isinstance(widget, TerminalWidget)
+    return isinstance(widget, _terminal_widget_class())
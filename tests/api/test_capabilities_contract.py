@@ -11,7 +11,8 @@ def test_connection_service_only_declares_connection_operations():
         "close", "get_capabilities", "get_connection", "get_connection_editor",
         "get_ssh_config_text", "get_effective_config", "check_unsaved_host", "prepare_external_terminal_launch", "save_ssh_config_text",
         "list_connections", "create_connection", "duplicate_connection",
-        "delete_connection", "store_connection_password",
+        "delete_connection", "update_connections", "delete_connections",
+        "store_connection_password",
         "set_session_connection_password",
         "clear_session_connection_password",
         "delete_connection_password",
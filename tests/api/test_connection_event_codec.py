@@ -110,3 +110,60 @@ def test_wire_payload_allows_ssh_config_keys():
         payload={**envelope.payload, "remote_command": "echo hello"},
     )
     assert replaced.payload["remote_command"] == "echo hello"
+
+
+def test_reachability_event_round_trips_over_the_public_event_codec():
+    from datetime import datetime, timezone
+
+    from sshpilot.api.models import (
+        ConnectionHealth,
+        ConnectionReachability,
+        ConnectionReachabilityRequest,
+    )
+    from sshpilot.api.transport.codec import (
+        connection_reachability_request_from_wire,
+        connection_reachability_request_to_wire,
+        public_event_from_envelope,
+        public_event_to_envelope,
+    )
+
+    checked = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    payload = ConnectionReachability(
+        connection_id=ConnectionId("demo"),
+        health=ConnectionHealth.REACHABLE,
+        probes=3,
+        last_checked_at=checked,
+        last_seen_at=checked,
+        rtt_p50_ms=1.5,
+        rtt_p90_ms=4.0,
+        rtt_max_ms=9.25,
+        ssh_banner="SSH-2.0-OpenSSH_9.6",
+    )
+    envelope = public_event_to_envelope(
+        CoreEvent(
+            type=EventType.CONNECTION_REACHABILITY_CHANGED,
+            payload=payload,
+            sequence=0,
+            connection_id="demo",
+        ),
+        sequence=5,
+        protocol_version="1.0",
+    )
+
+    decoded = public_event_from_envelope(decode_envelope(encode_envelope(envelope)))
+
+    assert decoded.type is EventType.CONNECTION_REACHABILITY_CHANGED
+    assert decoded.payload == payload
+    assert decoded.connection_id == "demo"
+    request = ConnectionReachabilityRequest(
+        visible_connection_ids=(ConnectionId("demo"),), read_ssh_banner=True
+    )
+    encoded = connection_reachability_request_to_wire(request)
+    assert connection_reachability_request_from_wire(encoded) == request
+    assert connection_reachability_request_from_wire(
+        {"visible_connection_ids": []}
+    ) == ConnectionReachabilityRequest()
+    with pytest.raises(ValueError):
+        ConnectionReachability(
+            connection_id=ConnectionId("demo"), rtt_p50_ms=2.0, rtt_p90_ms=1.0, rtt_max_ms=3.0
+        )
@@ -1,21 +1,32 @@
 import pytest
 
 from sshpilot.api.models import (
+    ConnectionBatchItemResult,
+    ConnectionBatchResult,
+    ConnectionUpdateItem,
     CreateConnectionRequest,
     DeleteConnectionRequest,
     DeleteConnectionResult,
+    DeleteConnectionsRequest,
     UpdateConnectionRequest,
+    UpdateConnectionsRequest,
 )
 from sshpilot.api.models.common import ConnectionId
 from sshpilot.api.transport.codec import (
+    connection_batch_result_from_wire,
+    connection_batch_result_to_wire,
     create_connection_request_from_wire,
     create_connection_request_to_wire,
     delete_connection_request_from_wire,
     delete_connection_request_to_wire,
     delete_connection_result_from_wire,
     delete_connection_result_to_wire,
+    delete_connections_request_from_wire,
+    delete_connections_request_to_wire,
     update_connection_request_from_wire,
     update_connection_request_to_wire,
+    update_connections_request_from_wire,
+    update_connections_request_to_wire,
 )
 
 
@@ -52,6 +63,36 @@ def test_mutation_codec_round_trips_all_public_models():
     ) == result
 
 
+def test_batch_codec_round_trips_and_rejects_duplicate_ids():
+    update_many = UpdateConnectionsRequest(items=(
+        ConnectionUpdateItem("web", UpdateConnectionRequest(port=2201)),
+        ConnectionUpdateItem(
+            "db", UpdateConnectionRequest(username="", expected_generation=0)
+        ),
+    ))
+    delete_many = DeleteConnectionsRequest(connection_ids=("web", "db"))
+    result = ConnectionBatchResult(items=(
+        ConnectionBatchItemResult("web", True),
+        ConnectionBatchItemResult(
+            "db", False, "connection_not_found", "Connection not found."
+        ),
+    ))
+
+    assert update_connections_request_from_wire(
+        update_connections_request_to_wire(update_many)
+    ) == update_many
+    assert delete_connections_request_from_wire(
+        delete_connections_request_to_wire(delete_many)
+    ) == delete_many
+    assert connection_batch_result_from_wire(
+        connection_batch_result_to_wire(result)
+    ) == result
+    with pytest.raises(ValueError):
+        delete_connections_request_from_wire(
+            {"connection_ids": ["web", "web"]}
+        )
+
+
 def test_update_expected_generation_none_omitted_but_zero_preserved():
     """None (no generation supplied) must not collide with a real zero
     generation, either on the wire or after a decode."""
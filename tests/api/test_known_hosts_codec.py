@@ -3,6 +3,7 @@
 import pytest
 
 from sshpilot.api.models.known_hosts import (
+    FindKnownHostEntriesRequest,
     KnownHostEntryId,
     KnownHostEntrySummary,
     KnownHostsMutationResult,
@@ -10,6 +11,8 @@ from sshpilot.api.models.known_hosts import (
     RemoveKnownHostEntriesRequest,
 )
 from sshpilot.api.transport.codec import (
+    find_known_host_entries_request_from_wire,
+    find_known_host_entries_request_to_wire,
     known_host_entry_summary_from_wire,
     known_host_entry_summary_to_wire,
     known_hosts_mutation_result_from_wire,
@@ -73,6 +76,13 @@ def test_remove_request_round_trip():
     ) == request
 
 
+def test_find_request_round_trip():
+    request = FindKnownHostEntriesRequest(host="example.test", port=2222)
+    encoded = find_known_host_entries_request_to_wire(request)
+    assert encoded == {"host": "example.test", "port": 2222}
+    assert find_known_host_entries_request_from_wire(encoded) == request
+
+
 def test_mutation_result_round_trip():
     result = _mutation_result()
     assert known_hosts_mutation_result_from_wire(
@@ -122,6 +132,11 @@ def test_mutation_result_wire_shape():
         (remove_known_host_entries_request_from_wire, {"revision": "r"}),
         (remove_known_host_entries_request_from_wire, {"revision": "r", "entry_ids": {}}),
         (remove_known_host_entries_request_from_wire, {"revision": "r", "entry_ids": ["a", "a"]}),
+        (find_known_host_entries_request_from_wire, {"host": "h"}),
+        (find_known_host_entries_request_from_wire, {"host": "", "port": 22}),
+        (find_known_host_entries_request_from_wire, {"host": "a b", "port": 22}),
+        (find_known_host_entries_request_from_wire, {"host": "h", "port": 0}),
+        (find_known_host_entries_request_from_wire, {"host": "h", "port": True}),
         (known_hosts_mutation_result_from_wire, {"revision": "r", "removed_count": 1}),
         (known_hosts_mutation_result_from_wire, {"revision": "r", "removed_count": -1, "entries": []}),
         (known_hosts_mutation_result_from_wire, {"revision": "r", "removed_count": "1", "entries": []}),
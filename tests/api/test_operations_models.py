@@ -2,11 +2,15 @@ from datetime import datetime, timezone
 
 import pytest
 
-from sshpilot.api.models.common import ConnectionId, RequestId, SessionId
+from sshpilot.api.models.common import ConnectionId, ForwardId, RequestId, SessionId
 from sshpilot.api.models.operations import (
     FileEntryKind,
+    ForwardHealth,
+    ForwardHealthStatus,
     ForwardKind,
     ForwardState,
+    ForwardSummary,
+    ForwardType,
     ListDirectoryRequest,
     OperationKind,
     OperationState,
@@ -18,6 +22,7 @@ from sshpilot.api.models.operations import (
     SftpCopyRequest,
     SftpEntry,
 )
+from sshpilot.api.transport.codec import forward_summary_from_wire, forward_summary_to_wire
 
 
 def test_sftp_copy_request_is_typed_and_rejects_self_copy():
@@ -66,6 +71,40 @@ def test_port_forward_model_validates_ports():
         )
 
 
+def test_forward_health_round_trips_and_is_optional_on_the_wire():
+    health = ForwardHealth(
+        status=ForwardHealthStatus.DEGRADED,
+        probes=5,
+        failures=2,
+        consecutive_failures=2,
+        last_probe_at=datetime(2030, 1, 1, tzinfo=timezone.utc),
+        last_latency_ms=0.4,
+        latency_histogram=(3, 0, 0, 0, 0, 0, 0),
+        restarts=1,
+    )
+    summary = ForwardSummary(
+        id=ForwardId("forward-1"),
+        connection_id=ConnectionId("web"),
+        type=ForwardType.DYNAMIC,
+        state=ForwardState.ACTIVE,
+        bind_host="127.0.0.1",
+        bind_port=1080,
+        health=health,
+    )
+    wire = forward_summary_to_wire(summary)
+    assert forward_summary_from_wire(wire) == summary
+    # Daemons before API 0.45 send no health at all.
+    del wire["health"]
+    assert forward_summary_from_wire(wire).health is None
+
+
+def test_forward_health_rejects_inconsistent_counts():
+    with pytest.raises(ValueError):
+        ForwardHealth(probes=1, failures=2)
+    with pytest.raises(ValueError):
+        ForwardHealth(latency_histogram=(1, 2))
+
+
 def test_plugin_operation_has_explicit_public_arguments():
     request = PluginOperationRequest(
         request_id=RequestId("request-1"),
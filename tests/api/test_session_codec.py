@@ -4,6 +4,12 @@ from datetime import datetime, timezone
 import pytest
 
 from sshpilot.api.events import CoreEvent, EventType
+from sshpilot.api.models.daemon import (
+    ConnectionStartupPercentiles,
+    ControlMasterPrewarmStats,
+    SecretCacheStats,
+    StartupStagePercentiles,
+)
 from sshpilot.api.models.common import (
     AttachmentId,
     ClientId,
@@ -17,9 +23,12 @@ from sshpilot.api.models.sessions import (
     CloseSessionRequest,
     DetachSessionRequest,
     OpenSessionRequest,
+    PrewarmConnectionRequest,
+    PrewarmReason,
     SessionCapabilities,
     SessionExitInfo,
     SessionFailure,
+    SessionStartupTiming,
     SessionState,
     SessionSummary,
 )
@@ -30,12 +39,20 @@ from sshpilot.api.transport.codec import (
     attach_session_result_to_wire,
     close_session_request_from_wire,
     close_session_request_to_wire,
+    connection_startup_percentiles_from_wire,
+    connection_startup_percentiles_to_wire,
+    control_master_prewarm_stats_from_wire,
+    control_master_prewarm_stats_to_wire,
     detach_session_request_from_wire,
     detach_session_request_to_wire,
     open_session_request_from_wire,
     open_session_request_to_wire,
+    prewarm_connection_request_from_wire,
+    prewarm_connection_request_to_wire,
     public_event_from_envelope,
     public_event_to_envelope,
+    secret_cache_stats_from_wire,
+    secret_cache_stats_to_wire,
     session_summary_from_wire,
     session_summary_to_wire,
 )
@@ -86,6 +103,35 @@ def test_session_request_and_result_codecs_round_trip_strictly():
     ) == result
 
 
+def test_prewarm_request_and_stats_codecs_round_trip_strictly():
+    request = PrewarmConnectionRequest(ConnectionId("web"), PrewarmReason.HOVER)
+    encoded = prewarm_connection_request_to_wire(request)
+    assert encoded == {"connection_id": "web", "reason": "hover"}
+    assert prewarm_connection_request_from_wire(encoded) == request
+    with pytest.raises(ValueError):
+        prewarm_connection_request_from_wire({**encoded, "reason": "startup"})
+
+    stats = ControlMasterPrewarmStats(hits=3, misses=1, prewarmed_hits=2, prewarms_started=2)
+    wire = control_master_prewarm_stats_to_wire(stats)
+    assert wire["hit_rate"] == 0.75
+    assert control_master_prewarm_stats_from_wire(wire) == stats
+    with pytest.raises(ValueError):
+        control_master_prewarm_stats_from_wire({**wire, "hit_rate": 1.5})
+    with pytest.raises(ValueError):
+        ControlMasterPrewarmStats(hits=1, prewarmed_hits=2)
+
+
+def test_secret_cache_stats_codec_round_trips_strictly():
+    stats = SecretCacheStats(hits=6, misses=2, coalesced=2, entries=2, locked_entries=1)
+    wire = secret_cache_stats_to_wire(stats)
+    assert wire["hit_rate"] == 0.8
+    assert secret_cache_stats_from_wire(wire) == stats
+    with pytest.raises(ValueError):
+        secret_cache_stats_from_wire({**wire, "values": []})
+    with pytest.raises(ValueError):
+        SecretCacheStats(entries=1, locked_entries=2)
+
+
 def test_open_session_request_codec_round_trips_remote_command():
     request = OpenSessionRequest(
         connection_id=ConnectionId("test"),
@@ -127,11 +173,44 @@ def test_session_summary_codec_round_trip_includes_safe_failure_and_exit():
         "exit_info",
         "failure",
         "attachment_count",
+        "startup_timing",
     }
     assert "command" not in repr(encoded)
     assert "environment" not in repr(encoded)
 
 
+def test_session_startup_timing_and_percentiles_round_trip():
+    timing = SessionStartupTiming(
+        command_ready_ms=4.0,
+        spawned_ms=11.5,
+        first_output_ms=180.0,
+        authenticated_ms=420.0,
+        secret_lookup_ms=35.0,
+        askpass_ms=60.0,
+        askpass_requests=1,
+    )
+    summary = replace(_summary(), startup_timing=timing)
+    encoded = session_summary_to_wire(summary)
+    assert encoded["startup_timing"]["first_prompt_ms"] is None
+    assert session_summary_from_wire(encoded) == summary
+    # Peers from before startup timing omit the field.
+    del encoded["startup_timing"]
+    assert session_summary_from_wire(encoded).startup_timing is None
+
+    percentiles = ConnectionStartupPercentiles(
+        connection_id=ConnectionId("web"),
+        launches=3,
+        stages=(StartupStagePercentiles("first_prompt", 3, 600.0, 950.0, 950.0),),
+    )
+    wire = connection_startup_percentiles_to_wire(percentiles)
+    assert connection_startup_percentiles_from_wire(wire) == percentiles
+    bad_stage = {**wire["stages"][0], "p50_ms": 1000.0}
+    with pytest.raises(ValueError):
+        connection_startup_percentiles_from_wire({**wire, "stages": [bad_stage]})
+    with pytest.raises(ValueError):
+        SessionStartupTiming(spawned_ms=-1.0)
+
+
 def test_session_response_codec_rejects_malformed_session_id():
     encoded = session_summary_to_wire(_summary())
     encoded["id"] = ""
@@ -103,6 +103,7 @@ ALLOWED: frozenset[tuple[str, str, str]] = frozenset(
         ("key_utils.py", "keys", "SKIPPED_FILENAMES"),
         ("key_utils.py", "keys", "is_private_key"),
         ("key_utils.py", "keys", "looks_like_private_key"),
+        ("ssh_key_fingerprint.py", "keys", "fingerprint_public_key"),
         # -- terminal-output evidence classification --------------------
         ("terminal.py", "connection_evidence", "classify_connection_evidence"),
         # -- plugin contracts (shared language, NOT authoritative I/O) --
@@ -180,6 +181,10 @@ DAEMON_ALLOWLIST: frozenset[tuple[str, str]] = frozenset(
         # makedirs under a lax umask once blocked daemon launches with
         # unsafe_socket).
         ("ssh_multiplex.py", "ensure_private_runtime_directory"),
+        # Expiring masters speaks the mux protocol to each ControlPath with
+        # the same client the daemon's ownership survey uses, instead of
+        # forking ``ssh -O`` per socket. Only the daemon calls it.
+        ("ssh_multiplex.py", "ssh_mux"),
         # App-side daemon bootstrap / launch errors (frontend-owned boundary).
         ("main.py", "DaemonLauncher"),
         ("terminal_manager.py", "DaemonLauncher"),
@@ -12,6 +12,7 @@ from sshpilot.api.models.broadcast import (
 )
 from sshpilot.api.models.common import ConnectionId, utc_now
 from sshpilot.api.models.connections import ConnectionHealth, ConnectionSummary
+from sshpilot.api.models.daemon import ConnectionStartupPercentiles, StartupStagePercentiles
 from sshpilot.api.models.interactions import (
     ConfirmationPrompt,
     HostKeyPrompt,
@@ -166,6 +167,49 @@ def test_connection_list_and_alias_resolution():
     assert '"hostname": "demo.example"' in out.getvalue()
 
 
+def test_connection_list_filters_and_ranks_by_query_and_tag():
+    from sshpilot.api.models.connection_store import (
+        ConnectionMetadataSummary,
+        ConnectionStoreSnapshot,
+    )
+
+    client = FakeClient()
+    client.connections = [
+        ConnectionSummary(ConnectionId(name), name, name, f"{name}.example", "alice", 22)
+        for name in ("prod-web", "web", "db")
+    ]
+    client.get_connection_store_snapshot = lambda: ConnectionStoreSnapshot(
+        generation=1,
+        connections=tuple(client.connections),
+        groups=(),
+        root_connection_ids=tuple(item.id for item in client.connections),
+        metadata=(
+            ConnectionMetadataSummary(ConnectionId("db"), {"tags": ["Prod"]}),
+        ),
+    )
+
+    out = StringIO()
+    assert run(
+        ["connections", "list", "web"],
+        client_factory=lambda **_: client,
+        stdout=out,
+        stderr=StringIO(),
+    ) == 0
+    assert [line.split("\t")[0] for line in out.getvalue().splitlines()] == [
+        "web",
+        "prod-web",
+    ]
+
+    out = StringIO()
+    assert run(
+        ["connections", "list", "--tag", "prod"],
+        client_factory=lambda **_: client,
+        stdout=out,
+        stderr=StringIO(),
+    ) == 0
+    assert [line.split("\t")[0] for line in out.getvalue().splitlines()] == ["db"]
+
+
 def test_sessions_list_command_shape_is_supported():
     client = FakeClient()
     out, err = StringIO(), StringIO()
@@ -178,6 +222,42 @@ def test_sessions_list_command_shape_is_supported():
     assert out.getvalue().strip() == "[]"
 
 
+def test_sessions_timings_prints_one_line_per_connection_stage():
+    client = FakeClient()
+    client.get_daemon_diagnostics = lambda: type("Diagnostics", (), {
+        "session_startup": (
+            ConnectionStartupPercentiles(
+                ConnectionId("demo"),
+                4,
+                (
+                    StartupStagePercentiles("authenticated", 4, 310.0, 480.4, 502.0),
+                    StartupStagePercentiles("first_prompt", 3, 390.0, 610.0, 610.0),
+                ),
+            ),
+        ),
+    })()
+    out, err = StringIO(), StringIO()
+    assert run(
+        ["sessions", "timings"],
+        client_factory=lambda **_: client,
+        stdout=out,
+        stderr=err,
+    ) == 0
+    assert out.getvalue().splitlines() == [
+        "demo\tauthenticated\tsamples=4\tp50=310ms\tp90=480ms\tmax=502ms",
+        "demo\tfirst_prompt\tsamples=3\tp50=390ms\tp90=610ms\tmax=610ms",
+    ]
+
+    out = StringIO()
+    assert run(
+        ["sessions", "timings", "--json"],
+        client_factory=lambda **_: client,
+        stdout=out,
+        stderr=err,
+    ) == 0
+    assert '"connection_id": "demo"' in out.getvalue()
+
+
 def test_ambiguous_connection_is_usage_error():
     client = FakeClient()
     client.connections.append(
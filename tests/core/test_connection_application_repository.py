@@ -30,10 +30,13 @@ from sshpilot.api.models.connections import (  # noqa: E402
     ConnectionEditorDetails,
     ConnectionId,
     ConnectionMutationResult,
+    ConnectionUpdateItem,
     CreateConnectionRequest,
     DeleteConnectionRequest,
+    DeleteConnectionsRequest,
     SplitConnectionRequest,
     UpdateConnectionRequest,
+    UpdateConnectionsRequest,
 )
 from sshpilot.api.events import EventType  # noqa: E402
 
@@ -208,6 +211,48 @@ def test_delete_connection_routes(tmp_path):
     assert [c.id for c in service.list_connections()] == []
 
 
+def test_delete_connections_commits_once_and_reports_failed_items(tmp_path):
+    repo, root = _repo(
+        tmp_path,
+        "Host web\n    HostName example.com\n"
+        "Host db\n    HostName db.example.com\n"
+        "Host keep\n    HostName keep.example.com\n",
+    )
+    service = _service(repo)
+    seen = []
+    service.subscribe_events(lambda event: seen.append(event.type))
+    result = service.delete_connections(
+        DeleteConnectionsRequest(connection_ids=("web", "missing", "db"))
+    )
+    assert result.succeeded_ids == ("web", "db")
+    assert [item.connection_id for item in result.failed] == ["missing"]
+    assert result.failed[0].error_code == "connection_not_found"
+    assert [c.id for c in service.list_connections()] == ["keep"]
+    assert "Host web" not in root.read_text()
+    assert seen.count(EventType.CONNECTION_DELETED) == 2
+    assert seen.count(EventType.CONNECTION_STORE_CHANGED) == 1
+
+
+def test_update_connections_applies_every_item_in_one_commit(tmp_path):
+    repo, _root = _repo(
+        tmp_path,
+        "Host web\n    HostName example.com\n"
+        "Host db\n    HostName db.example.com\n",
+    )
+    service = _service(repo)
+    seen = []
+    service.subscribe_events(lambda event: seen.append(event.type))
+    result = service.update_connections(UpdateConnectionsRequest(items=(
+        ConnectionUpdateItem("web", UpdateConnectionRequest(port=2201)),
+        ConnectionUpdateItem("db", UpdateConnectionRequest(port=2202)),
+    )))
+    assert result.succeeded_ids == ("web", "db")
+    assert service.get_connection(ConnectionId("web")).port == 2201
+    assert service.get_connection(ConnectionId("db")).port == 2202
+    assert seen.count(EventType.CONNECTION_UPDATED) == 2
+    assert seen.count(EventType.CONNECTION_STORE_CHANGED) == 1
+
+
 def test_split_connection_routes(tmp_path):
     repo, root = _repo(
         tmp_path, "Host db jump\n    HostName=db.internal\n    User dbuser\n"
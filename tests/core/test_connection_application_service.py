@@ -547,7 +547,9 @@ def test_unsaved_host_omitted_port_does_not_override_ssh_config(monkeypatch):
     assert service.check_unsaved_host(
         UnsavedHostCheckRequest(hostname="alias", username="alice")
     ).saved is True
-    assert calls == [{"user": "alice", "port": None, "proxy_jump": None}]
+    assert calls == [
+        {**{"user": "alice", "port": None, "proxy_jump": None}, "fields": ssh_config_effective.NATIVE_EFFECTIVE_FIELDS}
+    ]
 
 
 def test_unsaved_host_explicit_default_port_overrides_ssh_config(monkeypatch):
@@ -566,7 +568,37 @@ def test_unsaved_host_explicit_default_port_overrides_ssh_config(monkeypatch):
     assert service.check_unsaved_host(
         UnsavedHostCheckRequest(hostname="alias", username="alice", port=22)
     ).saved is True
-    assert calls == [{"user": "alice", "port": 22, "proxy_jump": None}]
+    assert calls == [
+        {**{"user": "alice", "port": 22, "proxy_jump": None}, "fields": ssh_config_effective.NATIVE_EFFECTIVE_FIELDS}
+    ]
+
+
+def test_direct_ssh_endpoints_skip_proxies_from_the_effective_config(monkeypatch):
+    from sshpilot.core import ssh_config_effective
+
+    def fake_effective(host, *_args, **_kwargs):
+        return {
+            "behind-jump": {"proxyjump": "bastion"},
+            "behind-command": {"proxycommand": "nc %h %p"},
+            "jump-none": {"proxyjump": "none"},
+        }.get(host, {})
+
+    monkeypatch.setattr(ssh_config_effective, "get_effective_ssh_config", fake_effective)
+    repo = FakeRepository(
+        [
+            _record("direct", hostname="10.0.0.1"),
+            _record("behind-jump"),
+            _record("behind-command"),
+            _record("jump-none", port=2200),
+            _record("stored-jump", data={"proxy_jump": ["bastion"]}),
+        ]
+    )
+    service = ConnectionApplicationService(repo, client_name="test")
+
+    assert service.direct_ssh_endpoints() == (
+        ("direct", "10.0.0.1", 22),
+        ("jump-none", "example.com", 2200),
+    )
 
 
 def test_effective_config_uses_daemon_root_in_default_mode(
@@ -966,6 +966,26 @@ def test_reload_after_state_file_change(tmp_path):
     assert [c.id for c in after.connections] == ["tel"]
 
 
+def test_reload_with_unchanged_sources_skips_rebuild(tmp_path, monkeypatch):
+    repo, root, state, _ = _repo(
+        tmp_path, "Host web\n    HostName example.com\n"
+    )
+    rebuilt = []
+    original = ConnectionRepository._load_sources_locked
+
+    def _counting(self, *args, **kwargs):
+        rebuilt.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ConnectionRepository, "_load_sources_locked", _counting)
+    repo.reload()
+    assert rebuilt == []
+    root.write_text("Host web\n    HostName changed.example.com\n")
+    after = repo.reload()
+    assert rebuilt == [1]
+    assert after.connections[0].hostname == "changed.example.com"
+
+
 # ---------------------------------------------------------------------------
 # Listeners and threads
 # ---------------------------------------------------------------------------
@@ -1139,3 +1139,95 @@ def test_no_event_and_unchanged_generation_after_successful_rollback(tmp_path):
         _write_state(state, {"version": 1, "non_ssh_connections": [], "groups": {"groups": {}, "root_connections": []}, "metadata": {}})
     assert len(changes) == 0
     assert repo._generation == gen_before
+
+
+# ---------------------------------------------------------------------------
+# Bulk transactions
+# ---------------------------------------------------------------------------
+
+
+def _count_calls(monkeypatch, module, name):
+    calls = []
+    original = getattr(module, name)
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, counted)
+    return calls
+
+
+def test_transaction_coalesces_writes_and_events(tmp_path, monkeypatch):
+    import sshpilot.core.connections.repository as repo_mod
+    import sshpilot.core.connections.ssh_config_store as store_mod
+
+    repo, root, state = _repo(tmp_path, "Host web\n    HostName example.com\n")
+    events = []
+    repo.add_listener(events.append)
+    config_writes = _count_calls(monkeypatch, store_mod, "_atomic_write_text")
+    state_writes = _count_calls(monkeypatch, repo_mod, "write_identity_state_v2")
+
+    with repo.transaction():
+        for index in range(5):
+            repo.create_connection(
+                {"nickname": f"h{index}", "hostname": f"h{index}.example", "protocol": "ssh"}
+            )
+        repo.update_connection("web", {"hostname": "changed.example"})
+        repo.create_connection(
+            {"nickname": "local", "hostname": "l.example", "protocol": "sftp"}
+        )
+        # Reads inside the scope observe the staged changes.
+        assert repo.get_record("h4") is not None
+
+    assert len(config_writes) == 1
+    assert len(state_writes) == 1
+    assert len(events) == 1
+    assert events[0].before.generation == 0
+    assert events[0].after.generation == 1
+    text = root.read_text()
+    assert "Host h4" in text and "changed.example" in text
+    assert not (tmp_path / "connections.json.pending").exists()
+
+    reopened, _root, _state_path = _repo(tmp_path)
+    assert {c.id for c in reopened.snapshot().connections} == {
+        "web", "h0", "h1", "h2", "h3", "h4", "local",
+    }
+
+
+def test_transaction_exception_discards_all_changes(tmp_path):
+    repo, root, state = _repo(tmp_path, "Host web\n    HostName example.com\n")
+    before_root = root.read_bytes()
+    before_snapshot = repo.snapshot()
+    events = []
+    repo.add_listener(events.append)
+
+    with pytest.raises(RuntimeError):
+        with repo.transaction():
+            repo.create_connection(
+                {"nickname": "new", "hostname": "example.net", "protocol": "ssh"}
+            )
+            raise RuntimeError("abort")
+
+    assert root.read_bytes() == before_root
+    assert repo.snapshot() == before_snapshot
+    assert events == []
+
+
+def test_transaction_failed_item_rolls_back_only_itself(tmp_path):
+    repo, root, state = _repo(tmp_path, "Host web\n    HostName example.com\n")
+    with repo.transaction():
+        repo.create_connection(
+            {"nickname": "a", "hostname": "a.example", "protocol": "ssh"}
+        )
+        with pytest.raises(CoreError):
+            repo.create_connection(
+                {"nickname": "web", "hostname": "dup.example", "protocol": "ssh"}
+            )
+        repo.create_connection(
+            {"nickname": "b", "hostname": "b.example", "protocol": "ssh"}
+        )
+    text = root.read_text()
+    assert "Host a" in text and "Host b" in text
+    assert "dup.example" not in text
+    assert {c.id for c in repo.snapshot().connections} == {"web", "a", "b"}
@@ -58,7 +58,6 @@ DAEMON_DEBT: dict[tuple[str, str], str] = {
     ("daemon/connection_launch_provider.py", "sshpilot.plugins"): "M8",
     ("daemon/connection_secret_provider.py", "sshpilot.credential_model"): "M5",
     ("daemon/connection_secret_provider.py", "sshpilot.secret_storage"): "M5",
-    ("daemon/connection_secret_provider.py", "sshpilot.askpass_utils"): "M5",
     # The daemon secret service owns the selected backend through the existing
     # SecretManager (secret_storage) and reuses CredentialManager/credential
     # model for export/import. These stay M5 debt until the migration moves the
@@ -0,0 +1,126 @@
+"""In-process public-key fingerprints and the stat-keyed fingerprint cache."""
+from __future__ import annotations
+
+import base64
+import hashlib
+import os
+import struct
+import subprocess
+from pathlib import Path
+
+from sshpilot.core.keys import FingerprintCache, KeyService, fingerprint_public_key
+from sshpilot.core.keys import fingerprint as fingerprint_module
+
+
+def _string(value: bytes) -> bytes:
+    return struct.pack(">I", len(value)) + value
+
+
+def _ed25519_line(seed: int = 1, comment: str = "user@host") -> str:
+    blob = _string(b"ssh-ed25519") + _string(bytes([seed % 256]) * 32)
+    return f"ssh-ed25519 {base64.b64encode(blob).decode()} {comment}"
+
+
+def _rsa_blob(bits: int) -> bytes:
+    modulus = (1 << (bits - 1)) | 1
+    return (
+        _string(b"ssh-rsa")
+        + _string(b"\x01\x00\x01")
+        + _string(b"\x00" + modulus.to_bytes(bits // 8, "big"))
+    )
+
+
+def test_ed25519_line_matches_ssh_keygen_output_format():
+    line = _ed25519_line()
+    blob = base64.b64decode(line.split()[1])
+    result = fingerprint_public_key(line)
+    sha = base64.b64encode(hashlib.sha256(blob).digest()).decode().rstrip("=")
+    md5 = hashlib.md5(blob).hexdigest()
+    assert result.sha256 == f"SHA256:{sha}"
+    assert result.md5 == "MD5:" + ":".join(md5[i:i + 2] for i in range(0, 32, 2))
+    assert (result.key_type, result.bits, result.comment) == ("ED25519", 256, "user@host")
+    assert result.keygen_line() == f"256 SHA256:{sha} user@host (ED25519)"
+
+
+def test_rsa_bits_come_from_the_modulus():
+    encoded = base64.b64encode(_rsa_blob(3072)).decode()
+    result = fingerprint_public_key(f"ssh-rsa {encoded}")
+    assert (result.key_type, result.bits) == ("RSA", 3072)
+    assert result.keygen_line().endswith(" no comment (RSA)")
+
+
+def test_unparsed_blobs_keep_hashes_without_bits():
+    mismatched = base64.b64encode(_string(b"ssh-rsa") + _string(b"x")).decode()
+    result = fingerprint_public_key(f"ssh-ed25519 {mismatched}")
+    assert result.bits is None and not result.complete
+    assert result.sha256.startswith("SHA256:")
+    assert fingerprint_public_key("ssh-ed25519 not-base64!") is None
+    assert fingerprint_public_key("ssh-ed25519") is None
+    assert fingerprint_public_key(None) is None
+
+
+def test_cache_rereads_only_when_the_file_signature_changes(tmp_path, monkeypatch):
+    public = tmp_path / "id_ed25519.pub"
+    public.write_text(_ed25519_line(1) + "\n")
+    reads = []
+    real = fingerprint_module.fingerprint_public_key_file
+    monkeypatch.setattr(
+        fingerprint_module,
+        "fingerprint_public_key_file",
+        lambda path: reads.append(path) or real(path),
+    )
+    cache = FingerprintCache()
+    first = cache.lookup(public)
+    assert cache.lookup(public) == first
+    assert len(reads) == 1
+
+    public.write_text(_ed25519_line(2, comment="rotated key") + "\n")
+    second = cache.lookup(public)
+    assert second.comment == "rotated key"
+    assert second.sha256 != first.sha256
+    assert len(reads) == 2
+
+    public.unlink()
+    assert cache.lookup(public) is None
+
+
+def test_cache_persists_between_instances(tmp_path, monkeypatch):
+    public = tmp_path / "id_ed25519.pub"
+    public.write_text(_ed25519_line() + "\n")
+    (tmp_path / "broken.pub").write_text("not a key\n")
+    store = tmp_path / "state" / "key-fingerprints.json"
+    cache = FingerprintCache(store)
+    expected = cache.lookup(public)
+    assert cache.lookup(tmp_path / "broken.pub") is None
+    cache.save()
+
+    def no_reads(path):
+        raise AssertionError(f"{path} should have come from the cache")
+
+    monkeypatch.setattr(fingerprint_module, "fingerprint_public_key_file", no_reads)
+    reloaded = FingerprintCache(store)
+    assert reloaded.lookup(public) == expected
+    assert reloaded.lookup(tmp_path / "broken.pub") is None
+
+
+def test_key_service_fingerprint_runs_ssh_keygen_only_for_unparsed_keys(
+    tmp_path: Path, monkeypatch
+):
+    calls = []
+
+    def fake_run(argv, **kwargs):
+        calls.append(argv)
+        return subprocess.CompletedProcess(argv, 0, stdout="256 SHA256:cert c (ED25519-CERT)\n")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    (tmp_path / "id_ed25519").write_text("PRIVATE")
+    (tmp_path / "id_ed25519.pub").write_text(_ed25519_line() + "\n")
+    certificate = tmp_path / "id_ed25519-cert.pub"
+    certificate.write_text("ssh-ed25519-cert-v01@openssh.com AAAA cert\n")
+    service = KeyService(tmp_path)
+
+    line = service.fingerprint(str(tmp_path / "id_ed25519"))
+    assert line == fingerprint_public_key(_ed25519_line()).keygen_line()
+    assert calls == []
+    assert service.fingerprint(str(certificate)) == "256 SHA256:cert c (ED25519-CERT)"
+    assert calls == [["ssh-keygen", "-lf", os.fspath(certificate)]]
@@ -0,0 +1,114 @@
+"""Known-hosts host index: plain, port, wildcard, negated and hashed names."""
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+
+from sshpilot.core.known_hosts import KnownHostEntry, KnownHostsIndex, find_host_matches
+from sshpilot.core.known_hosts.document import (
+    parse_known_hosts_document,
+    remove_known_hosts_document_entries,
+)
+
+KEY = "ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIkey"
+
+
+def _hashed(name: str, salt: bytes = b"s" * 20) -> str:
+    digest = hmac.new(salt, name.encode(), hashlib.sha1).digest()
+    return f"|1|{base64.b64encode(salt).decode()}|{base64.b64encode(digest).decode()}"
+
+
+CONTENT = "\n".join(
+    [
+        "# managed by hand",
+        f"one.test,192.0.2.1 {KEY}",
+        f"[one.test]:2222 {KEY}",
+        f"someone.test {KEY}",
+        f"{_hashed('hidden.test')} {KEY}",
+        f"{_hashed('[hidden.test]:2200', salt=b't' * 20)} {KEY}",
+        f"*.corp.test,!build.corp.test {KEY}",
+        f"@cert-authority *.ca.test {KEY}",
+        "",
+    ]
+).encode()
+
+
+def _lines(entries):
+    return [entry.line_index for entry in entries]
+
+
+def test_plain_and_port_names_match_exactly():
+    index = KnownHostsIndex(parse_known_hosts_document(CONTENT))
+    assert _lines(index.lookup("one.test")) == [1]
+    assert _lines(index.lookup("ONE.test")) == [1]
+    assert _lines(index.lookup("192.0.2.1")) == [1]
+    assert _lines(index.lookup("one.test", 2222)) == [2]
+    # A substring of another host is not a match.
+    assert _lines(index.lookup("one")) == []
+    assert index.lookup("") == ()
+
+
+def test_hashed_names_are_verified_per_salt():
+    index = KnownHostsIndex(parse_known_hosts_document(CONTENT))
+    assert _lines(index.lookup("hidden.test")) == [4]
+    assert _lines(index.lookup("hidden.test", 2200)) == [5]
+    assert _lines(index.lookup("hidden.test", 2222)) == []
+
+
+def test_wildcards_negations_and_markers():
+    index = KnownHostsIndex(parse_known_hosts_document(CONTENT))
+    assert _lines(index.lookup("web.corp.test")) == [6]
+    assert _lines(index.lookup("build.corp.test")) == []
+    assert _lines(index.lookup("host.ca.test")) == [7]
+
+
+def test_find_host_matches_uses_the_same_rules():
+    entries = [KnownHostEntry.parse(line) for line in CONTENT.decode().splitlines()]
+    matches = find_host_matches(entries, "hidden.test")
+    assert [entry.line for entry in matches] == [entries[4].line]
+    assert [entry.hostname for entry in find_host_matches(entries, "one.test")] == [
+        "one.test,192.0.2.1"
+    ]
+    assert find_host_matches(entries, "build.corp.test") == []
+
+
+def test_removal_shifts_the_index_without_rebuilding():
+    document = parse_known_hosts_document(CONTENT)
+    index = KnownHostsIndex(document)
+    targets = index.lookup("one.test") + index.lookup("one.test", 2222)
+    content = remove_known_hosts_document_entries(
+        document, tuple(entry.entry_id for entry in targets)
+    )
+    updated = parse_known_hosts_document(content)
+    index.apply_removal(updated, [entry.line_index for entry in targets])
+    fresh = KnownHostsIndex(updated)
+
+    assert index.revision == updated.revision
+    for host, port in (
+        ("one.test", 22),
+        ("someone.test", 22),
+        ("hidden.test", 22),
+        ("hidden.test", 2200),
+        ("web.corp.test", 22),
+        ("host.ca.test", 22),
+    ):
+        assert index.lookup(host, port) == fresh.lookup(host, port)
+    assert _lines(index.lookup("someone.test")) == [1]
+
+
+def test_refresh_indexes_appended_lines_and_rebuilds_otherwise():
+    document = parse_known_hosts_document(CONTENT)
+    index = KnownHostsIndex(document)
+    assert index.refresh(document) is index
+    assert index.lookup("new.test") == ()
+
+    appended = parse_known_hosts_document(CONTENT + f"{_hashed('new.test')} {KEY}\n".encode())
+    assert index.refresh(appended) is index
+    assert _lines(index.lookup("new.test")) == [8]
+    assert index.lookup("one.test")[0].entry_id.startswith(appended.revision)
+
+    rewritten = parse_known_hosts_document(f"other.test {KEY}\n".encode())
+    rebuilt = index.refresh(rewritten)
+    assert rebuilt is not index
+    assert _lines(rebuilt.lookup("other.test")) == [0]
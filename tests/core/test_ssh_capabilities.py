@@ -0,0 +1,184 @@
+"""ssh/scp capability probes cached by binary signature and persisted."""
+from __future__ import annotations
+
+import os
+import threading
+
+import pytest
+
+from sshpilot.core import ssh_capabilities as module
+from sshpilot.core.ssh_capabilities import SshCapabilities, SshCapabilityRegistry
+
+
+class _Completed:
+    def __init__(self, returncode=0, stdout=b"", stderr=b""):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+class _FakeOpenSsh:
+    """subprocess.run stand-in answering the ssh and scp probes."""
+
+    def __init__(self, *, expand=True, legacy_flag=True):
+        self.calls = []
+        self.expand = expand
+        self.legacy_flag = legacy_flag
+        self.release = None
+
+    def __call__(self, cmd, **kwargs):
+        self.calls.append(tuple(cmd))
+        if self.release is not None:
+            self.release.wait(timeout=3.0)
+        if os.path.basename(cmd[0]) == "scp":
+            usage = b"usage: scp [-346ABCOpqRrsTv] source ... target\n"
+            if not self.legacy_flag:
+                usage = b"scp: unknown option -- O\n" + usage
+            return _Completed(returncode=1, stderr=usage)
+        if cmd[1] == "-V":
+            return _Completed(stderr=b"OpenSSH_9.6p1, OpenSSL 3.0.13\n")
+        open(cmd[cmd.index("-E") + 1], "wb").close()
+        template = cmd[cmd.index("-o") + 1].partition("=")[2]
+        control_path = template.replace("%C", "0f1e2d") if self.expand else template
+        return _Completed(stdout=f"user root\ncontrolpath {control_path}\n".encode())
+
+
+def _binary(tmp_path, name):
+    path = tmp_path / "bin" / name
+    path.parent.mkdir(exist_ok=True)
+    path.write_text("#!/bin/sh\n")
+    return str(path)
+
+
+@pytest.fixture
+def openssh(monkeypatch):
+    fake = _FakeOpenSsh()
+    monkeypatch.setattr(module.subprocess, "run", fake)
+    return fake
+
+
+def test_ssh_probe_reports_version_and_capabilities(tmp_path, openssh):
+    ssh = _binary(tmp_path, "ssh")
+    registry = SshCapabilityRegistry(probe_root=tmp_path)
+    result = registry.get(ssh)
+
+    assert result == SshCapabilities(
+        executable=ssh,
+        version="OpenSSH_9.6p1, OpenSSL 3.0.13",
+        config_dump=True,
+        error_log=True,
+        expands_control_path=True,
+    )
+    assert result.openssh_version == (9, 6)
+    assert registry.get(ssh) is result
+    assert len(openssh.calls) == 2
+    # The probe directory is removed afterwards.
+    assert [entry for entry in tmp_path.iterdir() if entry.name != "bin"] == []
+
+
+def test_unexpanded_control_path_and_scp_flag(tmp_path, openssh):
+    openssh.expand = False
+    openssh.legacy_flag = False
+    registry = SshCapabilityRegistry(probe_root=tmp_path)
+    assert registry.get(_binary(tmp_path, "ssh")).expands_control_path is False
+    scp = registry.get(_binary(tmp_path, "scp"))
+    assert scp.legacy_scp_protocol is False
+    assert scp.version == "unknown"
+
+    openssh.legacy_flag = True
+    assert SshCapabilityRegistry().get(_binary(tmp_path, "scp")).legacy_scp_protocol is True
+
+
+def test_a_changed_binary_is_probed_again(tmp_path, openssh):
+    ssh = _binary(tmp_path, "ssh")
+    registry = SshCapabilityRegistry(probe_root=tmp_path)
+    registry.get(ssh)
+    assert registry.peek(ssh) is not None
+
+    with open(ssh, "a") as handle:
+        handle.write("# upgraded\n")
+    assert registry.peek(ssh) is None
+    registry.get(ssh)
+    assert len(openssh.calls) == 4
+
+
+def test_results_persist_between_registries(tmp_path, openssh, monkeypatch):
+    ssh = _binary(tmp_path, "ssh")
+    store = tmp_path / "state" / "ssh-capabilities.json"
+    first = SshCapabilityRegistry(store, probe_root=tmp_path)
+    expected = first.get(ssh)
+    first.get(str(tmp_path / "bin" / "missing-ssh"))
+    assert store.exists()
+
+    monkeypatch.setattr(module.subprocess, "run", lambda *a, **k: pytest.fail("probed"))
+    reloaded = SshCapabilityRegistry(store)
+    assert reloaded.get(ssh) == expected
+    # A binary that was missing is not remembered.
+    assert reloaded.peek(str(tmp_path / "bin" / "missing-ssh")) is None
+
+    store.write_text("{not json")
+    assert SshCapabilityRegistry(store).peek(ssh) is None
+
+
+def test_lookups_by_name_resolve_through_path(tmp_path, openssh):
+    ssh = _binary(tmp_path, "ssh")
+    os.chmod(ssh, 0o755)
+    registry = SshCapabilityRegistry(probe_root=tmp_path)
+    environment = {"PATH": os.path.dirname(ssh)}
+    registry.warm(("ssh",), environment)
+    assert registry.peek(ssh) is not None
+    assert registry.get("ssh", environment).executable == ssh
+    assert len(openssh.calls) == 2
+
+
+def test_concurrent_lookups_share_one_probe(tmp_path, openssh):
+    ssh = _binary(tmp_path, "ssh")
+    registry = SshCapabilityRegistry(probe_root=tmp_path)
+    openssh.release = threading.Event()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get(ssh)))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    openssh.release.set()
+    for thread in threads:
+        thread.join(timeout=3.0)
+
+    assert len(results) == 6 and len(set(results)) == 1
+    assert len(openssh.calls) == 2
+
+
+def test_inconclusive_probes_are_retried_and_never_persisted(tmp_path, openssh, monkeypatch):
+    ssh = _binary(tmp_path, "ssh")
+    store = tmp_path / "state" / "ssh-capabilities.json"
+    now = [100.0]
+    registry = SshCapabilityRegistry(
+        store, probe_root=tmp_path, retry_after=30.0, monotonic=lambda: now[0]
+    )
+
+    def timed_out(cmd, **kwargs):
+        if cmd[1] == "-V":
+            return openssh(cmd, **kwargs)
+        raise module.subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+    monkeypatch.setattr(module.subprocess, "run", timed_out)
+    assert registry.get(ssh).config_dump is False
+    assert registry.get(ssh).config_dump is False
+    assert len(openssh.calls) == 1
+    assert not store.exists()
+
+    monkeypatch.setattr(module.subprocess, "run", openssh)
+    now[0] += 30.0
+    assert registry.peek(ssh) is None
+    assert registry.get(ssh).config_dump is True
+    assert SshCapabilityRegistry(store).peek(ssh).config_dump is True
+
+
+def test_a_clean_unknown_option_answer_is_definitive(tmp_path, openssh):
+    openssh.legacy_flag = False
+    scp = _binary(tmp_path, "scp")
+    store = tmp_path / "state" / "ssh-capabilities.json"
+    SshCapabilityRegistry(store).get(scp)
+    assert SshCapabilityRegistry(store).peek(scp).legacy_scp_protocol is False
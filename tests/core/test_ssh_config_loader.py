@@ -1,9 +1,11 @@
 """Headless SSH config loader tests (golden fixtures from Task 0)."""
 
+import os
 from pathlib import Path
 
 import pytest
 
+from sshpilot.core.connections import ssh_config_loader
 from sshpilot.core.connections.ssh_config_loader import (
     load_ssh_configuration,
 )
@@ -382,3 +384,64 @@ def test_revision_is_deterministic_across_configs(tmp_path):
     # Same bytes on disk must hash identically regardless of access time.
     result2 = load_ssh_configuration(path, isolated=False)
     assert result.root_revision == result2.root_revision
+
+
+# ---------------------------------------------------------------------------
+# Per-file parse cache
+# ---------------------------------------------------------------------------
+def _age(path, seconds=60):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def test_unchanged_includes_are_not_reparsed(tmp_path, monkeypatch):
+    (tmp_path / "frag").mkdir()
+    for name in ("a", "b", "c"):
+        fragment = tmp_path / "frag" / f"{name}.conf"
+        fragment.write_text(f"Host {name}\n    HostName {name}.example.com\n", encoding="utf-8")
+    root = tmp_path / "config"
+    root.write_text("Include frag/*.conf\n", encoding="utf-8")
+    for path in [root, *(tmp_path / "frag").iterdir()]:
+        _age(path)
+    first = load_ssh_configuration(root, isolated=False)
+
+    parsed = []
+    original = ssh_config_loader.SSHConfigDocument.parse_text
+
+    def _counting(text, path=None):
+        parsed.append(Path(path).name)
+        return original(text, path=path)
+
+    monkeypatch.setattr(ssh_config_loader.SSHConfigDocument, "parse_text", _counting)
+    b_conf = tmp_path / "frag" / "b.conf"
+    b_conf.write_text("Host b\n    HostName b.example.com\n    Port 2222\n", encoding="utf-8")
+    second = load_ssh_configuration(root, isolated=False)
+
+    assert parsed == ["b.conf"]
+    assert second.changed_source_paths(first) == {str(b_conf.resolve())}
+    assert _by_id(second, "b").port == 2222
+    assert second.root_revision != first.root_revision
+
+
+def test_cached_revision_matches_uncached_formula(tmp_path):
+    root = tmp_path / "config"
+    root.write_text("Host a\n    HostName a.example.com\n", encoding="utf-8")
+    _age(root)
+    cached = load_ssh_configuration(root, isolated=False)
+    ssh_config_loader._FILE_CACHE.clear()
+    fresh = load_ssh_configuration(root, isolated=False)
+    assert cached.root_revision == fresh.root_revision
+    assert cached.file_revisions == fresh.file_revisions
+    assert fresh.changed_source_paths(cached) == frozenset()
+
+
+def test_same_size_rewrite_within_racy_window_is_detected(tmp_path):
+    root = tmp_path / "config"
+    root.write_text("Host a\n    HostName a.example.com\n", encoding="utf-8")
+    before = load_ssh_configuration(root, isolated=False)
+    st = root.stat()
+    root.write_text("Host b\n    HostName b.example.com\n", encoding="utf-8")
+    os.utime(root, ns=(st.st_atime_ns, st.st_mtime_ns))
+    after = load_ssh_configuration(root, isolated=False)
+    assert _ids(after) == ["b"]
+    assert after.root_revision != before.root_revision
@@ -71,6 +71,18 @@ def test_config_file_setting(tmp_path):
     assert settings.config_file == "~/.ssh/custom"
 
 
+def test_forward_health_probes_are_opt_in(tmp_path):
+    assert _settings(tmp_path).forward_health_probes is False
+    settings = _settings(tmp_path, payload={"daemon.forward_health_probes": True})
+    assert settings.forward_health_probes is True
+
+
+def test_forward_health_restart_is_opt_in(tmp_path):
+    assert _settings(tmp_path).forward_health_restart is False
+    settings = _settings(tmp_path, payload={"daemon.forward_health_restart": True})
+    assert settings.forward_health_restart is True
+
+
 def test_settings_module_never_imports_config_or_gi():
     source = Path("src/sshpilot/daemon/bootstrap_settings.py").read_text(
         encoding="utf-8"
@@ -0,0 +1,342 @@
+"""Usage-driven ControlPersist and speculative ControlMaster prewarms."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import threading
+import time
+
+import pytest
+
+from sshpilot.api.models.common import ConnectionId
+from sshpilot.api.models.sessions import PrewarmReason
+from sshpilot.core.ssh_capabilities import SshCapabilities
+from sshpilot.daemon import control_master_prewarm as prewarm
+from sshpilot.daemon.control_master_prewarm import (
+    ControlMasterPrewarmer,
+    HostUsageModel,
+    persist_for_score,
+    resolve_control_path,
+    with_control_persist,
+)
+from sshpilot.daemon.control_masters import MasterState
+
+NOON = 1_760_000_000.0  # any fixed instant; buckets follow its local hour
+WEB = ConnectionId("web")
+DB = ConnectionId("db")
+
+
+class _Process:
+    def __init__(self, returncode=0, release=None):
+        self.pid = 424242
+        self.returncode = returncode
+        self._release = release
+
+    def wait(self, timeout=None):
+        if self._release is not None:
+            self._release.wait(5)
+        return self.returncode
+
+    def kill(self):
+        pass
+
+
+class _Masters:
+    """ControlPaths the fake ``ssh`` has brought up."""
+
+    def __init__(self):
+        self.live = set()
+
+    def state(self, path):
+        return MasterState.LIVE if path in self.live else MasterState.ABSENT
+
+    def identity(self, path):
+        return (0, hash(path)) if path in self.live else None
+
+
+@pytest.fixture
+def masters(monkeypatch):
+    masters = _Masters()
+    monkeypatch.setattr(prewarm, "_master_state", masters.state)
+    monkeypatch.setattr(prewarm, "_socket_identity", masters.identity)
+    return masters
+
+
+def _drain(scheduler):
+    deadline = time.monotonic() + 5
+    while scheduler._in_flight and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def _settle(scheduler):
+    """Wait for the launch worker to finish what was noted so far."""
+    scheduler._launch_pool.submit(lambda: None).result(timeout=5)
+
+
+def _resolved(scheduler, *connection_ids):
+    """Cache ControlPaths as earlier launches of the same argv would have."""
+    for connection_id in connection_ids:
+        scheduler._control_path(connection_id, ("ssh", str(connection_id)), {})
+    return scheduler
+
+
+def _prewarmer(masters, *, usage=None, returncode=0, release=None, **kwargs):
+    spawned = []
+
+    def popen(argv, **_kwargs):
+        spawned.append(argv)
+        if returncode == 0:
+            masters.live.add(f"/cm/{argv[-2]}")
+        return _Process(returncode, release)
+
+    kwargs.setdefault("path_resolver", lambda argv, _env: f"/cm/{argv[1]}")
+    scheduler = ControlMasterPrewarmer(
+        lambda connection_id: (("ssh", str(connection_id), "true"), {}),
+        usage=usage or HostUsageModel(),
+        popen=popen,
+        clock=lambda: NOON,
+        **kwargs,
+    )
+    scheduler.spawned = spawned
+    return scheduler
+
+
+def test_score_counts_this_hour_and_half_of_its_neighbours():
+    usage = HostUsageModel(half_life=1e12)
+    usage.record(WEB, NOON)
+    usage.record(WEB, NOON + 3600)
+    usage.record(WEB, NOON + 5 * 3600)
+
+    assert usage.score(WEB, NOON) == pytest.approx(1.5)
+    assert usage.total(WEB, NOON) == pytest.approx(3.0)
+    assert usage.score(DB, NOON) == 0.0
+
+
+def test_usage_decays_by_half_per_half_life():
+    usage = HostUsageModel(half_life=3600.0)
+    for _ in range(4):
+        usage.record(WEB, NOON)
+
+    assert usage.score(WEB, NOON + 24 * 3600) == pytest.approx(4.0 / 2 ** 24)
+
+
+def test_usage_survives_a_restart_and_ignores_damage(tmp_path):
+    path = tmp_path / "usage.json"
+    usage = HostUsageModel(path)
+    usage.record(WEB, NOON)
+    usage.save()
+
+    assert HostUsageModel(path).score(WEB, NOON) == pytest.approx(1.0)
+
+    payload = json.loads(path.read_text())
+    payload["connections"]["db"] = {"as_of": NOON, "hours": [1.0]}
+    path.write_text(json.dumps(payload))
+    reloaded = HostUsageModel(path)
+    assert reloaded.score(DB, NOON) == 0.0
+    assert reloaded.score(WEB, NOON) == pytest.approx(1.0)
+
+    path.write_text("{not json")
+    assert HostUsageModel(path).score(WEB, NOON) == 0.0
+
+
+def test_the_least_used_connection_is_forgotten_first():
+    usage = HostUsageModel(max_connections=2)
+    usage.record(WEB, NOON)
+    usage.record(WEB, NOON)
+    usage.record(DB, NOON)
+    usage.record(ConnectionId("new"), NOON)
+
+    assert usage.total(DB, NOON) == 0.0
+    assert usage.total(WEB, NOON) == pytest.approx(2.0)
+
+
+def test_hot_hosts_keep_their_master_longer():
+    assert persist_for_score(0.0) is None
+    assert persist_for_score(0.5) == 300
+    assert persist_for_score(2.5) == 900
+    assert persist_for_score(40.0) == 1800
+
+    argv = ("ssh", "-o", "ControlMaster=auto", "-o", "ControlPersist=60", "web")
+    assert with_control_persist(argv, 900) == (
+        "ssh", "-o", "ControlMaster=auto", "-o", "ControlPersist=900", "web",
+    )
+    # Never shortened, and a user's "yes"/"no" is left alone.
+    assert with_control_persist(argv, 30) == argv
+    custom = ("ssh", "-o", "ControlPersist=yes", "web")
+    assert with_control_persist(custom, 900) == custom
+
+
+def test_control_path_is_not_resolved_for_scp(monkeypatch):
+    monkeypatch.setattr(subprocess, "run", lambda *_a, **_k: pytest.fail("ssh -G ran"))
+    assert resolve_control_path(("scp", "-o", "ControlMaster=auto", "a", "b"), {}) is None
+
+
+def test_control_path_is_not_resolved_by_an_ssh_that_cannot_expand_it(monkeypatch):
+    class _Capabilities:
+        def get(self, executable, env):
+            return SshCapabilities(executable=executable, config_dump=True)
+
+    monkeypatch.setattr(subprocess, "run", lambda *_a, **_k: pytest.fail("ssh -G ran"))
+    argv = ("ssh", "-o", "ControlMaster=auto", "web")
+    assert resolve_control_path(argv, {}, capabilities=_Capabilities()) is None
+
+
+def test_launches_count_hits_misses_and_usage(masters):
+    scheduler = _resolved(_prewarmer(masters), WEB, DB)
+    masters.live.add("/cm/web")
+    scheduler.note_launch(WEB, ("ssh", "web"), {})
+    scheduler.note_launch(DB, ("ssh", "db"), {})
+    scheduler.close()
+
+    stats = scheduler.stats()
+    assert (stats.hits, stats.misses, stats.prewarmed_hits) == (1, 1, 0)
+    assert stats.hit_rate == pytest.approx(0.5)
+    assert scheduler.persist_for(WEB) == 300
+
+
+def test_prewarms_wait_until_started():
+    scheduler = _prewarmer(_Masters())
+    scheduler._usage.record(WEB, NOON)
+    try:
+        assert scheduler.request_prewarm(WEB, PrewarmReason.SELECTION) is False
+    finally:
+        scheduler.close()
+    assert scheduler.spawned == []
+
+
+def test_cold_hosts_are_not_prewarmed(masters):
+    scheduler = _prewarmer(masters)
+    scheduler.start()
+    try:
+        assert scheduler.request_prewarm(WEB, PrewarmReason.SELECTION) is False
+        scheduler._usage.record(WEB, NOON - 6 * 3600)
+        assert scheduler.request_prewarm(WEB, PrewarmReason.HOVER) is False
+    finally:
+        scheduler.close()
+    assert scheduler.spawned == []
+
+
+def test_prewarmed_master_is_credited_to_the_next_launch(masters):
+    usage = HostUsageModel()
+    usage.record(WEB, NOON)
+    scheduler = _resolved(_prewarmer(masters, usage=usage), WEB)
+    scheduler.start()
+    assert scheduler.request_prewarm(WEB, PrewarmReason.HOVER) is True
+    _drain(scheduler)
+    # Cooldown: an immediate second hover is not acted on.
+    assert scheduler.request_prewarm(WEB, PrewarmReason.HOVER) is False
+    scheduler.note_launch(WEB, ("ssh", "web"), {})
+    scheduler.close()
+
+    assert scheduler.spawned == [["ssh", "web", "true"]]
+    stats = scheduler.stats()
+    assert (stats.prewarms_started, stats.prewarms_succeeded) == (1, 1)
+    assert (stats.hits, stats.prewarmed_hits, stats.prewarms_skipped) == (1, 1, 1)
+
+
+def test_live_masters_and_failures_are_counted(masters):
+    usage = HostUsageModel()
+    usage.record(WEB, NOON)
+    usage.record(DB, NOON)
+    masters.live.add("/cm/db")
+    scheduler = _prewarmer(masters, usage=usage, returncode=255)
+    scheduler.start()
+    assert scheduler.request_prewarm(WEB, PrewarmReason.SELECTION) is True
+    assert scheduler.request_prewarm(DB, PrewarmReason.SELECTION) is True
+    _drain(scheduler)
+    scheduler.close()
+
+    stats = scheduler.stats()
+    assert scheduler.spawned == [["ssh", "web", "true"]]
+    assert (stats.prewarms_failed, stats.prewarms_skipped) == (1, 1)
+
+
+def test_requests_beyond_the_cap_are_dropped(masters):
+    usage = HostUsageModel()
+    usage.record(WEB, NOON)
+    usage.record(DB, NOON)
+    release = threading.Event()
+    scheduler = _prewarmer(masters, usage=usage, release=release, max_concurrent=1)
+    scheduler.start()
+    try:
+        assert scheduler.request_prewarm(WEB, PrewarmReason.SELECTION) is True
+        assert scheduler.request_prewarm(DB, PrewarmReason.SELECTION) is False
+    finally:
+        release.set()
+        scheduler.close()
+    assert scheduler.stats().prewarms_skipped == 1
+
+
+def test_launch_is_classified_before_its_own_master_comes_up(masters):
+    scheduler = _resolved(_prewarmer(masters), WEB)
+    release = threading.Event()
+    scheduler._launch_pool.submit(release.wait, 5)
+    scheduler.note_launch(WEB, ("ssh", "web"), {})
+    # The launch spawns after note_launch returns and builds its master
+    # before the worker gets to probe.
+    masters.live.add("/cm/web")
+    release.set()
+    try:
+        _settle(scheduler)
+        stats = scheduler.stats()
+        assert (stats.hits, stats.misses) == (0, 1)
+    finally:
+        scheduler.close()
+
+
+def test_launches_never_resolve_or_probe_on_the_callers_thread(masters):
+    callers = []
+
+    def resolver(argv, _env):
+        callers.append(threading.current_thread())
+        return f"/cm/{argv[1]}"
+
+    scheduler = _prewarmer(masters, path_resolver=resolver)
+    try:
+        scheduler.note_launch(WEB, ("ssh", "web"), {})
+        _settle(scheduler)
+        # The first launch of a command line only resolves its ControlPath.
+        assert (scheduler.stats().hits, scheduler.stats().misses) == (0, 0)
+        masters.live.add("/cm/web")
+        scheduler.note_launch(WEB, ("ssh", "web"), {})
+        _settle(scheduler)
+        assert scheduler.stats().hits == 1
+    finally:
+        scheduler.close()
+    assert callers and threading.current_thread() not in callers
+
+
+def test_usage_is_saved_at_most_once_per_interval_and_on_close(masters, tmp_path):
+    path = tmp_path / "usage.json"
+    now = [NOON]
+    scheduler = ControlMasterPrewarmer(
+        lambda connection_id: (("ssh", str(connection_id), "true"), {}),
+        usage=HostUsageModel(path),
+        path_resolver=lambda argv, _env: None,
+        clock=lambda: now[0],
+        save_interval=60.0,
+    )
+    scheduler.note_launch(WEB, ("ssh", "web"), {})
+    _settle(scheduler)
+    assert not path.exists()
+    now[0] += 61
+    scheduler.note_launch(WEB, ("ssh", "web"), {})
+    _settle(scheduler)
+    assert set(json.loads(path.read_text())["connections"]) == {"web"}
+    scheduler.note_launch(DB, ("ssh", "db"), {})
+    _settle(scheduler)
+    assert set(json.loads(path.read_text())["connections"]) == {"web"}
+    scheduler.close()
+    assert set(json.loads(path.read_text())["connections"]) == {"web", "db"}
+
+
+def test_forgotten_connections_lose_their_usage(masters):
+    scheduler = _prewarmer(masters)
+    scheduler.note_launch(WEB, ("ssh", "web"), {})
+    scheduler.forget(WEB)
+    try:
+        assert scheduler._usage.total(WEB, NOON) == 0.0
+        assert scheduler.persist_for(WEB) is None
+    finally:
+        scheduler.close()
@@ -0,0 +1,294 @@
+"""Shared-selector health probes for active local and dynamic forwards."""
+
+from __future__ import annotations
+
+import functools
+import socket
+import threading
+import time
+
+from sshpilot.api.models.common import ClientId, ConnectionId
+from sshpilot.api.models.operations import (
+    ForwardHealthStatus,
+    ForwardState,
+    ForwardType,
+    OpenForwardRequest,
+)
+from sshpilot.daemon.forward_health import ForwardHealthMonitor
+from sshpilot.daemon.forward_runtime import ForwardRuntime
+from tests.daemon.test_forward_runtime import (
+    _CoreClient,
+    _FakeForwardRunner,
+    _free_port,
+    _wait_for_state,
+)
+
+
+class _Listener:
+    """Accepts on loopback and answers like an ssh forward would.
+
+    ``mode`` is ``"hold"`` (channel opened, destination silent),
+    ``"banner"`` (destination greets first), ``"refuse"`` (channel refused:
+    close at once), ``"socks"`` (SOCKS5 replies, then the destination greets)
+    or ``"socks-refuse"`` (SOCKS5 replies, then the channel is refused).
+    """
+
+    def __init__(self, mode, port=0):
+        self.mode = mode
+        self._server = socket.socket()
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        deadline = time.monotonic() + 2.0
+        while True:
+            try:
+                self._server.bind(("127.0.0.1", port))
+                break
+            except OSError:
+                # A refused probe's socket may still be in FIN_WAIT_2.
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.02)
+        self._server.listen(64)
+        self._held = []
+        self.requests = []
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    @property
+    def address(self):
+        return socket.AF_INET, self._server.getsockname()
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return
+            if self.mode == "refuse":
+                connection.close()
+                continue
+            if self.mode.startswith("socks"):
+                if connection.recv(3) != b"\x05\x01\x00":
+                    connection.close()
+                    continue
+                # Like OpenSSH, answer CONNECT before the channel is confirmed.
+                connection.sendall(b"\x05\x00")
+                self.requests.append(connection.recv(262))
+                connection.sendall(b"\x05\x00\x00\x01\x7f\x00\x00\x01\x00\x00")
+                if self.mode == "socks-refuse":
+                    connection.close()
+                    continue
+            if self.mode in ("banner", "socks"):
+                connection.sendall(b"SSH-2.0-OpenSSH_9.6\r\n")
+            self._held.append(connection)
+
+    def close(self):
+        # shutdown() wakes the blocked accept() so the port is released.
+        try:
+            self._server.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._server.close()
+        self._thread.join(timeout=1.0)
+        for connection in self._held:
+            connection.close()
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return
+        time.sleep(0.01)
+    assert predicate()
+
+
+def _monitor(**options):
+    options.setdefault("interval_seconds", 0.05)
+    options.setdefault("timeout_seconds", 1.0)
+    return ForwardHealthMonitor(**options)
+
+
+def test_socks_connect_marks_a_dynamic_forward_healthy_with_a_latency_sample():
+    listener = _Listener("socks")
+    monitor = _monitor(socks_probe_destination=("db.internal", 5432))
+    try:
+        monitor.track("fwd", ForwardType.DYNAMIC, listener.address)
+        _wait_for(lambda: monitor.health("fwd").probes >= 2)
+        health = monitor.health("fwd")
+        assert health.status is ForwardHealthStatus.HEALTHY
+        assert health.failures == 0
+        assert health.last_latency_ms is not None
+        assert sum(health.latency_histogram) == health.probes
+        assert listener.requests[0] == b"\x05\x01\x00\x03\x0bdb.internal\x15\x38"
+    finally:
+        monitor.close()
+        listener.close()
+
+
+def test_a_socks_reply_without_destination_data_is_not_healthy():
+    # ssh answers both SOCKS replies locally; a refused channel only shows
+    # up afterwards as EOF, and a stalled transport as silence.
+    for mode in ("socks-refuse", "hold"):
+        listener = _Listener(mode)
+        monitor = _monitor(timeout_seconds=0.2)
+        try:
+            monitor.track("fwd", ForwardType.DYNAMIC, listener.address)
+            _wait_for(lambda: monitor.health("fwd").probes >= 2)
+            health = monitor.health("fwd")
+            assert health.status is ForwardHealthStatus.DEGRADED
+            assert sum(health.latency_histogram) == 0
+        finally:
+            monitor.close()
+            listener.close()
+
+
+def test_a_silent_local_destination_is_inconclusive():
+    listener = _Listener("hold")
+    monitor = _monitor(timeout_seconds=0.1)
+    try:
+        monitor.track("fwd", ForwardType.LOCAL, listener.address)
+        _wait_for(lambda: monitor.health("fwd").probes >= 2)
+        health = monitor.health("fwd")
+        assert health.status is ForwardHealthStatus.UNKNOWN
+        assert health.failures == 0
+        assert health.last_latency_ms is None
+    finally:
+        monitor.close()
+        listener.close()
+
+
+def test_refused_channels_degrade_a_local_forward_until_it_recovers():
+    changes = []
+    listener = _Listener("refuse")
+    port = listener.address[1][1]
+    monitor = _monitor(on_change=lambda key, health: changes.append(health.status))
+    try:
+        monitor.track("fwd", ForwardType.LOCAL, listener.address)
+        _wait_for(lambda: monitor.health("fwd").status is ForwardHealthStatus.DEGRADED)
+        health = monitor.health("fwd")
+        assert health.consecutive_failures >= 2
+        assert sum(health.latency_histogram) == 0
+        listener.close()
+        listener = _Listener("banner", port)
+        _wait_for(lambda: monitor.health("fwd").status is ForwardHealthStatus.HEALTHY)
+        assert changes == [ForwardHealthStatus.DEGRADED, ForwardHealthStatus.HEALTHY]
+        assert monitor.health("fwd").consecutive_failures == 0
+    finally:
+        monitor.close()
+        listener.close()
+
+
+def test_probes_in_flight_stay_within_the_budget():
+    listener = _Listener("hold")
+    # Every forward is due at once; each local probe holds its socket until
+    # it times out waiting for the silent destination.
+    monitor = _monitor(
+        interval_seconds=30.0,
+        timeout_seconds=0.2,
+        max_in_flight=4,
+        random_fraction=lambda: 0.0,
+    )
+    keys = [f"fwd-{index}" for index in range(20)]
+    try:
+        for key in keys:
+            monitor.track(key, ForwardType.LOCAL, listener.address)
+        time.sleep(0.3)
+        assert sum(monitor.health(key).probes for key in keys) <= 8
+        _wait_for(lambda: all(monitor.health(key).probes == 1 for key in keys))
+    finally:
+        monitor.close()
+        listener.close()
+
+
+def test_degraded_forwards_are_restarted_on_a_growing_backoff():
+    restarts = []
+    listener = _Listener("refuse")
+    monitor = _monitor(
+        degraded_after=1,
+        restart=lambda key: restarts.append(time.monotonic()),
+        restart_backoff_seconds=0.1,
+        restart_backoff_max_seconds=0.4,
+    )
+    try:
+        monitor.track("fwd", ForwardType.LOCAL, listener.address)
+        _wait_for(lambda: len(restarts) >= 3)
+        assert restarts[2] - restarts[1] > restarts[1] - restarts[0]
+        assert monitor.health("fwd").restarts >= 3
+        monitor.untrack("fwd")
+        assert monitor.health("fwd") is None
+    finally:
+        monitor.close()
+        listener.close()
+
+
+def test_runtime_reports_health_and_restarts_a_degraded_forward():
+    runner = _FakeForwardRunner()
+    runtime = ForwardRuntime(
+        _CoreClient(),
+        runner=runner,
+        active_timeout_seconds=3.0,
+        forward_health_probes=True,
+        health_monitor_factory=functools.partial(
+            _monitor,
+            degraded_after=1,
+            restart_backoff_seconds=0.05,
+        ),
+        restart_degraded_forwards=True,
+    )
+    port = _free_port()
+    summary = runtime.prepare_open_forward(
+        OpenForwardRequest(
+            connection_id=ConnectionId("demo"),
+            type=ForwardType.LOCAL,
+            bind_host="127.0.0.1",
+            bind_port=port,
+            destination_host="internal.test",
+            destination_port=80,
+        ),
+        client_id=ClientId("client:owner"),
+    )
+    assert summary.health is None
+    runtime.start_forward(summary.id)
+    listener = _Listener("refuse", port)
+    try:
+        _wait_for_state(runtime, summary.id, ForwardState.ACTIVE)
+        _wait_for(lambda: len(runner.handles) >= 2)
+        # The retired process exited, yet the forward never left ACTIVE.
+        assert runner.handles[0].terminated == 1
+        forward = runtime.get_forward(summary.id)
+        assert forward.state is ForwardState.ACTIVE
+        assert forward.health.restarts >= 1
+        assert forward.health.status is ForwardHealthStatus.DEGRADED
+    finally:
+        runtime.shutdown()
+        listener.close()
+
+
+def test_runtime_does_not_probe_unless_enabled():
+    def refuse(**_options):
+        raise AssertionError("monitor built")
+
+    runtime = ForwardRuntime(
+        _CoreClient(),
+        runner=_FakeForwardRunner(),
+        active_timeout_seconds=3.0,
+        health_monitor_factory=refuse,
+    )
+    port = _free_port()
+    summary = runtime.prepare_open_forward(
+        OpenForwardRequest(
+            connection_id=ConnectionId("demo"),
+            type=ForwardType.DYNAMIC,
+            bind_host="127.0.0.1",
+            bind_port=port,
+        ),
+        client_id=ClientId("client:owner"),
+    )
+    runtime.start_forward(summary.id)
+    listener = _Listener("socks", port)
+    try:
+        _wait_for_state(runtime, summary.id, ForwardState.ACTIVE)
+        assert runtime.get_forward(summary.id).health is None
+    finally:
+        runtime.shutdown()
+        listener.close()
@@ -1,6 +1,9 @@
 """Minimal lifecycle coverage for ForwardRuntime with a mocked process runner."""
 
+import os
+import socket
 import threading
+import time
 
 import pytest
 
@@ -12,6 +15,7 @@ from sshpilot.api.models.operations import (
     ForwardType,
     OpenForwardRequest,
 )
+from sshpilot.daemon.forward_readiness import ForwardReadinessWatcher
 from sshpilot.daemon.forward_runtime import ForwardRuntime
 
 
@@ -64,12 +68,18 @@ class _FakeForwardHandle:
 
 
 class _FakeForwardRunner:
-    def __init__(self):
+    def __init__(self, with_stream=False):
         self.handles = []
         self.closed = False
+        self.with_stream = with_stream
+        self.stream_writers = []
 
     def start(self, spec, on_exit):
         handle = _FakeForwardHandle(on_exit)
+        if self.with_stream:
+            read_fd, write_fd = os.pipe()
+            handle.readiness_stream = os.fdopen(read_fd, "rb", buffering=0)
+            self.stream_writers.append(write_fd)
         self.handles.append(handle)
         return handle
 
@@ -83,17 +93,34 @@ def _make_runtime():
     return runtime, runner
 
 
-def _open_request():
+def _open_request(forward_type=ForwardType.REMOTE, bind_port=2222):
     return OpenForwardRequest(
         connection_id=ConnectionId("demo"),
-        type=ForwardType.REMOTE,
+        type=forward_type,
         bind_host="127.0.0.1",
-        bind_port=2222,
+        bind_port=bind_port,
         destination_host="internal.test",
         destination_port=80,
     )
 
 
+def _free_port():
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    port = int(probe.getsockname()[1])
+    probe.close()
+    return port
+
+
+def _wait_for_state(runtime, forward_id, state, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if runtime.get_forward(forward_id).state is state:
+            return
+        time.sleep(0.01)
+    assert runtime.get_forward(forward_id).state is state
+
+
 def test_prepare_open_forward_returns_starting_summary():
     runtime, _runner = _make_runtime()
     owner = ClientId("client:owner")
@@ -106,7 +133,7 @@ def test_start_forward_transitions_to_active():
     owner = ClientId("client:owner")
     summary = runtime.prepare_open_forward(_open_request(), client_id=owner)
     runtime.start_forward(summary.id)
-    assert runtime.get_forward(summary.id).state is ForwardState.ACTIVE
+    _wait_for_state(runtime, summary.id, ForwardState.ACTIVE)
     assert len(runner.handles) == 1
 
 
@@ -145,29 +172,129 @@ def test_client_can_interact_only_owner():
 def test_local_forward_not_active_without_bind():
     """Local ACTIVE requires a listening bind — process-alive alone is insufficient."""
 
-    import socket
-
     runner = _FakeForwardRunner()
     runtime = ForwardRuntime(_CoreClient(), runner=runner, active_timeout_seconds=0.15)
     owner = ClientId("client:owner")
     # Bind an ephemeral port, note it, then release so nothing listens.
-    probe = socket.socket()
-    probe.bind(("127.0.0.1", 0))
-    bind_port = int(probe.getsockname()[1])
-    probe.close()
-    request = OpenForwardRequest(
-        connection_id=ConnectionId("demo"),
-        type=ForwardType.LOCAL,
-        bind_host="127.0.0.1",
-        bind_port=bind_port,
-        destination_host="internal.test",
-        destination_port=80,
-    )
+    request = _open_request(ForwardType.LOCAL, _free_port())
     summary = runtime.prepare_open_forward(request, client_id=owner)
     runtime.start_forward(summary.id)
-    assert runtime.get_forward(summary.id).state is ForwardState.FAILED
+    _wait_for_state(runtime, summary.id, ForwardState.FAILED)
     assert runtime.get_forward(summary.id).failure is not None
     assert (
         str(runtime.get_forward(summary.id).failure.code)
         == ErrorCode.FORWARD_STARTUP_FAILED.value
     )
+    # A process that never bound is not left running.
+    assert runner.handles[0].terminated == 1
+
+
+def test_local_forward_activates_once_its_listener_appears():
+    runner = _FakeForwardRunner()
+    runtime = ForwardRuntime(_CoreClient(), runner=runner, active_timeout_seconds=3.0)
+    port = _free_port()
+    summary = runtime.prepare_open_forward(
+        _open_request(ForwardType.LOCAL, port), client_id=ClientId("client:owner")
+    )
+    started = time.monotonic()
+    runtime.start_forward(summary.id)
+    # start_forward no longer blocks waiting for the bind.
+    assert time.monotonic() - started < 0.5
+    assert runtime.get_forward(summary.id).state is ForwardState.STARTING
+    listener = socket.socket()
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(("127.0.0.1", port))
+    listener.listen()
+    try:
+        _wait_for_state(runtime, summary.id, ForwardState.ACTIVE)
+    finally:
+        listener.close()
+        runtime.shutdown()
+
+
+def test_remote_forward_activates_on_the_ssh_success_line():
+    runner = _FakeForwardRunner(with_stream=True)
+    runtime = ForwardRuntime(
+        _CoreClient(),
+        runner=runner,
+        active_timeout_seconds=5.0,
+        remote_stable_seconds=5.0,
+    )
+    summary = runtime.prepare_open_forward(
+        _open_request(), client_id=ClientId("client:owner")
+    )
+    runtime.start_forward(summary.id)
+    (writer,) = runner.stream_writers
+    os.write(writer, b"debug1: Authentication succeeded (publickey).\r\n")
+    time.sleep(0.05)
+    assert runtime.get_forward(summary.id).state is ForwardState.STARTING
+    os.write(writer, b"debug1: remote forward success for: listen 2222, connect")
+    os.write(writer, b" internal.test:80\r\n")
+    _wait_for_state(runtime, summary.id, ForwardState.ACTIVE, timeout=1.0)
+    os.close(writer)
+    runtime.shutdown()
+
+
+def _watcher_threads():
+    return {
+        thread
+        for thread in threading.enumerate()
+        if thread.name == "sshpilot-forward-readiness"
+    }
+
+
+def test_many_pending_forwards_share_one_watcher_thread():
+    before = _watcher_threads()
+    runner = _FakeForwardRunner(with_stream=True)
+    runtime = ForwardRuntime(_CoreClient(), runner=runner, active_timeout_seconds=5.0)
+    owner = ClientId("client:owner")
+    ports = []
+    forward_ids = []
+    for _ in range(40):
+        ports.append(_free_port())
+        summary = runtime.prepare_open_forward(
+            _open_request(ForwardType.LOCAL, ports[-1]), client_id=owner
+        )
+        runtime.start_forward(summary.id)
+        forward_ids.append(summary.id)
+    assert len(_watcher_threads() - before) == 1
+    assert all(
+        runtime.get_forward(forward_id).state is ForwardState.STARTING
+        for forward_id in forward_ids
+    )
+    listeners = []
+    for port, writer in zip(ports, runner.stream_writers):
+        listener = socket.socket()
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(("127.0.0.1", port))
+        listener.listen()
+        listeners.append(listener)
+        os.write(writer, b"debug1: Local forwarding listening on 127.0.0.1 port 1.\n")
+    try:
+        for forward_id in forward_ids:
+            _wait_for_state(runtime, forward_id, ForwardState.ACTIVE)
+    finally:
+        for listener, writer in zip(listeners, runner.stream_writers):
+            listener.close()
+            os.close(writer)
+        runtime.shutdown()
+
+
+def test_watcher_reports_failure_at_the_deadline_and_closes_the_stream():
+    watcher = ForwardReadinessWatcher(probe_max_seconds=0.05)
+    read_fd, write_fd = os.pipe()
+    stream = os.fdopen(read_fd, "rb", buffering=0)
+    failed = threading.Event()
+    watcher.watch(
+        "fwd",
+        deadline=time.monotonic() + 0.1,
+        on_ready=lambda key: pytest.fail("not ready"),
+        on_failed=lambda key: failed.set(),
+        stream=stream,
+        address=(socket.AF_INET, ("127.0.0.1", _free_port())),
+    )
+    assert failed.wait(2.0)
+    watcher.cancel("fwd")
+    watcher.close()
+    assert stream.closed
+    os.close(write_fd)
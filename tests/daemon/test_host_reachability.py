@@ -0,0 +1,226 @@
+"""Budgeted background reachability probes for the connection list."""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+
+from sshpilot.api.events import EventType
+from sshpilot.api.models.common import ConnectionId
+from sshpilot.api.models.connections import ConnectionHealth
+from sshpilot.daemon.host_reachability import (
+    HostReachabilityScheduler,
+    ReachabilityTarget,
+    subnet_key,
+)
+from tests.daemon.test_forward_runtime import _free_port
+
+_BANNER = b"SSH-2.0-OpenSSH_9.6 Test\r\n"
+
+
+class _Server:
+    """Loopback listener that counts accepts and optionally sends a banner."""
+
+    def __init__(self, banner=None):
+        self.banner = banner
+        self.accepted = 0
+        self._server = socket.socket()
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(64)
+        self._held = []
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    @property
+    def port(self):
+        return self._server.getsockname()[1]
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return
+            self.accepted += 1
+            if self.banner is not None:
+                connection.sendall(self.banner)
+            self._held.append(connection)
+
+    def close(self):
+        try:
+            self._server.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._server.close()
+        self._thread.join(timeout=1.0)
+        for connection in self._held:
+            connection.close()
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return
+        time.sleep(0.01)
+    assert predicate()
+
+
+def _targets(port, *names):
+    targets = [
+        ReachabilityTarget(ConnectionId(name), "127.0.0.1", port) for name in names
+    ]
+    return lambda: targets
+
+
+def _scheduler(targets, **options):
+    options.setdefault("visible_interval_seconds", 30.0)
+    options.setdefault("timeout_seconds", 1.0)
+    options.setdefault("random_fraction", lambda: 0.5)
+    return HostReachabilityScheduler(targets, **options)
+
+
+def test_subnet_keys_group_ipv4_by_24_and_ipv6_by_64():
+    assert subnet_key((socket.AF_INET, ("192.0.2.17", 22))) == "192.0.2.0/24"
+    assert (
+        subnet_key((socket.AF_INET6, ("2001:db8:1:2:3::9", 22, 0, 0)))
+        == "2001:db8:1:2::/64"
+    )
+    assert subnet_key((socket.AF_INET6, ("::ffff:192.0.2.5", 22, 0, 0))) == "192.0.2.0/24"
+
+
+def test_reachable_host_reports_rtt_and_banner_once():
+    events = []
+    server = _Server(_BANNER)
+    scheduler = _scheduler(_targets(server.port, "demo"))
+    subscription = scheduler.subscribe_events(events.append)
+    try:
+        assert scheduler.report_visible([ConnectionId("demo")], read_banner=True) == ()
+        _wait_for(lambda: scheduler.reachability(ConnectionId("demo")) is not None)
+        result = scheduler.reachability(ConnectionId("demo"))
+        assert result.health is ConnectionHealth.REACHABLE
+        assert result.ssh_banner == "SSH-2.0-OpenSSH_9.6 Test"
+        assert result.rtt_p50_ms is not None
+        assert result.rtt_p50_ms <= result.rtt_p90_ms <= result.rtt_max_ms
+        assert result.last_seen_at == result.last_checked_at
+        _wait_for(lambda: len(events) == 1)
+        assert events[0].type is EventType.CONNECTION_REACHABILITY_CHANGED
+        assert events[0].payload == result
+        assert scheduler.report_visible([ConnectionId("demo")]) == (result,)
+    finally:
+        subscription.close()
+        scheduler.close()
+        server.close()
+
+
+def test_host_is_unreachable_only_after_confirming_failures():
+    events = []
+    scheduler = _scheduler(_targets(_free_port(), "down"), confirm_seconds=0.05)
+    subscription = scheduler.subscribe_events(events.append)
+    try:
+        scheduler.report_visible([ConnectionId("down")])
+        _wait_for(lambda: events)
+        result = scheduler.reachability(ConnectionId("down"))
+        assert result.health is ConnectionHealth.UNREACHABLE
+        assert result.consecutive_failures == 2
+        assert result.last_seen_at is None
+        assert result.rtt_p50_ms is None
+        # The first failure was recorded without being published.
+        assert [event.payload.probes for event in events] == [2]
+    finally:
+        subscription.close()
+        scheduler.close()
+
+
+def test_probes_in_flight_stay_within_the_budget():
+    # The server never sends a banner, so each probe holds its socket until
+    # the timeout.
+    server = _Server()
+    names = [f"host-{index}" for index in range(8)]
+    scheduler = _scheduler(
+        _targets(server.port, *names),
+        timeout_seconds=0.3,
+        max_in_flight=2,
+        subnet_burst=100,
+    )
+    try:
+        scheduler.report_visible([], read_banner=True)
+        time.sleep(0.2)
+        assert server.accepted <= 2
+        _wait_for(
+            lambda: all(scheduler.reachability(ConnectionId(name)) for name in names)
+        )
+        result = scheduler.reachability(ConnectionId(names[-1]))
+        assert result.health is ConnectionHealth.REACHABLE
+        assert result.ssh_banner is None
+    finally:
+        scheduler.close()
+        server.close()
+
+
+def test_subnet_token_bucket_spreads_probes_out():
+    server = _Server()
+    names = [f"host-{index}" for index in range(5)]
+    scheduler = _scheduler(
+        _targets(server.port, *names),
+        subnet_burst=2,
+        subnet_rate_per_second=5.0,
+    )
+    try:
+        started = time.monotonic()
+        scheduler.report_visible([])
+        _wait_for(lambda: server.accepted >= 2)
+        assert server.accepted <= 3
+        _wait_for(
+            lambda: all(scheduler.reachability(ConnectionId(name)) for name in names)
+        )
+        # Three probes waited for a refill at five tokens a second.
+        assert time.monotonic() - started >= 0.5
+    finally:
+        scheduler.close()
+        server.close()
+
+
+def test_visible_connections_are_probed_first():
+    events = []
+    server = _Server()
+    scheduler = _scheduler(
+        _targets(server.port, "a", "b", "c", "d"),
+        max_in_flight=1,
+        subnet_burst=100,
+    )
+    subscription = scheduler.subscribe_events(events.append)
+    try:
+        scheduler.report_visible([ConnectionId("c")])
+        _wait_for(lambda: len(events) == 4)
+        assert events[0].payload.connection_id == "c"
+    finally:
+        subscription.close()
+        scheduler.close()
+        server.close()
+
+
+def test_probing_pauses_when_no_client_asked_recently():
+    server = _Server()
+    scheduler = _scheduler(
+        _targets(server.port, "demo"),
+        visible_interval_seconds=0.05,
+        jitter_fraction=0.0,
+        hint_ttl_seconds=0.3,
+        subnet_burst=100,
+        subnet_rate_per_second=100.0,
+    )
+    try:
+        scheduler.report_visible([ConnectionId("demo")])
+        _wait_for(lambda: server.accepted >= 3)
+        time.sleep(0.4)
+        paused = server.accepted
+        time.sleep(0.3)
+        assert server.accepted == paused
+        scheduler.report_visible([ConnectionId("demo")])
+        _wait_for(lambda: server.accepted > paused)
+    finally:
+        scheduler.close()
+        server.close()
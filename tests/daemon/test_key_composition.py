@@ -41,6 +41,18 @@ def test_production_resolver_uses_headless_path_helpers(monkeypatch, tmp_path):
     assert resolver(KeyStoreScope.ISOLATED) == get_config_dir()
 
 
+def test_production_key_services_share_one_persistent_fingerprint_cache(
+    tmp_path, monkeypatch
+):
+    from sshpilot.platform.paths import get_state_dir
+
+    services = _call_production_composition(tmp_path, monkeypatch)
+    first = services.keys._service_factory(tmp_path / "ssh")
+    second = services.keys._service_factory(tmp_path / "ssh")
+    assert first._fingerprint_cache is second._fingerprint_cache
+    assert first._fingerprint_cache._path == get_state_dir() / "key-fingerprints.json"
+
+
 def test_test_services_may_omit_keys():
     services = CoreServices(
         connections=ConnectionApplicationService(mock.Mock(), client_name="test")
@@ -13,6 +13,7 @@ import pytest
 from sshpilot.api import DaemonClient
 from sshpilot.api.errors import ErrorCode, SshPilotError
 from sshpilot.api.models import (
+    FindKnownHostEntriesRequest,
     KnownHostEntryId,
     RemoveKnownHostEntriesRequest,
 )
@@ -105,6 +106,21 @@ def test_remove_known_host_entries_over_socket(tmp_path, kh_server):
         client.close()
 
 
+def test_find_known_host_entries_over_socket(tmp_path, kh_server):
+    hosts = tmp_path / "known_hosts"
+    hosts.write_bytes(HOSTS + b"[example.test]:2222 ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIGkVport\n")
+    server = kh_server(hosts)
+    client = DaemonClient(socket_path=server.socket_path)
+    try:
+        found = client.find_known_host_entries(
+            FindKnownHostEntriesRequest(host="example.test", port=2222)
+        )
+        assert found.revision == client.list_known_hosts().revision
+        assert [entry.hostname for entry in found.entries] == ["[example.test]:2222"]
+    finally:
+        client.close()
+
+
 def test_stale_revision_maps_to_stale_editor(tmp_path, kh_server):
     hosts = tmp_path / "known_hosts"
     hosts.write_bytes(HOSTS)
@@ -83,9 +83,19 @@ def test_remove_maps_to_write_capability():
     assert "known_hosts.remove" in DRAIN_REJECTED_METHODS
 
 
+def test_find_maps_to_read_capability():
+    assert (
+        DAEMON_METHOD_CAPABILITIES["known_hosts.find"]
+        is Capability.KNOWN_HOSTS_READ
+    )
+    assert "known_hosts.find" in DEFERRED_DAEMON_METHODS
+    assert "known_hosts.find" not in DRAIN_REJECTED_METHODS
+
+
 def test_list_handler_is_registered(tmp_path):
     dispatcher, _service = _dispatcher(tmp_path)
     assert "known_hosts.list" in dispatcher.HANDLERS
+    assert "known_hosts.find" in dispatcher.HANDLERS
     assert "known_hosts.remove" in dispatcher.HANDLERS
 
 
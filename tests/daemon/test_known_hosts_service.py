@@ -1,11 +1,15 @@
 """Daemon known-hosts service tests."""
 
+import base64
+import hashlib
+import hmac
 import threading
 
 import pytest
 
 from sshpilot.api.errors import ErrorCode, SshPilotError
 from sshpilot.api.models.known_hosts import (
+    FindKnownHostEntriesRequest,
     KnownHostEntryId,
     RemoveKnownHostEntriesRequest,
 )
@@ -212,3 +216,53 @@ def test_concurrent_removals_serialize_with_one_winner(tmp_path):
     assert errors[0][1] is ErrorCode.STALE_EDITOR
     remaining = path.read_bytes()
     assert remaining.count(b"ssh-ed25519") + remaining.count(b"ssh-rsa") == 2
+
+
+# ---------------------------------------------------------------------------
+# Host lookups
+# ---------------------------------------------------------------------------
+def _hashed(name):
+    salt = b"\x07" * 20
+    digest = hmac.new(salt, name.encode(), hashlib.sha1).digest()
+    return f"|1|{base64.b64encode(salt).decode()}|{base64.b64encode(digest).decode()}"
+
+
+def test_find_matches_hashed_and_port_entries_and_feeds_removal(tmp_path):
+    service, path = _service(tmp_path)
+    path.write_bytes(
+        CONTENT
+        + f"{_hashed('one.test')} ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIhashed\n".encode()
+        + b"[one.test]:2222 ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIport\n"
+    )
+    found = service.find_known_host_entries(FindKnownHostEntriesRequest(host="one.test"))
+    assert found.revision == service.list_known_hosts().revision
+    assert len(found.entries) == 3
+    assert found.entries[-1].hostname.startswith("|1|")
+    on_port = service.find_known_host_entries(
+        FindKnownHostEntriesRequest(host="one.test", port=2222)
+    )
+    assert [entry.hostname for entry in on_port.entries] == ["[one.test]:2222"]
+
+    result = service.remove_known_host_entries(
+        _remove_request(found.revision, *(entry.entry_id for entry in found.entries))
+    )
+    assert result.removed_count == 3
+    after = service.find_known_host_entries(FindKnownHostEntriesRequest(host="one.test"))
+    assert after.revision == result.revision
+    assert after.entries == ()
+    # The incrementally updated index agrees with the file on disk.
+    moved = service.find_known_host_entries(
+        FindKnownHostEntriesRequest(host="one.test", port=2222)
+    )
+    assert [entry.entry_id for entry in moved.entries] == [result.entries[-1].entry_id]
+
+
+def test_find_sees_external_edits(tmp_path):
+    service, path = _service(tmp_path)
+    path.write_bytes(CONTENT)
+    assert service.find_known_host_entries(
+        FindKnownHostEntriesRequest(host="three.test")
+    ).entries == ()
+    path.write_bytes(CONTENT + b"three.test ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIthree\n")
+    found = service.find_known_host_entries(FindKnownHostEntriesRequest(host="three.test"))
+    assert [entry.hostname for entry in found.entries] == ["three.test"]
@@ -6,6 +6,7 @@ import pytest
 
 from sshpilot.api import ErrorCode
 from sshpilot.api.models import ConnectionId, SessionId, StartScpTransferRequest, TransferDirection, TransferId
+from sshpilot.core.ssh_capabilities import SshCapabilities
 from sshpilot.daemon.native_scp_backend import NativeScpBackend
 
 
@@ -193,6 +194,29 @@ def test_native_backend_retries_once_with_legacy_protocol_for_sftp_failure():
     assert popen.calls[1][0][1] == "-O"
 
 
+def test_native_backend_skips_the_legacy_retry_when_scp_rejects_it():
+    class _Capabilities:
+        def get(self, executable, env):
+            return SshCapabilities(executable=executable, legacy_scp_protocol=False)
+
+    popen = _Popen([_Process(returncode=1, stderr=b"subsystem request failed")])
+    backend = NativeScpBackend(
+        _Provider(), _Broker(), popen=popen, capabilities=_Capabilities()
+    )
+
+    with pytest.raises(Exception) as exc_info:
+        backend.run(
+            _request(sources=("/tmp/source",)),
+            connection_target="alice@example.test",
+            connection_id=ConnectionId("demo"),
+            transfer_id=TransferId("transfer-1"),
+            cancel_event=threading.Event(),
+        )
+
+    assert getattr(exc_info.value, "code", None) is ErrorCode.TRANSFER_IO_FAILED
+    assert len(popen.calls) == 1
+
+
 def test_native_backend_does_not_retry_authentication_failure():
     provider = _Provider()
     broker = _Broker()
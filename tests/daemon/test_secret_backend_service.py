@@ -1328,3 +1328,48 @@ def test_import_backup_threads_connection_store_restore(monkeypatch, tmp_path):
     )
     assert import_result.status.value == "success", import_result.message
     assert "svc-switch" in {c.id for c in target_repo.snapshot().connections}
+
+
+class _LookupManager(FakeManager):
+    """``FakeManager`` that also answers stored-secret lookups."""
+
+    def __init__(self, backends) -> None:
+        super().__init__(backends)
+        self.lookups = 0
+
+    def lookup(self, spec) -> Optional[str]:
+        self.lookups += 1
+        return "stored-secret"
+
+
+def test_lock_logout_and_selection_routes_invalidate_cached_secrets(tmp_path):
+    path = _write_settings(tmp_path / "config.json")
+    backends = {
+        "bitwarden": FakeBackend("bitwarden"),
+        "rbw": FakeBackend("rbw"),
+        "keepassxc": FakeBackend("keepassxc"),
+    }
+    manager = _LookupManager(backends)
+    service = SecretBackendService(path, secret_manager=manager)
+    cached = service.cached_secret_manager()
+    spec = SimpleNamespace(keyring_service="sshPilot", keyring_account="alice@web")
+
+    routes = (
+        "lock",
+        "bitwarden_lock",
+        "bitwarden_logout",
+        "rbw_lock",
+        "keepassxc_lock",
+        lambda: service.update_configuration(_update_req({"session_timeout": 60})),
+    )
+    for route in routes:
+        lookups = manager.lookups
+        assert cached.lookup(spec) == "stored-secret"
+        assert cached.lookup(spec) == "stored-secret"
+        assert manager.lookups == lookups + 1
+        (route if callable(route) else getattr(service, route))()
+        assert service.secret_cache_stats().entries == 0, route
+
+    service.shutdown()
+    cached.lookup(spec)
+    assert service.secret_cache_stats().entries == 0
@@ -0,0 +1,148 @@
+"""Daemon secret cache: TTL, single flight, invalidation and counters."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from sshpilot.daemon.secret_cache import CachingSecretManager, SecretCache
+from sshpilot.secret_storage import passphrase_spec, password_spec
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingManager:
+    def __init__(self, values=None) -> None:
+        self.values = dict(values or {})
+        self.lookups = 0
+
+    def lookup(self, spec):
+        self.lookups += 1
+        return self.values.get(spec.keyring_account)
+
+    def store(self, spec, secret):
+        self.values[spec.keyring_account] = secret
+        return True
+
+    def delete(self, spec):
+        return self.values.pop(spec.keyring_account, None) is not None
+
+
+def test_found_values_are_served_until_the_ttl_expires():
+    clock = _Clock()
+    cache = SecretCache(ttl_seconds=60.0, monotonic=clock)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return "hunter2"
+
+    assert cache.lookup("web", load) == "hunter2"
+    clock.now += 59.0
+    assert cache.lookup("web", load) == "hunter2"
+    assert len(loads) == 1
+    clock.now += 2.0
+    assert cache.lookup("web", load) == "hunter2"
+    assert len(loads) == 2
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 1)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_misses_are_not_cached():
+    cache = SecretCache()
+    values = iter([None, "unlocked-now"])
+    assert cache.lookup("web", lambda: next(values)) is None
+    assert cache.lookup("web", lambda: next(values)) == "unlocked-now"
+    assert cache.stats().misses == 2
+
+
+def test_concurrent_lookups_of_one_key_share_a_single_backend_call():
+    cache = SecretCache()
+    release = threading.Event()
+    calls = []
+
+    def slow_load():
+        calls.append(1)
+        release.wait(timeout=3.0)
+        return "passphrase"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.lookup("key", slow_load)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    # Let every follower reach the in-flight lookup before it completes.
+    deadline = threading.Event()
+    while cache.stats().coalesced < 7 and not deadline.wait(0.01):
+        pass
+    release.set()
+    for thread in threads:
+        thread.join(timeout=3.0)
+
+    assert results == ["passphrase"] * 8
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats.misses, stats.coalesced) == (1, 7)
+
+
+def test_a_failed_load_is_raised_to_every_waiter_and_not_cached():
+    cache = SecretCache()
+
+    def broken():
+        raise RuntimeError("backend crashed")
+
+    with pytest.raises(RuntimeError):
+        cache.lookup("web", broken)
+    assert cache.lookup("web", lambda: "later") == "later"
+
+
+def test_invalidation_during_a_lookup_keeps_the_stale_value_out():
+    cache = SecretCache()
+
+    def load_then_lock():
+        cache.invalidate()
+        return "old-secret"
+
+    assert cache.lookup("web", load_then_lock) == "old-secret"
+    assert cache.stats().entries == 0
+    assert cache.lookup("web", lambda: "fresh") == "fresh"
+
+
+def test_eviction_and_close_wipe_entries():
+    cache = SecretCache(max_entries=2)
+    for name in ("a", "b", "c"):
+        cache.lookup(name, lambda name=name: f"secret-{name}")
+    stats = cache.stats()
+    assert (stats.entries, stats.evictions) == (2, 1)
+    assert stats.locked_entries <= stats.entries
+    cache.close()
+    assert cache.stats().entries == 0
+    # A closed cache still answers, straight from the backend.
+    assert cache.lookup("a", lambda: "direct") == "direct"
+    assert cache.stats().entries == 0
+
+
+def test_caching_manager_invalidates_on_store_and_delete():
+    spec = password_spec("example.com", "alice")
+    manager = _CountingManager({spec.keyring_account: "old"})
+    cached = CachingSecretManager(manager, SecretCache())
+
+    assert cached.lookup(spec) == "old"
+    assert cached.lookup(spec) == "old"
+    assert manager.lookups == 1
+    assert cached.store(spec, "new") is True
+    assert cached.lookup(spec) == "new"
+    assert cached.delete(spec) is True
+    assert cached.lookup(spec) is None
+    # Distinct specs never share an entry.
+    assert cached.lookup(passphrase_spec("/home/alice/.ssh/id_ed25519")) is None
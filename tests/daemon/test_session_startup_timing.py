@@ -0,0 +1,179 @@
+"""Per-launch startup stages and their rolling per-connection percentiles."""
+
+from __future__ import annotations
+
+import pytest
+
+from sshpilot.api.models.common import ClientId, ConnectionId, SessionId
+from sshpilot.api.models.sessions import OpenSessionRequest, SessionExitInfo, SessionState
+from sshpilot.api.models.terminal import TerminalDimensions
+from sshpilot.core.connection_application_service import ConnectionApplicationService
+from sshpilot.daemon.session_runtime import SessionRuntime
+from sshpilot.daemon.session_startup_timing import SessionStartupTimings
+from tests.helpers.fake_connection_repository import make_test_repository
+
+WEB = ConnectionId("web")
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000.0
+
+
+def _launch(timings, clock, session, marks, connection=WEB):
+    timings.begin(SessionId(session), connection)
+    for milestone, at_ms in marks:
+        clock.now = 100.0 + at_ms / 1000.0
+        timings.mark(SessionId(session), milestone)
+    clock.now = 100.0
+
+
+def test_milestones_are_offsets_and_the_first_mark_wins():
+    clock = _Clock()
+    timings = SessionStartupTimings(clock=clock)
+    session = SessionId("s1")
+    timings.begin(session, WEB)
+    clock.advance(5)
+    timings.mark(session, "command_ready")
+    clock.advance(20)
+    timings.mark(session, "spawned")
+    timings.add(session, "secret_lookup", 0.012)
+    timings.add(session, "askpass", 0.5)
+    timings.add(session, "askpass", 0.25)
+    clock.advance(100)
+    timings.mark(session, "command_ready")
+
+    timing = timings.timing(session)
+    assert timing.command_ready_ms == pytest.approx(5.0)
+    assert timing.spawned_ms == pytest.approx(25.0)
+    assert timing.first_prompt_ms is None
+    assert timing.secret_lookup_ms == pytest.approx(12.0)
+    assert (timing.askpass_ms, timing.askpass_requests) == (pytest.approx(750.0), 2)
+    # Nothing is folded until the launch reaches its prompt or ends.
+    assert timings.percentiles() == ()
+
+
+def test_unknown_sessions_are_ignored():
+    timings = SessionStartupTimings()
+    timings.mark(SessionId("ghost"), "spawned")
+    timings.add(SessionId("ghost"), "askpass", 1.0)
+    timings.finish(SessionId("ghost"))
+    assert timings.timing(SessionId("ghost")) is None
+    with pytest.raises(ValueError):
+        timings.mark(SessionId("ghost"), "first_byte")
+
+
+def test_percentiles_use_nearest_rank_over_the_rolling_window():
+    clock = _Clock()
+    timings = SessionStartupTimings(window=10, clock=clock)
+    for index in range(12):
+        prompt = 100.0 * (index + 1)
+        _launch(timings, clock, f"s{index}", [
+            ("spawned", 10.0),
+            ("authenticated", prompt - 50.0),
+            ("first_prompt", prompt),
+        ])
+    # A failed launch counts for the stages it reached.
+    _launch(timings, clock, "failed", [("spawned", 2000.0)])
+    timings.finish(SessionId("failed"))
+
+    (web,) = timings.percentiles()
+    assert web.launches == 10
+    stages = {stage.stage: stage for stage in web.stages}
+    assert set(stages) == {"spawned", "authenticated", "first_prompt"}
+    # The window kept launches 4..12 (prompts 400..1200) plus the failure.
+    prompt = stages["first_prompt"]
+    assert prompt.samples == 9
+    assert (prompt.p50_ms, prompt.p90_ms, prompt.max_ms) == pytest.approx(
+        (800.0, 1200.0, 1200.0)
+    )
+    assert stages["spawned"].max_ms == pytest.approx(2000.0)
+
+
+def test_a_finished_launch_keeps_its_timing_until_discarded():
+    clock = _Clock()
+    timings = SessionStartupTimings(clock=clock)
+    _launch(timings, clock, "s1", [("spawned", 10.0), ("first_prompt", 50.0)])
+    timings.mark(SessionId("s1"), "authenticated")
+
+    assert timings.timing(SessionId("s1")).authenticated_ms is None
+    assert timings.percentiles()[0].launches == 1
+    timings.discard(SessionId("s1"))
+    assert timings.timing(SessionId("s1")) is None
+
+
+class _Handle:
+    def __init__(self, on_exit):
+        self._on_exit = on_exit
+
+    def write(self, data):
+        return True
+
+    def terminate(self):
+        self._on_exit(SessionExitInfo(exit_code=0, reason="terminated"))
+
+    def kill(self):
+        self.terminate()
+
+    def wait(self, timeout):
+        return None
+
+    def poll(self):
+        return None
+
+
+class _Runner:
+    terminal_capable = True
+
+    def __init__(self, clock):
+        self._clock = clock
+        self.on_output = None
+
+    def start(self, spec, on_exit, on_output=None, on_eof=None):
+        self._clock.advance(30)
+        self.on_output = on_output
+        return _Handle(on_exit)
+
+    def emit(self, data, after_ms):
+        self._clock.advance(after_ms)
+        self.on_output(data)
+
+    def close(self):
+        return None
+
+
+def test_runtime_times_a_launch_to_its_first_prompt():
+    clock = _Clock()
+    core = ConnectionApplicationService(make_test_repository(), client_name="timing")
+    runner = _Runner(clock)
+    runtime = SessionRuntime(
+        core, runner=runner, startup_timings=SessionStartupTimings(clock=clock)
+    )
+    runtime.enable_connection_evidence_gate()
+    prepared = runtime.prepare_open_session(
+        OpenSessionRequest(
+            connection_id=core.list_connections()[0].id,
+            dimensions=TerminalDimensions(rows=24, columns=80),
+        ),
+        client_id=ClientId("client:a"),
+    )
+    runtime.start_session(prepared.id)
+    runner.emit(b"alice@example.test's password: ", after_ms=70)
+    runner.emit(b"\r\nLast login: today\r\n", after_ms=400)
+    assert runtime.get_session(prepared.id).state is SessionState.RUNNING
+    runner.emit(b"\x1b[32malice@host\x1b[0m:~$ ", after_ms=50)
+
+    timing = runtime.get_session(prepared.id).startup_timing
+    assert timing.spawned_ms == pytest.approx(30.0)
+    assert timing.first_output_ms == pytest.approx(100.0)
+    assert timing.authenticated_ms == pytest.approx(500.0)
+    assert timing.first_prompt_ms == pytest.approx(550.0)
+    (percentiles,) = runtime.startup_timings.percentiles()
+    assert percentiles.connection_id == prepared.connection_id
+    assert percentiles.launches == 1
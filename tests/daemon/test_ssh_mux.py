@@ -0,0 +1,260 @@
+"""The native mux client against a fake OpenSSH master.
+
+The fake speaks the master side of ``PROTOCOL.mux``: hello first, then one
+reply per request. Probing through it must give the same answers
+``ssh -O check`` / ``ssh -O exit`` would, without forking ssh.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import struct
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+from sshpilot.daemon import control_masters, ssh_mux
+from sshpilot.daemon.control_masters import (
+    MasterState,
+    probe_control_master,
+    survey_control_masters,
+    terminate_owned_control_masters,
+)
+
+
+def _packet(*fields) -> bytes:
+    payload = b"".join(
+        struct.pack(">I", len(f)) + f if isinstance(f, bytes) else struct.pack(">I", f)
+        for f in fields
+    )
+    return struct.pack(">I", len(payload)) + payload
+
+
+def _read_packet(conn) -> tuple:
+    def exact(size):
+        data = b""
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                raise EOFError
+            data += chunk
+        return data
+
+    (length,) = struct.unpack(">I", exact(4))
+    payload = exact(length)
+    return struct.unpack(">II", payload[:8]) if length >= 8 else (struct.unpack(">I", payload)[0],)
+
+
+def _serve(conn, *, pid=4242, version=4, deny_terminate=False, on_terminate=None):
+    """Master side of one mux conversation."""
+    with conn:
+        conn.sendall(_packet(ssh_mux.MUX_MSG_HELLO, version, b"ext", b"value"))
+        try:
+            kind, client_version = _read_packet(conn)
+            assert (kind, client_version) == (ssh_mux.MUX_MSG_HELLO, 4)
+            while True:
+                kind, request_id = _read_packet(conn)
+                if kind == ssh_mux.MUX_C_ALIVE_CHECK:
+                    conn.sendall(_packet(ssh_mux.MUX_S_ALIVE, request_id, pid))
+                elif kind == ssh_mux.MUX_C_TERMINATE:
+                    if deny_terminate:
+                        conn.sendall(_packet(ssh_mux.MUX_S_PERMISSION_DENIED, request_id,
+                                             b"confirmation declined"))
+                    else:
+                        conn.sendall(_packet(ssh_mux.MUX_S_OK, request_id))
+                        if on_terminate is not None:
+                            on_terminate()
+                        return
+        except EOFError:
+            return
+
+
+class _FakeMaster:
+    """A listening ControlPath answering like an OpenSSH master."""
+
+    def __init__(self, path: Path, **behaviour):
+        self.path = path
+        self.behaviour = behaviour
+        self.connections = 0
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(str(path))
+        self._sock.listen(16)
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._thread.start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(
+                target=_serve, args=(conn,),
+                kwargs=dict(self.behaviour, on_terminate=self.stop), daemon=True,
+            ).start()
+
+    def stop(self):
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+        self._sock.close()
+
+
+@pytest.fixture
+def control_dir(tmp_path):
+    directory = tmp_path / "cm"
+    directory.mkdir(mode=0o700)
+    return directory
+
+
+@pytest.fixture
+def no_ssh(monkeypatch):
+    """Fail loudly if anything falls back to forking ssh."""
+    def _forbidden(*_args, **_kwargs):
+        raise AssertionError("ssh was spawned")
+
+    monkeypatch.setattr(subprocess, "run", _forbidden)
+
+
+def test_alive_check_over_a_socketpair():
+    client_sock, server_sock = socket.socketpair()
+    server = threading.Thread(target=_serve, args=(server_sock,), kwargs={"pid": 31337})
+    server.start()
+    with ssh_mux.MuxClient(client_sock, timeout=2.0) as client:
+        assert client.alive_check() == 31337
+        assert client.alive_check() == 31337  # one hello, several requests
+    server.join(2.0)
+
+
+def test_terminate_denied_raises():
+    client_sock, server_sock = socket.socketpair()
+    threading.Thread(target=_serve, args=(server_sock,),
+                     kwargs={"deny_terminate": True}, daemon=True).start()
+    with ssh_mux.MuxClient(client_sock, timeout=2.0) as client:
+        with pytest.raises(ssh_mux.MuxRequestDenied, match="confirmation declined"):
+            client.terminate()
+
+
+def test_wrong_protocol_version_is_a_protocol_error():
+    client_sock, server_sock = socket.socketpair()
+    threading.Thread(target=_serve, args=(server_sock,),
+                     kwargs={"version": 3}, daemon=True).start()
+    with ssh_mux.MuxClient(client_sock, timeout=2.0) as client:
+        with pytest.raises(ssh_mux.MuxProtocolError):
+            client.alive_check()
+
+
+def test_a_silent_peer_times_out():
+    client_sock, _server_sock = socket.socketpair()
+    with ssh_mux.MuxClient(client_sock, timeout=0.1) as client:
+        with pytest.raises(TimeoutError):
+            client.alive_check()
+
+
+def test_live_master_is_probed_without_forking_ssh(control_dir, no_ssh):
+    master = _FakeMaster(control_dir / "abcdef", pid=777)
+    try:
+        probe = probe_control_master(master.path)
+    finally:
+        master.stop()
+    assert probe.state is MasterState.LIVE
+    assert probe.pid == 777
+
+
+def test_stale_socket_is_positively_absent(control_dir, no_ssh):
+    path = control_dir / "stale"
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(path))
+    sock.close()  # the socket file stays; nobody listens on it
+
+    assert probe_control_master(path).state is MasterState.ABSENT
+
+
+def test_unresponsive_master_is_unknown_not_absent(control_dir, no_ssh):
+    path = control_dir / "hung"
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(path))
+    sock.listen(1)  # accepts at the kernel level, never answers
+    try:
+        probe = probe_control_master(path, timeout=0.2)
+    finally:
+        sock.close()
+    assert probe.state is MasterState.UNKNOWN
+    assert "timed out" in probe.reason
+
+
+def test_protocol_mismatch_falls_back_to_ssh(control_dir, monkeypatch):
+    master = _FakeMaster(control_dir / "odd", version=3)
+    calls = []
+
+    def _ssh(args, **_kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(
+            args=args, returncode=0, stdout=b"", stderr=b"Master running (pid=99)\n")
+
+    monkeypatch.setattr(subprocess, "run", _ssh)
+    try:
+        probe = probe_control_master(master.path)
+    finally:
+        master.stop()
+    assert probe.state is MasterState.LIVE and probe.pid == 99
+    assert calls and "check" in calls[0]
+
+
+def test_survey_probes_many_masters_concurrently(control_dir, no_ssh):
+    masters = [_FakeMaster(control_dir / f"m{index:03d}", pid=1000 + index)
+               for index in range(40)]
+    try:
+        probes = survey_control_masters(directory=control_dir)
+    finally:
+        for master in masters:
+            master.stop()
+    assert [probe.pid for probe in probes] == [1000 + index for index in range(40)]
+    assert all(probe.state is MasterState.LIVE for probe in probes)
+
+
+def test_terminate_exits_masters_natively_and_waits_for_them(control_dir, no_ssh, monkeypatch):
+    masters = [_FakeMaster(control_dir / f"m{index}", pid=2000 + index) for index in range(5)]
+    stale = control_dir / "stale"
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(stale))
+    sock.close()
+
+    # The master acknowledges before it is gone: hold the exit back a moment.
+    real_stop = _FakeMaster.stop
+
+    def _slow_stop(self):
+        threading.Timer(0.1, real_stop, args=(self,)).start()
+
+    monkeypatch.setattr(_FakeMaster, "stop", _slow_stop)
+    remaining = terminate_owned_control_masters(directory=control_dir)
+
+    assert remaining == ()
+    assert os.listdir(control_dir) == []
+    assert all(master.connections >= 2 for master in masters)  # check, then exit
+
+
+def test_denied_exit_is_reported_as_still_live(control_dir, no_ssh):
+    master = _FakeMaster(control_dir / "stubborn", deny_terminate=True)
+    try:
+        remaining = terminate_owned_control_masters(directory=control_dir)
+    finally:
+        master.stop()
+    assert [probe.state for probe in remaining] == [MasterState.LIVE]
+
+
+def test_non_socket_paths_use_the_ssh_fallback(control_dir, monkeypatch):
+    (control_dir / "plain-file").write_bytes(b"")
+    monkeypatch.setattr(control_masters.ssh_mux, "alive_check",
+                        lambda *_a, **_k: pytest.fail("native probe on a regular file"))
+    monkeypatch.setattr(
+        subprocess, "run",
+        lambda *_a, **_k: subprocess.CompletedProcess(
+            args=[], returncode=255, stdout=b"", stderr=b"Connection refused"),
+    )
+    assert survey_control_masters(directory=control_dir)[0].state is MasterState.ABSENT
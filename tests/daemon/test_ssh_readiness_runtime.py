@@ -37,7 +37,7 @@ def _fake_subprocess(monkeypatch, *, probe_returncode=0, create_file=True):
             open(probe, "wb").write(b"")
         return _Completed(returncode=probe_returncode)
 
-    monkeypatch.setattr("sshpilot.daemon.ssh_readiness.subprocess.run", _run)
+    monkeypatch.setattr("sshpilot.core.ssh_capabilities.subprocess.run", _run)
     return _run
 
 
@@ -203,7 +203,7 @@ def test_capability_probe_is_cached_per_executable(tmp_path, monkeypatch):
         open(cmd[cmd.index("-E") + 1], "wb").write(b"")
         return _Completed()
 
-    monkeypatch.setattr("sshpilot.daemon.ssh_readiness.subprocess.run", _run)
+    monkeypatch.setattr("sshpilot.core.ssh_capabilities.subprocess.run", _run)
     first = manager.prepare_launch("session-1", ("/usr/bin/ssh", "host"), {})
     second = manager.prepare_launch("session-2", ("/usr/bin/ssh", "host2"), {})
     assert first and second
@@ -8,6 +8,7 @@ publishes ``RepositoryChange`` events after each mutation.
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
 
 from sshpilot.core.connections.models import ConnectionRecord, GroupRecord
@@ -165,6 +166,12 @@ class FakeConnectionRepository:
         self._bump()
         self._notify(before)
 
+    @contextmanager
+    def transaction(self):
+        # The fake commits every mutation immediately; batches simply run
+        # their items in order.
+        yield self
+
     def split_connection(
         self,
         connection_id: str,
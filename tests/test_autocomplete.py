@@ -7,6 +7,7 @@ import pytest
 from sshpilot.autocomplete import (
     Autocompleter,
     CommandBlockProvider,
+    HistoryIndex,
     LineTracker,
     RemoteHistoryProvider,
     SessionProvider,
@@ -111,7 +112,7 @@ def test_shell_history_provider(tmp_path):
 def test_shell_history_dedupes_and_skips_exact():
     from sshpilot import autocomplete
     p = ShellHistoryProvider(paths=[])
-    p._entries = ["git status", "git status", "git"]
+    p._index = HistoryIndex(["git", "git status", "git status"])
     p._refresh = lambda: None
     texts = [s.text for s in p.suggestions("git", 10)]
     assert texts == ["git status", "git status"] or texts == ["git status"]
@@ -125,6 +126,91 @@ def test_shell_history_missing_file():
     assert p.suggestions("git", 10) == []
 
 
+def test_shell_history_parses_only_appended_lines(tmp_path, monkeypatch):
+    from sshpilot import autocomplete
+
+    bash = tmp_path / "bash_history"
+    bash.write_text("git status\n")
+    p = ShellHistoryProvider(paths=[str(bash)])
+    assert [s.text for s in p.suggestions("git", 10)] == ["git status"]
+
+    reads = []
+    real = autocomplete.read_appended
+    monkeypatch.setattr(autocomplete, "read_appended",
+                        lambda path, start: reads.append(start) or real(path, start))
+    with open(bash, "a") as f:
+        f.write("git push\ngit pu")  # last line still being written
+    assert [s.text for s in p.suggestions("git", 10)] == ["git push", "git status"]
+    assert reads == [len("git status\n")]
+
+    assert [s.text for s in p.suggestions("git", 10)] == ["git push", "git status"]
+    assert len(reads) == 1  # unchanged file: stat only
+
+
+def test_shell_history_rewritten_file_reloads(tmp_path):
+    bash = tmp_path / "bash_history"
+    bash.write_text("git status\ngit status\ngit push\n")
+    p = ShellHistoryProvider(paths=[str(bash)])
+    assert [s.text for s in p.suggestions("git", 10)] == ["git status", "git push"]
+
+    # bash trimming to HISTFILESIZE rewrites the file from the top.
+    bash.write_text("git push\ngit log --oneline\ngit fetch\n")
+    assert [s.text for s in p.suggestions("git", 10)] == [
+        "git fetch", "git log --oneline", "git push"]
+
+
+def test_history_index_ranks_by_frequency_and_recency():
+    lines = ["make test"] * 3 + [f"echo {i}" for i in range(40)] + ["make lint"]
+    index = HistoryIndex(lines)
+    # Two repeats are worth 64 lines of recency.
+    assert index.search("make", 10) == ["make test", "make lint"]
+    index.ingest(["echo filler"] * 40)
+    index.ingest(["make lint"])
+    assert index.search("make", 10) == ["make lint", "make test"]
+
+
+def test_history_index_long_prefix_and_substring_matches():
+    index = HistoryIndex([
+        "kubectl get pods -A",
+        "kubectl get pods",
+        "sudo kubectl get pods",
+        "kubectl logs -f web",
+    ])
+    assert index.search("kubectl get pods", 10) == ["kubectl get pods -A", "sudo kubectl get pods"]
+    assert index.search("kubectl g", 1) == ["kubectl get pods"]
+    assert index.search("logs", 10) == ["kubectl logs -f web"]
+
+
+def test_history_index_matches_full_scan():
+    import random
+
+    rng = random.Random(7)
+    words = ["git", "gi", "go", "grep", "status", "stash", "push", "-v", "log", "lo"]
+    lines = [" ".join(rng.choice(words) for _ in range(rng.randrange(1, 5)))
+             for _ in range(3000)]
+    index = HistoryIndex(lines, max_entries=200)
+    assert len(index) <= 250
+
+    for prefix in ("gi", "git s", "git status pu", "lo", "-v", "push"):
+        # Reference: best score per command, prefix matches before substrings.
+        kept = index.ranked()
+        expected = [c for c in kept if c.startswith(prefix) and c != prefix]
+        expected += [c for c in kept if prefix in c and not c.startswith(prefix)]
+        assert index.search(prefix, 8) == expected[:8], prefix
+
+
+def test_history_substring_fallback_scans_only_the_best_commands(monkeypatch):
+    import sshpilot.autocomplete as autocomplete
+
+    monkeypatch.setattr(autocomplete, "_SUBSTRING_SCAN", 3)
+    # Oldest first: "rare deploy" ranks last of five.
+    index = HistoryIndex(["rare deploy", "ls", "pwd", "make deploy", "cd"])
+
+    assert index.search("deploy", 10) == ["make deploy"]
+    assert index.search("make", 10) == ["make deploy"]
+    assert index.search("rare", 10) == ["rare deploy"]
+
+
 def test_command_block_provider_orders_by_use_count():
     class Store:
         def get_commands(self):
@@ -138,6 +224,24 @@ def test_command_block_provider_orders_by_use_count():
     assert p.suggestions("git", 10)[0].source == "snippet"
 
 
+def test_command_block_provider_uses_store_index():
+    from sshpilot.command_blocks import CommandBlockStore
+
+    class Config:
+        config_data = {"command_blocks": {"folders": [], "commands": [], "defaults_loaded": True}}
+
+        def save_json_config(self):
+            pass
+
+    store = CommandBlockStore(Config())
+    store.add_command("a", "git log")
+    status = store.add_command("b", "git status")
+    store.record_use(status["id"])
+
+    p = CommandBlockProvider(store)
+    assert [s.text for s in p.suggestions("git", 10)] == ["git status", "git log"]
+
+
 def test_command_block_provider_none_store():
     assert CommandBlockProvider(None).suggestions("git", 10) == []
 
@@ -201,6 +305,13 @@ def test_remote_history_failed_fetch_is_quiet():
     assert p.suggestions("git", 10) == []
 
 
+def test_remote_history_ranks_repeated_commands():
+    p = RemoteHistoryProvider("host5", lambda: "git pull\ngit pull\ngit push\n")
+    p.suggestions("git", 10)
+    _wait_for_cache("host5")
+    assert [s.text for s in p.suggestions("git", 10)] == ["git pull", "git push"]
+
+
 def test_prefetch_warms_remote_provider():
     remote = RemoteHistoryProvider("host4", lambda: "git status\n")
     ac = Autocompleter([remote])
@@ -214,7 +325,8 @@ def test_prefetch_warms_remote_provider():
 def _ac(**kwargs):
     session = SessionProvider()
     history = ShellHistoryProvider(paths=[])
-    history._entries = kwargs.pop("history", [])
+    # History is given most recent first; the index ingests oldest first.
+    history._index = HistoryIndex(reversed(kwargs.pop("history", [])))
     history._refresh = lambda: None
     return Autocompleter([session, history], session=session, **kwargs), session
 
@@ -156,6 +156,100 @@ def test_search_empty_returns_all_and_substring_matches_fields():
     assert store.search("nomatch") == []
 
 
+def test_search_ranks_prefix_matches_by_field():
+    store, _ = _seeded_store()
+    store.add_command("Tail logs", "less +F app.log", description="follow output")
+    store.add_command("Pods", "kubectl get pods", description="list kube pods")
+    store.add_command("Kube context", "kubectl config get-contexts")
+    # Title beats command beats description; "kub" is a prefix of all three.
+    assert [c["name"] for c in store.search("kub")] == ["Kube context", "Pods"]
+    # Every query token must match; order of tokens does not matter.
+    assert [c["name"] for c in store.search("pods get")] == ["Pods"]
+    # Mid-word fragments still match, after the token hits.
+    assert [c["name"] for c in store.search("ctl")] == ["Pods", "Kube context"]
+
+
+def test_search_keeps_mid_word_matches_after_token_hits():
+    store, _ = _seeded_store()
+    store.add_command("Restart docker", "systemctl restart docker")
+    store.add_command("Kernel version", "uname -r")
+    # "ker" starts a token of "Kernel version" and sits inside "docker".
+    assert [c["name"] for c in store.search("ker")] == [
+        "Kernel version",
+        "Restart docker",
+    ]
+
+
+def test_search_index_follows_edits():
+    store, _ = _seeded_store()
+    cmd = store.add_command("Deploy", "kubectl apply")
+    assert [c["id"] for c in store.search("deploy")] == [cmd["id"]]
+
+    store.update_command(cmd["id"], name="Rollout", tags=["helm"])
+    assert store.search("deploy") == []
+    assert [c["id"] for c in store.search("helm")] == [cmd["id"]]
+
+    copy = store.duplicate_command(cmd["id"])
+    assert {c["id"] for c in store.search("rollout")} == {cmd["id"], copy["id"]}
+
+    store.delete_command(cmd["id"])
+    assert [c["id"] for c in store.search("rollout")] == [copy["id"]]
+
+
+def test_search_index_rebuilds_when_commands_are_replaced():
+    store, cfg = _seeded_store()
+    store.add_command("Old", "echo old")
+    assert store.search("old")
+
+    cfg.config_data["command_blocks"]["commands"] = [
+        {"id": "x", "name": "Fresh", "command": "echo new", "tags": []},
+    ]
+    assert store.search("old") == []
+    assert [c["id"] for c in store.search("fresh")] == ["x"]
+
+
+def test_completions_prefer_leading_matches_then_use_count():
+    store, _ = _seeded_store()
+    rare = store.add_command("a", "git log")
+    store.add_command("b", "git status")
+    store.add_command("c", "sudo git pull")
+    store.add_command("d", "git")
+    for _ in range(3):
+        store.record_use(store.get_commands()[1]["id"])
+    store.record_use(store.get_commands()[2]["id"])
+
+    assert store.completions("git", 10) == ["git status", "git log", "sudo git pull"]
+    store.record_use(rare["id"])
+    store.record_use(rare["id"])
+    store.record_use(rare["id"])
+    store.record_use(rare["id"])
+    assert store.completions("git", 2) == ["git log", "git status"]
+
+
+def test_substring_matches_follow_token_hits_and_are_capped():
+    index = command_blocks.CommandBlockIndex(
+        [{"id": f"c{n}", "name": f"job {n}", "command": f"kubectl get pod-{n}"} for n in range(300)]
+        + [{"id": "ctl", "name": "ctl", "command": "systemctl status"}]
+    )
+    # "ctl" is a token of one command; mid-word hits follow it, capped.
+    hits = [c["id"] for c in index.search("ctl")]
+    assert hits[:2] == ["ctl", "c0"]
+    assert len(hits) == 1 + command_blocks._SUBSTRING_FALLBACK_LIMIT
+    fallback = index.search("ubectl")
+    assert len(fallback) == command_blocks._SUBSTRING_FALLBACK_LIMIT
+    assert fallback[0]["id"] == "c0"
+
+
+def test_completions_follow_edited_command_text():
+    index = command_blocks.CommandBlockIndex(
+        [{"id": "a", "command": "git log"}, {"id": "b", "command": "git status"}]
+    )
+    assert index.completions("git s", 5) == ["git status"]
+    index.update({"id": "b", "command": "hg status"})
+    assert index.completions("git", 5) == ["git log"]
+    assert index.completions("status", 5) == ["hg status"]
+
+
 def test_get_favorites():
     store, _ = _seeded_store()
     store.add_command("plain", "c")
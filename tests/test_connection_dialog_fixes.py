@@ -267,3 +267,63 @@ def test_key_chooser_dialog_passes_itself_as_browse_parent():
         "KeyChooserDialog must pass itself as the parent for the browse "
         "callback, not rely on the callback defaulting to some other window"
     )
+
+
+def test_key_chooser_opens_before_key_discovery(monkeypatch):
+    """The chooser is presented with placeholders; discovery (daemon round
+    trips + fingerprinting) runs on a worker and fills it in afterwards."""
+    from sshpilot import connection_dialog as cd
+    from sshpilot.connection_dialog import ConnectionDialog
+
+    events = []
+
+    class _FakeChooser:
+        def __init__(self, parent, **kwargs):
+            events.append(("created", kwargs.get("disk_keys"), kwargs.get("agent_keys")))
+
+        def present(self):
+            events.append(("presented",))
+
+        def set_keys(self, disk_keys, agent_keys):
+            events.append(("keys", disk_keys, agent_keys))
+
+    workers = []
+
+    class _FakeThread:
+        def __init__(self, target, daemon=False):
+            workers.append(target)
+
+        def start(self):
+            pass
+
+    monkeypatch.setattr(cd, "KeyChooserDialog", _FakeChooser)
+    monkeypatch.setattr(cd.threading, "Thread", _FakeThread)
+    monkeypatch.setattr(cd.startup_profile, "log_time_to_interactive", lambda *a: None)
+    monkeypatch.setattr(cd.GLib, "idle_add", lambda func, *args: func(*args))
+    monkeypatch.setattr(cd, "_fingerprint_for_path", lambda path: ("ED25519", "SHA256:abc", ""))
+
+    manager = _FakeKeyManager([SSHKey("/home/alice/.ssh/id_ed25519")])
+    agent_key = types.SimpleNamespace(fingerprint="SHA256:xyz", key_type="ssh-rsa", comment="work")
+    client = types.SimpleNamespace(
+        list_agent_keys=lambda: types.SimpleNamespace(keys=[agent_key]))
+    parent = types.SimpleNamespace(key_manager=manager, client=client)
+    dialog = types.SimpleNamespace(
+        parent_window=parent,
+        get_transient_for=lambda: parent,
+        _browse_key=None,
+    )
+    for name in ("_discover_disk_keys", "_agent_keys", "_collect_chooser_keys"):
+        setattr(dialog, name, types.MethodType(ConnectionDialog.__dict__[name], dialog))
+    editor = types.SimpleNamespace(get_paths=list, add_path=lambda path: None)
+
+    types.MethodType(ConnectionDialog.__dict__["_open_key_chooser"], dialog)(editor)
+
+    assert events == [("created", None, None), ("presented",)]
+    assert len(workers) == 1
+
+    workers[0]()
+
+    disk_keys, agent_keys = events[-1][1], events[-1][2]
+    assert [(k["path"], k["meta"]) for k in disk_keys] == [
+        ("/home/alice/.ssh/id_ed25519", "SHA256:abc")]
+    assert [(k["title"], k["meta"]) for k in agent_keys] == [("work", "SHA256:xyz")]
@@ -2,7 +2,10 @@
 
 import pytest
 
-from sshpilot.core.connection_evidence import classify_connection_evidence
+from sshpilot.core.connection_evidence import (
+    classify_connection_evidence,
+    looks_like_shell_prompt,
+)
 
 
 @pytest.mark.parametrize(
@@ -31,3 +34,20 @@ def test_later_remote_output_supersedes_failed_authentication_attempt():
 
     assert result.verdict == "connected"
     assert result.failure_reason == ""
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("\x1b[32malice@host\x1b[0m:\x1b[34m~\x1b[0m$ ", True),
+        ("Last login: today\r\n[root@db ~]# ", True),
+        ("\x1b]0;title\x07~/src ❯ ", True),
+        ("alice@example.test's password: ", False),
+        ("Enter passphrase for key '/home/alice/.ssh/id_ed25519': ", False),
+        ("Are you sure you want to continue connecting (yes/no/[fingerprint])? ", False),
+        ("alice@host:~$ \r\n", False),
+        ("", False),
+    ],
+)
+def test_looks_like_shell_prompt(text, expected):
+    assert looks_like_shell_prompt(text) is expected
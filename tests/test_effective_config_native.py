@@ -0,0 +1,174 @@
+"""Cross-check the native effective-config evaluator against ``ssh -G``.
+
+The in-process evaluator only answers the destination fields
+(``NATIVE_EFFECTIVE_FIELDS``); every case here asserts it agrees with the
+real OpenSSH resolver for those fields, and that unsupported constructs fall
+back to ``ssh -G``. Skips if ssh is unavailable.
+"""
+
+import shutil
+
+import pytest
+
+from sshpilot.core import ssh_config_effective
+from sshpilot.core.ssh_config_effective import (
+    NATIVE_EFFECTIVE_FIELDS,
+    get_effective_ssh_config,
+    invalidate_effective_config_cache,
+)
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("ssh") is None, reason="ssh binary not available"
+)
+
+CONFIG = """\
+Host Web
+    HostName WEB.%h.example.com
+    User deploy
+    Port 2201
+
+Host *.internal !db.internal
+    ProxyJump bastion
+    User ops
+
+Host db.internal
+    ProxyJump none
+    Port 5022
+
+Match host 10.0.0.*
+    User matched
+
+Host ipalias
+    HostName 10.0.0.7
+
+Host legacy
+    ProxyCommand nc %h %p
+    ProxyJump ignored
+
+Host *
+    User fallback
+"""
+
+CASES = [
+    ("web", {}),
+    ("Web", {}),
+    ("IPALIAS", {}),
+    ("api.internal", {}),
+    ("db.internal", {}),
+    ("ipalias", {}),
+    ("legacy", {}),
+    ("other", {}),
+    ("api.internal", {"user": "cli", "port": 2222}),
+    ("other", {"proxy_jump": "jump1,jump2"}),
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    invalidate_effective_config_cache()
+    yield
+    invalidate_effective_config_cache()
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config"
+    path.write_text(CONFIG, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("host,kwargs", CASES)
+def test_native_fields_match_ssh_g(config_path, host, kwargs):
+    native = get_effective_ssh_config(
+        host, config_path, fields=NATIVE_EFFECTIVE_FIELDS, **kwargs
+    )
+    invalidate_effective_config_cache()
+    real = ssh_config_effective._run_ssh_g(
+        host,
+        config_path,
+        user=kwargs.get("user"),
+        port=kwargs.get("port"),
+        proxy_jump=kwargs.get("proxy_jump"),
+    )
+    assert real, "ssh -G should resolve the fixture"
+    for field in NATIVE_EFFECTIVE_FIELDS:
+        assert native.get(field) == real.get(field), field
+
+
+def test_native_lookup_does_not_spawn_ssh(config_path, monkeypatch):
+    def unexpected(*_args, **_kwargs):
+        raise AssertionError("ssh -G should not run for native fields")
+
+    monkeypatch.setattr(ssh_config_effective, "_run_ssh_g", unexpected)
+    result = get_effective_ssh_config(
+        "Web", config_path, fields=("hostname", "port")
+    )
+    assert result["hostname"] == "web.web.example.com"
+    assert result["port"] == "2201"
+
+
+def test_unsupported_match_falls_back_to_ssh_g(tmp_path, monkeypatch):
+    path = tmp_path / "config"
+    path.write_text(
+        "Match exec \"true\"\n    User fromexec\n", encoding="utf-8"
+    )
+    calls = []
+
+    def fake_ssh_g(host, config_file, **kwargs):
+        calls.append(host)
+        return {"hostname": host, "user": "fromexec", "port": "22"}
+
+    monkeypatch.setattr(ssh_config_effective, "_run_ssh_g", fake_ssh_g)
+    result = get_effective_ssh_config(
+        "box", str(path), fields=NATIVE_EFFECTIVE_FIELDS
+    )
+    assert calls == ["box"]
+    assert result["user"] == "fromexec"
+
+
+def test_ssh_g_results_are_memoized_per_revision(config_path, monkeypatch):
+    calls = []
+    real = ssh_config_effective._run_ssh_g
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(ssh_config_effective, "_run_ssh_g", counting)
+    first = get_effective_ssh_config("Web", config_path)
+    second = get_effective_ssh_config("Web", config_path)
+    assert first == second
+    assert calls == ["Web"]
+
+    with open(config_path, "a", encoding="utf-8") as handle:
+        handle.write("\nHost web2\n    Port 1\n")
+    get_effective_ssh_config("Web", config_path)
+    assert calls == ["Web", "Web"]
+
+
+def test_include_lines_are_parsed_once_per_file_revision(tmp_path, monkeypatch):
+    (tmp_path / "conf.d").mkdir()
+    root = tmp_path / "config"
+    root.write_text(f"Include {tmp_path}/conf.d/*\nHost a\n    Port 1\n", encoding="utf-8")
+    (tmp_path / "conf.d" / "one").write_text("Host one\n", encoding="utf-8")
+    parsed = []
+    real = ssh_config_effective.split_config_option
+
+    def counting(line):
+        parsed.append(line)
+        return real(line)
+
+    monkeypatch.setattr(ssh_config_effective, "split_config_option", counting)
+    first = ssh_config_effective._config_sources(str(root))
+    assert [path for path, _digest in first] == [
+        str(root), str(tmp_path / "conf.d" / "one")
+    ]
+    parsed.clear()
+    assert ssh_config_effective._config_sources(str(root)) == first
+    assert parsed == []
+
+    # A new file matching the pattern joins without the root changing.
+    (tmp_path / "conf.d" / "two").write_text("Host two\n", encoding="utf-8")
+    sources = ssh_config_effective._config_sources(str(root))
+    assert sources[-1][0] == str(tmp_path / "conf.d" / "two")
+    assert parsed == ["Host two"]
@@ -0,0 +1,143 @@
+import os
+import queue
+import threading
+
+from sshpilot.file_manager.local_listing import (
+    LocalDirectoryLoader,
+    count_local_children,
+    iter_local_entries,
+)
+
+
+class _MainLoop:
+    """Dispatcher double: queue callbacks, run them when the test drains."""
+
+    def __init__(self):
+        self.pending = queue.Queue()
+
+    def dispatch(self, func, *args, **kwargs):
+        self.pending.put(lambda: func(*args, **kwargs))
+
+    def drain(self, until, timeout=5.0):
+        while not until():
+            self.pending.get(timeout=timeout)()
+
+
+def _tree(tmp_path, files=5, folders=2):
+    for index in range(files):
+        (tmp_path / f"file-{index}.txt").write_text("x" * index)
+    for index in range(folders):
+        folder = tmp_path / f"dir-{index}"
+        folder.mkdir()
+        for child in range(index + 1):
+            (folder / f"child-{child}").write_text("")
+    return str(tmp_path)
+
+
+def test_iter_local_entries_batches_grow_and_skip_nothing(tmp_path):
+    path = _tree(tmp_path, files=20, folders=0)
+
+    batches = list(iter_local_entries(path, batch_size=3, max_batch_size=8))
+
+    assert [len(batch) for batch in batches] == [3, 6, 8, 3]
+    names = {entry.name for batch in batches for entry in batch}
+    assert names == {f"file-{index}.txt" for index in range(20)}
+    # Listing no longer walks into subdirectories for counts.
+    assert all(entry.item_count is None for batch in batches for entry in batch)
+
+
+def test_iter_local_entries_stops_when_cancelled(tmp_path):
+    path = _tree(tmp_path, files=10, folders=0)
+    cancelled = threading.Event()
+
+    batches = []
+    for batch in iter_local_entries(path, cancelled, batch_size=2, max_batch_size=2):
+        batches.append(batch)
+        cancelled.set()
+
+    assert len(batches) == 1
+
+
+def test_count_local_children_handles_unreadable(tmp_path):
+    _tree(tmp_path, files=0, folders=2)
+
+    assert count_local_children(str(tmp_path / "dir-1")) == 2
+    assert count_local_children(str(tmp_path / "missing")) is None
+
+
+def test_loader_streams_batches_then_completes(tmp_path):
+    path = _tree(tmp_path, files=300, folders=0)
+    loop = _MainLoop()
+    loader = LocalDirectoryLoader(loop.dispatch)
+    events = []
+
+    loader.load(
+        path,
+        lambda p, entries, first: events.append(("batch", len(entries), first)),
+        lambda p, empty: events.append(("done", empty)),
+        lambda p, exc: events.append(("error", exc)),
+    )
+    loop.drain(lambda: events and events[-1][0] in {"done", "error"})
+
+    batches = [event for event in events if event[0] == "batch"]
+    assert batches[0][2] is True
+    assert all(first is False for _kind, _size, first in batches[1:])
+    assert sum(size for _kind, size, _first in batches) == 300
+    assert events[-1] == ("done", False)
+
+
+def test_superseded_load_delivers_nothing(tmp_path):
+    first_dir = tmp_path / "first"
+    second_dir = tmp_path / "second"
+    first_dir.mkdir()
+    second_dir.mkdir()
+    _tree(first_dir, files=3, folders=0)
+    loop = _MainLoop()
+    loader = LocalDirectoryLoader(loop.dispatch)
+    seen = []
+
+    def record(path, *_args):
+        seen.append(path)
+
+    loader.load(str(first_dir), record, record, record)
+    loader.load(str(second_dir), record, record, record)
+    loop.drain(lambda: str(second_dir) in seen)
+    # Give the first worker time to post anything it still had queued.
+    while True:
+        try:
+            loop.pending.get(timeout=0.2)()
+        except queue.Empty:
+            break
+
+    assert set(seen) == {str(second_dir)}
+
+
+def test_missing_directory_reports_error(tmp_path):
+    loop = _MainLoop()
+    loader = LocalDirectoryLoader(loop.dispatch)
+    errors = []
+
+    loader.load(str(tmp_path / "nope"), None, None, lambda p, exc: errors.append(exc))
+    loop.drain(lambda: errors)
+
+    assert isinstance(errors[0], NotADirectoryError)
+
+
+def test_counts_are_computed_once_for_the_current_listing(tmp_path):
+    path = _tree(tmp_path, files=0, folders=2)
+    loop = _MainLoop()
+    loader = LocalDirectoryLoader(loop.dispatch)
+    counts = {}
+    done = []
+
+    loader.load(path, lambda *_args: None, lambda *_args: done.append(1), None)
+    loop.drain(lambda: done)
+
+    for _ in range(3):
+        loader.request_count(path, "dir-0", lambda p, update: counts.update(update))
+    loader.request_count(path, "dir-1", lambda p, update: counts.update(update))
+    loader.request_count(os.path.dirname(path), "dir-1", lambda p, update: counts.update({"stale": 1}))
+    loop.drain(lambda: len(counts) == 2)
+
+    assert counts == {"dir-0": 1, "dir-1": 2}
+    assert loop.pending.empty()
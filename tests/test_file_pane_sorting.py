@@ -0,0 +1,148 @@
+from tests.test_file_pane_typeahead import _load_file_manager_window
+
+
+class _Store:
+    def __init__(self):
+        self.items = []
+        self.splices = 0
+
+    def get_n_items(self):
+        return len(self.items)
+
+    def splice(self, position, n_removals, additions):
+        self.splices += 1
+        self.items[position:position + n_removals] = list(additions)
+
+
+class _Bitset:
+    def __init__(self, indices):
+        self._indices = sorted(indices)
+
+    def get_size(self):
+        return len(self._indices)
+
+    def get_nth(self, nth):
+        return self._indices[nth]
+
+
+class _Selection:
+    def __init__(self):
+        self.selected = set()
+
+    def get_selection(self):
+        return _Bitset(self.selected)
+
+    def unselect_all(self):
+        self.selected.clear()
+
+    def select_item(self, index, _exclusive):
+        self.selected.add(index)
+
+
+class _StringObject:
+    created = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    @classmethod
+    def new(cls, value):
+        cls.created += 1
+        return cls(value)
+
+
+def _pane(module, monkeypatch):
+    pane_module = __import__("sshpilot.file_manager.pane", fromlist=["Gtk"])
+    monkeypatch.setattr(pane_module.Gtk, "StringObject", _StringObject, raising=False)
+    _StringObject.created = 0
+    FilePane = module.FilePane
+    pane = FilePane.__new__(FilePane)
+    pane._is_remote = False
+    pane._show_hidden = False
+    pane._sort_key = "name"
+    pane._sort_descending = False
+    pane._entries = []
+    pane._cached_entries = []
+    pane._raw_entries = []
+    pane._collation_keys = {}
+    pane._store_items = {}
+    pane._list_store = _Store()
+    pane._selection_model = _Selection()
+    pane._selection_anchor = None
+    pane._update_menu_state = lambda: None
+    pane._clear_load_error = lambda: None
+    pane._set_current_pathbar_text = lambda _path: None
+    pane._update_sort_direction_states = lambda: None
+    return pane
+
+
+def _entries(module):
+    FileEntry = module.FileEntry
+    return [
+        FileEntry("beta.txt", False, 30, 3.0),
+        FileEntry("Alpha.txt", False, 10, 1.0),
+        FileEntry(".hidden", False, 5, 9.0),
+        FileEntry("src", True, 0, 2.0),
+        FileEntry("Docs", True, 0, 4.0),
+    ]
+
+
+def _names(pane):
+    return [item.value for item in pane._list_store.items]
+
+
+def test_listing_populates_store_in_one_splice(monkeypatch):
+    module = _load_file_manager_window()
+    pane = _pane(module, monkeypatch)
+
+    pane.show_entries("/tmp", _entries(module))
+
+    assert _names(pane) == ["Docs/", "src/", "Alpha.txt", "beta.txt"]
+    assert pane._list_store.splices == 1
+
+
+def test_sort_change_reuses_store_items_and_keeps_selection(monkeypatch):
+    module = _load_file_manager_window()
+    pane = _pane(module, monkeypatch)
+    pane.show_entries("/tmp", _entries(module))
+    created = _StringObject.created
+    pane._selection_model.select_item(3, False)  # beta.txt
+
+    pane._on_sort_by("size")
+    # Equal folder sizes keep listing order.
+    assert _names(pane) == ["src/", "Docs/", "Alpha.txt", "beta.txt"]
+
+    pane._on_sort_direction(True)
+    assert _names(pane) == ["src/", "Docs/", "beta.txt", "Alpha.txt"]
+    assert [entry.name for entry in pane.get_selected_entries()] == ["beta.txt"]
+
+    pane._show_hidden = True
+    pane._apply_entry_filter(preserve_selection=True)
+    assert ".hidden" in _names(pane)
+    # Only the newly visible hidden file needed a new item.
+    assert _StringObject.created == created + 1
+
+
+def test_unchanged_order_skips_the_store(monkeypatch):
+    module = _load_file_manager_window()
+    pane = _pane(module, monkeypatch)
+    FileEntry = module.FileEntry
+    pane.show_entries("/tmp", [FileEntry("a", True, 0, 1.0), FileEntry("b", True, 0, 2.0)])
+    splices = pane._list_store.splices
+
+    # Folders all have size 0, so a size sort keeps the order.
+    pane._on_sort_by("size")
+
+    assert pane._list_store.splices == splices
+
+
+def test_appended_batches_merge_into_sorted_order(monkeypatch):
+    module = _load_file_manager_window()
+    pane = _pane(module, monkeypatch)
+    FileEntry = module.FileEntry
+    pane.show_entries("/tmp", [FileEntry("m", False, 1, 1.0)])
+
+    pane.append_entries("/tmp", [FileEntry("a", False, 1, 1.0), FileEntry("z", True, 1, 1.0)])
+    pane.append_entries("/elsewhere", [FileEntry("ignored", False, 1, 1.0)])
+
+    assert _names(pane) == ["z/", "a", "m"]
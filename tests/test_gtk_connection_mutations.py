@@ -42,6 +42,13 @@ class _Client:
         self.deleted.append(request)
         return SimpleNamespace(connection_id=request.connection_id, deleted=True)
 
+    def delete_connections(self, request):
+        self.deleted.extend(request.connection_ids)
+        return SimpleNamespace(
+            succeeded_ids=request.connection_ids,
+            failed=(),
+        )
+
     def update_connection_metadata(self, connection_id, metadata):
         self.metadata.append((connection_id, metadata))
         return True
@@ -81,9 +88,11 @@ class _ProjectionGroupManager:
 
 class _ProjectionWindow:
     on_projection_reset = MainWindow.on_projection_reset
+    _reindex_connection_search = MainWindow._reindex_connection_search
 
     def __init__(self):
         self.group_manager = _ProjectionGroupManager()
+        self.connection_list = None
         self.rebuilds = 0
         # Mirrors MainWindow.__init__'s startup-focus bookkeeping, which
         # on_projection_reset reads/writes (see "focus first row on startup",
@@ -1230,6 +1239,29 @@ def test_daemon_delete_is_not_optimistic_and_disconnects_only_after_success():
     assert window.rebuilds == 1
 
 
+def test_daemon_bulk_delete_submits_one_batch_and_reports_failed_items():
+    window = _MutationWindow()
+    connections = [
+        SimpleNamespace(nickname=name, protocol="ssh", connection_id=name, uuid=name)
+        for name in ("one", "two", "three")
+    ]
+
+    window._delete_connections_via_client(connections, close_terminals=True)
+
+    assert len(window.client_bridge.calls) == 1
+    operation, success, _failure = window.client_bridge.calls[0]
+    operation()
+    assert window.client.deleted == ["one", "two", "three"]
+
+    success(SimpleNamespace(
+        succeeded_ids=("one", "three"),
+        failed=(SimpleNamespace(connection_id="two", error_code="conflict"),),
+    ))
+    assert window.disconnected == [connections[0], connections[2]]
+    assert window.connection_manager.reloads == 1
+    assert len(window.errors) == 1
+
+
 def test_daemon_group_move_failure_does_not_mutate_local_group_manager():
     from sshpilot.window import MainWindow
 
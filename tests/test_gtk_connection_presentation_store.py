@@ -16,7 +16,11 @@ from sshpilot.api.models.connection_store import (
     ConnectionStoreSnapshot,
     GroupSummary,
 )
-from sshpilot.api.models.connections import ConnectionSummary
+from sshpilot.api.models.connections import (
+    ConnectionHealth,
+    ConnectionReachability,
+    ConnectionSummary,
+)
 from sshpilot.gtk.connection_store import ConnectionPresentationStore
 
 
@@ -335,6 +339,43 @@ def test_refresh_emits_one_projection_reset_instead_of_item_signals():
     assert emitted == [("projection-reset", None)]
 
 
+def test_reachability_events_and_polled_results_keep_the_newest_probe():
+    client = Client("daemon-a", [summary("one")])
+    store = ConnectionPresentationStore()
+    store.attach_client(client)
+    emitted = []
+    store.connect_after(
+        "connection-reachability",
+        lambda _store, item: emitted.append(item),
+    )
+    newer = ConnectionReachability(
+        connection_id="one",
+        health=ConnectionHealth.REACHABLE,
+        probes=3,
+        last_checked_at=datetime(2026, 1, 1, 12, 1, tzinfo=timezone.utc),
+        last_seen_at=datetime(2026, 1, 1, 12, 1, tzinfo=timezone.utc),
+        rtt_p50_ms=4.0,
+        rtt_p90_ms=6.0,
+        rtt_max_ms=6.0,
+    )
+    older = ConnectionReachability(
+        connection_id="one",
+        health=ConnectionHealth.UNREACHABLE,
+        probes=2,
+        consecutive_failures=2,
+        last_checked_at=datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
+    )
+
+    client.emit(EventType.CONNECTION_REACHABILITY_CHANGED, newer, 0)
+    store.apply_reachability([older])
+
+    assert store.get_reachability("one") == newer
+    assert emitted == [newer]
+    # Probe results never advance the store's event sequence.
+    client.emit(EventType.CONNECTION_CREATED, summary("two"), 1)
+    assert [item.id for item in store.snapshot().connections] == ["one", "two"]
+
+
 # ---------------------------------------------------------------------------
 # Boundary guarantees
 # ---------------------------------------------------------------------------
@@ -0,0 +1,155 @@
+import os
+
+import pytest
+
+from sshpilot.log_index import (
+    LogLineIndex,
+    count_lines,
+    read_appended,
+    read_lines_before,
+    tail_lines,
+)
+
+
+def _write(path, lines, tail=""):
+    path.write_text("".join(f"{line}\n" for line in lines) + tail)
+    return str(path)
+
+
+def _lines(count):
+    return [f"2024-01-01 00:00:00 - sshpilot - INFO - record {i} " + "x" * (i % 37) for i in range(count)]
+
+
+@pytest.mark.parametrize("n", [0, 1, 7, 300, 5000])
+def test_tail_lines_matches_a_full_read(tmp_path, n):
+    lines = _lines(3000)
+    path = _write(tmp_path / "a.log", lines, tail="partial record")
+
+    got, start, end = tail_lines(path, n, block_size=113)
+
+    assert got == (lines[-n:] if n else [])
+    with open(path, "rb") as fh:
+        data = fh.read()
+    assert end == len(data) - len(b"partial record")
+    if n:
+        assert data[start:end].decode().splitlines() == got
+
+
+def test_read_lines_before_pages_up_to_the_start(tmp_path):
+    lines = _lines(1000)
+    path = _write(tmp_path / "a.log", lines)
+
+    collected = []
+    end = os.path.getsize(path)
+    while True:
+        page, end = read_lines_before(path, end, 128, block_size=257)
+        if not page:
+            break
+        collected[:0] = page
+
+    assert collected == lines
+    assert end == 0
+
+
+def test_read_appended_leaves_partial_line_for_later(tmp_path):
+    path = _write(tmp_path / "a.log", ["one"], tail="tw")
+    lines, consumed = read_appended(path, 0)
+    assert lines == ["one"] and consumed == 4
+
+    with open(path, "a") as fh:
+        fh.write("o\nthree\n")
+    lines, consumed = read_appended(path, consumed)
+    assert lines == ["two", "three"]
+    assert consumed == os.path.getsize(path)
+
+
+def test_count_lines_counts_unterminated_tail(tmp_path):
+    assert count_lines(_write(tmp_path / "a.log", ["a", "b"], tail="c")) == 3
+    assert count_lines(_write(tmp_path / "b.log", [])) == 0
+
+
+def _build(index, step=4096):
+    while not index.extend(step):
+        pass
+
+
+def test_index_seeks_to_any_line(tmp_path):
+    lines = _lines(5000)
+    path = _write(tmp_path / "a.log", lines)
+    index = LogLineIndex(path, stride=64)
+    index.refresh()
+    _build(index, step=10_000)
+
+    assert index.line_count == 5000
+    for line in (0, 1, 63, 64, 65, 4999):
+        got, _end = index.read_lines(line, 2)
+        assert got == lines[line:line + 2]
+    _tail, start, end = tail_lines(path, 10)
+    assert index.line_at_offset(start) == 4990
+    assert index.line_at_offset(end) == 5000
+
+
+def test_index_extends_appends_without_rescanning(tmp_path):
+    lines = _lines(200)
+    path = _write(tmp_path / "a.log", lines)
+    index = LogLineIndex(path, stride=16)
+    index.refresh()
+    _build(index)
+    indexed = index.indexed_to
+
+    with open(path, "a") as fh:
+        fh.write("appended\n")
+
+    assert index.refresh() is False
+    assert index.indexed_to == indexed
+    _build(index)
+    assert index.line_count == 201
+    assert index.read_lines(200, 1)[0] == ["appended"]
+
+
+def test_index_resets_on_truncation_and_rotation(tmp_path):
+    path = _write(tmp_path / "a.log", _lines(100))
+    index = LogLineIndex(path, stride=16)
+    index.refresh()
+    _build(index)
+
+    # Truncated and regrown past the old size with different content.
+    _write(tmp_path / "a.log", ["rotated"] * 500)
+    assert index.refresh() is True
+    _build(index)
+    assert index.line_count == 500
+
+    # Rotated: the path now names a different file.
+    os.replace(path, str(tmp_path / "a.log.1"))
+    _write(tmp_path / "a.log", ["fresh"])
+    assert index.refresh() is True
+    _build(index)
+    assert index.line_count == 1
+
+
+def test_index_drops_a_slice_already_indexed_by_another_caller(tmp_path):
+    path = _write(tmp_path / "a.log", _lines(5000))
+    index = LogLineIndex(path, stride=100)
+    index.refresh()
+    real_lock = index._lock
+    raced = []
+
+    class _RacingLock:
+        """Runs a second extend() right after the first one snapshots."""
+
+        def __enter__(self):
+            return real_lock.__enter__()
+
+        def __exit__(self, *exc):
+            real_lock.__exit__(*exc)
+            if not raced:
+                raced.append(True)
+                assert index.extend() is True
+
+    index._lock = _RacingLock()
+    index.extend()
+    index._lock = real_lock
+
+    assert index.line_count == 5000
+    assert len(index._checkpoints) == 51
+    assert index.line_at_offset(index.indexed_to) == 5000
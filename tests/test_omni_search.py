@@ -1,5 +1,6 @@
 from types import SimpleNamespace
 
+from sshpilot import omni_search
 from sshpilot.api.models.connection_store import ConnectionMetadataSummary
 from sshpilot.omni_search import (
     CommandSpec,
@@ -228,3 +229,119 @@ def test_ssh_results_share_field_validation_without_rejecting_aliases(
     assert invalid_port.kind == "validation"
     assert invalid_port.enabled is False
     assert alias.kind == "ssh"
+
+
+class _MenuSection:
+    def __init__(self):
+        self.handlers = []
+
+    def connect(self, signal, handler):
+        assert signal == "items-changed"
+        self.handlers.append(handler)
+
+    def emit(self):
+        for handler in self.handlers:
+            handler(self, 0, 0, 1)
+
+
+def test_commands_are_cached_until_plugin_menu_changes(monkeypatch):
+    calls = []
+
+    def collect(_window):
+        calls.append(1)
+        return [CommandSpec("Preferences", "app.preferences")]
+
+    monkeypatch.setattr("sshpilot.omni_search.collect_commands", collect)
+    window = _window()
+    window._plugins_menu_section = _MenuSection()
+
+    for query in ("p", "pr", "pre", "prefs"):
+        search_omni(window, query)
+    assert len(calls) == 1
+
+    window._plugins_menu_section.emit()
+    search_omni(window, "pref")
+    assert len(calls) == 2
+
+
+def test_refined_query_rescans_only_previous_literal_matches(monkeypatch):
+    monkeypatch.setattr("sshpilot.omni_search.collect_commands", lambda _window: [])
+    scored = []
+    real = omni_search._literal_score
+
+    def spy(query, tokens, phrases):
+        scored.append(phrases)
+        return real(query, tokens, phrases)
+
+    monkeypatch.setattr(omni_search, "_literal_score", spy)
+    connections = [_connection(f"web-{index}") for index in range(20)]
+    connections += [_connection(f"db-{index}") for index in range(20)]
+    window = _window(connections)
+
+    search_omni(window, "web")
+    assert len(scored) == 40
+    scored.clear()
+
+    results = search_omni(window, "web-1")
+    assert len(scored) == 20
+    assert results[0].title == "web-1"
+
+    # A query that does not extend the previous one scans everything again.
+    scored.clear()
+    search_omni(window, "db")
+    assert len(scored) == 40
+
+
+def test_catalog_tracks_connection_changes(monkeypatch):
+    monkeypatch.setattr("sshpilot.omni_search.collect_commands", lambda _window: [])
+    web = _connection("web")
+    window = _window([web])
+    assert [r.title for r in search_omni(window, "web")] == ["web"]
+
+    window.connection_manager._connections = [_connection("db")]
+    assert search_omni(window, "web") == []
+    assert [r.title for r in search_omni(window, "db")] == ["db"]
+
+    db = window.connection_manager._connections[0]
+    db.tags = ["web"]
+    assert [r.title for r in search_omni(window, "web")] == ["db"]
+
+
+def _reference_search(window, query, limit=8):
+    """The pre-cache algorithm: score everything, full sort, then dedupe."""
+    results = []
+    for connection in window.connection_manager.get_connections():
+        score = _match_score(query, omni_search._connection_phrases(connection))
+        if score:
+            results.append(omni_search._connection_result(connection, score + 50))
+    for command in omni_search.collect_commands(window):
+        score = _match_score(query, (command.title, *command.aliases))
+        if score:
+            results.append(omni_search.OmniResult(
+                "command", command.title, "Command", command.icon_name,
+                score, command,
+            ))
+    results.sort(key=lambda result: (-result.score, result.title.casefold()))
+    deduped, seen = [], set()
+    for result in results:
+        key = omni_search._result_key(result)
+        if key not in seen:
+            seen.add(key)
+            deduped.append(result)
+    return deduped[:limit]
+
+
+def test_top_k_matches_full_sort_including_fuzzy_fallback(monkeypatch):
+    commands = [
+        CommandSpec("Preferences", "app.preferences", aliases=("settings",)),
+        CommandSpec("Open Terminal", "app.local-terminal", aliases=("shell",)),
+        CommandSpec("Production Report", "app.report"),
+    ]
+    monkeypatch.setattr("sshpilot.omni_search.collect_commands", lambda _window: commands)
+    names = ["prod-web", "prod-db", "preview", "staging", "pref", "prefs-host"]
+    connections = [_connection(name, host=f"{name}.lan") for name in names]
+    connections += [_connection(f"node-{index}") for index in range(12)]
+    window = _window(connections)
+
+    for query in ("p", "pr", "pre", "pref", "prefe", "preferenes", "node", "node-1", "nod-3", "stagin"):
+        assert search_omni(window, query) == _reference_search(window, query), query
@@ -40,7 +40,7 @@ def test_application_quit_with_confirmation_dialog_does_not_crash():
         'sshpilot.welcome_page': types.SimpleNamespace(WelcomePage=object),
         'sshpilot.actions': types.SimpleNamespace(WindowActions=object, register_window_actions=lambda window: None),
         'sshpilot.shutdown': types.SimpleNamespace(cleanup_and_quit=lambda w: None),
-        'sshpilot.search_utils': types.SimpleNamespace(connection_matches=lambda *a, **k: False),
+        'sshpilot.search_utils': types.SimpleNamespace(ConnectionSearchIndex=object, connection_matches=lambda *a, **k: False),
     }
     old_modules = {}
     for name, mod in stub_modules.items():
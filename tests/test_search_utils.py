@@ -1,5 +1,5 @@
 from sshpilot.connection_manager import Connection
-from sshpilot.search_utils import connection_matches
+from sshpilot.search_utils import ConnectionSearchIndex, connection_matches
 
 
 def make_connection(nickname, hostname, host=None):
@@ -98,3 +98,59 @@ def test_extra_whitespace_is_ignored():
     setattr(conn, "tags", ["web"])
     assert connection_matches(conn, "  server   web  ")
     assert connection_matches(conn, "   ")
+
+
+def _fleet():
+    fleet = [
+        make_connection("web-server", "10.0.0.8"),
+        make_connection("web", "10.0.0.9"),
+        make_connection("db1", "db1.example.com"),
+        make_connection("alpha", "192.168.1.10"),
+        make_connection("prod-web", "203.0.113.10"),
+    ]
+    setattr(fleet[0], "tags", ["Production", "frontend"])
+    setattr(fleet[3], "tags", ["db"])
+    return fleet
+
+
+def test_index_agrees_with_connection_matches():
+    fleet = _fleet()
+    index = ConnectionSearchIndex()
+    index.update(fleet)
+    for query in ("web", "WEB prod", "10.0", "db", "example.com", "e", "zz", "", "server 10.0 frontend"):
+        expected = {c.nickname for c in fleet if connection_matches(c, query)}
+        assert index.matching_ids(query) == expected, query
+
+
+def test_index_tag_facet_and_incremental_update():
+    fleet = _fleet()
+    index = ConnectionSearchIndex()
+    index.update(fleet)
+    assert index.matching_ids("", tag="production") == {"web-server"}
+    assert index.matching_ids("web", tag="db") == set()
+
+    setattr(fleet[1], "tags", ["production"])
+    index.update(fleet[1:])
+    assert index.matching_ids("", tag="PRODUCTION") == {"web"}
+    assert "web-server" not in index.matching_ids("web")
+    assert len(index) == 4
+
+
+def test_index_upsert_and_discard_apply_single_changes():
+    fleet = _fleet()
+    index = ConnectionSearchIndex()
+    index.update(fleet)
+    renamed = make_connection("cache", "10.0.0.9")
+    index.discard("web")
+    index.upsert(renamed, tags=["Redis"])
+    assert index.matching_ids("web") == {"web-server", "prod-web"}
+    assert index.matching_ids("", tag="redis") == {"cache"}
+    assert len(index) == 5
+
+
+def test_index_rank_prefers_nickname_hits_and_falls_back_to_fuzzy():
+    index = ConnectionSearchIndex()
+    index.update(_fleet())
+    assert index.rank("web") == ["web", "web-server", "prod-web"]
+    assert index.rank("web", limit=1) == ["web"]
+    assert index.rank("wbsrv") == ["web-server"]
@@ -19,6 +19,7 @@ class _Row:
         self.file_manager_button = MagicMock()
         self._file_manager_callback = None
         self._effective_warning_callback = MagicMock()
+        self._prewarm_callback = MagicMock()
         self.connection = SimpleNamespace(protocol="ssh")
 
 
@@ -54,6 +55,7 @@ def test_hover_requests_effective_config_check():
     row._on_row_enter(None, 0, 0)
 
     row._effective_warning_callback.assert_called_once_with(row, row.connection)
+    row._prewarm_callback.assert_called_once_with(row.connection)
 
 
 def test_non_ssh_hover_never_requests_effective_config_check():
@@ -63,6 +65,7 @@ def test_non_ssh_hover_never_requests_effective_config_check():
     row._on_row_enter(None, 0, 0)
 
     row._effective_warning_callback.assert_not_called()
+    row._prewarm_callback.assert_not_called()
 
 
 def test_compact_row_hides_warning_and_skips_check():
@@ -75,3 +78,38 @@ def test_compact_row_hides_warning_and_skips_check():
 
     row.effective_warning_icon.set_visible.assert_called_with(False)
     row._effective_warning_callback.assert_not_called()
+
+
+def test_leaving_a_row_keeps_the_pending_selection_prewarm(monkeypatch):
+    from sshpilot import window as window_module
+    from sshpilot.api.models.sessions import PrewarmReason
+
+    pending = {}
+    ids = iter(range(1, 100))
+
+    def timeout_add(_delay, callback):
+        source = next(ids)
+        pending[source] = callback
+        return source
+
+    monkeypatch.setattr(
+        window_module,
+        "GLib",
+        SimpleNamespace(
+            timeout_add=timeout_add,
+            source_remove=lambda source: pending.pop(source, None),
+        ),
+    )
+    owner = SimpleNamespace(_request_connection_prewarm=MagicMock())
+    schedule = window_module.MainWindow._schedule_connection_prewarm
+    selected = SimpleNamespace(protocol="ssh")
+
+    schedule(owner, selected, PrewarmReason.SELECTION)
+    schedule(owner, SimpleNamespace(protocol="ssh"))
+    schedule(owner, None)
+    for callback in list(pending.values()):
+        callback()
+
+    owner._request_connection_prewarm.assert_called_once_with(
+        selected, PrewarmReason.SELECTION
+    )
@@ -0,0 +1,143 @@
+from types import SimpleNamespace
+
+from sshpilot.sidebar import ConnectionRow, SidebarRowCache, reconcile_list_rows
+
+
+class _Row:
+    def __init__(self, name):
+        self.name = name
+        self.parent = None
+
+    def get_next_sibling(self):
+        children = self.parent.children
+        index = children.index(self) + 1
+        return children[index] if index < len(children) else None
+
+    def __repr__(self):
+        return f"_Row({self.name!r})"
+
+
+class _ListBox:
+    def __init__(self, rows=()):
+        self.children = []
+        self.operations = []
+        for row in rows:
+            self.append(row)
+        self.operations.clear()
+
+    def get_first_child(self):
+        return self.children[0] if self.children else None
+
+    def append(self, row):
+        row.parent = self
+        self.children.append(row)
+        self.operations.append(("append", row.name))
+
+    def insert(self, row, position):
+        row.parent = self
+        self.children.insert(position, row)
+        self.operations.append(("insert", row.name, position))
+
+    def remove(self, row):
+        self.children.remove(row)
+        row.parent = None
+        self.operations.append(("remove", row.name))
+
+
+def _rows(names):
+    return {name: _Row(name) for name in names}
+
+
+def test_unchanged_presentation_touches_no_widgets():
+    rows = _rows("abcde")
+    listbox = _ListBox(rows.values())
+
+    reconcile_list_rows(listbox, list(rows.values()))
+
+    assert listbox.operations == []
+
+
+def test_single_insert_and_remove_are_the_only_operations():
+    rows = _rows("abcdef")
+    listbox = _ListBox([rows[name] for name in "abcde"])
+
+    reconcile_list_rows(listbox, [rows[name] for name in "abdfe"])
+
+    assert [row.name for row in listbox.children] == list("abdfe")
+    assert sorted(listbox.operations) == [("insert", "f", 3), ("remove", "c")]
+
+
+def test_moved_row_is_reinserted_and_strays_removed():
+    rows = _rows("abcdx")
+    listbox = _ListBox([rows[name] for name in "abcxd"])
+
+    reconcile_list_rows(listbox, [rows[name] for name in "dabc"])
+
+    assert [row.name for row in listbox.children] == list("dabc")
+    assert ("remove", "x") in listbox.operations
+    assert len(listbox.operations) == 3  # drop x, move d
+
+
+def test_listbox_without_insert_falls_back_to_append():
+    rows = _rows("abc")
+    listbox = _ListBox([rows["a"], rows["b"]])
+    listbox.insert = None
+
+    reconcile_list_rows(listbox, [rows["c"], rows["a"]])
+
+    assert [row.name for row in listbox.children] == ["c", "a"]
+
+
+def test_rebind_with_unchanged_data_skips_redraw():
+    row = ConnectionRow.__new__(ConnectionRow)
+    redraws = []
+    row.group_manager = SimpleNamespace(groups={})
+    row._bound_signature = None
+    row.set_visible = lambda visible: None
+    row.hide_drop_indicators = lambda: None
+    row.set_compact = lambda compact: None
+    row.update_display = lambda: redraws.append("display")
+    row._apply_group_color_style = lambda: redraws.append("color")
+    connection = SimpleNamespace(nickname="web")
+
+    row.rebind(connection, display_group_id=None)
+    row.rebind(connection, display_group_id=None)
+    assert redraws == ["display", "color"]
+
+    row.rebind(SimpleNamespace(nickname="web-renamed"), display_group_id=None)
+    assert redraws == ["display", "color", "display", "color"]
+
+
+class _CachedRow(_Row):
+    def rebind(self):
+        pass
+
+
+def _take(cache, name):
+    return cache.take(("connection", name, None, False), lambda: _CachedRow(name), _CachedRow.rebind)
+
+
+def test_row_cache_trims_least_recently_shown_detached_rows():
+    cache = SidebarRowCache(max_detached=2)
+    cache.begin()
+    rows = {name: _take(cache, name) for name in "abcd"}
+    cache.begin()
+    assert _take(cache, "b") is rows["b"]
+    cache.trim()
+    # "a" was shown longest ago of the three detached rows.
+    assert len(cache) == 3
+    cache.begin()
+    assert _take(cache, "c") is rows["c"]
+    assert _take(cache, "a") is not rows["a"]
+
+
+def test_row_cache_evicts_every_slot_of_a_removed_connection():
+    cache = SidebarRowCache()
+    cache.begin()
+    cache.take(("connection", "a", "g1", False), lambda: _CachedRow("a"), _CachedRow.rebind)
+    cache.take(("connection", "a", None, False), lambda: _CachedRow("a"), _CachedRow.rebind)
+    _take(cache, "b")
+    cache.begin()
+    _take(cache, "b")
+    cache.evict("a")
+    assert len(cache) == 1
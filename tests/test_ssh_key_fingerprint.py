@@ -50,8 +50,20 @@ class TestFingerprintForPath:
 
         result = _fingerprint_for_path(str(private))
         assert result == ("ED25519", _fingerprint(b"abc"), "user@host")
-        public.unlink()
         assert _fingerprint_for_path(str(private)) == result
+        public.unlink()
+        assert _fingerprint_for_path(str(private)) == ("", "", "")
+
+    def test_rewritten_public_key_is_read_again(self, tmp_path):
+        public = tmp_path / "id_ed25519.pub"
+        public.write_text("ssh-ed25519 YWJj user@host\n")
+        assert _fingerprint_for_path(str(public))[1] == _fingerprint(b"abc")
+        public.write_text("ssh-ed25519 ZGVmZw== rotated\n")
+        assert _fingerprint_for_path(str(public)) == (
+            "ED25519",
+            _fingerprint(b"defg"),
+            "rotated",
+        )
 
     def test_missing_public_companion_yields_empty(self, tmp_path):
         private = tmp_path / "id_ed25519"
@@ -107,3 +107,28 @@ def test_socket_dir_repairs_existing_loose_runtime_tree(monkeypatch, tmp_path):
 
     assert stat.S_IMODE(root.stat().st_mode) == 0o700
     assert stat.S_IMODE((root / "cm").stat().st_mode) == 0o700
+
+
+def test_expire_all_masters_settles_real_sockets_without_ssh(monkeypatch, tmp_path):
+    import socket
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    sock_dir = mux.socket_dir()
+    stale = os.path.join(sock_dir, "stale")
+    leftover = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    leftover.bind(stale)
+    leftover.close()  # socket file remains, nothing listens
+
+    stopped = []
+    monkeypatch.setattr(
+        "sshpilot.daemon.ssh_mux.stop_listening",
+        lambda path, timeout: stopped.append(path) or (_ for _ in ()).throw(ConnectionRefusedError()),
+    )
+    monkeypatch.setattr(
+        mux.subprocess, "run",
+        lambda *_a, **_k: (_ for _ in ()).throw(AssertionError("ssh was spawned")),
+    )
+    mux.expire_all_masters(background=False)
+
+    assert stopped == [stale]
+    assert not os.path.exists(stale)
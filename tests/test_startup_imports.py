@@ -0,0 +1,136 @@
+"""The startup critical path must not import heavy subsystems.
+
+``sshpilot.main`` and ``sshpilot.window`` (imported when the app activates) run
+before the first sidebar paint. Everything they import at module level --
+transitively -- is on that path. The closure is computed statically from the
+source (GTK is not needed), so a new top-level import that drags in the
+terminal stack, file manager, preferences, backups, MCP or the PyXterm backend
+fails here instead of silently slowing every launch.
+"""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+CRITICAL_PATH_ROOTS = ("sshpilot.main", "sshpilot.window")
+
+# Loaded on first use, never on the way to the first paint.
+DEFERRED = {
+    "sshpilot.backup_manager",
+    "sshpilot.backup_archive",
+    "sshpilot.command_blocks",
+    "sshpilot.connection_dialog",
+    "sshpilot.file_manager",
+    "sshpilot.file_manager_window",
+    "sshpilot.mcp",
+    "sshpilot.preferences",
+    "sshpilot.scp_window",
+    "sshpilot.secret_storage",
+    "sshpilot.sftp",
+    "sshpilot.split_view",
+    "sshpilot.sshcopyid_window",
+    "sshpilot.ssh_process_manager",
+    "sshpilot.terminal",
+    "sshpilot.terminal_backends",
+    "sshpilot.terminal_manager",
+    "sshpilot.update_checker",
+    "sshpilot.xterm_pty_bridge",
+    "sshpilot.xterm_shell",
+}
+
+
+def _module_file(name: str):
+    path = SRC.joinpath(*name.split("."))
+    if (path / "__init__.py").exists():
+        return path / "__init__.py"
+    if path.with_suffix(".py").exists():
+        return path.with_suffix(".py")
+    return None
+
+
+def _is_type_checking(test: ast.expr) -> bool:
+    return "TYPE_CHECKING" in ast.unparse(test)
+
+
+def _import_time_imports(name: str) -> set[str]:
+    """Modules *name* imports while it is being imported (not in functions)."""
+    path = _module_file(name)
+    if path is None:
+        return set()
+    package = name.split(".") if path.name == "__init__.py" else name.split(".")[:-1]
+    found: set[str] = set()
+
+    def add(module: str) -> None:
+        parts = module.split(".")
+        found.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+
+    def visit(statements) -> None:
+        for node in statements:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if isinstance(node, ast.If) and _is_type_checking(node.test):
+                visit(node.orelse)
+                continue
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    add(alias.name)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    base = package[: len(package) - (node.level - 1)]
+                    module = ".".join(base + ([node.module] if node.module else []))
+                else:
+                    module = node.module or ""
+                add(module)
+                for alias in node.names:
+                    if _module_file(f"{module}.{alias.name}") is not None:
+                        add(f"{module}.{alias.name}")
+            for field in ("body", "orelse", "finalbody"):
+                visit(getattr(node, field, None) or ())
+            for handler in getattr(node, "handlers", None) or ():
+                visit(handler.body)
+
+    visit(ast.parse(path.read_text(encoding="utf-8")).body)
+    return found
+
+
+def _critical_path() -> dict[str, str]:
+    """Every sshpilot module on the startup path, mapped to who imported it."""
+    importer: dict[str, str] = {root: "" for root in CRITICAL_PATH_ROOTS}
+    pending = list(CRITICAL_PATH_ROOTS)
+    while pending:
+        module = pending.pop()
+        for dependency in sorted(_import_time_imports(module)):
+            if dependency.startswith("sshpilot") and dependency not in importer:
+                importer[dependency] = module
+                pending.append(dependency)
+    return importer
+
+
+def _chain(importer: dict[str, str], module: str) -> str:
+    chain = [module]
+    while importer.get(chain[-1]):
+        chain.append(importer[chain[-1]])
+    return " <- ".join(chain)
+
+
+def test_heavy_subsystems_stay_off_the_startup_import_path():
+    importer = _critical_path()
+
+    leaked = sorted(
+        module for module in importer
+        if any(module == name or module.startswith(name + ".") for name in DEFERRED)
+    )
+
+    assert not leaked, "\n".join(_chain(importer, module) for module in leaked)
+
+
+def test_critical_path_is_computed_from_real_imports():
+    importer = _critical_path()
+
+    # Sanity: the analysis does follow top-level imports.
+    assert "sshpilot.sidebar" in importer
+    assert "sshpilot.startup_profile" in importer
+    assert importer["sshpilot.window_tabs"] == "sshpilot.window"
@@ -0,0 +1,157 @@
+import json
+import sys
+
+import pytest
+
+from sshpilot import startup_profile
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    profiler = startup_profile.install(str(tmp_path / "profile.json"))
+    yield profiler
+    startup_profile.uninstall()
+
+
+def _write_package(root, name, body):
+    package = root / name
+    package.mkdir()
+    (package / "__init__.py").write_text(body)
+    return package
+
+
+def test_records_nested_import_cost(tmp_path, monkeypatch, profiler):
+    _write_package(tmp_path, "profiled_outer", "import profiled_inner\nVALUE = profiled_inner.VALUE\n")
+    _write_package(tmp_path, "profiled_inner", "import time\ntime.sleep(0.02)\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("profiled_outer", "profiled_inner"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    import profiled_outer
+
+    assert profiled_outer.VALUE == 42
+    # The module sees its real loader, not the timing proxy.
+    assert type(profiled_outer.__spec__.loader).__name__ == "SourceFileLoader"
+    assert profiled_outer.__loader__ is profiled_outer.__spec__.loader
+
+    imports = {item["module"]: item for item in profiler.report()["imports"]}
+    outer, inner = imports["profiled_outer"], imports["profiled_inner"]
+    assert inner["self_ms"] >= 15
+    assert outer["cumulative_ms"] >= inner["cumulative_ms"]
+    assert outer["self_ms"] < inner["self_ms"]
+
+
+def test_phases_write_the_profile_once_complete(tmp_path, profiler):
+    for phase in startup_profile.PHASES[:-1]:
+        startup_profile.mark(phase)
+    startup_profile.mark("imports")  # only the first mark counts
+    assert not (tmp_path / "profile.json").exists()
+
+    startup_profile.mark(startup_profile.PHASES[-1])
+
+    report = json.loads((tmp_path / "profile.json").read_text())
+    assert list(report["phases_ms"]) == list(startup_profile.PHASES)
+    assert report["missing_phases"] == []
+    times = list(report["phases_ms"].values())
+    assert times == sorted(times)
+    assert profiler._finder not in sys.meta_path
+
+
+def test_mark_after_paint_waits_for_the_frame_clock(profiler):
+    class Clock:
+        def __init__(self):
+            self.handlers = {}
+
+        def connect(self, _signal, callback):
+            self.handlers[1] = callback
+            return 1
+
+        def disconnect(self, handler_id):
+            del self.handlers[handler_id]
+
+    class Widget:
+        def __init__(self):
+            self.clock = Clock()
+            self.draws = 0
+
+        def get_frame_clock(self):
+            return self.clock
+
+        def queue_draw(self):
+            self.draws += 1
+
+    widget = Widget()
+    startup_profile.mark_after_paint(widget, "first_sidebar_paint")
+    assert "first_sidebar_paint" not in profiler.phases
+    assert widget.draws == 1
+
+    widget.clock.handlers[1](widget.clock)
+    assert "first_sidebar_paint" in profiler.phases
+    assert widget.clock.handlers == {}
+
+
+def test_environment_variable_controls_installation(tmp_path, monkeypatch):
+    monkeypatch.delenv(startup_profile.ENV_VAR, raising=False)
+    assert startup_profile.install_from_environment() is None
+    assert not startup_profile.active()
+
+    target = tmp_path / "custom.json"
+    monkeypatch.setenv(startup_profile.ENV_VAR, str(target))
+    monkeypatch.setattr(startup_profile.atexit, "register", lambda _func: None)
+    try:
+        profiler = startup_profile.install_from_environment()
+        assert profiler.path == str(target)
+        assert startup_profile.active()
+        assert profiler.write() == str(target)
+        assert target.exists()
+    finally:
+        startup_profile.uninstall()
+    startup_profile.mark("imports")  # no profiler: a no-op
+
+
+def test_time_to_interactive_waits_for_map_and_paint(caplog):
+    class Clock:
+        def __init__(self):
+            self.handlers = {}
+
+        def connect(self, _signal, callback):
+            self.handlers[1] = callback
+            return 1
+
+        def disconnect(self, handler_id):
+            del self.handlers[handler_id]
+
+    class Dialog:
+        def __init__(self):
+            self.clock = Clock()
+            self.mapped = False
+            self.signals = {}
+
+        def get_mapped(self):
+            return self.mapped
+
+        def connect(self, signal, callback):
+            self.signals[7] = callback
+            return 7
+
+        def disconnect(self, handler_id):
+            del self.signals[handler_id]
+
+        def get_frame_clock(self):
+            return self.clock
+
+        def queue_draw(self):
+            pass
+
+    dialog = Dialog()
+    caplog.set_level("INFO", logger=startup_profile.__name__)
+    startup_profile.log_time_to_interactive(dialog, "Preferences", startup_profile.time.perf_counter())
+    assert dialog.clock.handlers == {}
+
+    dialog.signals[7](dialog)
+    assert dialog.signals == {}
+    assert "interactive" not in caplog.text
+
+    dialog.clock.handlers[1](dialog.clock)
+    assert "Preferences interactive after" in caplog.text
+    assert dialog.clock.handlers == {}
@@ -130,19 +130,19 @@ def test_search_results_include_matching_groups(monkeypatch):
 
     monkeypatch.setattr(window_module.MainWindow, "add_connection_row", tracked_add_connection_row)
 
-    original_matcher = window_module.connection_matches
-    match_calls = []
+    index_queries = []
+    original_matching_ids = window_module.ConnectionSearchIndex.matching_ids
 
-    def recording_match(connection, query):
-        fields = [
-            getattr(connection, "nickname", ""),
-            getattr(connection, "host", ""),
-        ]
-        result = original_matcher(connection, query)
-        match_calls.append((connection.nickname, query, fields, result))
+    def recording_matching_ids(self, query, *, tag=None):
+        result = original_matching_ids(self, query, tag=tag)
+        index_queries.append((query, tag, sorted(result)))
         return result
 
-    monkeypatch.setattr(window_module, "connection_matches", recording_match)
+    monkeypatch.setattr(
+        window_module.ConnectionSearchIndex,
+        "matching_ids",
+        recording_matching_ids,
+    )
 
     group_id = "group-1"
     group_connections = ["prod-server"]
@@ -168,9 +168,8 @@ def test_search_results_include_matching_groups(monkeypatch):
     test_window.config = DummyConfig()
     test_window.search_entry = DummySearchEntry("prod")
     test_window._hide_hosts = False
-
-    assert original_matcher(grouped_connection, "prod")
-    assert original_matcher(direct_connection, "prod")
+    test_window._connection_sort_last = None
+    test_window._drop_indicator_row = None
 
     test_window.rebuild_connection_list()
 
@@ -180,10 +179,7 @@ def test_search_results_include_matching_groups(monkeypatch):
 
     assert len(group_rows) == 1
     assert group_rows[0].group_info["name"] == "Production"
-    assert match_calls == [
-        ("prod-server", "prod", ["prod-server", "prod-01"], True),
-        ("prod-bastion", "prod", ["prod-bastion", "bastion"], True),
-    ]
+    assert index_queries == [("prod", None, ["prod-bastion", "prod-server"])]
     assert added_connections == [
         ("prod-server", 1, "group-1"),
         ("prod-bastion", 0, None),
@@ -197,3 +193,65 @@ def test_search_results_include_matching_groups(monkeypatch):
     assert len(direct_rows) == 1
     assert direct_rows[0].indentation == 0
 
+
+
+class RecyclingConnectionRow(StubConnectionRow):
+    created = 0
+
+    def __init__(self, connection, group_manager=None, config=None, **kwargs):
+        super().__init__(connection, group_manager, config, **kwargs)
+        type(self).created += 1
+        self.rebinds = []
+
+    def rebind(self, connection, **kwargs):
+        self.connection = connection
+        self.rebinds.append(kwargs)
+
+
+def test_search_keystrokes_recycle_connection_rows(monkeypatch):
+    monkeypatch.setitem(sys.modules, "cairo", types.SimpleNamespace())
+    window_module = importlib.import_module("sshpilot.window")
+    window_module = importlib.reload(window_module)
+
+    monkeypatch.setattr(window_module, "GroupRow", StubGroupRow)
+    monkeypatch.setattr(window_module, "ConnectionRow", RecyclingConnectionRow)
+    RecyclingConnectionRow.created = 0
+    snapshots = []
+    original_update = window_module.ConnectionSearchIndex.update
+
+    def counting_update(self, connections, **kwargs):
+        snapshots.append(len(connections))
+        return original_update(self, connections, **kwargs)
+
+    monkeypatch.setattr(window_module.ConnectionSearchIndex, "update", counting_update)
+
+    connections = [
+        Connection({"nickname": name, "host": name})
+        for name in ("web-1", "web-2", "db-1")
+    ]
+    test_window = window_module.MainWindow.__new__(window_module.MainWindow)
+    test_window.connection_list = DummyListBox()
+    test_window.connection_rows = {}
+    test_window.connection_scrolled = None
+    test_window.connection_manager = DummyConnectionManager(connections)
+    test_window.group_manager = DummyGroupManager({})
+    test_window.config = DummyConfig()
+    test_window.search_entry = DummySearchEntry("web")
+    test_window._hide_hosts = False
+    test_window._connection_sort_last = None
+    test_window._drop_indicator_row = None
+
+    test_window.rebuild_connection_list()
+    first = {row.connection.nickname: row for row in test_window.connection_list}
+    assert sorted(first) == ["web-1", "web-2"]
+
+    for text in ("web-", "web-1", "w", "web"):
+        test_window.search_entry = DummySearchEntry(text)
+        test_window.rebuild_connection_list()
+
+    again = {row.connection.nickname: row for row in test_window.connection_list}
+    assert again == first
+    assert RecyclingConnectionRow.created == 2
+    # Keystrokes query the index; only its first use reads the snapshot.
+    assert snapshots == [3]
+    assert first["web-1"].rebinds